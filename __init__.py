@@ -3,16 +3,23 @@
 基于WHO儿童生长标准的BMI计算器，支持0-19岁儿童青少年的BMI百分位计算。
 """
 
-from .age_calculator import AgeCalculator
-from .percentile_descriptions import (
-    get_percentile_description,
-    HEIGHT_PERCENTILE_DESCRIPTIONS,
-    WEIGHT_PERCENTILE_DESCRIPTIONS,
-    BMI_PERCENTILE_DESCRIPTIONS_UNDER_2,
-    BMI_PERCENTILE_DESCRIPTIONS_OVER_2,
-    BMI_PERCENTILE_DESCRIPTIONS_GENERAL
-)
-from .bmi_data_final import BMI_STANDARD_DATA
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .age_calculator import AgeCalculator
+    from .percentile_descriptions import (
+        get_percentile_description,
+        HEIGHT_PERCENTILE_DESCRIPTIONS,
+        WEIGHT_PERCENTILE_DESCRIPTIONS,
+        BMI_PERCENTILE_DESCRIPTIONS_UNDER_2,
+        BMI_PERCENTILE_DESCRIPTIONS_OVER_2,
+        BMI_PERCENTILE_DESCRIPTIONS_GENERAL
+    )
+    from .bmi_data_final import BMI_STANDARD_DATA
+
+# 实例与子模块同名：子模块被导入后包属性会指向模块本身，因此在此直接绑定实例。
+# 该模块很轻量，参考数据在首次百分位查找时才加载。
 from .who_standard_service import WHOStandardService, who_standard_service
 
 __version__ = "1.0.0"
@@ -30,3 +37,28 @@ __all__ = [
     "WHOStandardService",
     "who_standard_service",
 ]
+
+# 公开名称 -> 所在模块，首次访问时才导入对应模块
+_LAZY_ATTRS = {
+    "AgeCalculator": ".age_calculator",
+    "get_percentile_description": ".percentile_descriptions",
+    "HEIGHT_PERCENTILE_DESCRIPTIONS": ".percentile_descriptions",
+    "WEIGHT_PERCENTILE_DESCRIPTIONS": ".percentile_descriptions",
+    "BMI_PERCENTILE_DESCRIPTIONS_UNDER_2": ".percentile_descriptions",
+    "BMI_PERCENTILE_DESCRIPTIONS_OVER_2": ".percentile_descriptions",
+    "BMI_PERCENTILE_DESCRIPTIONS_GENERAL": ".percentile_descriptions",
+    "BMI_STANDARD_DATA": ".bmi_data_final",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
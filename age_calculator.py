@@ -1,8 +1,47 @@
 from datetime import datetime, date
-from typing import Tuple, Optional
+from typing import NamedTuple, Tuple, Optional
 import re
 import calendar
 
+from .result_cache import AgeCache
+
+# age_date的基本格式：YYYY-MM-DD
+AGE_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+# 可选的年龄计算结果缓存，默认关闭
+_age_cache: Optional[AgeCache] = None
+
+# 预先生成的年龄字符串（0-19岁），相同的年龄总是返回同一个字符串对象
+INTERNED_MAX_YEARS = 19
+_STORAGE_STRINGS = tuple(
+    tuple(f"{years}岁{months}个月" for months in range(12)) for years in range(INTERNED_MAX_YEARS + 1)
+)
+_MONTH_DISPLAY_STRINGS = tuple(
+    tuple(
+        f"{months}个月" if years == 0 else f"{years}岁" if months == 0 else _STORAGE_STRINGS[years][months]
+        for months in range(12)
+    )
+    for years in range(INTERNED_MAX_YEARS + 1)
+)
+# 一岁以内：[月数][天数]，天数不超过30
+_DAY_DISPLAY_STRINGS = tuple(tuple(f"{months}月{days}天" for days in range(31)) for months in range(12))
+
+
+class AgeParts(NamedTuple):
+    """一次计算得到的全部年龄表示"""
+    years: int
+    months: int
+    total_months: int
+    days: int
+    weeks: int
+
+
+class ResolvedAge(NamedTuple):
+    """解析并格式化后的年龄"""
+    display: str
+    storage: str
+    total_months: int
+
 
 class AgeCalculator:
     """年龄计算工具类"""
@@ -24,8 +63,7 @@ class AgeCalculator:
             raise ValueError("age_date不能为空")
         
         # 匹配基本格式：YYYY-MM-DD
-        basic_pattern = r'^(\d{4})-(\d{2})-(\d{2})$'
-        basic_match = re.match(basic_pattern, age_date)
+        basic_match = AGE_DATE_PATTERN.match(age_date)
         if not basic_match:
             raise ValueError(f"age_date格式不正确：{age_date}，应为'YYYY-MM-DD'格式")
         
@@ -195,21 +233,161 @@ class AgeCalculator:
         Returns:
             Tuple[str, str]: (用于显示的年龄字符串, 用于存储的年龄字符串)
         """
-        parsed_date, age_type = AgeCalculator.parse_age_date(age_date)
+        if _age_cache is not None:
+            display_age, storage_age, _ = AgeCalculator.resolve_age(age_date, current_date)
+            return display_age, storage_age
+        
+        if current_date is None:
+            current_date = date.today()
+        parsed_date, _ = AgeCalculator.parse_age_date(age_date)
+        display_age, storage_age, _ = _format_age(parsed_date, current_date)
+        return display_age, storage_age
+    
+    @staticmethod
+    def calculate_age_parts(birth_date: date, current_date: Optional[date] = None) -> AgeParts:
+        """一次计算全部年龄表示
         
-        # 计算年龄（年和月）
-        years, months = AgeCalculator.calculate_age_in_months(parsed_date, current_date)
+        结果与分别调用 calculate_age_in_months、calculate_age_in_days、calculate_age_in_weeks 一致。
         
-        # 根据年龄决定显示格式
-        if years < 1:
-            # 一岁以内：显示XX月XX天
-            total_months, days = AgeCalculator.calculate_age_in_days(parsed_date, current_date)
-            display_age = AgeCalculator.format_age_for_display('day', months=total_months, days=days)
-        else:
-            # 一岁以上：显示XX岁XX月
-            display_age = AgeCalculator.format_age_for_display('month', years=years, months=months)
+        Args:
+            birth_date: 出生日期
+            current_date: 当前日期，默认为今天
+            
+        Returns:
+            AgeParts: (年数, 月数, 总月数, 天数, 周数)，出生日期晚于当前日期时均为0
+        """
+        if current_date is None:
+            current_date = date.today()
+        
+        if birth_date > current_date:
+            return AgeParts(0, 0, 0, 0, 0)
+        
+        years, months, total_months, days = _age_parts(birth_date, current_date)
+        return AgeParts(years, months, total_months, days, (current_date - birth_date).days // 7)
+    
+    @staticmethod
+    def resolve_age(age_date: str, current_date: Optional[date] = None) -> ResolvedAge:
+        """解析age_date并计算显示、存储格式的年龄和总月数
         
-        # 存储格式统一为 X岁X个月
-        storage_age = AgeCalculator.format_age_for_storage(years, months)
+        开启年龄缓存（enable_age_cache）后，相同的 (age_date, 当前日期) 直接返回缓存的结果；
+        0-19岁的年龄字符串预先生成，相同年龄返回同一个字符串对象。
         
-        return display_age, storage_age
\ No newline at end of file
+        Args:
+            age_date: 年龄日期字符串，格式同 parse_age_date
+            current_date: 当前日期，默认为今天
+            
+        Returns:
+            ResolvedAge: (用于显示的年龄字符串, 用于存储的年龄字符串, 总月数)
+            
+        Raises:
+            ValueError: age_date格式不正确
+        """
+        if current_date is None:
+            current_date = date.today()
+        
+        cache = _age_cache
+        if cache is not None:
+            key = (age_date, current_date)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        parsed_date, _ = AgeCalculator.parse_age_date(age_date)
+        result = ResolvedAge._make(_format_age(parsed_date, current_date))
+        if cache is not None:
+            cache.put(key, result)
+        return result
+    
+    @staticmethod
+    def enable_age_cache(maxsize: int = 4096) -> AgeCache:
+        """开启年龄计算结果缓存
+        
+        Args:
+            maxsize: 最多缓存的 (age_date, 当前日期) 数，超出后淘汰最久未使用的结果
+            
+        Returns:
+            新建的缓存，可通过 stats() 查看命中、未命中和淘汰次数
+        """
+        global _age_cache
+        _age_cache = AgeCache(maxsize)
+        return _age_cache
+    
+    @staticmethod
+    def disable_age_cache() -> None:
+        """关闭并丢弃年龄计算结果缓存"""
+        global _age_cache
+        _age_cache = None
+    
+    @staticmethod
+    def get_age_cache() -> Optional[AgeCache]:
+        """获取当前的年龄计算结果缓存，未开启时返回None"""
+        return _age_cache
+    
+    @staticmethod
+    def parse_age_date_batch(age_dates):
+        """批量解析age_date字段（需要NumPy）
+        
+        Args:
+            age_dates: age_date字符串数组，格式同 parse_age_date
+        
+        Returns:
+            AgeDateBatch: 日期数组（datetime64[D]，无效行为NaT）、类型编码数组
+            （见 AGE_TYPES：0='month'，1='week'）和有效性掩码，不抛出格式异常
+        """
+        from .vectorized import parse_age_date_batch
+        return parse_age_date_batch(age_dates)
+    
+    @staticmethod
+    def calculate_age_batch(age_dates, current_date: Optional[date] = None):
+        """批量解析age_date并计算年龄（需要NumPy）
+        
+        Args:
+            age_dates: age_date字符串数组，格式同 parse_age_date
+            current_date: 当前日期，默认为今天
+        
+        Returns:
+            AgeBatchResult: 年、月、总月数、天数、周数数组，以及类型编码和有效性掩码，
+            有效行与 calculate_age_in_months / calculate_age_in_days / calculate_age_in_weeks 一致
+        """
+        from .vectorized import calculate_age_batch
+        return calculate_age_batch(age_dates, current_date)
+
+
+def _age_parts(birth_date: date, current_date: date) -> Tuple[int, int, int, int]:
+    """(年数, 月数, 总月数, 天数)，规则同 calculate_age_in_months 和 calculate_age_in_days"""
+    if birth_date > current_date:
+        return 0, 0, 0, 0
+    
+    total_months = (current_date.year - birth_date.year) * 12 + (current_date.month - birth_date.month)
+    if current_date.day >= birth_date.day:
+        days = current_date.day - birth_date.day
+    else:
+        # 还没到满月：月数减1，天数从上个月的同一天算起
+        total_months -= 1
+        prev_month = current_date.month - 1 if current_date.month > 1 else 12
+        prev_year = current_date.year if current_date.month > 1 else current_date.year - 1
+        days = calendar.monthrange(prev_year, prev_month)[1] - birth_date.day + current_date.day
+    
+    years, months = divmod(total_months, 12)
+    return years, months, total_months, days
+
+
+def _format_age(birth_date: date, current_date: date) -> Tuple[str, str, int]:
+    """(用于显示的年龄字符串, 用于存储的年龄字符串, 总月数)，0-19岁使用预先生成的字符串"""
+    years, months, total_months, days = _age_parts(birth_date, current_date)
+    if years > INTERNED_MAX_YEARS:
+        return (
+            AgeCalculator.format_age_for_display('month', years=years, months=months),
+            AgeCalculator.format_age_for_storage(years, months),
+            total_months,
+        )
+    
+    # 一岁以内显示XX月XX天，一岁以上显示XX岁XX月
+    if years >= 1:
+        display_age = _MONTH_DISPLAY_STRINGS[years][months]
+    elif 0 <= days <= 30:
+        display_age = _DAY_DISPLAY_STRINGS[total_months][days]
+    else:
+        # 出生日大于上个月天数时天数可能为负，与 calculate_age_in_days 保持一致
+        display_age = AgeCalculator.format_age_for_display('day', months=total_months, days=days)
+    return display_age, _STORAGE_STRINGS[years][months], total_months
\ No newline at end of file
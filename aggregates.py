@@ -0,0 +1,273 @@
+"""可合并的人群汇总统计
+
+按 (性别, 月龄) 维护固定大小的计数器：百分位编码计数、BMI直方图和BMI合计，
+内存占用与记录数无关，不保存任何逐条结果。各工作进程或分片分别汇总后用 merge 合并
+（计数器直接相加，结果与单进程汇总完全一致），最后按年龄段生成偏瘦、超重、肥胖等的患病率表。
+"""
+import math
+from array import array
+from operator import add
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .percentile_descriptions import (
+    BMI_CATEGORIES,
+    BMI_CATEGORY_BY_CODE,
+    NO_CATEGORY,
+    PERCENTILE_CODE_LABELS,
+    PERCENTILE_CODES,
+    PercentileCode,
+)
+from .reference_table import normalize_age
+from .vectorized import GENDERS, MAX_AGE_MONTHS, _require_numpy, encode_genders, np
+from .who_standard_service import WHOStandardService
+
+_CODES = len(PERCENTILE_CODE_LABELS)
+_AGES = MAX_AGE_MONTHS + 1
+_CELLS = len(GENDERS) * _AGES
+_UNKNOWN = int(PercentileCode.UNKNOWN)
+
+# BMI直方图：[HISTOGRAM_MIN, HISTOGRAM_MAX) 按 HISTOGRAM_WIDTH 分桶，首末各加一个溢出桶
+HISTOGRAM_MIN = 8.0
+HISTOGRAM_MAX = 40.0
+HISTOGRAM_WIDTH = 0.5
+HISTOGRAM_BINS = int(round((HISTOGRAM_MAX - HISTOGRAM_MIN) / HISTOGRAM_WIDTH)) + 2
+
+# 默认年龄段（月，左闭右开）：每12个月一段，最后一段包含228个月
+DEFAULT_AGE_BANDS = tuple((start, start + 12) for start in range(0, 204, 12)) + ((204, 216), (216, _AGES))
+
+
+def _histogram_bin(bmi: float) -> int:
+    if bmi < HISTOGRAM_MIN:
+        return 0
+    if bmi >= HISTOGRAM_MAX:
+        return HISTOGRAM_BINS - 1
+    return int((bmi - HISTOGRAM_MIN) // HISTOGRAM_WIDTH) + 1
+
+
+class PopulationAggregate:
+    """按 (性别, 月龄) 汇总的百分位计数与BMI直方图
+
+    Attributes:
+        counts: 计数器，下标为 (性别编码 * 229 + 月龄) * 16 + 百分位编码
+        histogram: BMI直方图，下标为 (性别编码 * 229 + 月龄) * HISTOGRAM_BINS + 桶号，NaN不计入
+        bmi_sum: 各 (性别, 月龄) 的BMI合计（NaN不计入），用于计算平均值
+        age_out_of_range: 年龄超出数据范围的记录数
+        unsupported_gender: 不支持的性别的记录数
+        invalid_age: 年龄在范围内但不是整数月龄的记录数（百分位为"unknown"，不计入分组）
+        errors: 无法计算BMI的记录数（身高或体重非法）
+    """
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * _CELLS * _CODES))
+        self.histogram = array("Q", bytes(8 * _CELLS * HISTOGRAM_BINS))
+        self.bmi_sum = array("d", bytes(8 * _CELLS))
+        self.age_out_of_range = 0
+        self.unsupported_gender = 0
+        self.invalid_age = 0
+        self.errors = 0
+
+    def _add_cell(self, cell: int, code: int, bmi: float) -> None:
+        self.counts[cell * _CODES + code] += 1
+        if bmi == bmi:
+            self.histogram[cell * HISTOGRAM_BINS + _histogram_bin(bmi)] += 1
+            self.bmi_sum[cell] += bmi
+
+    def _cell(self, gender: str, age_in_months) -> Optional[int]:
+        """返回 (性别, 月龄) 的分组下标，无法分组时计入对应的排除计数并返回None"""
+        if age_in_months < 0 or age_in_months > MAX_AGE_MONTHS:
+            self.age_out_of_range += 1
+            return None
+        try:
+            gender_code = GENDERS.index(gender)
+        except ValueError:
+            self.unsupported_gender += 1
+            return None
+        age = normalize_age(age_in_months)
+        if age is None:
+            self.invalid_age += 1
+            return None
+        return gender_code * _AGES + age
+
+    def add(self, gender: str, age_in_months: int, bmi: float) -> None:
+        """计入一条BMI记录
+
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            bmi: BMI值
+        """
+        cell = self._cell(gender, age_in_months)
+        if cell is None:
+            return
+        code = WHOStandardService.calculate_bmi_percentile_record(gender, age_in_months, bmi).code
+        self._add_cell(cell, _UNKNOWN if code is None else code, bmi)
+
+    def add_result(self, gender: str, age_in_months: int, result: Any) -> None:
+        """计入一条已评分的结果，不再重新查表
+
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            result: calculate_bmi_with_percentile 的结果字典或 BMIResult 记录；
+                含 "error" 字段的字典（评分失败的行）计入 errors
+        """
+        if isinstance(result, Mapping):
+            if "error" in result:
+                self.errors += 1
+                return
+            bmi, percentile = result["bmi"], result["percentile"]
+        else:
+            bmi, percentile = result.bmi, result.percentile
+        cell = self._cell(gender, age_in_months)
+        if cell is None:
+            return
+        self._add_cell(cell, PERCENTILE_CODES.get(percentile, _UNKNOWN), bmi)
+
+    def add_batch(self, genders, ages_in_months, bmi, percentile_codes=None) -> None:
+        """批量计入BMI记录（需要NumPy）
+
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            bmi: BMI数组
+            percentile_codes: 已计算的百分位编码（如 score_into 的 out_code），
+                省略时按 calculate_bmi_percentile_batch 计算
+        """
+        _require_numpy()
+        genders, ages, bmi = np.broadcast_arrays(
+            encode_genders(genders), np.asarray(ages_in_months), np.asarray(bmi, dtype=np.float64)
+        )
+        genders, ages, bmi = genders.ravel(), ages.ravel(), bmi.ravel()
+        if percentile_codes is None:
+            from .vectorized import calculate_bmi_percentile_batch
+
+            codes = calculate_bmi_percentile_batch(genders, ages, bmi).percentile_codes
+        else:
+            codes = np.asarray(percentile_codes).ravel()
+            if len(codes) != len(bmi):
+                raise ValueError("percentile_codes的长度与输入不一致")
+
+        # 与逐条计算一致：先检查年龄范围，再检查性别，只有整数月龄参与分组
+        with np.errstate(invalid="ignore"):
+            age_ok = ~((ages < 0) | (ages > MAX_AGE_MONTHS))
+        gender_ok = (genders == 0) | (genders == 1)
+        valid = age_ok & gender_ok
+        self.age_out_of_range += int(np.count_nonzero(~age_ok))
+        self.unsupported_gender += int(np.count_nonzero(age_ok & ~gender_ok))
+        if ages.dtype.kind not in "iu":
+            self.invalid_age += int(np.count_nonzero(valid))
+            return
+
+        cells = genders[valid] * _AGES + ages[valid].astype(np.int64)
+        bmi = bmi[valid]
+        counts = np.frombuffer(self.counts, dtype=np.uint64)
+        counts += np.bincount(cells * _CODES + codes[valid], minlength=counts.size).astype(np.uint64)
+
+        counted = ~np.isnan(bmi)
+        cells, bmi = cells[counted], bmi[counted]
+        # 先在浮点上截断再转换为整数：±inf 转换为int64会溢出，与 _histogram_bin 一样落入首末溢出桶
+        scaled = np.floor((bmi - HISTOGRAM_MIN) / HISTOGRAM_WIDTH)
+        np.clip(scaled, -1, HISTOGRAM_BINS - 2, out=scaled)
+        bins = scaled.astype(np.int64) + 1
+        histogram = np.frombuffer(self.histogram, dtype=np.uint64)
+        histogram += np.bincount(cells * HISTOGRAM_BINS + bins, minlength=histogram.size).astype(np.uint64)
+        bmi_sum = np.frombuffer(self.bmi_sum, dtype=np.float64)
+        bmi_sum += np.bincount(cells, weights=bmi, minlength=bmi_sum.size)
+
+    def merge(self, other: "PopulationAggregate") -> "PopulationAggregate":
+        """将另一个汇总结果合并到当前对象，返回当前对象（有NumPy时逐元素相加不经过Python循环）"""
+        for mine, theirs in ((self.counts, other.counts), (self.histogram, other.histogram), (self.bmi_sum, other.bmi_sum)):
+            if np is not None:
+                view = np.frombuffer(mine, dtype=np.float64 if mine.typecode == "d" else np.uint64)
+                view += np.frombuffer(theirs, dtype=view.dtype)
+            else:
+                mine[:] = array(mine.typecode, map(add, mine, theirs))
+        self.age_out_of_range += other.age_out_of_range
+        self.unsupported_gender += other.unsupported_gender
+        self.invalid_age += other.invalid_age
+        self.errors += other.errors
+        return self
+
+    @classmethod
+    def merge_all(cls, aggregates: Iterable["PopulationAggregate"]) -> "PopulationAggregate":
+        """合并多个汇总结果（如各工作进程、各分片的部分结果）"""
+        merged = cls()
+        for aggregate in aggregates:
+            merged.merge(aggregate)
+        return merged
+
+    @property
+    def total(self) -> int:
+        """已计入分组的记录数"""
+        return sum(self.counts)
+
+    def percentile_counts(self, gender: str, age_from: int = 0, age_to: int = _AGES) -> Dict[str, int]:
+        """返回指定性别、月龄 [age_from, age_to) 内各百分位标签的记录数"""
+        base = GENDERS.index(gender) * _AGES
+        totals = [0] * _CODES
+        for age in range(max(age_from, 0), min(age_to, _AGES)):
+            offset = (base + age) * _CODES
+            for code in range(_CODES):
+                totals[code] += self.counts[offset + code]
+        return dict(zip(PERCENTILE_CODE_LABELS, totals))
+
+    def bmi_histogram(self, gender: str, age_from: int = 0, age_to: int = _AGES) -> List[Tuple[float, float, int]]:
+        """返回指定性别、月龄 [age_from, age_to) 内的BMI直方图 [(下界, 上界, 记录数)]"""
+        base = GENDERS.index(gender) * _AGES
+        totals = [0] * HISTOGRAM_BINS
+        for age in range(max(age_from, 0), min(age_to, _AGES)):
+            offset = (base + age) * HISTOGRAM_BINS
+            for i in range(HISTOGRAM_BINS):
+                totals[i] += self.histogram[offset + i]
+        edges = [-math.inf] + [HISTOGRAM_MIN + i * HISTOGRAM_WIDTH for i in range(HISTOGRAM_BINS - 1)] + [math.inf]
+        return [(edges[i], edges[i + 1], totals[i]) for i in range(HISTOGRAM_BINS)]
+
+    def prevalence_table(self, age_bands: Sequence[Tuple[int, int]] = DEFAULT_AGE_BANDS) -> List[Dict[str, Any]]:
+        """生成按性别、年龄段汇总的BMI分类患病率表
+
+        Args:
+            age_bands: 年龄段列表 [(起始月龄, 结束月龄)]，左闭右开
+
+        Returns:
+            list: 每个 (性别, 年龄段) 一行，包含 gender、age_from、age_to、count、unknown、mean_bmi，
+            各BMI分类的记录数（如 "肥胖"）及其占已分类记录的比例（如 "肥胖率"）
+        """
+        rows = []
+        for gender_code, gender in enumerate(GENDERS):
+            for age_from, age_to in age_bands:
+                categories = [0] * len(BMI_CATEGORIES)
+                unknown = 0
+                bmi_count = 0
+                bmi_sum = 0.0
+                for age in range(max(age_from, 0), min(age_to, _AGES)):
+                    cell = gender_code * _AGES + age
+                    category_by_code = BMI_CATEGORY_BY_CODE[0 if age < 24 else 1]
+                    offset = cell * _CODES
+                    for code in range(_CODES):
+                        count = self.counts[offset + code]
+                        if not count:
+                            continue
+                        category = category_by_code[code]
+                        if category == NO_CATEGORY:
+                            unknown += count
+                        else:
+                            categories[category] += count
+                    offset = cell * HISTOGRAM_BINS
+                    bmi_count += sum(self.histogram[offset:offset + HISTOGRAM_BINS])
+                    bmi_sum += self.bmi_sum[cell]
+
+                classified = sum(categories)
+                row = {
+                    "gender": gender,
+                    "age_from": age_from,
+                    "age_to": age_to,
+                    "count": classified + unknown,
+                    "unknown": unknown,
+                    "mean_bmi": round(bmi_sum / bmi_count, 2) if bmi_count else None,
+                }
+                for name, count in zip(BMI_CATEGORIES, categories):
+                    row[name] = count
+                for name, count in zip(BMI_CATEGORIES, categories):
+                    row[f"{name}率"] = count / classified if classified else None
+                rows.append(row)
+        return rows
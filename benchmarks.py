@@ -0,0 +1,251 @@
+"""性能基准测试
+
+覆盖包内的所有热点路径（单次调用与批量调用）、包导入耗时和常驻内存，
+结果输出为JSON，可与保存的基线对比并按阈值判断是否退化。
+
+用法：
+    python -m who_bmi_calculator bench -o results.json
+    python -m who_bmi_calculator bench --baseline baseline.json --threshold 0.2
+"""
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+from .age_calculator import AgeCalculator
+from .percentile_descriptions import get_percentile_description
+from .who_standard_service import WHOStandardService
+
+_PACKAGE = __name__.rpartition(".")[0]
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BATCH_SIZE = 1000
+DEFAULT_THRESHOLD = 0.2
+
+
+def _time_per_call(func: Callable[[], Any], calls: int, number: int, repeat: int) -> float:
+    """func 每次执行包含 calls 次调用，取多次重复中的最小值，返回每次调用的纳秒数"""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / (number * calls) * 1e9
+
+
+def _inputs(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(count):
+        birth = date(rng.randint(2006, 2025), rng.randint(1, 12), rng.randint(1, 28))
+        inputs.append({
+            "gender": rng.choice(("boy", "girl")),
+            "age": rng.randint(0, 228),
+            "height": round(rng.uniform(50, 190), 1),
+            "weight": round(rng.uniform(3, 100), 1),
+            "bmi": round(rng.uniform(10, 40), 2),
+            "age_date": birth.isoformat() if rng.random() < 0.5 else birth.strftime("%Y-%m-00"),
+        })
+    return inputs
+
+
+def _hot_paths(inputs: List[Dict[str, Any]]) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    gender_data = WHOStandardService.get_bmi_data_by_gender("boy")
+    current_date = date(2025, 9, 1)
+    return {
+        "calculate_bmi": lambda x: WHOStandardService.calculate_bmi(x["height"], x["weight"]),
+        "find_percentile_for_bmi": lambda x: WHOStandardService.find_percentile_for_bmi(gender_data, x["age"], x["bmi"]),
+        "find_percentile_for_weight": lambda x: WHOStandardService.find_percentile_for_weight(gender_data, x["age"], x["bmi"]),
+        "find_percentile_for_height": lambda x: WHOStandardService.find_percentile_for_height(gender_data, x["age"], x["bmi"]),
+        "calculate_bmi_percentile": lambda x: WHOStandardService.calculate_bmi_percentile(x["gender"], x["age"], x["bmi"]),
+        "calculate_bmi_with_percentile": lambda x: WHOStandardService.calculate_bmi_with_percentile(
+            x["gender"], x["age"], x["height"], x["weight"]
+        ),
+        "calculate_bmi_zscore": lambda x: WHOStandardService.calculate_bmi_zscore(x["gender"], x["age"], x["bmi"]),
+        "calculate_adult_bmi_category": lambda x: WHOStandardService.calculate_adult_bmi_category(x["bmi"], x["gender"]),
+        "get_percentile_description": lambda x: get_percentile_description("p50", "bmi", x["age"]),
+        "parse_age_date": lambda x: AgeCalculator.parse_age_date(x["age_date"]),
+        "calculate_and_format_age": lambda x: AgeCalculator.calculate_and_format_age(x["age_date"], current_date),
+    }
+
+
+def _run_in_subprocess(code: str) -> Dict[str, Any]:
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=_PACKAGE_PARENT)
+    return json.loads(output)
+
+
+def measure_import(repeat: int = 5) -> Dict[str, float]:
+    """在新进程中测量包导入耗时、首次百分位查找耗时和常驻内存"""
+    code = (
+        "import json, time\n"
+        "started = time.perf_counter()\n"
+        f"import {_PACKAGE} as package\n"
+        "imported = time.perf_counter()\n"
+        "package.WHOStandardService.calculate_bmi_percentile('boy', 60, 17.0)\n"
+        "looked_up = time.perf_counter()\n"
+        "try:\n"
+        "    import resource\n"
+        "    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        "except ImportError:\n"
+        "    rss = 0\n"
+        "print(json.dumps({'import': imported - started, 'first_lookup': looked_up - imported, 'rss': rss}))\n"
+    )
+    runs = [_run_in_subprocess(code) for _ in range(repeat)]
+    return {
+        "import_ms": min(run["import"] for run in runs) * 1000,
+        "first_lookup_ms": min(run["first_lookup"] for run in runs) * 1000,
+        # Linux 下 ru_maxrss 的单位为KB
+        "max_rss_kb": min(run["rss"] for run in runs),
+    }
+
+
+def run_benchmarks(repeat: int = 5, batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+    """运行全部基准测试
+
+    Returns:
+        {"meta": 运行环境, "results": {名称: 每次调用纳秒数或其他指标}}
+    """
+    inputs = _inputs(batch_size)
+    single = inputs[0]
+    results: Dict[str, float] = {}
+
+    for name, func in _hot_paths(inputs).items():
+        func(single)  # 预热，触发参考表等一次性加载
+        results[f"{name}.single_ns"] = _time_per_call(lambda: func(single), 1, 2000, repeat)
+        results[f"{name}.batch_ns"] = _time_per_call(lambda: [func(x) for x in inputs], len(inputs), 3, repeat)
+
+    # 专用分类函数（按单个性别、月龄生成）
+    classify = WHOStandardService.get_bmi_classifier(single["gender"], single["age"])
+    results["get_bmi_classifier.single_ns"] = _time_per_call(lambda: classify(single["bmi"]), 1, 2000, repeat)
+
+    # 量化直接索引查找（与二分查找结果一致）
+    WHOStandardService.enable_quantized_lookup()
+    try:
+        func = _hot_paths(inputs)["calculate_bmi_percentile"]
+        results["calculate_bmi_percentile_quantized.single_ns"] = _time_per_call(lambda: func(single), 1, 2000, repeat)
+        results["calculate_bmi_percentile_quantized.batch_ns"] = _time_per_call(
+            lambda: [func(x) for x in inputs], len(inputs), 3, repeat
+        )
+    finally:
+        WHOStandardService.disable_quantized_lookup()
+
+    # 年龄计算结果缓存（同一批记录的出生日期高度重复）
+    AgeCalculator.enable_age_cache()
+    try:
+        func = _hot_paths(inputs)["calculate_and_format_age"]
+        results["calculate_and_format_age_cached.batch_ns"] = _time_per_call(
+            lambda: [func(x) for x in inputs], len(inputs), 3, repeat
+        )
+    finally:
+        AgeCalculator.disable_age_cache()
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        batch = {
+            "genders": np.array([0 if x["gender"] == "boy" else 1 for x in inputs]),
+            "ages": np.array([x["age"] for x in inputs]),
+            "heights": np.array([x["height"] for x in inputs]),
+            "weights": np.array([x["weight"] for x in inputs]),
+        }
+        calculate_batch = WHOStandardService.calculate_bmi_with_percentile_batch
+        calculate_batch(batch["genders"], batch["ages"], batch["heights"], batch["weights"])
+        results["calculate_bmi_with_percentile_batch.batch_ns"] = _time_per_call(
+            lambda: calculate_batch(batch["genders"], batch["ages"], batch["heights"], batch["weights"]),
+            len(inputs),
+            10,
+            repeat,
+        )
+
+        WHOStandardService.enable_quantized_lookup()
+        try:
+            results["calculate_bmi_with_percentile_batch_quantized.batch_ns"] = _time_per_call(
+                lambda: calculate_batch(batch["genders"], batch["ages"], batch["heights"], batch["weights"]),
+                len(inputs),
+                10,
+                repeat,
+            )
+        finally:
+            WHOStandardService.disable_quantized_lookup()
+
+        out = np.empty(len(inputs), dtype=[("bmi", "f8"), ("percentile_code", "u1")])
+        score_into = WHOStandardService.score_into
+        results["score_into.batch_ns"] = _time_per_call(
+            lambda: score_into(batch["genders"], batch["ages"], batch["heights"], batch["weights"], out=out),
+            len(inputs),
+            10,
+            repeat,
+        )
+
+        zscore_batch = WHOStandardService.calculate_bmi_zscore_batch
+        bmi = np.array([x["bmi"] for x in inputs])
+        results["calculate_bmi_zscore_batch.batch_ns"] = _time_per_call(
+            lambda: zscore_batch(batch["genders"], batch["ages"], bmi), len(inputs), 10, repeat
+        )
+
+        age_dates = np.array([x["age_date"] for x in inputs])
+        current_date = date(2025, 9, 1)
+        calculate_age_batch = AgeCalculator.calculate_age_batch
+        results["calculate_age_batch.batch_ns"] = _time_per_call(
+            lambda: calculate_age_batch(age_dates, current_date), len(inputs), 10, repeat
+        )
+
+    results.update(measure_import())
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "batch_size": batch_size,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """与基线对比，返回超过阈值的退化项
+
+    所有指标均为越小越好，current / baseline > 1 + threshold 视为退化。
+    """
+    regressions = []
+    current_results = results["results"]
+    for name, base_value in baseline["results"].items():
+        value = current_results.get(name)
+        if value is None or not base_value:
+            continue
+        ratio = value / base_value
+        if ratio > 1 + threshold:
+            regressions.append({"name": name, "baseline": base_value, "current": value, "ratio": ratio})
+    return regressions
+
+
+def run(output: Optional[str] = None, baseline: Optional[str] = None, threshold: float = DEFAULT_THRESHOLD,
+        repeat: int = 5, batch_size: int = BATCH_SIZE) -> int:
+    """运行基准测试并写出JSON结果；指定基线时存在退化项返回1"""
+    results = run_benchmarks(repeat=repeat, batch_size=batch_size)
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), threshold)
+        for item in regressions:
+            print(
+                f"性能退化：{item['name']} {item['baseline']:.1f} -> {item['current']:.1f}（{item['ratio']:.2f}x）",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+        print(f"与基线相比无超过 {threshold:.0%} 的退化", file=sys.stderr)
+    return 0
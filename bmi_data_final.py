@@ -1,467 +1,497 @@
 # BMI标准数据
 
-# 0-19岁BMI标准数据
-BMI_STANDARD_DATA = {
-    "boy": {
-        "0": {'p1': 10.8, 'p3': 11.3, 'p5': 11.5, 'p15': 12.2, 'p25': 12.6, 'p50': 13.4, 'p75': 14.3, 'p85': 14.8, 'p95': 15.8, 'p97': 16.1, 'p99': 16.8, 'p999': 16.9, 'p01': 10.0, 'p10': 11.8, 'p90': 15.3},
-        "1": {'p1': 12.0, 'p3': 12.6, 'p5': 12.8, 'p15': 13.6, 'p25': 14.1, 'p50': 14.9, 'p75': 15.9, 'p85': 16.4, 'p95': 17.3, 'p97': 17.6, 'p99': 18.2, 'p999': 18.3, 'p01': 11.2, 'p10': 13.2, 'p90': 16.9},
-        "2": {'p1': 13.3, 'p3': 13.8, 'p5': 14.1, 'p15': 14.9, 'p25': 15.4, 'p50': 16.3, 'p75': 17.3, 'p85': 17.8, 'p95': 18.8, 'p97': 19.2, 'p99': 19.8, 'p999': 19.9, 'p01': 12.4, 'p10': 14.5, 'p90': 18.3},
-        "3": {'p1': 13.9, 'p3': 14.4, 'p5': 14.7, 'p15': 15.5, 'p25': 16.0, 'p50': 16.9, 'p75': 17.9, 'p85': 18.5, 'p95': 19.4, 'p97': 19.8, 'p99': 20.5, 'p999': 20.6, 'p01': 12.9, 'p10': 15.1, 'p90': 18.9},
-        "4": {'p1': 14.1, 'p3': 14.7, 'p5': 15.0, 'p15': 15.7, 'p25': 16.2, 'p50': 17.2, 'p75': 18.2, 'p85': 18.7, 'p95': 19.7, 'p97': 20.1, 'p99': 20.8, 'p999': 20.9, 'p01': 13.1, 'p10': 15.3, 'p90': 19.2},
-        "5": {'p1': 14.3, 'p3': 14.8, 'p5': 15.1, 'p15': 15.9, 'p25': 16.4, 'p50': 17.3, 'p75': 18.3, 'p85': 18.9, 'p95': 19.8, 'p97': 20.2, 'p99': 20.9, 'p999': 21.0, 'p01': 13.3, 'p10': 15.5, 'p90': 19.4},
-        "6": {'p1': 14.4, 'p3': 14.9, 'p5': 15.2, 'p15': 15.9, 'p25': 16.4, 'p50': 17.3, 'p75': 18.3, 'p85': 18.9, 'p95': 19.9, 'p97': 20.3, 'p99': 21.0, 'p999': 21.1, 'p01': 13.4, 'p10': 15.6, 'p90': 19.4},
-        "7": {'p1': 14.4, 'p3': 14.9, 'p5': 15.2, 'p15': 15.9, 'p25': 16.4, 'p50': 17.3, 'p75': 18.3, 'p85': 18.9, 'p95': 19.9, 'p97': 20.3, 'p99': 21.0, 'p999': 21.1, 'p01': 13.4, 'p10': 15.6, 'p90': 19.4},
-        "8": {'p1': 14.4, 'p3': 14.9, 'p5': 15.1, 'p15': 15.9, 'p25': 16.3, 'p50': 17.3, 'p75': 18.2, 'p85': 18.8, 'p95': 19.8, 'p97': 20.2, 'p99': 20.9, 'p999': 21.0, 'p01': 13.4, 'p10': 15.5, 'p90': 19.3},
-        "9": {'p1': 14.3, 'p3': 14.8, 'p5': 15.1, 'p15': 15.8, 'p25': 16.3, 'p50': 17.2, 'p75': 18.1, 'p85': 18.7, 'p95': 19.7, 'p97': 20.1, 'p99': 20.7, 'p999': 20.8, 'p01': 13.3, 'p10': 15.4, 'p90': 19.2},
-        "10": {'p1': 14.2, 'p3': 14.7, 'p5': 15.0, 'p15': 15.7, 'p25': 16.2, 'p50': 17.0, 'p75': 18.0, 'p85': 18.6, 'p95': 19.5, 'p97': 19.9, 'p99': 20.6, 'p999': 20.7, 'p01': 13.2, 'p10': 15.3, 'p90': 19.1},
-        "11": {'p1': 14.1, 'p3': 14.6, 'p5': 14.9, 'p15': 15.6, 'p25': 16.0, 'p50': 16.9, 'p75': 17.9, 'p85': 18.4, 'p95': 19.4, 'p97': 19.8, 'p99': 20.4, 'p999': 20.5, 'p01': 13.1, 'p10': 15.2, 'p90': 18.9},
-        "12": {'p1': 14.0, 'p3': 14.5, 'p5': 14.8, 'p15': 15.5, 'p25': 15.9, 'p50': 16.8, 'p75': 17.7, 'p85': 18.3, 'p95': 19.2, 'p97': 19.6, 'p99': 20.3, 'p999': 20.4, 'p01': 13.0, 'p10': 15.2, 'p90': 18.8},
-        "13": {'p1': 13.9, 'p3': 14.4, 'p5': 14.7, 'p15': 15.4, 'p25': 15.8, 'p50': 16.7, 'p75': 17.6, 'p85': 18.1, 'p95': 19.1, 'p97': 19.5, 'p99': 20.1, 'p999': 20.2, 'p01': 12.9, 'p10': 15.1, 'p90': 18.6},
-        "14": {'p1': 13.9, 'p3': 14.3, 'p5': 14.6, 'p15': 15.3, 'p25': 15.7, 'p50': 16.6, 'p75': 17.5, 'p85': 18.0, 'p95': 18.9, 'p97': 19.3, 'p99': 20.0, 'p999': 20.1, 'p01': 12.9, 'p10': 14.9, 'p90': 18.4},
-        "15": {'p1': 13.8, 'p3': 14.2, 'p5': 14.5, 'p15': 15.2, 'p25': 15.6, 'p50': 16.4, 'p75': 17.4, 'p85': 17.9, 'p95': 18.8, 'p97': 19.2, 'p99': 19.8, 'p999': 19.9, 'p01': 12.8, 'p10': 14.8, 'p90': 18.4},
-        "16": {'p1': 13.7, 'p3': 14.2, 'p5': 14.4, 'p15': 15.1, 'p25': 15.5, 'p50': 16.3, 'p75': 17.2, 'p85': 17.8, 'p95': 18.7, 'p97': 19.1, 'p99': 19.7, 'p999': 19.8, 'p01': 12.7, 'p10': 14.8, 'p90': 18.2},
-        "17": {'p1': 13.6, 'p3': 14.1, 'p5': 14.3, 'p15': 15.0, 'p25': 15.4, 'p50': 16.2, 'p75': 17.1, 'p85': 17.6, 'p95': 18.6, 'p97': 18.9, 'p99': 19.6, 'p999': 19.7, 'p01': 12.6, 'p10': 14.7, 'p90': 18.1},
-        "18": {'p1': 13.6, 'p3': 14.0, 'p5': 14.2, 'p15': 14.9, 'p25': 15.3, 'p50': 16.1, 'p75': 17.0, 'p85': 17.5, 'p95': 18.5, 'p97': 18.8, 'p99': 19.5, 'p999': 19.6, 'p01': 12.6, 'p10': 14.6, 'p90': 18.0},
-        "19": {'p1': 13.5, 'p3': 13.9, 'p5': 14.2, 'p15': 14.8, 'p25': 15.2, 'p50': 16.1, 'p75': 16.9, 'p85': 17.4, 'p95': 18.4, 'p97': 18.7, 'p99': 19.4, 'p999': 19.5, 'p01': 12.6, 'p10': 14.5, 'p90': 17.9},
-        "20": {'p1': 13.4, 'p3': 13.9, 'p5': 14.1, 'p15': 14.8, 'p25': 15.2, 'p50': 16.0, 'p75': 16.9, 'p85': 17.4, 'p95': 18.3, 'p97': 18.6, 'p99': 19.3, 'p999': 19.4, 'p01': 12.5, 'p10': 14.4, 'p90': 17.9},
-        "21": {'p1': 13.4, 'p3': 13.8, 'p5': 14.1, 'p15': 14.7, 'p25': 15.1, 'p50': 15.9, 'p75': 16.8, 'p85': 17.3, 'p95': 18.2, 'p97': 18.6, 'p99': 19.2, 'p999': 19.3, 'p01': 12.5, 'p10': 14.4, 'p90': 17.8},
-        "22": {'p1': 13.3, 'p3': 13.8, 'p5': 14.0, 'p15': 14.6, 'p25': 15.0, 'p50': 15.8, 'p75': 16.7, 'p85': 17.2, 'p95': 18.1, 'p97': 18.5, 'p99': 19.1, 'p999': 19.2, 'p01': 12.4, 'p10': 14.3, 'p90': 17.6},
-        "23": {'p1': 13.3, 'p3': 13.7, 'p5': 14.0, 'p15': 14.6, 'p25': 15.0, 'p50': 15.8, 'p75': 16.7, 'p85': 17.1, 'p95': 18.0, 'p97': 18.4, 'p99': 19.0, 'p999': 19.1, 'p01': 12.4, 'p10': 14.3, 'p90': 17.6},
-        "24": {'p1': 13.3, 'p3': 13.7, 'p5': 13.9, 'p15': 14.5, 'p25': 14.9, 'p50': 15.7, 'p75': 16.6, 'p85': 17.1, 'p95': 18.0, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 12.4, 'p10': 14.2, 'p90': 17.6},
-        "25": {'p1': 13.5, 'p3': 13.9, 'p5': 14.1, 'p15': 14.8, 'p25': 15.2, 'p50': 16.0, 'p75': 16.9, 'p85': 17.4, 'p95': 18.3, 'p97': 18.6, 'p99': 19.3, 'p999': 19.4, 'p01': 12.6, 'p10': 14.4, 'p90': 17.9},
-        "26": {'p1': 13.4, 'p3': 13.8, 'p5': 14.1, 'p15': 14.7, 'p25': 15.1, 'p50': 15.9, 'p75': 16.8, 'p85': 17.3, 'p95': 18.2, 'p97': 18.6, 'p99': 19.2, 'p999': 19.3, 'p01': 12.5, 'p10': 14.4, 'p90': 17.8},
-        "27": {'p1': 13.4, 'p3': 13.8, 'p5': 14.0, 'p15': 14.7, 'p25': 15.1, 'p50': 15.9, 'p75': 16.8, 'p85': 17.3, 'p95': 18.2, 'p97': 18.5, 'p99': 19.1, 'p999': 19.2, 'p01': 12.5, 'p10': 14.3, 'p90': 17.8},
-        "28": {'p1': 13.3, 'p3': 13.8, 'p5': 14.0, 'p15': 14.7, 'p25': 15.1, 'p50': 15.9, 'p75': 16.7, 'p85': 17.2, 'p95': 18.1, 'p97': 18.5, 'p99': 19.1, 'p999': 19.2, 'p01': 12.4, 'p10': 14.3, 'p90': 17.6},
-        "29": {'p1': 13.3, 'p3': 13.7, 'p5': 14.0, 'p15': 14.6, 'p25': 15.0, 'p50': 15.8, 'p75': 16.7, 'p85': 17.2, 'p95': 18.1, 'p97': 18.4, 'p99': 19.0, 'p999': 19.1, 'p01': 12.4, 'p10': 14.3, 'p90': 17.6},
-        "30": {'p1': 13.3, 'p3': 13.7, 'p5': 13.9, 'p15': 14.6, 'p25': 15.0, 'p50': 15.8, 'p75': 16.7, 'p85': 17.2, 'p95': 18.0, 'p97': 18.4, 'p99': 19.0, 'p999': 19.1, 'p01': 12.4, 'p10': 14.2, 'p90': 17.6},
-        "31": {'p1': 13.2, 'p3': 13.7, 'p5': 13.9, 'p15': 14.5, 'p25': 15.0, 'p50': 15.8, 'p75': 16.6, 'p85': 17.1, 'p95': 18.0, 'p97': 18.4, 'p99': 19.0, 'p999': 19.1, 'p01': 12.3, 'p10': 14.2, 'p90': 17.6},
-        "32": {'p1': 13.2, 'p3': 13.6, 'p5': 13.9, 'p15': 14.5, 'p25': 14.9, 'p50': 15.7, 'p75': 16.6, 'p85': 17.1, 'p95': 18.0, 'p97': 18.3, 'p99': 18.9, 'p999': 19.0, 'p01': 12.3, 'p10': 14.2, 'p90': 17.6},
-        "33": {'p1': 13.1, 'p3': 13.6, 'p5': 13.8, 'p15': 14.5, 'p25': 14.9, 'p50': 15.7, 'p75': 16.6, 'p85': 17.0, 'p95': 17.9, 'p97': 18.3, 'p99': 18.9, 'p999': 19.0, 'p01': 12.2, 'p10': 14.2, 'p90': 17.4},
-        "34": {'p1': 13.1, 'p3': 13.5, 'p5': 13.8, 'p15': 14.4, 'p25': 14.9, 'p50': 15.7, 'p75': 16.5, 'p85': 17.0, 'p95': 17.9, 'p97': 18.2, 'p99': 18.8, 'p999': 18.9, 'p01': 12.2, 'p10': 14.1, 'p90': 17.4},
-        "35": {'p1': 13.1, 'p3': 13.5, 'p5': 13.8, 'p15': 14.4, 'p25': 14.8, 'p50': 15.6, 'p75': 16.5, 'p85': 17.0, 'p95': 17.9, 'p97': 18.2, 'p99': 18.8, 'p999': 18.9, 'p01': 12.2, 'p10': 14.1, 'p90': 17.4},
-        "36": {'p1': 13.0, 'p3': 13.5, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.6, 'p75': 16.5, 'p85': 17.0, 'p95': 17.8, 'p97': 18.2, 'p99': 18.8, 'p999': 18.9, 'p01': 12.1, 'p10': 14.1, 'p90': 17.4},
-        "37": {'p1': 13.0, 'p3': 13.5, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.6, 'p75': 16.4, 'p85': 16.9, 'p95': 17.8, 'p97': 18.1, 'p99': 18.7, 'p999': 18.8, 'p01': 12.1, 'p10': 14.1, 'p90': 17.4},
-        "38": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.3, 'p25': 14.7, 'p50': 15.5, 'p75': 16.4, 'p85': 16.9, 'p95': 17.8, 'p97': 18.1, 'p99': 18.7, 'p999': 18.8, 'p01': 12.1, 'p10': 14.0, 'p90': 17.4},
-        "39": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.5, 'p75': 16.4, 'p85': 16.9, 'p95': 17.7, 'p97': 18.1, 'p99': 18.7, 'p999': 18.8, 'p01': 12.0, 'p10': 13.9, 'p90': 17.3},
-        "40": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.5, 'p75': 16.4, 'p85': 16.8, 'p95': 17.7, 'p97': 18.1, 'p99': 18.7, 'p999': 18.8, 'p01': 12.0, 'p10': 13.9, 'p90': 17.2},
-        "41": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.2, 'p25': 14.7, 'p50': 15.5, 'p75': 16.3, 'p85': 16.8, 'p95': 17.7, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 12.0, 'p10': 13.9, 'p90': 17.2},
-        "42": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.2, 'p25': 14.6, 'p50': 15.4, 'p75': 16.3, 'p85': 16.8, 'p95': 17.7, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 12.0, 'p10': 13.9, 'p90': 17.2},
-        "43": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.4, 'p75': 16.3, 'p85': 16.8, 'p95': 17.7, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.2},
-        "44": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.4, 'p75': 16.3, 'p85': 16.8, 'p95': 17.7, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.2},
-        "45": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.4, 'p75': 16.3, 'p85': 16.8, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.2},
-        "46": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.1},
-        "47": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.1},
-        "48": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.8, 'p10': 13.8, 'p90': 17.1},
-        "49": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.8, 'p10': 13.8, 'p90': 17.1},
-        "50": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.8, 'p10': 13.8, 'p90': 17.1},
-        "51": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.5, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.8, 'p10': 13.7, 'p90': 17.1},
-        "52": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.8, 'p10': 13.7, 'p90': 17.1},
-        "53": {'p1': 12.7, 'p3': 13.1, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.6, 'p999': 18.7, 'p01': 11.8, 'p10': 13.7, 'p90': 17.1},
-        "54": {'p1': 12.6, 'p3': 13.1, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.7, 'p999': 18.8, 'p01': 11.7, 'p10': 13.7, 'p90': 17.1},
-        "55": {'p1': 12.6, 'p3': 13.1, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.2, 'p75': 16.2, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.7, 'p999': 18.8, 'p01': 11.7, 'p10': 13.7, 'p90': 17.1},
-        "56": {'p1': 12.6, 'p3': 13.1, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.2, 'p75': 16.1, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.7, 'p999': 18.8, 'p01': 11.7, 'p10': 13.7, 'p90': 17.1},
-        "57": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.2, 'p75': 16.1, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.7, 'p999': 18.8, 'p01': 11.7, 'p10': 13.7, 'p90': 17.1},
-        "58": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 13.9, 'p25': 14.4, 'p50': 15.2, 'p75': 16.1, 'p85': 16.7, 'p95': 17.6, 'p97': 18.0, 'p99': 18.7, 'p999': 18.8, 'p01': 11.7, 'p10': 13.6, 'p90': 17.1},
-        "59": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 13.9, 'p25': 14.4, 'p50': 15.2, 'p75': 16.1, 'p85': 16.7, 'p95': 17.7, 'p97': 18.1, 'p99': 18.8, 'p999': 18.9, 'p01': 11.7, 'p10': 13.6, 'p90': 17.2},
-        "60": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 13.9, 'p25': 14.3, 'p50': 15.2, 'p75': 16.1, 'p85': 16.7, 'p95': 17.7, 'p97': 18.1, 'p99': 18.8, 'p999': 18.9, 'p01': 11.7, 'p10': 13.6, 'p90': 17.2},
-        "61": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.7, 'p97': 18.1, 'p99': 18.8, 'p999': 18.9, 'p01': 11.8, 'p10': 13.7, 'p90': 17.2},
-        "62": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.7, 'p97': 18.1, 'p99': 18.8, 'p999': 18.9, 'p01': 11.8, 'p10': 13.7, 'p90': 17.2},
-        "63": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.7, 'p97': 18.1, 'p99': 18.8, 'p999': 18.9, 'p01': 11.8, 'p10': 13.7, 'p90': 17.2},
-        "64": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.7, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.7, 'p90': 17.2},
-        "65": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "66": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "67": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.7, 'p95': 17.7, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.7, 'p90': 17.2},
-        "68": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "69": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 19.0, 'p999': 19.1, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "70": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.2, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 19.0, 'p999': 19.1, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "71": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.0, 'p25': 14.5, 'p50': 15.3, 'p75': 16.2, 'p85': 16.8, 'p95': 17.8, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "72": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.0, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.3, 'p99': 19.1, 'p999': 19.2, 'p01': 11.8, 'p10': 13.7, 'p90': 17.4},
-        "73": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.0, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.3, 'p99': 19.1, 'p999': 19.2, 'p01': 11.8, 'p10': 13.7, 'p90': 17.4},
-        "74": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 17.9, 'p97': 18.4, 'p99': 19.2, 'p999': 19.3, 'p01': 11.8, 'p10': 13.8, 'p90': 17.4},
-        "75": {'p1': 12.8, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 17.9, 'p97': 18.4, 'p99': 19.2, 'p999': 19.3, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "76": {'p1': 12.8, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.4, 'p99': 19.3, 'p999': 19.4, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "77": {'p1': 12.8, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.5, 'p99': 19.3, 'p999': 19.4, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "78": {'p1': 12.8, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.4, 'p85': 16.9, 'p95': 18.0, 'p97': 18.5, 'p99': 19.3, 'p999': 19.4, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "79": {'p1': 12.8, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.4, 'p85': 17.0, 'p95': 18.1, 'p97': 18.5, 'p99': 19.4, 'p999': 19.5, 'p01': 11.9, 'p10': 13.8, 'p90': 17.6},
-        "80": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.4, 'p85': 17.0, 'p95': 18.1, 'p97': 18.6, 'p99': 19.5, 'p999': 19.6, 'p01': 11.9, 'p10': 13.8, 'p90': 17.6},
-        "81": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.6, 'p50': 15.4, 'p75': 16.4, 'p85': 17.0, 'p95': 18.1, 'p97': 18.6, 'p99': 19.5, 'p999': 19.6, 'p01': 11.9, 'p10': 13.8, 'p90': 17.6},
-        "82": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.6, 'p50': 15.4, 'p75': 16.5, 'p85': 17.1, 'p95': 18.2, 'p97': 18.7, 'p99': 19.6, 'p999': 19.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.6},
-        "83": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.5, 'p85': 17.1, 'p95': 18.2, 'p97': 18.7, 'p99': 19.6, 'p999': 19.7, 'p01': 11.9, 'p10': 13.8, 'p90': 17.6},
-        "84": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.5, 'p85': 17.1, 'p95': 18.3, 'p97': 18.8, 'p99': 19.7, 'p999': 19.8, 'p01': 11.9, 'p10': 13.8, 'p90': 17.7},
-        "85": {'p1': 12.9, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.5, 'p85': 17.1, 'p95': 18.3, 'p97': 18.8, 'p99': 19.7, 'p999': 19.8, 'p01': 12.0, 'p10': 13.8, 'p90': 17.7},
-        "86": {'p1': 12.9, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.6, 'p85': 17.2, 'p95': 18.3, 'p97': 18.8, 'p99': 19.8, 'p999': 19.9, 'p01': 12.0, 'p10': 13.8, 'p90': 17.8},
-        "87": {'p1': 12.9, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.6, 'p85': 17.2, 'p95': 18.4, 'p97': 18.9, 'p99': 19.9, 'p999': 20.0, 'p01': 12.0, 'p10': 13.8, 'p90': 17.8},
-        "88": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.2, 'p25': 14.7, 'p50': 15.6, 'p75': 16.6, 'p85': 17.2, 'p95': 18.4, 'p97': 18.9, 'p99': 19.9, 'p999': 20.0, 'p01': 12.0, 'p10': 13.9, 'p90': 17.8},
-        "89": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.2, 'p25': 14.7, 'p50': 15.6, 'p75': 16.6, 'p85': 17.3, 'p95': 18.5, 'p97': 19.0, 'p99': 20.0, 'p999': 20.1, 'p01': 12.0, 'p10': 13.9, 'p90': 17.9},
-        "90": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.6, 'p75': 16.7, 'p85': 17.3, 'p95': 18.5, 'p97': 19.0, 'p99': 20.1, 'p999': 20.2, 'p01': 12.0, 'p10': 13.9, 'p90': 17.9},
-        "91": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.6, 'p75': 16.7, 'p85': 17.3, 'p95': 18.6, 'p97': 19.1, 'p99': 20.1, 'p999': 20.2, 'p01': 12.0, 'p10': 13.9, 'p90': 18.0},
-        "92": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.6, 'p75': 16.7, 'p85': 17.4, 'p95': 18.6, 'p97': 19.2, 'p99': 20.2, 'p999': 20.3, 'p01': 12.0, 'p10': 13.9, 'p90': 18.0},
-        "93": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.7, 'p75': 16.7, 'p85': 17.4, 'p95': 18.7, 'p97': 19.2, 'p99': 20.3, 'p999': 20.4, 'p01': 12.0, 'p10': 13.9, 'p90': 18.0},
-        "94": {'p1': 13.0, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.8, 'p50': 15.7, 'p75': 16.8, 'p85': 17.4, 'p95': 18.7, 'p97': 19.3, 'p99': 20.3, 'p999': 20.4, 'p01': 12.1, 'p10': 13.9, 'p90': 18.0},
-        "95": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.3, 'p25': 14.8, 'p50': 15.7, 'p75': 16.8, 'p85': 17.5, 'p95': 18.8, 'p97': 19.3, 'p99': 20.4, 'p999': 20.5, 'p01': 12.1, 'p10': 14.0, 'p90': 18.1},
-        "96": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.7, 'p75': 16.8, 'p85': 17.5, 'p95': 18.8, 'p97': 19.4, 'p99': 20.5, 'p999': 20.6, 'p01': 12.1, 'p10': 14.1, 'p90': 18.1},
-        "97": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.8, 'p75': 16.9, 'p85': 17.5, 'p95': 18.9, 'p97': 19.4, 'p99': 20.5, 'p999': 20.6, 'p01': 12.1, 'p10': 14.1, 'p90': 18.2},
-        "98": {'p1': 13.0, 'p3': 13.5, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.8, 'p75': 16.9, 'p85': 17.6, 'p95': 18.9, 'p97': 19.5, 'p99': 20.6, 'p999': 20.7, 'p01': 12.1, 'p10': 14.1, 'p90': 18.2},
-        "99": {'p1': 13.0, 'p3': 13.5, 'p5': 13.7, 'p15': 14.4, 'p25': 14.9, 'p50': 15.8, 'p75': 16.9, 'p85': 17.6, 'p95': 19.0, 'p97': 19.5, 'p99': 20.7, 'p999': 20.8, 'p01': 12.1, 'p10': 14.1, 'p90': 18.3},
-        "100": {'p1': 13.0, 'p3': 13.5, 'p5': 13.7, 'p15': 14.4, 'p25': 14.9, 'p50': 15.8, 'p75': 17.0, 'p85': 17.7, 'p95': 19.0, 'p97': 19.6, 'p99': 20.8, 'p999': 20.9, 'p01': 12.1, 'p10': 14.1, 'p90': 18.4},
-        "101": {'p1': 13.1, 'p3': 13.5, 'p5': 13.7, 'p15': 14.4, 'p25': 14.9, 'p50': 15.9, 'p75': 17.0, 'p85': 17.7, 'p95': 19.1, 'p97': 19.7, 'p99': 20.9, 'p999': 21.0, 'p01': 12.2, 'p10': 14.1, 'p90': 18.4},
-        "102": {'p1': 13.1, 'p3': 13.5, 'p5': 13.8, 'p15': 14.5, 'p25': 14.9, 'p50': 15.9, 'p75': 17.0, 'p85': 17.7, 'p95': 19.1, 'p97': 19.7, 'p99': 20.9, 'p999': 21.0, 'p01': 12.2, 'p10': 14.2, 'p90': 18.4},
-        "103": {'p1': 13.1, 'p3': 13.5, 'p5': 13.8, 'p15': 14.5, 'p25': 14.9, 'p50': 15.9, 'p75': 17.1, 'p85': 17.8, 'p95': 19.2, 'p97': 19.8, 'p99': 21.0, 'p999': 21.1, 'p01': 12.2, 'p10': 14.2, 'p90': 18.5},
-        "104": {'p1': 13.1, 'p3': 13.5, 'p5': 13.8, 'p15': 14.5, 'p25': 15.0, 'p50': 15.9, 'p75': 17.1, 'p85': 17.8, 'p95': 19.2, 'p97': 19.9, 'p99': 21.1, 'p999': 21.2, 'p01': 12.2, 'p10': 14.2, 'p90': 18.5},
-        "105": {'p1': 13.1, 'p3': 13.6, 'p5': 13.8, 'p15': 14.5, 'p25': 15.0, 'p50': 16.0, 'p75': 17.1, 'p85': 17.9, 'p95': 19.3, 'p97': 19.9, 'p99': 21.2, 'p999': 21.3, 'p01': 12.2, 'p10': 14.2, 'p90': 18.6},
-        "106": {'p1': 13.1, 'p3': 13.6, 'p5': 13.8, 'p15': 14.5, 'p25': 15.0, 'p50': 16.0, 'p75': 17.2, 'p85': 17.9, 'p95': 19.3, 'p97': 20.0, 'p99': 21.3, 'p999': 21.4, 'p01': 12.2, 'p10': 14.2, 'p90': 18.6},
-        "107": {'p1': 13.2, 'p3': 13.6, 'p5': 13.8, 'p15': 14.6, 'p25': 15.0, 'p50': 16.0, 'p75': 17.2, 'p85': 17.9, 'p95': 19.4, 'p97': 20.0, 'p99': 21.3, 'p999': 21.4, 'p01': 12.3, 'p10': 14.2, 'p90': 18.6},
-        "108": {'p1': 13.2, 'p3': 13.6, 'p5': 13.9, 'p15': 14.6, 'p25': 15.1, 'p50': 16.0, 'p75': 17.2, 'p85': 18.0, 'p95': 19.5, 'p97': 20.1, 'p99': 21.4, 'p999': 21.5, 'p01': 12.3, 'p10': 14.2, 'p90': 18.8},
-        "109": {'p1': 13.2, 'p3': 13.6, 'p5': 13.9, 'p15': 14.6, 'p25': 15.1, 'p50': 16.1, 'p75': 17.3, 'p85': 18.0, 'p95': 19.5, 'p97': 20.2, 'p99': 21.5, 'p999': 21.6, 'p01': 12.3, 'p10': 14.2, 'p90': 18.8},
-        "110": {'p1': 13.2, 'p3': 13.7, 'p5': 13.9, 'p15': 14.6, 'p25': 15.1, 'p50': 16.1, 'p75': 17.3, 'p85': 18.1, 'p95': 19.6, 'p97': 20.2, 'p99': 21.6, 'p999': 21.7, 'p01': 12.3, 'p10': 14.2, 'p90': 18.9},
-        "111": {'p1': 13.2, 'p3': 13.7, 'p5': 13.9, 'p15': 14.6, 'p25': 15.1, 'p50': 16.1, 'p75': 17.4, 'p85': 18.1, 'p95': 19.6, 'p97': 20.3, 'p99': 21.7, 'p999': 21.8, 'p01': 12.3, 'p10': 14.2, 'p90': 18.9},
-        "112": {'p1': 13.2, 'p3': 13.7, 'p5': 13.9, 'p15': 14.7, 'p25': 15.1, 'p50': 16.2, 'p75': 17.4, 'p85': 18.2, 'p95': 19.7, 'p97': 20.4, 'p99': 21.8, 'p999': 21.9, 'p01': 12.3, 'p10': 14.3, 'p90': 18.9},
-        "113": {'p1': 13.3, 'p3': 13.7, 'p5': 14.0, 'p15': 14.7, 'p25': 15.2, 'p50': 16.2, 'p75': 17.4, 'p85': 18.2, 'p95': 19.8, 'p97': 20.5, 'p99': 21.9, 'p999': 22.0, 'p01': 12.4, 'p10': 14.3, 'p90': 19.0},
-        "114": {'p1': 13.3, 'p3': 13.7, 'p5': 14.0, 'p15': 14.7, 'p25': 15.2, 'p50': 16.2, 'p75': 17.5, 'p85': 18.3, 'p95': 19.8, 'p97': 20.5, 'p99': 22.0, 'p999': 22.1, 'p01': 12.4, 'p10': 14.3, 'p90': 19.1},
-        "115": {'p1': 13.3, 'p3': 13.8, 'p5': 14.0, 'p15': 14.7, 'p25': 15.2, 'p50': 16.3, 'p75': 17.5, 'p85': 18.3, 'p95': 19.9, 'p97': 20.6, 'p99': 22.1, 'p999': 22.2, 'p01': 12.4, 'p10': 14.3, 'p90': 19.1},
-        "116": {'p1': 13.3, 'p3': 13.8, 'p5': 14.0, 'p15': 14.8, 'p25': 15.3, 'p50': 16.3, 'p75': 17.6, 'p85': 18.4, 'p95': 20.0, 'p97': 20.7, 'p99': 22.2, 'p999': 22.3, 'p01': 12.4, 'p10': 14.4, 'p90': 19.2},
-        "117": {'p1': 13.3, 'p3': 13.8, 'p5': 14.1, 'p15': 14.8, 'p25': 15.3, 'p50': 16.3, 'p75': 17.6, 'p85': 18.4, 'p95': 20.0, 'p97': 20.8, 'p99': 22.3, 'p999': 22.4, 'p01': 12.4, 'p10': 14.4, 'p90': 19.2},
-        "118": {'p1': 13.4, 'p3': 13.8, 'p5': 14.1, 'p15': 14.8, 'p25': 15.3, 'p50': 16.4, 'p75': 17.7, 'p85': 18.5, 'p95': 20.1, 'p97': 20.8, 'p99': 22.4, 'p999': 22.5, 'p01': 12.5, 'p10': 14.4, 'p90': 19.3},
-        "119": {'p1': 13.4, 'p3': 13.8, 'p5': 14.1, 'p15': 14.8, 'p25': 15.3, 'p50': 16.4, 'p75': 17.7, 'p85': 18.5, 'p95': 20.2, 'p97': 20.9, 'p99': 22.5, 'p999': 22.6, 'p01': 12.5, 'p10': 14.4, 'p90': 19.4},
-        "120": {'p1': 13.4, 'p3': 13.9, 'p5': 14.1, 'p15': 14.9, 'p25': 15.4, 'p50': 16.4, 'p75': 17.7, 'p85': 18.6, 'p95': 20.2, 'p97': 21.0, 'p99': 22.6, 'p999': 22.7, 'p01': 12.5, 'p10': 14.5, 'p90': 19.4},
-        "121": {'p1': 13.4, 'p3': 13.9, 'p5': 14.2, 'p15': 14.9, 'p25': 15.4, 'p50': 16.5, 'p75': 17.8, 'p85': 18.6, 'p95': 20.3, 'p97': 21.1, 'p99': 22.7, 'p999': 22.8, 'p01': 12.5, 'p10': 14.6, 'p90': 19.5},
-        "122": {'p1': 13.4, 'p3': 13.9, 'p5': 14.2, 'p15': 14.9, 'p25': 15.4, 'p50': 16.5, 'p75': 17.8, 'p85': 18.7, 'p95': 20.4, 'p97': 21.1, 'p99': 22.8, 'p999': 22.9, 'p01': 12.5, 'p10': 14.6, 'p90': 19.5},
-        "123": {'p1': 13.5, 'p3': 13.9, 'p5': 14.2, 'p15': 15.0, 'p25': 15.5, 'p50': 16.6, 'p75': 17.9, 'p85': 18.7, 'p95': 20.4, 'p97': 21.2, 'p99': 22.9, 'p999': 23.0, 'p01': 12.6, 'p10': 14.6, 'p90': 19.5},
-        "124": {'p1': 13.5, 'p3': 14.0, 'p5': 14.2, 'p15': 15.0, 'p25': 15.5, 'p50': 16.6, 'p75': 17.9, 'p85': 18.8, 'p95': 20.5, 'p97': 21.3, 'p99': 23.0, 'p999': 23.1, 'p01': 12.6, 'p10': 14.6, 'p90': 19.6},
-        "125": {'p1': 13.5, 'p3': 14.0, 'p5': 14.3, 'p15': 15.0, 'p25': 15.5, 'p50': 16.6, 'p75': 18.0, 'p85': 18.8, 'p95': 20.6, 'p97': 21.4, 'p99': 23.1, 'p999': 23.2, 'p01': 12.6, 'p10': 14.7, 'p90': 19.7},
-        "126": {'p1': 13.5, 'p3': 14.0, 'p5': 14.3, 'p15': 15.1, 'p25': 15.6, 'p50': 16.7, 'p75': 18.0, 'p85': 18.9, 'p95': 20.7, 'p97': 21.5, 'p99': 23.2, 'p999': 23.3, 'p01': 12.6, 'p10': 14.7, 'p90': 19.8},
-        "127": {'p1': 13.6, 'p3': 14.0, 'p5': 14.3, 'p15': 15.1, 'p25': 15.6, 'p50': 16.7, 'p75': 18.1, 'p85': 19.0, 'p95': 20.7, 'p97': 21.6, 'p99': 23.3, 'p999': 23.4, 'p01': 12.6, 'p10': 14.7, 'p90': 19.9},
-        "128": {'p1': 13.6, 'p3': 14.1, 'p5': 14.3, 'p15': 15.1, 'p25': 15.6, 'p50': 16.8, 'p75': 18.1, 'p85': 19.0, 'p95': 20.8, 'p97': 21.6, 'p99': 23.4, 'p999': 23.5, 'p01': 12.6, 'p10': 14.7, 'p90': 19.9},
-        "129": {'p1': 13.6, 'p3': 14.1, 'p5': 14.4, 'p15': 15.2, 'p25': 15.7, 'p50': 16.8, 'p75': 18.2, 'p85': 19.1, 'p95': 20.9, 'p97': 21.7, 'p99': 23.5, 'p999': 23.6, 'p01': 12.6, 'p10': 14.8, 'p90': 20.0},
-        "130": {'p1': 13.6, 'p3': 14.1, 'p5': 14.4, 'p15': 15.2, 'p25': 15.7, 'p50': 16.9, 'p75': 18.2, 'p85': 19.1, 'p95': 21.0, 'p97': 21.8, 'p99': 23.6, 'p999': 23.7, 'p01': 12.6, 'p10': 14.8, 'p90': 20.1},
-        "131": {'p1': 13.7, 'p3': 14.2, 'p5': 14.4, 'p15': 15.2, 'p25': 15.8, 'p50': 16.9, 'p75': 18.3, 'p85': 19.2, 'p95': 21.0, 'p97': 21.9, 'p99': 23.7, 'p999': 23.8, 'p01': 12.7, 'p10': 14.8, 'p90': 20.1},
-        "132": {'p1': 13.7, 'p3': 14.2, 'p5': 14.5, 'p15': 15.3, 'p25': 15.8, 'p50': 16.9, 'p75': 18.4, 'p85': 19.3, 'p95': 21.1, 'p97': 22.0, 'p99': 23.8, 'p999': 23.9, 'p01': 12.7, 'p10': 14.9, 'p90': 20.2},
-        "133": {'p1': 13.7, 'p3': 14.2, 'p5': 14.5, 'p15': 15.3, 'p25': 15.8, 'p50': 17.0, 'p75': 18.4, 'p85': 19.3, 'p95': 21.2, 'p97': 22.1, 'p99': 23.9, 'p999': 24.0, 'p01': 12.7, 'p10': 14.9, 'p90': 20.2},
-        "134": {'p1': 13.8, 'p3': 14.3, 'p5': 14.5, 'p15': 15.3, 'p25': 15.9, 'p50': 17.0, 'p75': 18.5, 'p85': 19.4, 'p95': 21.3, 'p97': 22.2, 'p99': 24.0, 'p999': 24.1, 'p01': 12.8, 'p10': 14.9, 'p90': 20.4},
-        "135": {'p1': 13.8, 'p3': 14.3, 'p5': 14.6, 'p15': 15.4, 'p25': 15.9, 'p50': 17.1, 'p75': 18.5, 'p85': 19.4, 'p95': 21.4, 'p97': 22.2, 'p99': 24.1, 'p999': 24.2, 'p01': 12.8, 'p10': 15.0, 'p90': 20.4},
-        "136": {'p1': 13.8, 'p3': 14.3, 'p5': 14.6, 'p15': 15.4, 'p25': 16.0, 'p50': 17.1, 'p75': 18.6, 'p85': 19.5, 'p95': 21.4, 'p97': 22.3, 'p99': 24.3, 'p999': 24.4, 'p01': 12.8, 'p10': 15.0, 'p90': 20.4},
-        "137": {'p1': 13.9, 'p3': 14.4, 'p5': 14.6, 'p15': 15.4, 'p25': 16.0, 'p50': 17.2, 'p75': 18.6, 'p85': 19.6, 'p95': 21.5, 'p97': 22.4, 'p99': 24.4, 'p999': 24.5, 'p01': 12.9, 'p10': 15.0, 'p90': 20.6},
-        "138": {'p1': 13.9, 'p3': 14.4, 'p5': 14.7, 'p15': 15.5, 'p25': 16.0, 'p50': 17.2, 'p75': 18.7, 'p85': 19.6, 'p95': 21.6, 'p97': 22.5, 'p99': 24.5, 'p999': 24.6, 'p01': 12.9, 'p10': 15.1, 'p90': 20.6},
-        "139": {'p1': 13.9, 'p3': 14.4, 'p5': 14.7, 'p15': 15.5, 'p25': 16.1, 'p50': 17.3, 'p75': 18.8, 'p85': 19.7, 'p95': 21.7, 'p97': 22.6, 'p99': 24.6, 'p999': 24.7, 'p01': 12.9, 'p10': 15.1, 'p90': 20.7},
-        "140": {'p1': 13.9, 'p3': 14.5, 'p5': 14.7, 'p15': 15.6, 'p25': 16.1, 'p50': 17.3, 'p75': 18.8, 'p85': 19.8, 'p95': 21.8, 'p97': 22.7, 'p99': 24.7, 'p999': 24.8, 'p01': 12.9, 'p10': 15.1, 'p90': 20.8},
-        "141": {'p1': 14.0, 'p3': 14.5, 'p5': 14.8, 'p15': 15.6, 'p25': 16.2, 'p50': 17.4, 'p75': 18.9, 'p85': 19.8, 'p95': 21.8, 'p97': 22.8, 'p99': 24.8, 'p999': 24.9, 'p01': 13.0, 'p10': 15.2, 'p90': 20.8},
-        "142": {'p1': 14.0, 'p3': 14.5, 'p5': 14.8, 'p15': 15.6, 'p25': 16.2, 'p50': 17.4, 'p75': 18.9, 'p85': 19.9, 'p95': 21.9, 'p97': 22.9, 'p99': 24.9, 'p999': 25.0, 'p01': 13.0, 'p10': 15.2, 'p90': 20.9},
-        "143": {'p1': 14.0, 'p3': 14.6, 'p5': 14.9, 'p15': 15.7, 'p25': 16.3, 'p50': 17.5, 'p75': 19.0, 'p85': 20.0, 'p95': 22.0, 'p97': 23.0, 'p99': 25.0, 'p999': 25.1, 'p01': 13.0, 'p10': 15.3, 'p90': 21.0},
-        "144": {'p1': 14.1, 'p3': 14.6, 'p5': 14.9, 'p15': 15.7, 'p25': 16.3, 'p50': 17.5, 'p75': 19.1, 'p85': 20.1, 'p95': 22.1, 'p97': 23.1, 'p99': 25.1, 'p999': 25.2, 'p01': 13.1, 'p10': 15.3, 'p90': 21.1},
-        "145": {'p1': 14.1, 'p3': 14.6, 'p5': 14.9, 'p15': 15.8, 'p25': 16.3, 'p50': 17.6, 'p75': 19.1, 'p85': 20.1, 'p95': 22.2, 'p97': 23.1, 'p99': 25.2, 'p999': 25.3, 'p01': 13.1, 'p10': 15.4, 'p90': 21.1},
-        "146": {'p1': 14.2, 'p3': 14.7, 'p5': 15.0, 'p15': 15.8, 'p25': 16.4, 'p50': 17.6, 'p75': 19.2, 'p85': 20.2, 'p95': 22.3, 'p97': 23.2, 'p99': 25.3, 'p999': 25.4, 'p01': 13.2, 'p10': 15.4, 'p90': 21.2},
-        "147": {'p1': 14.2, 'p3': 14.7, 'p5': 15.0, 'p15': 15.9, 'p25': 16.4, 'p50': 17.7, 'p75': 19.3, 'p85': 20.3, 'p95': 22.3, 'p97': 23.3, 'p99': 25.5, 'p999': 25.6, 'p01': 13.2, 'p10': 15.4, 'p90': 21.3},
-        "148": {'p1': 14.2, 'p3': 14.8, 'p5': 15.1, 'p15': 15.9, 'p25': 16.5, 'p50': 17.8, 'p75': 19.3, 'p85': 20.3, 'p95': 22.4, 'p97': 23.4, 'p99': 25.6, 'p999': 25.7, 'p01': 13.2, 'p10': 15.5, 'p90': 21.4},
-        "149": {'p1': 14.3, 'p3': 14.8, 'p5': 15.1, 'p15': 16.0, 'p25': 16.5, 'p50': 17.8, 'p75': 19.4, 'p85': 20.4, 'p95': 22.5, 'p97': 23.5, 'p99': 25.7, 'p999': 25.8, 'p01': 13.3, 'p10': 15.6, 'p90': 21.4},
-        "150": {'p1': 14.3, 'p3': 14.8, 'p5': 15.1, 'p15': 16.0, 'p25': 16.6, 'p50': 17.9, 'p75': 19.5, 'p85': 20.5, 'p95': 22.6, 'p97': 23.6, 'p99': 25.8, 'p999': 25.9, 'p01': 13.3, 'p10': 15.6, 'p90': 21.6},
-        "151": {'p1': 14.3, 'p3': 14.9, 'p5': 15.2, 'p15': 16.1, 'p25': 16.6, 'p50': 17.9, 'p75': 19.5, 'p85': 20.6, 'p95': 22.7, 'p97': 23.7, 'p99': 25.9, 'p999': 26.0, 'p01': 13.3, 'p10': 15.7, 'p90': 21.6},
-        "152": {'p1': 14.4, 'p3': 14.9, 'p5': 15.2, 'p15': 16.1, 'p25': 16.7, 'p50': 18.0, 'p75': 19.6, 'p85': 20.6, 'p95': 22.8, 'p97': 23.8, 'p99': 26.0, 'p999': 26.1, 'p01': 13.4, 'p10': 15.7, 'p90': 21.7},
-        "153": {'p1': 14.4, 'p3': 15.0, 'p5': 15.3, 'p15': 16.2, 'p25': 16.8, 'p50': 18.0, 'p75': 19.7, 'p85': 20.7, 'p95': 22.9, 'p97': 23.9, 'p99': 26.1, 'p999': 26.2, 'p01': 13.4, 'p10': 15.8, 'p90': 21.8},
-        "154": {'p1': 14.5, 'p3': 15.0, 'p5': 15.3, 'p15': 16.2, 'p25': 16.8, 'p50': 18.1, 'p75': 19.7, 'p85': 20.8, 'p95': 23.0, 'p97': 24.0, 'p99': 26.2, 'p999': 26.3, 'p01': 13.5, 'p10': 15.8, 'p90': 21.9},
-        "155": {'p1': 14.5, 'p3': 15.0, 'p5': 15.4, 'p15': 16.3, 'p25': 16.9, 'p50': 18.2, 'p75': 19.8, 'p85': 20.9, 'p95': 23.1, 'p97': 24.1, 'p99': 26.3, 'p999': 26.4, 'p01': 13.5, 'p10': 15.9, 'p90': 22.0},
-        "156": {'p1': 14.5, 'p3': 15.1, 'p5': 15.4, 'p15': 16.3, 'p25': 16.9, 'p50': 18.2, 'p75': 19.9, 'p85': 20.9, 'p95': 23.1, 'p97': 24.2, 'p99': 26.4, 'p999': 26.5, 'p01': 13.5, 'p10': 15.9, 'p90': 22.0},
-        "157": {'p1': 14.6, 'p3': 15.1, 'p5': 15.4, 'p15': 16.4, 'p25': 17.0, 'p50': 18.3, 'p75': 19.9, 'p85': 21.0, 'p95': 23.2, 'p97': 24.3, 'p99': 26.6, 'p999': 26.7, 'p01': 13.6, 'p10': 15.9, 'p90': 22.1},
-        "158": {'p1': 14.6, 'p3': 15.2, 'p5': 15.5, 'p15': 16.4, 'p25': 17.0, 'p50': 18.4, 'p75': 20.0, 'p85': 21.1, 'p95': 23.3, 'p97': 24.4, 'p99': 26.7, 'p999': 26.8, 'p01': 13.6, 'p10': 15.9, 'p90': 22.2},
-        "159": {'p1': 14.7, 'p3': 15.2, 'p5': 15.5, 'p15': 16.5, 'p25': 17.1, 'p50': 18.4, 'p75': 20.1, 'p85': 21.2, 'p95': 23.4, 'p97': 24.5, 'p99': 26.8, 'p999': 26.9, 'p01': 13.7, 'p10': 16.0, 'p90': 22.3},
-        "160": {'p1': 14.7, 'p3': 15.3, 'p5': 15.6, 'p15': 16.5, 'p25': 17.1, 'p50': 18.5, 'p75': 20.2, 'p85': 21.3, 'p95': 23.5, 'p97': 24.6, 'p99': 26.9, 'p999': 27.0, 'p01': 13.7, 'p10': 16.1, 'p90': 22.4},
-        "161": {'p1': 14.7, 'p3': 15.3, 'p5': 15.6, 'p15': 16.6, 'p25': 17.2, 'p50': 18.6, 'p75': 20.2, 'p85': 21.3, 'p95': 23.6, 'p97': 24.7, 'p99': 27.0, 'p999': 27.1, 'p01': 13.7, 'p10': 16.1, 'p90': 22.5},
-        "162": {'p1': 14.8, 'p3': 15.4, 'p5': 15.7, 'p15': 16.6, 'p25': 17.2, 'p50': 18.6, 'p75': 20.3, 'p85': 21.4, 'p95': 23.7, 'p97': 24.8, 'p99': 27.1, 'p999': 27.2, 'p01': 13.8, 'p10': 16.1, 'p90': 22.5},
-        "163": {'p1': 14.8, 'p3': 15.4, 'p5': 15.7, 'p15': 16.7, 'p25': 17.3, 'p50': 18.7, 'p75': 20.4, 'p85': 21.5, 'p95': 23.8, 'p97': 24.9, 'p99': 27.2, 'p999': 27.3, 'p01': 13.8, 'p10': 16.2, 'p90': 22.6},
-        "164": {'p1': 14.9, 'p3': 15.5, 'p5': 15.8, 'p15': 16.7, 'p25': 17.4, 'p50': 18.7, 'p75': 20.5, 'p85': 21.6, 'p95': 23.9, 'p97': 24.9, 'p99': 27.3, 'p999': 27.4, 'p01': 13.9, 'p10': 16.2, 'p90': 22.8},
-        "165": {'p1': 14.9, 'p3': 15.5, 'p5': 15.8, 'p15': 16.8, 'p25': 17.4, 'p50': 18.8, 'p75': 20.5, 'p85': 21.7, 'p95': 24.0, 'p97': 25.0, 'p99': 27.4, 'p999': 27.5, 'p01': 13.9, 'p10': 16.3, 'p90': 22.9},
-        "166": {'p1': 15.0, 'p3': 15.5, 'p5': 15.9, 'p15': 16.8, 'p25': 17.5, 'p50': 18.9, 'p75': 20.6, 'p85': 21.7, 'p95': 24.0, 'p97': 25.1, 'p99': 27.5, 'p999': 27.6, 'p01': 14.0, 'p10': 16.4, 'p90': 22.9},
-        "167": {'p1': 15.0, 'p3': 15.6, 'p5': 15.9, 'p15': 16.9, 'p25': 17.5, 'p50': 18.9, 'p75': 20.7, 'p85': 21.8, 'p95': 24.1, 'p97': 25.2, 'p99': 27.6, 'p999': 27.7, 'p01': 14.0, 'p10': 16.4, 'p90': 23.0},
-        "168": {'p1': 15.1, 'p3': 15.6, 'p5': 16.0, 'p15': 16.9, 'p25': 17.6, 'p50': 19.0, 'p75': 20.8, 'p85': 21.9, 'p95': 24.2, 'p97': 25.3, 'p99': 27.7, 'p999': 27.8, 'p01': 14.0, 'p10': 16.4, 'p90': 23.0},
-        "169": {'p1': 15.1, 'p3': 15.7, 'p5': 16.0, 'p15': 17.0, 'p25': 17.7, 'p50': 19.1, 'p75': 20.8, 'p85': 22.0, 'p95': 24.3, 'p97': 25.4, 'p99': 27.8, 'p999': 27.9, 'p01': 14.0, 'p10': 16.5, 'p90': 23.1},
-        "170": {'p1': 15.1, 'p3': 15.7, 'p5': 16.1, 'p15': 17.0, 'p25': 17.7, 'p50': 19.1, 'p75': 20.9, 'p85': 22.0, 'p95': 24.4, 'p97': 25.5, 'p99': 27.9, 'p999': 28.0, 'p01': 14.0, 'p10': 16.6, 'p90': 23.2},
-        "171": {'p1': 15.2, 'p3': 15.8, 'p5': 16.1, 'p15': 17.1, 'p25': 17.8, 'p50': 19.2, 'p75': 21.0, 'p85': 22.1, 'p95': 24.5, 'p97': 25.6, 'p99': 28.0, 'p999': 28.1, 'p01': 14.1, 'p10': 16.6, 'p90': 23.3},
-        "172": {'p1': 15.2, 'p3': 15.8, 'p5': 16.2, 'p15': 17.2, 'p25': 17.8, 'p50': 19.3, 'p75': 21.1, 'p85': 22.2, 'p95': 24.6, 'p97': 25.7, 'p99': 28.1, 'p999': 28.2, 'p01': 14.1, 'p10': 16.7, 'p90': 23.4},
-        "173": {'p1': 15.3, 'p3': 15.9, 'p5': 16.2, 'p15': 17.2, 'p25': 17.9, 'p50': 19.3, 'p75': 21.1, 'p85': 22.3, 'p95': 24.7, 'p97': 25.8, 'p99': 28.2, 'p999': 28.3, 'p01': 14.2, 'p10': 16.7, 'p90': 23.5},
-        "174": {'p1': 15.3, 'p3': 15.9, 'p5': 16.3, 'p15': 17.3, 'p25': 17.9, 'p50': 19.4, 'p75': 21.2, 'p85': 22.4, 'p95': 24.7, 'p97': 25.8, 'p99': 28.3, 'p999': 28.3, 'p01': 14.2, 'p10': 16.8, 'p90': 23.5},
-        "175": {'p1': 15.3, 'p3': 16.0, 'p5': 16.3, 'p15': 17.3, 'p25': 18.0, 'p50': 19.5, 'p75': 21.3, 'p85': 22.4, 'p95': 24.8, 'p97': 25.9, 'p99': 28.3, 'p999': 28.4, 'p01': 14.2, 'p10': 16.8, 'p90': 23.6},
-        "176": {'p1': 15.4, 'p3': 16.0, 'p5': 16.4, 'p15': 17.4, 'p25': 18.1, 'p50': 19.5, 'p75': 21.3, 'p85': 22.5, 'p95': 24.9, 'p97': 26.0, 'p99': 28.4, 'p999': 28.5, 'p01': 14.3, 'p10': 16.9, 'p90': 23.7},
-        "177": {'p1': 15.4, 'p3': 16.1, 'p5': 16.4, 'p15': 17.4, 'p25': 18.1, 'p50': 19.6, 'p75': 21.4, 'p85': 22.6, 'p95': 25.0, 'p97': 26.1, 'p99': 28.5, 'p999': 28.6, 'p01': 14.3, 'p10': 16.9, 'p90': 23.8},
-        "178": {'p1': 15.5, 'p3': 16.1, 'p5': 16.5, 'p15': 17.5, 'p25': 18.2, 'p50': 19.6, 'p75': 21.5, 'p85': 22.7, 'p95': 25.1, 'p97': 26.2, 'p99': 28.6, 'p999': 28.7, 'p01': 14.4, 'p10': 17.0, 'p90': 23.9},
-        "179": {'p1': 15.5, 'p3': 16.1, 'p5': 16.5, 'p15': 17.5, 'p25': 18.2, 'p50': 19.7, 'p75': 21.6, 'p85': 22.7, 'p95': 25.1, 'p97': 26.3, 'p99': 28.7, 'p999': 28.8, 'p01': 14.4, 'p10': 17.0, 'p90': 23.9},
-        "180": {'p1': 15.6, 'p3': 16.2, 'p5': 16.5, 'p15': 17.6, 'p25': 18.3, 'p50': 19.8, 'p75': 21.6, 'p85': 22.8, 'p95': 25.2, 'p97': 26.4, 'p99': 28.8, 'p999': 28.9, 'p01': 14.5, 'p10': 17.1, 'p90': 24.0},
-        "181": {'p1': 15.6, 'p3': 16.2, 'p5': 16.6, 'p15': 17.6, 'p25': 18.3, 'p50': 19.8, 'p75': 21.7, 'p85': 22.9, 'p95': 25.3, 'p97': 26.4, 'p99': 28.8, 'p999': 28.9, 'p01': 14.5, 'p10': 17.1, 'p90': 24.1},
-        "182": {'p1': 15.6, 'p3': 16.3, 'p5': 16.6, 'p15': 17.7, 'p25': 18.4, 'p50': 19.9, 'p75': 21.8, 'p85': 23.0, 'p95': 25.4, 'p97': 26.5, 'p99': 28.9, 'p999': 29.0, 'p01': 14.5, 'p10': 17.1, 'p90': 24.2},
-        "183": {'p1': 15.7, 'p3': 16.3, 'p5': 16.7, 'p15': 17.7, 'p25': 18.4, 'p50': 20.0, 'p75': 21.8, 'p85': 23.0, 'p95': 25.5, 'p97': 26.6, 'p99': 29.0, 'p999': 29.1, 'p01': 14.6, 'p10': 17.2, 'p90': 24.2},
-        "184": {'p1': 15.7, 'p3': 16.4, 'p5': 16.7, 'p15': 17.8, 'p25': 18.5, 'p50': 20.0, 'p75': 21.9, 'p85': 23.1, 'p95': 25.5, 'p97': 26.7, 'p99': 29.1, 'p999': 29.2, 'p01': 14.6, 'p10': 17.2, 'p90': 24.3},
-        "185": {'p1': 15.8, 'p3': 16.4, 'p5': 16.8, 'p15': 17.8, 'p25': 18.5, 'p50': 20.1, 'p75': 22.0, 'p85': 23.2, 'p95': 25.6, 'p97': 26.7, 'p99': 29.2, 'p999': 29.3, 'p01': 14.7, 'p10': 17.3, 'p90': 24.4},
-        "186": {'p1': 15.8, 'p3': 16.4, 'p5': 16.8, 'p15': 17.9, 'p25': 18.6, 'p50': 20.1, 'p75': 22.0, 'p85': 23.2, 'p95': 25.7, 'p97': 26.8, 'p99': 29.3, 'p999': 29.3, 'p01': 14.7, 'p10': 17.4, 'p90': 24.4},
-        "187": {'p1': 15.8, 'p3': 16.5, 'p5': 16.9, 'p15': 17.9, 'p25': 18.7, 'p50': 20.2, 'p75': 22.1, 'p85': 23.3, 'p95': 25.8, 'p97': 26.9, 'p99': 29.4, 'p999': 29.4, 'p01': 14.7, 'p10': 17.4, 'p90': 24.6},
-        "188": {'p1': 15.9, 'p3': 16.5, 'p5': 16.9, 'p15': 18.0, 'p25': 18.7, 'p50': 20.3, 'p75': 22.2, 'p85': 23.4, 'p95': 25.8, 'p97': 27.0, 'p99': 29.4, 'p999': 29.5, 'p01': 14.8, 'p10': 17.4, 'p90': 24.6},
-        "189": {'p1': 15.9, 'p3': 16.6, 'p5': 17.0, 'p15': 18.0, 'p25': 18.8, 'p50': 20.3, 'p75': 22.2, 'p85': 23.5, 'p95': 25.9, 'p97': 27.0, 'p99': 29.4, 'p999': 29.5, 'p01': 14.8, 'p10': 17.5, 'p90': 24.7},
-        "190": {'p1': 15.9, 'p3': 16.6, 'p5': 17.0, 'p15': 18.1, 'p25': 18.8, 'p50': 20.4, 'p75': 22.3, 'p85': 23.5, 'p95': 26.0, 'p97': 27.1, 'p99': 29.5, 'p999': 29.6, 'p01': 14.8, 'p10': 17.6, 'p90': 24.8},
-        "191": {'p1': 16.0, 'p3': 16.7, 'p5': 17.0, 'p15': 18.1, 'p25': 18.9, 'p50': 20.4, 'p75': 22.4, 'p85': 23.6, 'p95': 26.1, 'p97': 27.2, 'p99': 29.6, 'p999': 29.7, 'p01': 14.9, 'p10': 17.6, 'p90': 24.9},
-        "192": {'p1': 16.0, 'p3': 16.7, 'p5': 17.1, 'p15': 18.2, 'p25': 18.9, 'p50': 20.5, 'p75': 22.4, 'p85': 23.7, 'p95': 26.1, 'p97': 27.3, 'p99': 29.6, 'p999': 29.7, 'p01': 14.9, 'p10': 17.6, 'p90': 24.9},
-        "193": {'p1': 16.1, 'p3': 16.7, 'p5': 17.1, 'p15': 18.2, 'p25': 19.0, 'p50': 20.6, 'p75': 22.5, 'p85': 23.7, 'p95': 26.2, 'p97': 27.3, 'p99': 29.7, 'p999': 29.8, 'p01': 15.0, 'p10': 17.6, 'p90': 24.9},
-        "194": {'p1': 16.1, 'p3': 16.8, 'p5': 17.2, 'p15': 18.3, 'p25': 19.0, 'p50': 20.6, 'p75': 22.6, 'p85': 23.8, 'p95': 26.3, 'p97': 27.4, 'p99': 29.8, 'p999': 29.9, 'p01': 15.0, 'p10': 17.8, 'p90': 25.1},
-        "195": {'p1': 16.1, 'p3': 16.8, 'p5': 17.2, 'p15': 18.3, 'p25': 19.1, 'p50': 20.7, 'p75': 22.6, 'p85': 23.9, 'p95': 26.3, 'p97': 27.5, 'p99': 29.8, 'p999': 29.9, 'p01': 15.0, 'p10': 17.8, 'p90': 25.1},
-        "196": {'p1': 16.2, 'p3': 16.8, 'p5': 17.2, 'p15': 18.4, 'p25': 19.1, 'p50': 20.7, 'p75': 22.7, 'p85': 23.9, 'p95': 26.4, 'p97': 27.5, 'p99': 29.9, 'p999': 30.0, 'p01': 15.1, 'p10': 17.8, 'p90': 25.1},
-        "197": {'p1': 16.2, 'p3': 16.9, 'p5': 17.3, 'p15': 18.4, 'p25': 19.2, 'p50': 20.8, 'p75': 22.7, 'p85': 24.0, 'p95': 26.5, 'p97': 27.6, 'p99': 30.0, 'p999': 30.1, 'p01': 15.1, 'p10': 17.9, 'p90': 25.2},
-        "198": {'p1': 16.2, 'p3': 16.9, 'p5': 17.3, 'p15': 18.5, 'p25': 19.2, 'p50': 20.8, 'p75': 22.8, 'p85': 24.0, 'p95': 26.5, 'p97': 27.7, 'p99': 30.0, 'p999': 30.1, 'p01': 15.1, 'p10': 17.9, 'p90': 25.2},
-        "199": {'p1': 16.3, 'p3': 17.0, 'p5': 17.4, 'p15': 18.5, 'p25': 19.3, 'p50': 20.9, 'p75': 22.9, 'p85': 24.1, 'p95': 26.6, 'p97': 27.7, 'p99': 30.1, 'p999': 30.2, 'p01': 15.2, 'p10': 17.9, 'p90': 25.4},
-        "200": {'p1': 16.3, 'p3': 17.0, 'p5': 17.4, 'p15': 18.5, 'p25': 19.3, 'p50': 20.9, 'p75': 22.9, 'p85': 24.2, 'p95': 26.7, 'p97': 27.8, 'p99': 30.1, 'p999': 30.2, 'p01': 15.2, 'p10': 17.9, 'p90': 25.4},
-        "201": {'p1': 16.3, 'p3': 17.0, 'p5': 17.4, 'p15': 18.6, 'p25': 19.3, 'p50': 21.0, 'p75': 23.0, 'p85': 24.2, 'p95': 26.7, 'p97': 27.8, 'p99': 30.2, 'p999': 30.3, 'p01': 15.2, 'p10': 18.0, 'p90': 25.4},
-        "202": {'p1': 16.4, 'p3': 17.1, 'p5': 17.5, 'p15': 18.6, 'p25': 19.4, 'p50': 21.0, 'p75': 23.0, 'p85': 24.3, 'p95': 26.8, 'p97': 27.9, 'p99': 30.3, 'p999': 30.4, 'p01': 15.3, 'p10': 18.1, 'p90': 25.6},
-        "203": {'p1': 16.4, 'p3': 17.1, 'p5': 17.5, 'p15': 18.7, 'p25': 19.4, 'p50': 21.1, 'p75': 23.1, 'p85': 24.4, 'p95': 26.9, 'p97': 28.0, 'p99': 30.4, 'p999': 30.5, 'p01': 15.3, 'p10': 18.1, 'p90': 25.6},
-        "204": {'p1': 16.4, 'p3': 17.1, 'p5': 17.5, 'p15': 18.7, 'p25': 19.5, 'p50': 21.1, 'p75': 23.1, 'p85': 24.4, 'p95': 26.9, 'p97': 28.0, 'p99': 30.4, 'p999': 30.5, 'p01': 15.3, 'p10': 18.1, 'p90': 25.6},
-        "205": {'p1': 16.4, 'p3': 17.2, 'p5': 17.6, 'p15': 18.7, 'p25': 19.5, 'p50': 21.2, 'p75': 23.2, 'p85': 24.5, 'p95': 27.0, 'p97': 28.1, 'p99': 30.4, 'p999': 30.5, 'p01': 15.3, 'p10': 18.1, 'p90': 25.8},
-        "206": {'p1': 16.5, 'p3': 17.2, 'p5': 17.6, 'p15': 18.8, 'p25': 19.6, 'p50': 21.2, 'p75': 23.3, 'p85': 24.5, 'p95': 27.0, 'p97': 28.1, 'p99': 30.5, 'p999': 30.6, 'p01': 15.3, 'p10': 18.2, 'p90': 25.8},
-        "207": {'p1': 16.5, 'p3': 17.2, 'p5': 17.6, 'p15': 18.8, 'p25': 19.6, 'p50': 21.3, 'p75': 23.3, 'p85': 24.6, 'p95': 27.1, 'p97': 28.2, 'p99': 30.5, 'p999': 30.6, 'p01': 15.3, 'p10': 18.2, 'p90': 25.9},
-        "208": {'p1': 16.5, 'p3': 17.3, 'p5': 17.7, 'p15': 18.9, 'p25': 19.7, 'p50': 21.3, 'p75': 23.4, 'p85': 24.6, 'p95': 27.1, 'p97': 28.2, 'p99': 30.6, 'p999': 30.7, 'p01': 15.3, 'p10': 18.3, 'p90': 25.9},
-        "209": {'p1': 16.6, 'p3': 17.3, 'p5': 17.7, 'p15': 18.9, 'p25': 19.7, 'p50': 21.4, 'p75': 23.4, 'p85': 24.7, 'p95': 27.2, 'p97': 28.3, 'p99': 30.6, 'p999': 30.7, 'p01': 15.4, 'p10': 18.3, 'p90': 25.9},
-        "210": {'p1': 16.6, 'p3': 17.3, 'p5': 17.7, 'p15': 18.9, 'p25': 19.7, 'p50': 21.4, 'p75': 23.5, 'p85': 24.7, 'p95': 27.2, 'p97': 28.4, 'p99': 30.7, 'p999': 30.8, 'p01': 15.4, 'p10': 18.3, 'p90': 25.9},
-        "211": {'p1': 16.6, 'p3': 17.4, 'p5': 17.8, 'p15': 19.0, 'p25': 19.8, 'p50': 21.5, 'p75': 23.5, 'p85': 24.8, 'p95': 27.3, 'p97': 28.4, 'p99': 30.7, 'p999': 30.8, 'p01': 15.4, 'p10': 18.4, 'p90': 26.1},
-        "212": {'p1': 16.6, 'p3': 17.4, 'p5': 17.8, 'p15': 19.0, 'p25': 19.8, 'p50': 21.5, 'p75': 23.6, 'p85': 24.8, 'p95': 27.3, 'p97': 28.5, 'p99': 30.7, 'p999': 30.8, 'p01': 15.4, 'p10': 18.4, 'p90': 26.1},
-        "213": {'p1': 16.7, 'p3': 17.4, 'p5': 17.8, 'p15': 19.1, 'p25': 19.9, 'p50': 21.6, 'p75': 23.6, 'p85': 24.9, 'p95': 27.4, 'p97': 28.5, 'p99': 30.8, 'p999': 30.9, 'p01': 15.5, 'p10': 18.5, 'p90': 26.1},
-        "214": {'p1': 16.7, 'p3': 17.4, 'p5': 17.9, 'p15': 19.1, 'p25': 19.9, 'p50': 21.6, 'p75': 23.7, 'p85': 24.9, 'p95': 27.4, 'p97': 28.6, 'p99': 30.8, 'p999': 30.9, 'p01': 15.5, 'p10': 18.5, 'p90': 26.1},
-        "215": {'p1': 16.7, 'p3': 17.5, 'p5': 17.9, 'p15': 19.1, 'p25': 19.9, 'p50': 21.7, 'p75': 23.7, 'p85': 25.0, 'p95': 27.5, 'p97': 28.6, 'p99': 30.9, 'p999': 31.0, 'p01': 15.5, 'p10': 18.5, 'p90': 26.2},
-        "216": {'p1': 16.7, 'p3': 17.5, 'p5': 17.9, 'p15': 19.2, 'p25': 20.0, 'p50': 21.7, 'p75': 23.8, 'p85': 25.0, 'p95': 27.5, 'p97': 28.6, 'p99': 30.9, 'p999': 31.0, 'p01': 15.5, 'p10': 18.5, 'p90': 26.2},
-        "217": {'p1': 16.8, 'p3': 17.5, 'p5': 18.0, 'p15': 19.2, 'p25': 20.0, 'p50': 21.8, 'p75': 23.8, 'p85': 25.1, 'p95': 27.6, 'p97': 28.7, 'p99': 31.0, 'p999': 31.1, 'p01': 15.6, 'p10': 18.6, 'p90': 26.4},
-        "218": {'p1': 16.8, 'p3': 17.5, 'p5': 18.0, 'p15': 19.2, 'p25': 20.1, 'p50': 21.8, 'p75': 23.9, 'p85': 25.1, 'p95': 27.6, 'p97': 28.7, 'p99': 31.0, 'p999': 31.1, 'p01': 15.6, 'p10': 18.6, 'p90': 26.4},
-        "219": {'p1': 16.8, 'p3': 17.6, 'p5': 18.0, 'p15': 19.3, 'p25': 20.1, 'p50': 21.8, 'p75': 23.9, 'p85': 25.2, 'p95': 27.7, 'p97': 28.8, 'p99': 31.0, 'p999': 31.1, 'p01': 15.6, 'p10': 18.6, 'p90': 26.4},
-        "220": {'p1': 16.8, 'p3': 17.6, 'p5': 18.0, 'p15': 19.3, 'p25': 20.1, 'p50': 21.9, 'p75': 24.0, 'p85': 25.2, 'p95': 27.7, 'p97': 28.8, 'p99': 31.1, 'p999': 31.2, 'p01': 15.6, 'p10': 18.6, 'p90': 26.4},
-        "221": {'p1': 16.8, 'p3': 17.6, 'p5': 18.1, 'p15': 19.3, 'p25': 20.2, 'p50': 21.9, 'p75': 24.0, 'p85': 25.3, 'p95': 27.8, 'p97': 28.9, 'p99': 31.1, 'p999': 31.2, 'p01': 15.6, 'p10': 18.7, 'p90': 26.6},
-        "222": {'p1': 16.8, 'p3': 17.6, 'p5': 18.1, 'p15': 19.4, 'p25': 20.2, 'p50': 22.0, 'p75': 24.0, 'p85': 25.3, 'p95': 27.8, 'p97': 28.9, 'p99': 31.1, 'p999': 31.2, 'p01': 15.6, 'p10': 18.8, 'p90': 26.6},
-        "223": {'p1': 16.9, 'p3': 17.7, 'p5': 18.1, 'p15': 19.4, 'p25': 20.2, 'p50': 22.0, 'p75': 24.1, 'p85': 25.4, 'p95': 27.9, 'p97': 29.0, 'p99': 31.2, 'p999': 31.3, 'p01': 15.7, 'p10': 18.8, 'p90': 26.6},
-        "224": {'p1': 16.9, 'p3': 17.7, 'p5': 18.1, 'p15': 19.4, 'p25': 20.3, 'p50': 22.0, 'p75': 24.1, 'p85': 25.4, 'p95': 27.9, 'p97': 29.0, 'p99': 31.2, 'p999': 31.3, 'p01': 15.7, 'p10': 18.8, 'p90': 26.6},
-        "225": {'p1': 16.9, 'p3': 17.7, 'p5': 18.2, 'p15': 19.5, 'p25': 20.3, 'p50': 22.1, 'p75': 24.2, 'p85': 25.5, 'p95': 28.0, 'p97': 29.1, 'p99': 31.3, 'p999': 31.4, 'p01': 15.7, 'p10': 18.9, 'p90': 26.8},
-        "226": {'p1': 16.9, 'p3': 17.7, 'p5': 18.2, 'p15': 19.5, 'p25': 20.3, 'p50': 22.1, 'p75': 24.2, 'p85': 25.5, 'p95': 28.0, 'p97': 29.1, 'p99': 31.3, 'p999': 31.4, 'p01': 15.7, 'p10': 18.9, 'p90': 26.8},
-        "227": {'p1': 16.9, 'p3': 17.8, 'p5': 18.2, 'p15': 19.5, 'p25': 20.4, 'p50': 22.2, 'p75': 24.3, 'p85': 25.5, 'p95': 28.0, 'p97': 29.1, 'p99': 31.3, 'p999': 31.4, 'p01': 15.7, 'p10': 18.9, 'p90': 26.8},
-        "228": {'p1': 17.0, 'p3': 17.8, 'p5': 18.2, 'p15': 19.5, 'p25': 20.4, 'p50': 22.2, 'p75': 24.3, 'p85': 25.6, 'p95': 28.1, 'p97': 29.1, 'p99': 31.3, 'p999': 31.4, 'p01': 15.8, 'p10': 18.9, 'p90': 26.9},
-    },
-    "girl": {
-        "0": {'p1': 10.8, 'p3': 11.2, 'p5': 11.5, 'p15': 12.1, 'p25': 12.5, 'p50': 13.3, 'p75': 14.2, 'p85': 14.7, 'p95': 15.5, 'p97': 15.9, 'p99': 16.5, 'p999': 16.6, 'p01': 10.0, 'p10': 11.8, 'p90': 15.1},
-        "1": {'p1': 11.6, 'p3': 12.1, 'p5': 12.4, 'p15': 13.2, 'p25': 13.6, 'p50': 14.6, 'p75': 15.5, 'p85': 16.1, 'p95': 17.0, 'p97': 17.3, 'p99': 17.9, 'p999': 18.0, 'p01': 10.8, 'p10': 12.8, 'p90': 16.6},
-        "2": {'p1': 12.6, 'p3': 13.2, 'p5': 13.5, 'p15': 14.3, 'p25': 14.8, 'p50': 15.8, 'p75': 16.8, 'p85': 17.4, 'p95': 18.4, 'p97': 18.8, 'p99': 19.4, 'p999': 19.5, 'p01': 11.7, 'p10': 13.9, 'p90': 17.9},
-        "3": {'p1': 13.2, 'p3': 13.7, 'p5': 14.0, 'p15': 14.9, 'p25': 15.4, 'p50': 16.4, 'p75': 17.4, 'p85': 18.0, 'p95': 19.0, 'p97': 19.4, 'p99': 20.2, 'p999': 20.3, 'p01': 12.3, 'p10': 14.4, 'p90': 18.5},
-        "4": {'p1': 13.5, 'p3': 14.0, 'p5': 14.3, 'p15': 15.2, 'p25': 15.7, 'p50': 16.7, 'p75': 17.7, 'p85': 18.3, 'p95': 19.4, 'p97': 19.8, 'p99': 20.5, 'p999': 20.6, 'p01': 12.6, 'p10': 14.8, 'p90': 18.9},
-        "5": {'p1': 13.7, 'p3': 14.2, 'p5': 14.5, 'p15': 15.3, 'p25': 15.8, 'p50': 16.8, 'p75': 17.9, 'p85': 18.5, 'p95': 19.6, 'p97': 20.0, 'p99': 20.7, 'p999': 20.8, 'p01': 12.7, 'p10': 14.9, 'p90': 19.1},
-        "6": {'p1': 13.7, 'p3': 14.3, 'p5': 14.6, 'p15': 15.4, 'p25': 15.9, 'p50': 16.9, 'p75': 18.0, 'p85': 18.6, 'p95': 19.6, 'p97': 20.1, 'p99': 20.8, 'p999': 20.9, 'p01': 12.7, 'p10': 15.0, 'p90': 19.1},
-        "7": {'p1': 13.8, 'p3': 14.3, 'p5': 14.6, 'p15': 15.4, 'p25': 15.9, 'p50': 16.9, 'p75': 18.0, 'p85': 18.6, 'p95': 19.6, 'p97': 20.1, 'p99': 20.8, 'p999': 20.9, 'p01': 12.8, 'p10': 15.0, 'p90': 19.1},
-        "8": {'p1': 13.7, 'p3': 14.3, 'p5': 14.6, 'p15': 15.4, 'p25': 15.9, 'p50': 16.8, 'p75': 17.9, 'p85': 18.5, 'p95': 19.6, 'p97': 20.0, 'p99': 20.7, 'p999': 20.8, 'p01': 12.7, 'p10': 15.0, 'p90': 19.1},
-        "9": {'p1': 13.7, 'p3': 14.2, 'p5': 14.5, 'p15': 15.3, 'p25': 15.8, 'p50': 16.7, 'p75': 17.8, 'p85': 18.4, 'p95': 19.4, 'p97': 19.9, 'p99': 20.6, 'p999': 20.7, 'p01': 12.7, 'p10': 14.9, 'p90': 18.9},
-        "10": {'p1': 13.6, 'p3': 14.1, 'p5': 14.4, 'p15': 15.2, 'p25': 15.7, 'p50': 16.6, 'p75': 17.7, 'p85': 18.2, 'p95': 19.3, 'p97': 19.7, 'p99': 20.5, 'p999': 20.6, 'p01': 12.6, 'p10': 14.8, 'p90': 18.8},
-        "11": {'p1': 13.5, 'p3': 14.0, 'p5': 14.3, 'p15': 15.1, 'p25': 15.5, 'p50': 16.5, 'p75': 17.5, 'p85': 18.1, 'p95': 19.1, 'p97': 19.6, 'p99': 20.3, 'p999': 20.4, 'p01': 12.6, 'p10': 14.7, 'p90': 18.6},
-        "12": {'p1': 13.4, 'p3': 13.9, 'p5': 14.2, 'p15': 15.0, 'p25': 15.4, 'p50': 16.4, 'p75': 17.4, 'p85': 17.9, 'p95': 19.0, 'p97': 19.4, 'p99': 20.1, 'p999': 20.2, 'p01': 12.5, 'p10': 14.6, 'p90': 18.4},
-        "13": {'p1': 13.3, 'p3': 13.8, 'p5': 14.1, 'p15': 14.8, 'p25': 15.3, 'p50': 16.2, 'p75': 17.2, 'p85': 17.8, 'p95': 18.8, 'p97': 19.2, 'p99': 20.0, 'p999': 20.1, 'p01': 12.4, 'p10': 14.4, 'p90': 18.3},
-        "14": {'p1': 13.3, 'p3': 13.7, 'p5': 14.0, 'p15': 14.7, 'p25': 15.2, 'p50': 16.1, 'p75': 17.1, 'p85': 17.7, 'p95': 18.7, 'p97': 19.1, 'p99': 19.8, 'p999': 19.9, 'p01': 12.4, 'p10': 14.3, 'p90': 18.2},
-        "15": {'p1': 13.2, 'p3': 13.7, 'p5': 13.9, 'p15': 14.6, 'p25': 15.1, 'p50': 16.0, 'p75': 17.0, 'p85': 17.5, 'p95': 18.6, 'p97': 19.0, 'p99': 19.7, 'p999': 19.8, 'p01': 12.3, 'p10': 14.2, 'p90': 18.1},
-        "16": {'p1': 13.1, 'p3': 13.6, 'p5': 13.8, 'p15': 14.6, 'p25': 15.0, 'p50': 15.9, 'p75': 16.9, 'p85': 17.4, 'p95': 18.4, 'p97': 18.8, 'p99': 19.6, 'p999': 19.7, 'p01': 12.2, 'p10': 14.2, 'p90': 17.9},
-        "17": {'p1': 13.0, 'p3': 13.5, 'p5': 13.8, 'p15': 14.5, 'p25': 14.9, 'p50': 15.8, 'p75': 16.8, 'p85': 17.3, 'p95': 18.3, 'p97': 18.7, 'p99': 19.4, 'p999': 19.5, 'p01': 12.1, 'p10': 14.2, 'p90': 17.8},
-        "18": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.7, 'p75': 16.7, 'p85': 17.2, 'p95': 18.2, 'p97': 18.6, 'p99': 19.3, 'p999': 19.4, 'p01': 12.1, 'p10': 14.1, 'p90': 17.7},
-        "19": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.8, 'p50': 15.7, 'p75': 16.6, 'p85': 17.2, 'p95': 18.1, 'p97': 18.5, 'p99': 19.2, 'p999': 19.3, 'p01': 12.0, 'p10': 13.9, 'p90': 17.6},
-        "20": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.6, 'p75': 16.5, 'p85': 17.1, 'p95': 18.1, 'p97': 18.5, 'p99': 19.2, 'p999': 19.3, 'p01': 12.0, 'p10': 13.9, 'p90': 17.6},
-        "21": {'p1': 12.8, 'p3': 13.3, 'p5': 13.6, 'p15': 14.2, 'p25': 14.7, 'p50': 15.5, 'p75': 16.5, 'p85': 17.0, 'p95': 18.0, 'p97': 18.4, 'p99': 19.1, 'p999': 19.2, 'p01': 11.9, 'p10': 13.9, 'p90': 17.5},
-        "22": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.4, 'p85': 17.0, 'p95': 17.9, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "23": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.4, 'p75': 16.4, 'p85': 16.9, 'p95': 17.9, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "24": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.6, 'p50': 15.4, 'p75': 16.3, 'p85': 16.9, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "25": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.7, 'p75': 16.6, 'p85': 17.1, 'p95': 18.1, 'p97': 18.5, 'p99': 19.2, 'p999': 19.3, 'p01': 12.1, 'p10': 14.1, 'p90': 17.6},
-        "26": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.4, 'p25': 14.8, 'p50': 15.6, 'p75': 16.6, 'p85': 17.1, 'p95': 18.1, 'p97': 18.5, 'p99': 19.2, 'p999': 19.3, 'p01': 12.1, 'p10': 14.1, 'p90': 17.6},
-        "27": {'p1': 13.0, 'p3': 13.4, 'p5': 13.7, 'p15': 14.3, 'p25': 14.8, 'p50': 15.6, 'p75': 16.5, 'p85': 17.1, 'p95': 18.0, 'p97': 18.4, 'p99': 19.1, 'p999': 19.2, 'p01': 12.1, 'p10': 14.0, 'p90': 17.6},
-        "28": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.6, 'p75': 16.5, 'p85': 17.0, 'p95': 18.0, 'p97': 18.4, 'p99': 19.1, 'p999': 19.2, 'p01': 12.0, 'p10': 13.9, 'p90': 17.5},
-        "29": {'p1': 12.9, 'p3': 13.4, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.6, 'p75': 16.5, 'p85': 17.0, 'p95': 18.0, 'p97': 18.4, 'p99': 19.1, 'p999': 19.2, 'p01': 12.0, 'p10': 13.9, 'p90': 17.5},
-        "30": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.3, 'p25': 14.7, 'p50': 15.5, 'p75': 16.5, 'p85': 17.0, 'p95': 17.9, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 12.0, 'p10': 13.9, 'p90': 17.4},
-        "31": {'p1': 12.9, 'p3': 13.3, 'p5': 13.6, 'p15': 14.2, 'p25': 14.7, 'p50': 15.5, 'p75': 16.4, 'p85': 17.0, 'p95': 17.9, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 12.0, 'p10': 13.9, 'p90': 17.4},
-        "32": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.4, 'p85': 16.9, 'p95': 17.9, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "33": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.5, 'p75': 16.4, 'p85': 16.9, 'p95': 17.9, 'p97': 18.3, 'p99': 18.9, 'p999': 19.0, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "34": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.2, 'p25': 14.6, 'p50': 15.4, 'p75': 16.4, 'p85': 16.9, 'p95': 17.9, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "35": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.6, 'p50': 15.4, 'p75': 16.3, 'p85': 16.9, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "36": {'p1': 12.8, 'p3': 13.2, 'p5': 13.5, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.3, 'p85': 16.9, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.9, 'p10': 13.8, 'p90': 17.4},
-        "37": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.8, 'p90': 17.3},
-        "38": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.4, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.8, 'p90': 17.3},
-        "39": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.1, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.8, 'p90': 17.3},
-        "40": {'p1': 12.7, 'p3': 13.1, 'p5': 13.4, 'p15': 14.0, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.8, 'p10': 13.7, 'p90': 17.3},
-        "41": {'p1': 12.6, 'p3': 13.1, 'p5': 13.3, 'p15': 14.0, 'p25': 14.5, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.7, 'p10': 13.7, 'p90': 17.3},
-        "42": {'p1': 12.6, 'p3': 13.1, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 18.9, 'p999': 19.0, 'p01': 11.7, 'p10': 13.7, 'p90': 17.3},
-        "43": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 19.0, 'p999': 19.1, 'p01': 11.7, 'p10': 13.7, 'p90': 17.3},
-        "44": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.2, 'p99': 19.0, 'p999': 19.1, 'p01': 11.7, 'p10': 13.7, 'p90': 17.3},
-        "45": {'p1': 12.5, 'p3': 13.0, 'p5': 13.3, 'p15': 14.0, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.6, 'p10': 13.7, 'p90': 17.3},
-        "46": {'p1': 12.5, 'p3': 13.0, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.8, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.6, 'p10': 13.6, 'p90': 17.3},
-        "47": {'p1': 12.5, 'p3': 13.0, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.3, 'p99': 19.0, 'p999': 19.1, 'p01': 11.6, 'p10': 13.6, 'p90': 17.4},
-        "48": {'p1': 12.5, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.3, 'p99': 19.1, 'p999': 19.2, 'p01': 11.6, 'p10': 13.6, 'p90': 17.4},
-        "49": {'p1': 12.5, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.3, 'p99': 19.1, 'p999': 19.2, 'p01': 11.6, 'p10': 13.6, 'p90': 17.4},
-        "50": {'p1': 12.4, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.3, 'p99': 19.1, 'p999': 19.2, 'p01': 11.5, 'p10': 13.6, 'p90': 17.4},
-        "51": {'p1': 12.4, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.8, 'p95': 17.9, 'p97': 18.4, 'p99': 19.1, 'p999': 19.2, 'p01': 11.5, 'p10': 13.6, 'p90': 17.4},
-        "52": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 16.9, 'p95': 17.9, 'p97': 18.4, 'p99': 19.2, 'p999': 19.3, 'p01': 11.5, 'p10': 13.5, 'p90': 17.4},
-        "53": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 17.9, 'p97': 18.4, 'p99': 19.2, 'p999': 19.3, 'p01': 11.5, 'p10': 13.5, 'p90': 17.4},
-        "54": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.4, 'p99': 19.2, 'p999': 19.3, 'p01': 11.5, 'p10': 13.5, 'p90': 17.4},
-        "55": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.4, 'p99': 19.3, 'p999': 19.4, 'p01': 11.5, 'p10': 13.5, 'p90': 17.4},
-        "56": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.5, 'p99': 19.3, 'p999': 19.4, 'p01': 11.5, 'p10': 13.4, 'p90': 17.4},
-        "57": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.5, 'p99': 19.3, 'p999': 19.4, 'p01': 11.5, 'p10': 13.4, 'p90': 17.4},
-        "58": {'p1': 12.3, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 18.0, 'p97': 18.5, 'p99': 19.3, 'p999': 19.4, 'p01': 11.4, 'p10': 13.4, 'p90': 17.4},
-        "59": {'p1': 12.3, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 16.9, 'p95': 18.1, 'p97': 18.5, 'p99': 19.4, 'p999': 19.5, 'p01': 11.4, 'p10': 13.4, 'p90': 17.5},
-        "60": {'p1': 12.3, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.3, 'p85': 17.0, 'p95': 18.1, 'p97': 18.6, 'p99': 19.4, 'p999': 19.5, 'p01': 11.4, 'p10': 13.4, 'p90': 17.6},
-        "61": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 16.9, 'p95': 18.1, 'p97': 18.6, 'p99': 19.5, 'p999': 19.6, 'p01': 11.5, 'p10': 13.4, 'p90': 17.5},
-        "62": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 16.9, 'p95': 18.1, 'p97': 18.6, 'p99': 19.5, 'p999': 19.6, 'p01': 11.5, 'p10': 13.4, 'p90': 17.5},
-        "63": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 17.0, 'p95': 18.1, 'p97': 18.7, 'p99': 19.6, 'p999': 19.7, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "64": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 17.0, 'p95': 18.2, 'p97': 18.7, 'p99': 19.6, 'p999': 19.7, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "65": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 17.0, 'p95': 18.2, 'p97': 18.7, 'p99': 19.7, 'p999': 19.8, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "66": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 17.0, 'p95': 18.2, 'p97': 18.7, 'p99': 19.7, 'p999': 19.8, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "67": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.2, 'p75': 16.3, 'p85': 17.0, 'p95': 18.2, 'p97': 18.8, 'p99': 19.7, 'p999': 19.8, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "68": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.0, 'p95': 18.3, 'p97': 18.8, 'p99': 19.8, 'p999': 19.9, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "69": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.0, 'p95': 18.3, 'p97': 18.8, 'p99': 19.8, 'p999': 19.9, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "70": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.0, 'p95': 18.3, 'p97': 18.9, 'p99': 19.9, 'p999': 20.0, 'p01': 11.5, 'p10': 13.4, 'p90': 17.6},
-        "71": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.1, 'p95': 18.3, 'p97': 18.9, 'p99': 19.9, 'p999': 20.0, 'p01': 11.5, 'p10': 13.4, 'p90': 17.7},
-        "72": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.1, 'p95': 18.4, 'p97': 18.9, 'p99': 20.0, 'p999': 20.1, 'p01': 11.5, 'p10': 13.4, 'p90': 17.8},
-        "73": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.1, 'p95': 18.4, 'p97': 19.0, 'p99': 20.0, 'p999': 20.1, 'p01': 11.5, 'p10': 13.4, 'p90': 17.8},
-        "74": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.1, 'p95': 18.4, 'p97': 19.0, 'p99': 20.1, 'p999': 20.2, 'p01': 11.5, 'p10': 13.4, 'p90': 17.8},
-        "75": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.4, 'p85': 17.1, 'p95': 18.5, 'p97': 19.0, 'p99': 20.1, 'p999': 20.2, 'p01': 11.5, 'p10': 13.4, 'p90': 17.8},
-        "76": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.5, 'p85': 17.2, 'p95': 18.5, 'p97': 19.1, 'p99': 20.2, 'p999': 20.3, 'p01': 11.5, 'p10': 13.4, 'p90': 17.9},
-        "77": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.5, 'p85': 17.2, 'p95': 18.5, 'p97': 19.1, 'p99': 20.3, 'p999': 20.4, 'p01': 11.5, 'p10': 13.4, 'p90': 17.9},
-        "78": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.5, 'p85': 17.2, 'p95': 18.6, 'p97': 19.2, 'p99': 20.3, 'p999': 20.4, 'p01': 11.5, 'p10': 13.4, 'p90': 17.9},
-        "79": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.5, 'p85': 17.2, 'p95': 18.6, 'p97': 19.2, 'p99': 20.4, 'p999': 20.5, 'p01': 11.5, 'p10': 13.4, 'p90': 17.9},
-        "80": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.8, 'p25': 14.3, 'p50': 15.3, 'p75': 16.5, 'p85': 17.3, 'p95': 18.6, 'p97': 19.3, 'p99': 20.4, 'p999': 20.5, 'p01': 11.5, 'p10': 13.4, 'p90': 18.0},
-        "81": {'p1': 12.4, 'p3': 12.8, 'p5': 13.1, 'p15': 13.9, 'p25': 14.3, 'p50': 15.4, 'p75': 16.6, 'p85': 17.3, 'p95': 18.7, 'p97': 19.3, 'p99': 20.5, 'p999': 20.6, 'p01': 11.5, 'p10': 13.5, 'p90': 18.0},
-        "82": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.3, 'p50': 15.4, 'p75': 16.6, 'p85': 17.3, 'p95': 18.7, 'p97': 19.3, 'p99': 20.6, 'p999': 20.7, 'p01': 11.5, 'p10': 13.5, 'p90': 18.0},
-        "83": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.4, 'p50': 15.4, 'p75': 16.6, 'p85': 17.3, 'p95': 18.8, 'p97': 19.4, 'p99': 20.6, 'p999': 20.7, 'p01': 11.5, 'p10': 13.5, 'p90': 18.1},
-        "84": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.4, 'p50': 15.4, 'p75': 16.6, 'p85': 17.4, 'p95': 18.8, 'p97': 19.4, 'p99': 20.7, 'p999': 20.8, 'p01': 11.5, 'p10': 13.5, 'p90': 18.1},
-        "85": {'p1': 12.4, 'p3': 12.9, 'p5': 13.1, 'p15': 13.9, 'p25': 14.4, 'p50': 15.4, 'p75': 16.6, 'p85': 17.4, 'p95': 18.9, 'p97': 19.5, 'p99': 20.8, 'p999': 20.9, 'p01': 11.5, 'p10': 13.5, 'p90': 18.1},
-        "86": {'p1': 12.4, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.4, 'p75': 16.7, 'p85': 17.4, 'p95': 18.9, 'p97': 19.6, 'p99': 20.8, 'p999': 20.9, 'p01': 11.5, 'p10': 13.6, 'p90': 18.1},
-        "87": {'p1': 12.4, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.5, 'p75': 16.7, 'p85': 17.5, 'p95': 19.0, 'p97': 19.6, 'p99': 20.9, 'p999': 21.0, 'p01': 11.5, 'p10': 13.6, 'p90': 18.2},
-        "88": {'p1': 12.4, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.5, 'p75': 16.7, 'p85': 17.5, 'p95': 19.0, 'p97': 19.7, 'p99': 21.0, 'p999': 21.1, 'p01': 11.5, 'p10': 13.6, 'p90': 18.2},
-        "89": {'p1': 12.4, 'p3': 12.9, 'p5': 13.2, 'p15': 13.9, 'p25': 14.4, 'p50': 15.5, 'p75': 16.8, 'p85': 17.5, 'p95': 19.1, 'p97': 19.7, 'p99': 21.1, 'p999': 21.2, 'p01': 11.5, 'p10': 13.6, 'p90': 18.3},
-        "90": {'p1': 12.5, 'p3': 12.9, 'p5': 13.2, 'p15': 14.0, 'p25': 14.5, 'p50': 15.5, 'p75': 16.8, 'p85': 17.6, 'p95': 19.1, 'p97': 19.8, 'p99': 21.1, 'p999': 21.2, 'p01': 11.6, 'p10': 13.6, 'p90': 18.4},
-        "91": {'p1': 12.5, 'p3': 12.9, 'p5': 13.2, 'p15': 14.0, 'p25': 14.5, 'p50': 15.5, 'p75': 16.8, 'p85': 17.6, 'p95': 19.2, 'p97': 19.8, 'p99': 21.2, 'p999': 21.3, 'p01': 11.6, 'p10': 13.6, 'p90': 18.4},
-        "92": {'p1': 12.5, 'p3': 13.0, 'p5': 13.2, 'p15': 14.0, 'p25': 14.5, 'p50': 15.6, 'p75': 16.9, 'p85': 17.6, 'p95': 19.2, 'p97': 19.9, 'p99': 21.3, 'p999': 21.4, 'p01': 11.6, 'p10': 13.6, 'p90': 18.4},
-        "93": {'p1': 12.5, 'p3': 13.0, 'p5': 13.2, 'p15': 14.0, 'p25': 14.5, 'p50': 15.6, 'p75': 16.9, 'p85': 17.7, 'p95': 19.3, 'p97': 20.0, 'p99': 21.4, 'p999': 21.5, 'p01': 11.6, 'p10': 13.6, 'p90': 18.5},
-        "94": {'p1': 12.5, 'p3': 13.0, 'p5': 13.3, 'p15': 14.0, 'p25': 14.5, 'p50': 15.6, 'p75': 16.9, 'p85': 17.7, 'p95': 19.3, 'p97': 20.0, 'p99': 21.5, 'p999': 21.6, 'p01': 11.6, 'p10': 13.7, 'p90': 18.5},
-        "95": {'p1': 12.5, 'p3': 13.0, 'p5': 13.3, 'p15': 14.0, 'p25': 14.6, 'p50': 15.7, 'p75': 17.0, 'p85': 17.8, 'p95': 19.4, 'p97': 20.1, 'p99': 21.6, 'p999': 21.7, 'p01': 11.6, 'p10': 13.7, 'p90': 18.6},
-        "96": {'p1': 12.5, 'p3': 13.0, 'p5': 13.3, 'p15': 14.1, 'p25': 14.6, 'p50': 15.7, 'p75': 17.0, 'p85': 17.8, 'p95': 19.4, 'p97': 20.2, 'p99': 21.6, 'p999': 21.7, 'p01': 11.6, 'p10': 13.7, 'p90': 18.6},
-        "97": {'p1': 12.6, 'p3': 13.0, 'p5': 13.3, 'p15': 14.1, 'p25': 14.6, 'p50': 15.7, 'p75': 17.0, 'p85': 17.9, 'p95': 19.5, 'p97': 20.2, 'p99': 21.7, 'p999': 21.8, 'p01': 11.7, 'p10': 13.7, 'p90': 18.7},
-        "98": {'p1': 12.6, 'p3': 13.1, 'p5': 13.3, 'p15': 14.1, 'p25': 14.6, 'p50': 15.7, 'p75': 17.1, 'p85': 17.9, 'p95': 19.6, 'p97': 20.3, 'p99': 21.8, 'p999': 21.9, 'p01': 11.7, 'p10': 13.7, 'p90': 18.8},
-        "99": {'p1': 12.6, 'p3': 13.1, 'p5': 13.4, 'p15': 14.1, 'p25': 14.7, 'p50': 15.8, 'p75': 17.1, 'p85': 18.0, 'p95': 19.6, 'p97': 20.4, 'p99': 21.9, 'p999': 22.0, 'p01': 11.7, 'p10': 13.8, 'p90': 18.8},
-        "100": {'p1': 12.6, 'p3': 13.1, 'p5': 13.4, 'p15': 14.2, 'p25': 14.7, 'p50': 15.8, 'p75': 17.2, 'p85': 18.0, 'p95': 19.7, 'p97': 20.4, 'p99': 22.0, 'p999': 22.1, 'p01': 11.7, 'p10': 13.8, 'p90': 18.9},
-        "101": {'p1': 12.6, 'p3': 13.1, 'p5': 13.4, 'p15': 14.2, 'p25': 14.7, 'p50': 15.8, 'p75': 17.2, 'p85': 18.1, 'p95': 19.8, 'p97': 20.5, 'p99': 22.1, 'p999': 22.2, 'p01': 11.7, 'p10': 13.8, 'p90': 19.0},
-        "102": {'p1': 12.6, 'p3': 13.1, 'p5': 13.4, 'p15': 14.2, 'p25': 14.7, 'p50': 15.9, 'p75': 17.2, 'p85': 18.1, 'p95': 19.8, 'p97': 20.6, 'p99': 22.2, 'p999': 22.3, 'p01': 11.7, 'p10': 13.8, 'p90': 19.0},
-        "103": {'p1': 12.7, 'p3': 13.2, 'p5': 13.4, 'p15': 14.2, 'p25': 14.8, 'p50': 15.9, 'p75': 17.3, 'p85': 18.2, 'p95': 19.9, 'p97': 20.7, 'p99': 22.3, 'p999': 22.4, 'p01': 11.8, 'p10': 13.8, 'p90': 19.0},
-        "104": {'p1': 12.7, 'p3': 13.2, 'p5': 13.5, 'p15': 14.3, 'p25': 14.8, 'p50': 15.9, 'p75': 17.3, 'p85': 18.2, 'p95': 20.0, 'p97': 20.7, 'p99': 22.4, 'p999': 22.5, 'p01': 11.8, 'p10': 13.9, 'p90': 19.1},
-        "105": {'p1': 12.7, 'p3': 13.2, 'p5': 13.5, 'p15': 14.3, 'p25': 14.8, 'p50': 16.0, 'p75': 17.4, 'p85': 18.3, 'p95': 20.0, 'p97': 20.8, 'p99': 22.5, 'p999': 22.6, 'p01': 11.8, 'p10': 13.9, 'p90': 19.1},
-        "106": {'p1': 12.7, 'p3': 13.2, 'p5': 13.5, 'p15': 14.3, 'p25': 14.9, 'p50': 16.0, 'p75': 17.4, 'p85': 18.3, 'p95': 20.1, 'p97': 20.9, 'p99': 22.6, 'p999': 22.7, 'p01': 11.8, 'p10': 13.9, 'p90': 19.2},
-        "107": {'p1': 12.8, 'p3': 13.3, 'p5': 13.5, 'p15': 14.4, 'p25': 14.9, 'p50': 16.1, 'p75': 17.5, 'p85': 18.4, 'p95': 20.2, 'p97': 21.0, 'p99': 22.7, 'p999': 22.8, 'p01': 11.9, 'p10': 13.9, 'p90': 19.3},
-        "108": {'p1': 12.8, 'p3': 13.3, 'p5': 13.6, 'p15': 14.4, 'p25': 14.9, 'p50': 16.1, 'p75': 17.5, 'p85': 18.4, 'p95': 20.2, 'p97': 21.1, 'p99': 22.8, 'p999': 22.9, 'p01': 11.9, 'p10': 14.0, 'p90': 19.3},
-        "109": {'p1': 12.8, 'p3': 13.3, 'p5': 13.6, 'p15': 14.4, 'p25': 15.0, 'p50': 16.1, 'p75': 17.6, 'p85': 18.5, 'p95': 20.3, 'p97': 21.1, 'p99': 22.9, 'p999': 23.0, 'p01': 11.9, 'p10': 14.0, 'p90': 19.4},
-        "110": {'p1': 12.8, 'p3': 13.3, 'p5': 13.6, 'p15': 14.4, 'p25': 15.0, 'p50': 16.2, 'p75': 17.6, 'p85': 18.5, 'p95': 20.4, 'p97': 21.2, 'p99': 23.0, 'p999': 23.1, 'p01': 11.9, 'p10': 14.0, 'p90': 19.4},
-        "111": {'p1': 12.8, 'p3': 13.4, 'p5': 13.6, 'p15': 14.5, 'p25': 15.0, 'p50': 16.2, 'p75': 17.7, 'p85': 18.6, 'p95': 20.5, 'p97': 21.3, 'p99': 23.1, 'p999': 23.2, 'p01': 11.9, 'p10': 14.1, 'p90': 19.6},
-        "112": {'p1': 12.9, 'p3': 13.4, 'p5': 13.7, 'p15': 14.5, 'p25': 15.1, 'p50': 16.3, 'p75': 17.7, 'p85': 18.7, 'p95': 20.5, 'p97': 21.4, 'p99': 23.2, 'p999': 23.3, 'p01': 12.0, 'p10': 14.1, 'p90': 19.6},
-        "113": {'p1': 12.9, 'p3': 13.4, 'p5': 13.7, 'p15': 14.5, 'p25': 15.1, 'p50': 16.3, 'p75': 17.8, 'p85': 18.7, 'p95': 20.6, 'p97': 21.5, 'p99': 23.3, 'p999': 23.4, 'p01': 12.0, 'p10': 14.1, 'p90': 19.6},
-        "114": {'p1': 12.9, 'p3': 13.4, 'p5': 13.7, 'p15': 14.6, 'p25': 15.1, 'p50': 16.3, 'p75': 17.8, 'p85': 18.8, 'p95': 20.7, 'p97': 21.6, 'p99': 23.4, 'p999': 23.5, 'p01': 12.0, 'p10': 14.1, 'p90': 19.8},
-        "115": {'p1': 13.0, 'p3': 13.5, 'p5': 13.8, 'p15': 14.6, 'p25': 15.2, 'p50': 16.4, 'p75': 17.9, 'p85': 18.8, 'p95': 20.7, 'p97': 21.6, 'p99': 23.5, 'p999': 23.6, 'p01': 12.1, 'p10': 14.2, 'p90': 19.8},
-        "116": {'p1': 13.0, 'p3': 13.5, 'p5': 13.8, 'p15': 14.6, 'p25': 15.2, 'p50': 16.4, 'p75': 17.9, 'p85': 18.9, 'p95': 20.8, 'p97': 21.7, 'p99': 23.6, 'p999': 23.7, 'p01': 12.1, 'p10': 14.2, 'p90': 19.9},
-        "117": {'p1': 13.0, 'p3': 13.5, 'p5': 13.8, 'p15': 14.7, 'p25': 15.2, 'p50': 16.5, 'p75': 18.0, 'p85': 18.9, 'p95': 20.9, 'p97': 21.8, 'p99': 23.7, 'p999': 23.8, 'p01': 12.1, 'p10': 14.2, 'p90': 19.9},
-        "118": {'p1': 13.0, 'p3': 13.6, 'p5': 13.9, 'p15': 14.7, 'p25': 15.3, 'p50': 16.5, 'p75': 18.0, 'p85': 19.0, 'p95': 21.0, 'p97': 21.9, 'p99': 23.8, 'p999': 23.9, 'p01': 12.1, 'p10': 14.3, 'p90': 20.0},
-        "119": {'p1': 13.1, 'p3': 13.6, 'p5': 13.9, 'p15': 14.7, 'p25': 15.3, 'p50': 16.6, 'p75': 18.1, 'p85': 19.1, 'p95': 21.1, 'p97': 22.0, 'p99': 23.9, 'p999': 24.0, 'p01': 12.2, 'p10': 14.3, 'p90': 20.1},
-        "120": {'p1': 13.1, 'p3': 13.6, 'p5': 13.9, 'p15': 14.8, 'p25': 15.4, 'p50': 16.6, 'p75': 18.2, 'p85': 19.1, 'p95': 21.1, 'p97': 22.1, 'p99': 24.0, 'p999': 24.1, 'p01': 12.2, 'p10': 14.4, 'p90': 20.1},
-        "121": {'p1': 13.1, 'p3': 13.6, 'p5': 14.0, 'p15': 14.8, 'p25': 15.4, 'p50': 16.7, 'p75': 18.2, 'p85': 19.2, 'p95': 21.2, 'p97': 22.2, 'p99': 24.1, 'p999': 24.2, 'p01': 12.2, 'p10': 14.4, 'p90': 20.2},
-        "122": {'p1': 13.1, 'p3': 13.7, 'p5': 14.0, 'p15': 14.9, 'p25': 15.4, 'p50': 16.7, 'p75': 18.3, 'p85': 19.3, 'p95': 21.3, 'p97': 22.2, 'p99': 24.2, 'p999': 24.3, 'p01': 12.2, 'p10': 14.4, 'p90': 20.3},
-        "123": {'p1': 13.2, 'p3': 13.7, 'p5': 14.0, 'p15': 14.9, 'p25': 15.5, 'p50': 16.8, 'p75': 18.3, 'p85': 19.3, 'p95': 21.4, 'p97': 22.3, 'p99': 24.3, 'p999': 24.4, 'p01': 12.3, 'p10': 14.4, 'p90': 20.4},
-        "124": {'p1': 13.2, 'p3': 13.7, 'p5': 14.1, 'p15': 14.9, 'p25': 15.5, 'p50': 16.8, 'p75': 18.4, 'p85': 19.4, 'p95': 21.5, 'p97': 22.4, 'p99': 24.5, 'p999': 24.6, 'p01': 12.3, 'p10': 14.5, 'p90': 20.4},
-        "125": {'p1': 13.2, 'p3': 13.8, 'p5': 14.1, 'p15': 15.0, 'p25': 15.6, 'p50': 16.9, 'p75': 18.5, 'p85': 19.5, 'p95': 21.5, 'p97': 22.5, 'p99': 24.6, 'p999': 24.7, 'p01': 12.3, 'p10': 14.6, 'p90': 20.5},
-        "126": {'p1': 13.3, 'p3': 13.8, 'p5': 14.1, 'p15': 15.0, 'p25': 15.6, 'p50': 16.9, 'p75': 18.5, 'p85': 19.5, 'p95': 21.6, 'p97': 22.6, 'p99': 24.7, 'p999': 24.8, 'p01': 12.4, 'p10': 14.6, 'p90': 20.6},
-        "127": {'p1': 13.3, 'p3': 13.9, 'p5': 14.2, 'p15': 15.1, 'p25': 15.7, 'p50': 17.0, 'p75': 18.6, 'p85': 19.6, 'p95': 21.7, 'p97': 22.7, 'p99': 24.8, 'p999': 24.9, 'p01': 12.4, 'p10': 14.6, 'p90': 20.6},
-        "128": {'p1': 13.3, 'p3': 13.9, 'p5': 14.2, 'p15': 15.1, 'p25': 15.7, 'p50': 17.0, 'p75': 18.6, 'p85': 19.7, 'p95': 21.8, 'p97': 22.8, 'p99': 24.9, 'p999': 25.0, 'p01': 12.4, 'p10': 14.6, 'p90': 20.8},
-        "129": {'p1': 13.4, 'p3': 13.9, 'p5': 14.2, 'p15': 15.1, 'p25': 15.8, 'p50': 17.1, 'p75': 18.7, 'p85': 19.8, 'p95': 21.9, 'p97': 22.9, 'p99': 25.0, 'p999': 25.1, 'p01': 12.5, 'p10': 14.6, 'p90': 20.9},
-        "130": {'p1': 13.4, 'p3': 14.0, 'p5': 14.3, 'p15': 15.2, 'p25': 15.8, 'p50': 17.1, 'p75': 18.8, 'p85': 19.8, 'p95': 22.0, 'p97': 23.0, 'p99': 25.1, 'p999': 25.2, 'p01': 12.5, 'p10': 14.8, 'p90': 20.9},
-        "131": {'p1': 13.4, 'p3': 14.0, 'p5': 14.3, 'p15': 15.2, 'p25': 15.9, 'p50': 17.2, 'p75': 18.8, 'p85': 19.9, 'p95': 22.1, 'p97': 23.1, 'p99': 25.2, 'p999': 25.3, 'p01': 12.5, 'p10': 14.8, 'p90': 21.0},
-        "132": {'p1': 13.5, 'p3': 14.0, 'p5': 14.4, 'p15': 15.3, 'p25': 15.9, 'p50': 17.2, 'p75': 18.9, 'p85': 20.0, 'p95': 22.2, 'p97': 23.2, 'p99': 25.3, 'p999': 25.4, 'p01': 12.6, 'p10': 14.9, 'p90': 21.1},
-        "133": {'p1': 13.5, 'p3': 14.1, 'p5': 14.4, 'p15': 15.3, 'p25': 16.0, 'p50': 17.3, 'p75': 19.0, 'p85': 20.0, 'p95': 22.2, 'p97': 23.3, 'p99': 25.5, 'p999': 25.6, 'p01': 12.6, 'p10': 14.9, 'p90': 21.1},
-        "134": {'p1': 13.6, 'p3': 14.1, 'p5': 14.4, 'p15': 15.4, 'p25': 16.0, 'p50': 17.4, 'p75': 19.0, 'p85': 20.1, 'p95': 22.3, 'p97': 23.4, 'p99': 25.6, 'p999': 25.7, 'p01': 12.6, 'p10': 14.9, 'p90': 21.2},
-        "135": {'p1': 13.6, 'p3': 14.2, 'p5': 14.5, 'p15': 15.4, 'p25': 16.1, 'p50': 17.4, 'p75': 19.1, 'p85': 20.2, 'p95': 22.4, 'p97': 23.5, 'p99': 25.7, 'p999': 25.8, 'p01': 12.6, 'p10': 14.9, 'p90': 21.3},
-        "136": {'p1': 13.6, 'p3': 14.2, 'p5': 14.5, 'p15': 15.5, 'p25': 16.1, 'p50': 17.5, 'p75': 19.2, 'p85': 20.3, 'p95': 22.5, 'p97': 23.6, 'p99': 25.8, 'p999': 25.9, 'p01': 12.6, 'p10': 15.0, 'p90': 21.4},
-        "137": {'p1': 13.7, 'p3': 14.2, 'p5': 14.6, 'p15': 15.5, 'p25': 16.2, 'p50': 17.5, 'p75': 19.3, 'p85': 20.4, 'p95': 22.6, 'p97': 23.7, 'p99': 25.9, 'p999': 26.0, 'p01': 12.7, 'p10': 15.1, 'p90': 21.5},
-        "138": {'p1': 13.7, 'p3': 14.3, 'p5': 14.6, 'p15': 15.6, 'p25': 16.2, 'p50': 17.6, 'p75': 19.3, 'p85': 20.4, 'p95': 22.7, 'p97': 23.8, 'p99': 26.0, 'p999': 26.1, 'p01': 12.7, 'p10': 15.1, 'p90': 21.5},
-        "139": {'p1': 13.7, 'p3': 14.3, 'p5': 14.7, 'p15': 15.6, 'p25': 16.3, 'p50': 17.7, 'p75': 19.4, 'p85': 20.5, 'p95': 22.8, 'p97': 23.9, 'p99': 26.1, 'p999': 26.2, 'p01': 12.7, 'p10': 15.1, 'p90': 21.6},
-        "140": {'p1': 13.8, 'p3': 14.4, 'p5': 14.7, 'p15': 15.7, 'p25': 16.3, 'p50': 17.7, 'p75': 19.5, 'p85': 20.6, 'p95': 22.9, 'p97': 24.0, 'p99': 26.3, 'p999': 26.4, 'p01': 12.8, 'p10': 15.2, 'p90': 21.8},
-        "141": {'p1': 13.8, 'p3': 14.4, 'p5': 14.8, 'p15': 15.7, 'p25': 16.4, 'p50': 17.8, 'p75': 19.6, 'p85': 20.7, 'p95': 23.0, 'p97': 24.1, 'p99': 26.4, 'p999': 26.5, 'p01': 12.8, 'p10': 15.2, 'p90': 21.9},
-        "142": {'p1': 13.9, 'p3': 14.5, 'p5': 14.8, 'p15': 15.8, 'p25': 16.4, 'p50': 17.9, 'p75': 19.6, 'p85': 20.8, 'p95': 23.1, 'p97': 24.2, 'p99': 26.5, 'p999': 26.6, 'p01': 12.9, 'p10': 15.3, 'p90': 22.0},
-        "143": {'p1': 13.9, 'p3': 14.5, 'p5': 14.9, 'p15': 15.8, 'p25': 16.5, 'p50': 17.9, 'p75': 19.7, 'p85': 20.8, 'p95': 23.2, 'p97': 24.3, 'p99': 26.6, 'p999': 26.7, 'p01': 12.9, 'p10': 15.4, 'p90': 22.0},
-        "144": {'p1': 14.0, 'p3': 14.6, 'p5': 14.9, 'p15': 15.9, 'p25': 16.6, 'p50': 18.0, 'p75': 19.8, 'p85': 20.9, 'p95': 23.3, 'p97': 24.4, 'p99': 26.7, 'p999': 26.8, 'p01': 13.0, 'p10': 15.4, 'p90': 22.1},
-        "145": {'p1': 14.0, 'p3': 14.6, 'p5': 15.0, 'p15': 15.9, 'p25': 16.6, 'p50': 18.1, 'p75': 19.9, 'p85': 21.0, 'p95': 23.4, 'p97': 24.5, 'p99': 26.8, 'p999': 26.9, 'p01': 13.0, 'p10': 15.4, 'p90': 22.2},
-        "146": {'p1': 14.0, 'p3': 14.7, 'p5': 15.0, 'p15': 16.0, 'p25': 16.7, 'p50': 18.1, 'p75': 19.9, 'p85': 21.1, 'p95': 23.5, 'p97': 24.6, 'p99': 26.9, 'p999': 27.0, 'p01': 13.0, 'p10': 15.5, 'p90': 22.3},
-        "147": {'p1': 14.1, 'p3': 14.7, 'p5': 15.0, 'p15': 16.1, 'p25': 16.7, 'p50': 18.2, 'p75': 20.0, 'p85': 21.2, 'p95': 23.6, 'p97': 24.7, 'p99': 27.1, 'p999': 27.2, 'p01': 13.1, 'p10': 15.6, 'p90': 22.4},
-        "148": {'p1': 14.1, 'p3': 14.7, 'p5': 15.1, 'p15': 16.1, 'p25': 16.8, 'p50': 18.3, 'p75': 20.1, 'p85': 21.3, 'p95': 23.7, 'p97': 24.8, 'p99': 27.2, 'p999': 27.3, 'p01': 13.1, 'p10': 15.6, 'p90': 22.5},
-        "149": {'p1': 14.2, 'p3': 14.8, 'p5': 15.1, 'p15': 16.2, 'p25': 16.8, 'p50': 18.3, 'p75': 20.2, 'p85': 21.3, 'p95': 23.8, 'p97': 24.9, 'p99': 27.3, 'p999': 27.4, 'p01': 13.2, 'p10': 15.6, 'p90': 22.6},
-        "150": {'p1': 14.2, 'p3': 14.8, 'p5': 15.2, 'p15': 16.2, 'p25': 16.9, 'p50': 18.4, 'p75': 20.2, 'p85': 21.4, 'p95': 23.9, 'p97': 25.0, 'p99': 27.4, 'p999': 27.5, 'p01': 13.2, 'p10': 15.7, 'p90': 22.6},
-        "151": {'p1': 14.3, 'p3': 14.9, 'p5': 15.2, 'p15': 16.3, 'p25': 17.0, 'p50': 18.5, 'p75': 20.3, 'p85': 21.5, 'p95': 23.9, 'p97': 25.1, 'p99': 27.5, 'p999': 27.6, 'p01': 13.3, 'p10': 15.8, 'p90': 22.7},
-        "152": {'p1': 14.3, 'p3': 14.9, 'p5': 15.3, 'p15': 16.3, 'p25': 17.0, 'p50': 18.5, 'p75': 20.4, 'p85': 21.6, 'p95': 24.0, 'p97': 25.2, 'p99': 27.6, 'p999': 27.7, 'p01': 13.3, 'p10': 15.8, 'p90': 22.8},
-        "153": {'p1': 14.3, 'p3': 15.0, 'p5': 15.3, 'p15': 16.4, 'p25': 17.1, 'p50': 18.6, 'p75': 20.5, 'p85': 21.7, 'p95': 24.1, 'p97': 25.3, 'p99': 27.7, 'p999': 27.8, 'p01': 13.3, 'p10': 15.8, 'p90': 22.9},
-        "154": {'p1': 14.4, 'p3': 15.0, 'p5': 15.4, 'p15': 16.4, 'p25': 17.1, 'p50': 18.7, 'p75': 20.6, 'p85': 21.8, 'p95': 24.2, 'p97': 25.4, 'p99': 27.8, 'p999': 27.9, 'p01': 13.4, 'p10': 15.9, 'p90': 23.0},
-        "155": {'p1': 14.4, 'p3': 15.1, 'p5': 15.4, 'p15': 16.5, 'p25': 17.2, 'p50': 18.7, 'p75': 20.6, 'p85': 21.8, 'p95': 24.3, 'p97': 25.5, 'p99': 27.9, 'p999': 28.0, 'p01': 13.4, 'p10': 15.9, 'p90': 23.1},
-        "156": {'p1': 14.5, 'p3': 15.1, 'p5': 15.5, 'p15': 16.5, 'p25': 17.3, 'p50': 18.8, 'p75': 20.7, 'p85': 21.9, 'p95': 24.4, 'p97': 25.6, 'p99': 28.0, 'p999': 28.1, 'p01': 13.5, 'p10': 16.0, 'p90': 23.1},
-        "157": {'p1': 14.5, 'p3': 15.2, 'p5': 15.5, 'p15': 16.6, 'p25': 17.3, 'p50': 18.9, 'p75': 20.8, 'p85': 22.0, 'p95': 24.5, 'p97': 25.7, 'p99': 28.1, 'p999': 28.2, 'p01': 13.5, 'p10': 16.1, 'p90': 23.2},
-        "158": {'p1': 14.6, 'p3': 15.2, 'p5': 15.6, 'p15': 16.7, 'p25': 17.4, 'p50': 18.9, 'p75': 20.9, 'p85': 22.1, 'p95': 24.6, 'p97': 25.8, 'p99': 28.3, 'p999': 28.4, 'p01': 13.6, 'p10': 16.1, 'p90': 23.4},
-        "159": {'p1': 14.6, 'p3': 15.3, 'p5': 15.6, 'p15': 16.7, 'p25': 17.4, 'p50': 19.0, 'p75': 20.9, 'p85': 22.2, 'p95': 24.7, 'p97': 25.9, 'p99': 28.4, 'p999': 28.5, 'p01': 13.6, 'p10': 16.1, 'p90': 23.4},
-        "160": {'p1': 14.6, 'p3': 15.3, 'p5': 15.7, 'p15': 16.8, 'p25': 17.5, 'p50': 19.1, 'p75': 21.0, 'p85': 22.3, 'p95': 24.8, 'p97': 26.0, 'p99': 28.5, 'p999': 28.6, 'p01': 13.6, 'p10': 16.2, 'p90': 23.6},
-        "161": {'p1': 14.7, 'p3': 15.3, 'p5': 15.7, 'p15': 16.8, 'p25': 17.5, 'p50': 19.1, 'p75': 21.1, 'p85': 22.3, 'p95': 24.9, 'p97': 26.1, 'p99': 28.6, 'p999': 28.7, 'p01': 13.7, 'p10': 16.2, 'p90': 23.6},
-        "162": {'p1': 14.7, 'p3': 15.4, 'p5': 15.8, 'p15': 16.9, 'p25': 17.6, 'p50': 19.2, 'p75': 21.2, 'p85': 22.4, 'p95': 25.0, 'p97': 26.1, 'p99': 28.7, 'p999': 28.8, 'p01': 13.7, 'p10': 16.4, 'p90': 23.7},
-        "163": {'p1': 14.8, 'p3': 15.4, 'p5': 15.8, 'p15': 16.9, 'p25': 17.7, 'p50': 19.3, 'p75': 21.2, 'p85': 22.5, 'p95': 25.1, 'p97': 26.2, 'p99': 28.8, 'p999': 28.9, 'p01': 13.8, 'p10': 16.4, 'p90': 23.8},
-        "164": {'p1': 14.8, 'p3': 15.5, 'p5': 15.9, 'p15': 17.0, 'p25': 17.7, 'p50': 19.3, 'p75': 21.3, 'p85': 22.6, 'p95': 25.1, 'p97': 26.3, 'p99': 28.8, 'p999': 28.9, 'p01': 13.8, 'p10': 16.4, 'p90': 23.9},
-        "165": {'p1': 14.8, 'p3': 15.5, 'p5': 15.9, 'p15': 17.0, 'p25': 17.8, 'p50': 19.4, 'p75': 21.4, 'p85': 22.6, 'p95': 25.2, 'p97': 26.4, 'p99': 28.9, 'p999': 29.0, 'p01': 13.8, 'p10': 16.4, 'p90': 23.9},
-        "166": {'p1': 14.9, 'p3': 15.6, 'p5': 15.9, 'p15': 17.1, 'p25': 17.8, 'p50': 19.4, 'p75': 21.4, 'p85': 22.7, 'p95': 25.3, 'p97': 26.5, 'p99': 29.0, 'p999': 29.1, 'p01': 13.9, 'p10': 16.5, 'p90': 24.0},
-        "167": {'p1': 14.9, 'p3': 15.6, 'p5': 16.0, 'p15': 17.1, 'p25': 17.9, 'p50': 19.5, 'p75': 21.5, 'p85': 22.8, 'p95': 25.4, 'p97': 26.6, 'p99': 29.1, 'p999': 29.2, 'p01': 13.9, 'p10': 16.6, 'p90': 24.1},
-        "168": {'p1': 15.0, 'p3': 15.6, 'p5': 16.0, 'p15': 17.2, 'p25': 17.9, 'p50': 19.6, 'p75': 21.6, 'p85': 22.9, 'p95': 25.5, 'p97': 26.7, 'p99': 29.2, 'p999': 29.3, 'p01': 14.0, 'p10': 16.6, 'p90': 24.2},
-        "169": {'p1': 15.0, 'p3': 15.7, 'p5': 16.1, 'p15': 17.2, 'p25': 18.0, 'p50': 19.6, 'p75': 21.6, 'p85': 22.9, 'p95': 25.6, 'p97': 26.8, 'p99': 29.3, 'p999': 29.4, 'p01': 14.0, 'p10': 16.6, 'p90': 24.2},
-        "170": {'p1': 15.0, 'p3': 15.7, 'p5': 16.1, 'p15': 17.3, 'p25': 18.0, 'p50': 19.7, 'p75': 21.7, 'p85': 23.0, 'p95': 25.6, 'p97': 26.8, 'p99': 29.4, 'p999': 29.5, 'p01': 14.0, 'p10': 16.7, 'p90': 24.3},
-        "171": {'p1': 15.1, 'p3': 15.8, 'p5': 16.2, 'p15': 17.3, 'p25': 18.1, 'p50': 19.7, 'p75': 21.8, 'p85': 23.1, 'p95': 25.7, 'p97': 26.9, 'p99': 29.5, 'p999': 29.6, 'p01': 14.0, 'p10': 16.8, 'p90': 24.4},
-        "172": {'p1': 15.1, 'p3': 15.8, 'p5': 16.2, 'p15': 17.4, 'p25': 18.1, 'p50': 19.8, 'p75': 21.8, 'p85': 23.2, 'p95': 25.8, 'p97': 27.0, 'p99': 29.6, 'p999': 29.7, 'p01': 14.0, 'p10': 16.8, 'p90': 24.5},
-        "173": {'p1': 15.1, 'p3': 15.8, 'p5': 16.2, 'p15': 17.4, 'p25': 18.2, 'p50': 19.9, 'p75': 21.9, 'p85': 23.2, 'p95': 25.9, 'p97': 27.1, 'p99': 29.6, 'p999': 29.7, 'p01': 14.0, 'p10': 16.8, 'p90': 24.5},
-        "174": {'p1': 15.2, 'p3': 15.9, 'p5': 16.3, 'p15': 17.4, 'p25': 18.2, 'p50': 19.9, 'p75': 22.0, 'p85': 23.3, 'p95': 25.9, 'p97': 27.1, 'p99': 29.7, 'p999': 29.8, 'p01': 14.1, 'p10': 16.9, 'p90': 24.6},
-        "175": {'p1': 15.2, 'p3': 15.9, 'p5': 16.3, 'p15': 17.5, 'p25': 18.3, 'p50': 20.0, 'p75': 22.0, 'p85': 23.4, 'p95': 26.0, 'p97': 27.2, 'p99': 29.8, 'p999': 29.9, 'p01': 14.1, 'p10': 16.9, 'p90': 24.7},
-        "176": {'p1': 15.2, 'p3': 15.9, 'p5': 16.4, 'p15': 17.5, 'p25': 18.3, 'p50': 20.0, 'p75': 22.1, 'p85': 23.4, 'p95': 26.1, 'p97': 27.3, 'p99': 29.9, 'p999': 30.0, 'p01': 14.1, 'p10': 16.9, 'p90': 24.8},
-        "177": {'p1': 15.3, 'p3': 16.0, 'p5': 16.4, 'p15': 17.6, 'p25': 18.4, 'p50': 20.1, 'p75': 22.2, 'p85': 23.5, 'p95': 26.1, 'p97': 27.4, 'p99': 29.9, 'p999': 30.0, 'p01': 14.2, 'p10': 17.0, 'p90': 24.8},
-        "178": {'p1': 15.3, 'p3': 16.0, 'p5': 16.4, 'p15': 17.6, 'p25': 18.4, 'p50': 20.1, 'p75': 22.2, 'p85': 23.5, 'p95': 26.2, 'p97': 27.4, 'p99': 30.0, 'p999': 30.1, 'p01': 14.2, 'p10': 17.0, 'p90': 24.9},
-        "179": {'p1': 15.3, 'p3': 16.0, 'p5': 16.5, 'p15': 17.6, 'p25': 18.4, 'p50': 20.2, 'p75': 22.3, 'p85': 23.6, 'p95': 26.3, 'p97': 27.5, 'p99': 30.1, 'p999': 30.2, 'p01': 14.2, 'p10': 17.1, 'p90': 25.0},
-        "180": {'p1': 15.3, 'p3': 16.1, 'p5': 16.5, 'p15': 17.7, 'p25': 18.5, 'p50': 20.2, 'p75': 22.3, 'p85': 23.7, 'p95': 26.3, 'p97': 27.6, 'p99': 30.1, 'p999': 30.2, 'p01': 14.2, 'p10': 17.1, 'p90': 25.0},
-        "181": {'p1': 15.4, 'p3': 16.1, 'p5': 16.5, 'p15': 17.7, 'p25': 18.5, 'p50': 20.3, 'p75': 22.4, 'p85': 23.7, 'p95': 26.4, 'p97': 27.6, 'p99': 30.2, 'p999': 30.3, 'p01': 14.3, 'p10': 17.1, 'p90': 25.0},
-        "182": {'p1': 15.4, 'p3': 16.1, 'p5': 16.6, 'p15': 17.8, 'p25': 18.6, 'p50': 20.3, 'p75': 22.4, 'p85': 23.8, 'p95': 26.5, 'p97': 27.7, 'p99': 30.3, 'p999': 30.4, 'p01': 14.3, 'p10': 17.2, 'p90': 25.1},
-        "183": {'p1': 15.4, 'p3': 16.2, 'p5': 16.6, 'p15': 17.8, 'p25': 18.6, 'p50': 20.4, 'p75': 22.5, 'p85': 23.8, 'p95': 26.5, 'p97': 27.7, 'p99': 30.3, 'p999': 30.4, 'p01': 14.3, 'p10': 17.2, 'p90': 25.1},
-        "184": {'p1': 15.4, 'p3': 16.2, 'p5': 16.6, 'p15': 17.8, 'p25': 18.6, 'p50': 20.4, 'p75': 22.5, 'p85': 23.9, 'p95': 26.6, 'p97': 27.8, 'p99': 30.4, 'p999': 30.5, 'p01': 14.3, 'p10': 17.2, 'p90': 25.2},
-        "185": {'p1': 15.5, 'p3': 16.2, 'p5': 16.6, 'p15': 17.9, 'p25': 18.7, 'p50': 20.4, 'p75': 22.6, 'p85': 23.9, 'p95': 26.6, 'p97': 27.9, 'p99': 30.4, 'p999': 30.5, 'p01': 14.4, 'p10': 17.2, 'p90': 25.2},
-        "186": {'p1': 15.5, 'p3': 16.2, 'p5': 16.7, 'p15': 17.9, 'p25': 18.7, 'p50': 20.5, 'p75': 22.6, 'p85': 24.0, 'p95': 26.7, 'p97': 27.9, 'p99': 30.5, 'p999': 30.6, 'p01': 14.4, 'p10': 17.3, 'p90': 25.4},
-        "187": {'p1': 15.5, 'p3': 16.3, 'p5': 16.7, 'p15': 17.9, 'p25': 18.8, 'p50': 20.5, 'p75': 22.7, 'p85': 24.0, 'p95': 26.7, 'p97': 28.0, 'p99': 30.5, 'p999': 30.6, 'p01': 14.4, 'p10': 17.3, 'p90': 25.4},
-        "188": {'p1': 15.5, 'p3': 16.3, 'p5': 16.7, 'p15': 18.0, 'p25': 18.8, 'p50': 20.6, 'p75': 22.7, 'p85': 24.1, 'p95': 26.8, 'p97': 28.0, 'p99': 30.6, 'p999': 30.7, 'p01': 14.4, 'p10': 17.4, 'p90': 25.5},
-        "189": {'p1': 15.6, 'p3': 16.3, 'p5': 16.8, 'p15': 18.0, 'p25': 18.8, 'p50': 20.6, 'p75': 22.8, 'p85': 24.1, 'p95': 26.8, 'p97': 28.1, 'p99': 30.6, 'p999': 30.7, 'p01': 14.5, 'p10': 17.4, 'p90': 25.5},
-        "190": {'p1': 15.6, 'p3': 16.3, 'p5': 16.8, 'p15': 18.0, 'p25': 18.8, 'p50': 20.6, 'p75': 22.8, 'p85': 24.2, 'p95': 26.9, 'p97': 28.1, 'p99': 30.7, 'p999': 30.8, 'p01': 14.5, 'p10': 17.4, 'p90': 25.5},
-        "191": {'p1': 15.6, 'p3': 16.4, 'p5': 16.8, 'p15': 18.0, 'p25': 18.9, 'p50': 20.7, 'p75': 22.8, 'p85': 24.2, 'p95': 26.9, 'p97': 28.2, 'p99': 30.7, 'p999': 30.8, 'p01': 14.5, 'p10': 17.4, 'p90': 25.5},
-        "192": {'p1': 15.6, 'p3': 16.4, 'p5': 16.8, 'p15': 18.1, 'p25': 18.9, 'p50': 20.7, 'p75': 22.9, 'p85': 24.2, 'p95': 27.0, 'p97': 28.2, 'p99': 30.8, 'p999': 30.9, 'p01': 14.5, 'p10': 17.5, 'p90': 25.6},
-        "193": {'p1': 15.6, 'p3': 16.4, 'p5': 16.8, 'p15': 18.1, 'p25': 18.9, 'p50': 20.7, 'p75': 22.9, 'p85': 24.3, 'p95': 27.0, 'p97': 28.2, 'p99': 30.8, 'p999': 30.9, 'p01': 14.5, 'p10': 17.5, 'p90': 25.6},
-        "194": {'p1': 15.7, 'p3': 16.4, 'p5': 16.9, 'p15': 18.1, 'p25': 19.0, 'p50': 20.8, 'p75': 23.0, 'p85': 24.3, 'p95': 27.1, 'p97': 28.3, 'p99': 30.9, 'p999': 31.0, 'p01': 14.6, 'p10': 17.5, 'p90': 25.7},
-        "195": {'p1': 15.7, 'p3': 16.4, 'p5': 16.9, 'p15': 18.1, 'p25': 19.0, 'p50': 20.8, 'p75': 23.0, 'p85': 24.4, 'p95': 27.1, 'p97': 28.3, 'p99': 30.9, 'p999': 31.0, 'p01': 14.6, 'p10': 17.5, 'p90': 25.8},
-        "196": {'p1': 15.7, 'p3': 16.5, 'p5': 16.9, 'p15': 18.2, 'p25': 19.0, 'p50': 20.8, 'p75': 23.0, 'p85': 24.4, 'p95': 27.1, 'p97': 28.4, 'p99': 30.9, 'p999': 31.0, 'p01': 14.6, 'p10': 17.5, 'p90': 25.8},
-        "197": {'p1': 15.7, 'p3': 16.5, 'p5': 16.9, 'p15': 18.2, 'p25': 19.0, 'p50': 20.9, 'p75': 23.1, 'p85': 24.4, 'p95': 27.2, 'p97': 28.4, 'p99': 31.0, 'p999': 31.1, 'p01': 14.6, 'p10': 17.5, 'p90': 25.8},
-        "198": {'p1': 15.7, 'p3': 16.5, 'p5': 16.9, 'p15': 18.2, 'p25': 19.1, 'p50': 20.9, 'p75': 23.1, 'p85': 24.5, 'p95': 27.2, 'p97': 28.4, 'p99': 31.0, 'p999': 31.1, 'p01': 14.6, 'p10': 17.5, 'p90': 25.9},
-        "199": {'p1': 15.7, 'p3': 16.5, 'p5': 17.0, 'p15': 18.2, 'p25': 19.1, 'p50': 20.9, 'p75': 23.1, 'p85': 24.5, 'p95': 27.2, 'p97': 28.5, 'p99': 31.0, 'p999': 31.1, 'p01': 14.6, 'p10': 17.6, 'p90': 25.9},
-        "200": {'p1': 15.7, 'p3': 16.5, 'p5': 17.0, 'p15': 18.3, 'p25': 19.1, 'p50': 20.9, 'p75': 23.1, 'p85': 24.5, 'p95': 27.3, 'p97': 28.5, 'p99': 31.1, 'p999': 31.2, 'p01': 14.6, 'p10': 17.6, 'p90': 25.9},
-        "201": {'p1': 15.7, 'p3': 16.5, 'p5': 17.0, 'p15': 18.3, 'p25': 19.1, 'p50': 21.0, 'p75': 23.2, 'p85': 24.6, 'p95': 27.3, 'p97': 28.5, 'p99': 31.1, 'p999': 31.2, 'p01': 14.6, 'p10': 17.6, 'p90': 26.0},
-        "202": {'p1': 15.8, 'p3': 16.6, 'p5': 17.0, 'p15': 18.3, 'p25': 19.2, 'p50': 21.0, 'p75': 23.2, 'p85': 24.6, 'p95': 27.3, 'p97': 28.6, 'p99': 31.1, 'p999': 31.2, 'p01': 14.7, 'p10': 17.6, 'p90': 26.0},
-        "203": {'p1': 15.8, 'p3': 16.6, 'p5': 17.0, 'p15': 18.3, 'p25': 19.2, 'p50': 21.0, 'p75': 23.2, 'p85': 24.6, 'p95': 27.4, 'p97': 28.6, 'p99': 31.1, 'p999': 31.2, 'p01': 14.7, 'p10': 17.6, 'p90': 26.0},
-        "204": {'p1': 15.8, 'p3': 16.6, 'p5': 17.0, 'p15': 18.3, 'p25': 19.2, 'p50': 21.0, 'p75': 23.3, 'p85': 24.7, 'p95': 27.4, 'p97': 28.6, 'p99': 31.2, 'p999': 31.3, 'p01': 14.7, 'p10': 17.6, 'p90': 26.0},
-        "205": {'p1': 15.8, 'p3': 16.6, 'p5': 17.0, 'p15': 18.3, 'p25': 19.2, 'p50': 21.1, 'p75': 23.3, 'p85': 24.7, 'p95': 27.4, 'p97': 28.6, 'p99': 31.2, 'p999': 31.3, 'p01': 14.7, 'p10': 17.6, 'p90': 26.0},
-        "206": {'p1': 15.8, 'p3': 16.6, 'p5': 17.1, 'p15': 18.4, 'p25': 19.2, 'p50': 21.1, 'p75': 23.3, 'p85': 24.7, 'p95': 27.4, 'p97': 28.7, 'p99': 31.2, 'p999': 31.3, 'p01': 14.7, 'p10': 17.8, 'p90': 26.0},
-        "207": {'p1': 15.8, 'p3': 16.6, 'p5': 17.1, 'p15': 18.4, 'p25': 19.2, 'p50': 21.1, 'p75': 23.3, 'p85': 24.7, 'p95': 27.5, 'p97': 28.7, 'p99': 31.2, 'p999': 31.3, 'p01': 14.7, 'p10': 17.8, 'p90': 26.1},
-        "208": {'p1': 15.8, 'p3': 16.6, 'p5': 17.1, 'p15': 18.4, 'p25': 19.3, 'p50': 21.1, 'p75': 23.4, 'p85': 24.8, 'p95': 27.5, 'p97': 28.7, 'p99': 31.2, 'p999': 31.3, 'p01': 14.7, 'p10': 17.8, 'p90': 26.1},
-        "209": {'p1': 15.8, 'p3': 16.6, 'p5': 17.1, 'p15': 18.4, 'p25': 19.3, 'p50': 21.1, 'p75': 23.4, 'p85': 24.8, 'p95': 27.5, 'p97': 28.7, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.1},
-        "210": {'p1': 15.8, 'p3': 16.6, 'p5': 17.1, 'p15': 18.4, 'p25': 19.3, 'p50': 21.2, 'p75': 23.4, 'p85': 24.8, 'p95': 27.5, 'p97': 28.8, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.1},
-        "211": {'p1': 15.8, 'p3': 16.6, 'p5': 17.1, 'p15': 18.4, 'p25': 19.3, 'p50': 21.2, 'p75': 23.4, 'p85': 24.8, 'p95': 27.6, 'p97': 28.8, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.2},
-        "212": {'p1': 15.8, 'p3': 16.7, 'p5': 17.1, 'p15': 18.4, 'p25': 19.3, 'p50': 21.2, 'p75': 23.4, 'p85': 24.8, 'p95': 27.6, 'p97': 28.8, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.2},
-        "213": {'p1': 15.8, 'p3': 16.7, 'p5': 17.1, 'p15': 18.5, 'p25': 19.3, 'p50': 21.2, 'p75': 23.5, 'p85': 24.9, 'p95': 27.6, 'p97': 28.8, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.2},
-        "214": {'p1': 15.8, 'p3': 16.7, 'p5': 17.1, 'p15': 18.5, 'p25': 19.3, 'p50': 21.2, 'p75': 23.5, 'p85': 24.9, 'p95': 27.6, 'p97': 28.8, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.2},
-        "215": {'p1': 15.8, 'p3': 16.7, 'p5': 17.1, 'p15': 18.5, 'p25': 19.4, 'p50': 21.2, 'p75': 23.5, 'p85': 24.9, 'p95': 27.6, 'p97': 28.9, 'p99': 31.3, 'p999': 31.4, 'p01': 14.7, 'p10': 17.8, 'p90': 26.2},
-        "216": {'p1': 15.9, 'p3': 16.7, 'p5': 17.1, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.5, 'p85': 24.9, 'p95': 27.7, 'p97': 28.9, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.8, 'p90': 26.3},
-        "217": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.5, 'p85': 24.9, 'p95': 27.7, 'p97': 28.9, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.3},
-        "218": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.6, 'p85': 25.0, 'p95': 27.7, 'p97': 28.9, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.4},
-        "219": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.6, 'p85': 25.0, 'p95': 27.7, 'p97': 28.9, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.4},
-        "220": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.6, 'p85': 25.0, 'p95': 27.7, 'p97': 28.9, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.4},
-        "221": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.6, 'p85': 25.0, 'p95': 27.7, 'p97': 28.9, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.4},
-        "222": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.5, 'p25': 19.4, 'p50': 21.3, 'p75': 23.6, 'p85': 25.0, 'p95': 27.7, 'p97': 29.0, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.4},
-        "223": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.6, 'p25': 19.5, 'p50': 21.4, 'p75': 23.6, 'p85': 25.0, 'p95': 27.8, 'p97': 29.0, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.4},
-        "224": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.6, 'p25': 19.5, 'p50': 21.4, 'p75': 23.6, 'p85': 25.1, 'p95': 27.8, 'p97': 29.0, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.5},
-        "225": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.6, 'p25': 19.5, 'p50': 21.4, 'p75': 23.7, 'p85': 25.1, 'p95': 27.8, 'p97': 29.0, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.5},
-        "226": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.6, 'p25': 19.5, 'p50': 21.4, 'p75': 23.7, 'p85': 25.1, 'p95': 27.8, 'p97': 29.0, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.5},
-        "227": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.6, 'p25': 19.5, 'p50': 21.4, 'p75': 23.7, 'p85': 25.1, 'p95': 27.8, 'p97': 29.0, 'p99': 31.4, 'p999': 31.5, 'p01': 14.8, 'p10': 17.9, 'p90': 26.5},
-        "228": {'p1': 15.9, 'p3': 16.7, 'p5': 17.2, 'p15': 18.6, 'p25': 19.5, 'p50': 21.4, 'p75': 23.7, 'p85': 25.1, 'p95': 27.8, 'p97': 29.0, 'p99': 31.5, 'p999': 31.6, 'p01': 14.8, 'p10': 17.9, 'p90': 26.5},
-    }
+from .percentile_descriptions import PERCENTILE_LABELS
+
+# 列顺序：百分位从低到高
+BMI_COLUMNS = PERCENTILE_LABELS
+
+# 0-19岁BMI标准数据，每行对应一个月龄（0-228），列顺序同 BMI_COLUMNS
+BMI_STANDARD_ROWS = {
+    "boy": (
+        (10.0, 10.8, 11.3, 11.5, 11.8, 12.2, 12.6, 13.4, 14.3, 14.8, 15.3, 15.8, 16.1, 16.8, 16.9),  # 0
+        (11.2, 12.0, 12.6, 12.8, 13.2, 13.6, 14.1, 14.9, 15.9, 16.4, 16.9, 17.3, 17.6, 18.2, 18.3),  # 1
+        (12.4, 13.3, 13.8, 14.1, 14.5, 14.9, 15.4, 16.3, 17.3, 17.8, 18.3, 18.8, 19.2, 19.8, 19.9),  # 2
+        (12.9, 13.9, 14.4, 14.7, 15.1, 15.5, 16.0, 16.9, 17.9, 18.5, 18.9, 19.4, 19.8, 20.5, 20.6),  # 3
+        (13.1, 14.1, 14.7, 15.0, 15.3, 15.7, 16.2, 17.2, 18.2, 18.7, 19.2, 19.7, 20.1, 20.8, 20.9),  # 4
+        (13.3, 14.3, 14.8, 15.1, 15.5, 15.9, 16.4, 17.3, 18.3, 18.9, 19.4, 19.8, 20.2, 20.9, 21.0),  # 5
+        (13.4, 14.4, 14.9, 15.2, 15.6, 15.9, 16.4, 17.3, 18.3, 18.9, 19.4, 19.9, 20.3, 21.0, 21.1),  # 6
+        (13.4, 14.4, 14.9, 15.2, 15.6, 15.9, 16.4, 17.3, 18.3, 18.9, 19.4, 19.9, 20.3, 21.0, 21.1),  # 7
+        (13.4, 14.4, 14.9, 15.1, 15.5, 15.9, 16.3, 17.3, 18.2, 18.8, 19.3, 19.8, 20.2, 20.9, 21.0),  # 8
+        (13.3, 14.3, 14.8, 15.1, 15.4, 15.8, 16.3, 17.2, 18.1, 18.7, 19.2, 19.7, 20.1, 20.7, 20.8),  # 9
+        (13.2, 14.2, 14.7, 15.0, 15.3, 15.7, 16.2, 17.0, 18.0, 18.6, 19.1, 19.5, 19.9, 20.6, 20.7),  # 10
+        (13.1, 14.1, 14.6, 14.9, 15.2, 15.6, 16.0, 16.9, 17.9, 18.4, 18.9, 19.4, 19.8, 20.4, 20.5),  # 11
+        (13.0, 14.0, 14.5, 14.8, 15.2, 15.5, 15.9, 16.8, 17.7, 18.3, 18.8, 19.2, 19.6, 20.3, 20.4),  # 12
+        (12.9, 13.9, 14.4, 14.7, 15.1, 15.4, 15.8, 16.7, 17.6, 18.1, 18.6, 19.1, 19.5, 20.1, 20.2),  # 13
+        (12.9, 13.9, 14.3, 14.6, 14.9, 15.3, 15.7, 16.6, 17.5, 18.0, 18.4, 18.9, 19.3, 20.0, 20.1),  # 14
+        (12.8, 13.8, 14.2, 14.5, 14.8, 15.2, 15.6, 16.4, 17.4, 17.9, 18.4, 18.8, 19.2, 19.8, 19.9),  # 15
+        (12.7, 13.7, 14.2, 14.4, 14.8, 15.1, 15.5, 16.3, 17.2, 17.8, 18.2, 18.7, 19.1, 19.7, 19.8),  # 16
+        (12.6, 13.6, 14.1, 14.3, 14.7, 15.0, 15.4, 16.2, 17.1, 17.6, 18.1, 18.6, 18.9, 19.6, 19.7),  # 17
+        (12.6, 13.6, 14.0, 14.2, 14.6, 14.9, 15.3, 16.1, 17.0, 17.5, 18.0, 18.5, 18.8, 19.5, 19.6),  # 18
+        (12.6, 13.5, 13.9, 14.2, 14.5, 14.8, 15.2, 16.1, 16.9, 17.4, 17.9, 18.4, 18.7, 19.4, 19.5),  # 19
+        (12.5, 13.4, 13.9, 14.1, 14.4, 14.8, 15.2, 16.0, 16.9, 17.4, 17.9, 18.3, 18.6, 19.3, 19.4),  # 20
+        (12.5, 13.4, 13.8, 14.1, 14.4, 14.7, 15.1, 15.9, 16.8, 17.3, 17.8, 18.2, 18.6, 19.2, 19.3),  # 21
+        (12.4, 13.3, 13.8, 14.0, 14.3, 14.6, 15.0, 15.8, 16.7, 17.2, 17.6, 18.1, 18.5, 19.1, 19.2),  # 22
+        (12.4, 13.3, 13.7, 14.0, 14.3, 14.6, 15.0, 15.8, 16.7, 17.1, 17.6, 18.0, 18.4, 19.0, 19.1),  # 23
+        (12.4, 13.3, 13.7, 13.9, 14.2, 14.5, 14.9, 15.7, 16.6, 17.1, 17.6, 18.0, 18.3, 19.0, 19.1),  # 24
+        (12.6, 13.5, 13.9, 14.1, 14.4, 14.8, 15.2, 16.0, 16.9, 17.4, 17.9, 18.3, 18.6, 19.3, 19.4),  # 25
+        (12.5, 13.4, 13.8, 14.1, 14.4, 14.7, 15.1, 15.9, 16.8, 17.3, 17.8, 18.2, 18.6, 19.2, 19.3),  # 26
+        (12.5, 13.4, 13.8, 14.0, 14.3, 14.7, 15.1, 15.9, 16.8, 17.3, 17.8, 18.2, 18.5, 19.1, 19.2),  # 27
+        (12.4, 13.3, 13.8, 14.0, 14.3, 14.7, 15.1, 15.9, 16.7, 17.2, 17.6, 18.1, 18.5, 19.1, 19.2),  # 28
+        (12.4, 13.3, 13.7, 14.0, 14.3, 14.6, 15.0, 15.8, 16.7, 17.2, 17.6, 18.1, 18.4, 19.0, 19.1),  # 29
+        (12.4, 13.3, 13.7, 13.9, 14.2, 14.6, 15.0, 15.8, 16.7, 17.2, 17.6, 18.0, 18.4, 19.0, 19.1),  # 30
+        (12.3, 13.2, 13.7, 13.9, 14.2, 14.5, 15.0, 15.8, 16.6, 17.1, 17.6, 18.0, 18.4, 19.0, 19.1),  # 31
+        (12.3, 13.2, 13.6, 13.9, 14.2, 14.5, 14.9, 15.7, 16.6, 17.1, 17.6, 18.0, 18.3, 18.9, 19.0),  # 32
+        (12.2, 13.1, 13.6, 13.8, 14.2, 14.5, 14.9, 15.7, 16.6, 17.0, 17.4, 17.9, 18.3, 18.9, 19.0),  # 33
+        (12.2, 13.1, 13.5, 13.8, 14.1, 14.4, 14.9, 15.7, 16.5, 17.0, 17.4, 17.9, 18.2, 18.8, 18.9),  # 34
+        (12.2, 13.1, 13.5, 13.8, 14.1, 14.4, 14.8, 15.6, 16.5, 17.0, 17.4, 17.9, 18.2, 18.8, 18.9),  # 35
+        (12.1, 13.0, 13.5, 13.7, 14.1, 14.4, 14.8, 15.6, 16.5, 17.0, 17.4, 17.8, 18.2, 18.8, 18.9),  # 36
+        (12.1, 13.0, 13.5, 13.7, 14.1, 14.4, 14.8, 15.6, 16.4, 16.9, 17.4, 17.8, 18.1, 18.7, 18.8),  # 37
+        (12.1, 13.0, 13.4, 13.7, 14.0, 14.3, 14.7, 15.5, 16.4, 16.9, 17.4, 17.8, 18.1, 18.7, 18.8),  # 38
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.5, 16.4, 16.9, 17.3, 17.7, 18.1, 18.7, 18.8),  # 39
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.5, 16.4, 16.8, 17.2, 17.7, 18.1, 18.7, 18.8),  # 40
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.2, 14.7, 15.5, 16.3, 16.8, 17.2, 17.7, 18.0, 18.6, 18.7),  # 41
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.2, 14.6, 15.4, 16.3, 16.8, 17.2, 17.7, 18.0, 18.6, 18.7),  # 42
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.4, 16.3, 16.8, 17.2, 17.7, 18.0, 18.6, 18.7),  # 43
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.4, 16.3, 16.8, 17.2, 17.7, 18.0, 18.6, 18.7),  # 44
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.2, 14.6, 15.4, 16.3, 16.8, 17.2, 17.6, 18.0, 18.6, 18.7),  # 45
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.5, 15.4, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 46
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.5, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 47
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.1, 14.5, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 48
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.1, 14.5, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 49
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.1, 14.5, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 50
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.5, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 51
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 52
+        (11.8, 12.7, 13.1, 13.3, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.6, 18.7),  # 53
+        (11.7, 12.6, 13.1, 13.3, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.1, 17.6, 18.0, 18.7, 18.8),  # 54
+        (11.7, 12.6, 13.1, 13.3, 13.7, 14.0, 14.4, 15.2, 16.2, 16.7, 17.1, 17.6, 18.0, 18.7, 18.8),  # 55
+        (11.7, 12.6, 13.1, 13.3, 13.7, 14.0, 14.4, 15.2, 16.1, 16.7, 17.1, 17.6, 18.0, 18.7, 18.8),  # 56
+        (11.7, 12.6, 13.0, 13.3, 13.7, 14.0, 14.4, 15.2, 16.1, 16.7, 17.1, 17.6, 18.0, 18.7, 18.8),  # 57
+        (11.7, 12.6, 13.0, 13.3, 13.6, 13.9, 14.4, 15.2, 16.1, 16.7, 17.1, 17.6, 18.0, 18.7, 18.8),  # 58
+        (11.7, 12.6, 13.0, 13.3, 13.6, 13.9, 14.4, 15.2, 16.1, 16.7, 17.2, 17.7, 18.1, 18.8, 18.9),  # 59
+        (11.7, 12.6, 13.0, 13.3, 13.6, 13.9, 14.3, 15.2, 16.1, 16.7, 17.2, 17.7, 18.1, 18.8, 18.9),  # 60
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.2, 17.7, 18.1, 18.8, 18.9),  # 61
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.2, 17.7, 18.1, 18.8, 18.9),  # 62
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.2, 17.7, 18.1, 18.8, 18.9),  # 63
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.2, 17.7, 18.2, 18.9, 19.0),  # 64
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 65
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 66
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.7, 17.2, 17.7, 18.2, 18.9, 19.0),  # 67
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 68
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.8, 17.3, 17.8, 18.2, 19.0, 19.1),  # 69
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.4, 15.3, 16.2, 16.8, 17.3, 17.8, 18.2, 19.0, 19.1),  # 70
+        (11.8, 12.7, 13.2, 13.4, 13.7, 14.0, 14.5, 15.3, 16.2, 16.8, 17.3, 17.8, 18.3, 19.0, 19.1),  # 71
+        (11.8, 12.7, 13.2, 13.4, 13.7, 14.0, 14.5, 15.3, 16.3, 16.8, 17.4, 17.9, 18.3, 19.1, 19.2),  # 72
+        (11.8, 12.7, 13.2, 13.4, 13.7, 14.0, 14.5, 15.3, 16.3, 16.8, 17.4, 17.9, 18.3, 19.1, 19.2),  # 73
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.1, 14.5, 15.3, 16.3, 16.9, 17.4, 17.9, 18.4, 19.2, 19.3),  # 74
+        (11.9, 12.8, 13.2, 13.4, 13.8, 14.1, 14.5, 15.3, 16.3, 16.9, 17.4, 17.9, 18.4, 19.2, 19.3),  # 75
+        (11.9, 12.8, 13.2, 13.4, 13.8, 14.1, 14.5, 15.4, 16.3, 16.9, 17.4, 18.0, 18.4, 19.3, 19.4),  # 76
+        (11.9, 12.8, 13.2, 13.4, 13.8, 14.1, 14.5, 15.4, 16.3, 16.9, 17.4, 18.0, 18.5, 19.3, 19.4),  # 77
+        (11.9, 12.8, 13.2, 13.4, 13.8, 14.1, 14.5, 15.4, 16.4, 16.9, 17.4, 18.0, 18.5, 19.3, 19.4),  # 78
+        (11.9, 12.8, 13.2, 13.4, 13.8, 14.1, 14.5, 15.4, 16.4, 17.0, 17.6, 18.1, 18.5, 19.4, 19.5),  # 79
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.5, 15.4, 16.4, 17.0, 17.6, 18.1, 18.6, 19.5, 19.6),  # 80
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.6, 15.4, 16.4, 17.0, 17.6, 18.1, 18.6, 19.5, 19.6),  # 81
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.6, 15.4, 16.5, 17.1, 17.6, 18.2, 18.7, 19.6, 19.7),  # 82
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.5, 17.1, 17.6, 18.2, 18.7, 19.6, 19.7),  # 83
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.5, 17.1, 17.7, 18.3, 18.8, 19.7, 19.8),  # 84
+        (12.0, 12.9, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.5, 17.1, 17.7, 18.3, 18.8, 19.7, 19.8),  # 85
+        (12.0, 12.9, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.6, 17.2, 17.8, 18.3, 18.8, 19.8, 19.9),  # 86
+        (12.0, 12.9, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.6, 17.2, 17.8, 18.4, 18.9, 19.9, 20.0),  # 87
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.2, 14.7, 15.6, 16.6, 17.2, 17.8, 18.4, 18.9, 19.9, 20.0),  # 88
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.2, 14.7, 15.6, 16.6, 17.3, 17.9, 18.5, 19.0, 20.0, 20.1),  # 89
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.3, 14.7, 15.6, 16.7, 17.3, 17.9, 18.5, 19.0, 20.1, 20.2),  # 90
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.6, 16.7, 17.3, 18.0, 18.6, 19.1, 20.1, 20.2),  # 91
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.6, 16.7, 17.4, 18.0, 18.6, 19.2, 20.2, 20.3),  # 92
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.7, 16.7, 17.4, 18.0, 18.7, 19.2, 20.3, 20.4),  # 93
+        (12.1, 13.0, 13.4, 13.6, 13.9, 14.3, 14.8, 15.7, 16.8, 17.4, 18.0, 18.7, 19.3, 20.3, 20.4),  # 94
+        (12.1, 13.0, 13.4, 13.7, 14.0, 14.3, 14.8, 15.7, 16.8, 17.5, 18.1, 18.8, 19.3, 20.4, 20.5),  # 95
+        (12.1, 13.0, 13.4, 13.7, 14.1, 14.4, 14.8, 15.7, 16.8, 17.5, 18.1, 18.8, 19.4, 20.5, 20.6),  # 96
+        (12.1, 13.0, 13.4, 13.7, 14.1, 14.4, 14.8, 15.8, 16.9, 17.5, 18.2, 18.9, 19.4, 20.5, 20.6),  # 97
+        (12.1, 13.0, 13.5, 13.7, 14.1, 14.4, 14.8, 15.8, 16.9, 17.6, 18.2, 18.9, 19.5, 20.6, 20.7),  # 98
+        (12.1, 13.0, 13.5, 13.7, 14.1, 14.4, 14.9, 15.8, 16.9, 17.6, 18.3, 19.0, 19.5, 20.7, 20.8),  # 99
+        (12.1, 13.0, 13.5, 13.7, 14.1, 14.4, 14.9, 15.8, 17.0, 17.7, 18.4, 19.0, 19.6, 20.8, 20.9),  # 100
+        (12.2, 13.1, 13.5, 13.7, 14.1, 14.4, 14.9, 15.9, 17.0, 17.7, 18.4, 19.1, 19.7, 20.9, 21.0),  # 101
+        (12.2, 13.1, 13.5, 13.8, 14.2, 14.5, 14.9, 15.9, 17.0, 17.7, 18.4, 19.1, 19.7, 20.9, 21.0),  # 102
+        (12.2, 13.1, 13.5, 13.8, 14.2, 14.5, 14.9, 15.9, 17.1, 17.8, 18.5, 19.2, 19.8, 21.0, 21.1),  # 103
+        (12.2, 13.1, 13.5, 13.8, 14.2, 14.5, 15.0, 15.9, 17.1, 17.8, 18.5, 19.2, 19.9, 21.1, 21.2),  # 104
+        (12.2, 13.1, 13.6, 13.8, 14.2, 14.5, 15.0, 16.0, 17.1, 17.9, 18.6, 19.3, 19.9, 21.2, 21.3),  # 105
+        (12.2, 13.1, 13.6, 13.8, 14.2, 14.5, 15.0, 16.0, 17.2, 17.9, 18.6, 19.3, 20.0, 21.3, 21.4),  # 106
+        (12.3, 13.2, 13.6, 13.8, 14.2, 14.6, 15.0, 16.0, 17.2, 17.9, 18.6, 19.4, 20.0, 21.3, 21.4),  # 107
+        (12.3, 13.2, 13.6, 13.9, 14.2, 14.6, 15.1, 16.0, 17.2, 18.0, 18.8, 19.5, 20.1, 21.4, 21.5),  # 108
+        (12.3, 13.2, 13.6, 13.9, 14.2, 14.6, 15.1, 16.1, 17.3, 18.0, 18.8, 19.5, 20.2, 21.5, 21.6),  # 109
+        (12.3, 13.2, 13.7, 13.9, 14.2, 14.6, 15.1, 16.1, 17.3, 18.1, 18.9, 19.6, 20.2, 21.6, 21.7),  # 110
+        (12.3, 13.2, 13.7, 13.9, 14.2, 14.6, 15.1, 16.1, 17.4, 18.1, 18.9, 19.6, 20.3, 21.7, 21.8),  # 111
+        (12.3, 13.2, 13.7, 13.9, 14.3, 14.7, 15.1, 16.2, 17.4, 18.2, 18.9, 19.7, 20.4, 21.8, 21.9),  # 112
+        (12.4, 13.3, 13.7, 14.0, 14.3, 14.7, 15.2, 16.2, 17.4, 18.2, 19.0, 19.8, 20.5, 21.9, 22.0),  # 113
+        (12.4, 13.3, 13.7, 14.0, 14.3, 14.7, 15.2, 16.2, 17.5, 18.3, 19.1, 19.8, 20.5, 22.0, 22.1),  # 114
+        (12.4, 13.3, 13.8, 14.0, 14.3, 14.7, 15.2, 16.3, 17.5, 18.3, 19.1, 19.9, 20.6, 22.1, 22.2),  # 115
+        (12.4, 13.3, 13.8, 14.0, 14.4, 14.8, 15.3, 16.3, 17.6, 18.4, 19.2, 20.0, 20.7, 22.2, 22.3),  # 116
+        (12.4, 13.3, 13.8, 14.1, 14.4, 14.8, 15.3, 16.3, 17.6, 18.4, 19.2, 20.0, 20.8, 22.3, 22.4),  # 117
+        (12.5, 13.4, 13.8, 14.1, 14.4, 14.8, 15.3, 16.4, 17.7, 18.5, 19.3, 20.1, 20.8, 22.4, 22.5),  # 118
+        (12.5, 13.4, 13.8, 14.1, 14.4, 14.8, 15.3, 16.4, 17.7, 18.5, 19.4, 20.2, 20.9, 22.5, 22.6),  # 119
+        (12.5, 13.4, 13.9, 14.1, 14.5, 14.9, 15.4, 16.4, 17.7, 18.6, 19.4, 20.2, 21.0, 22.6, 22.7),  # 120
+        (12.5, 13.4, 13.9, 14.2, 14.6, 14.9, 15.4, 16.5, 17.8, 18.6, 19.5, 20.3, 21.1, 22.7, 22.8),  # 121
+        (12.5, 13.4, 13.9, 14.2, 14.6, 14.9, 15.4, 16.5, 17.8, 18.7, 19.5, 20.4, 21.1, 22.8, 22.9),  # 122
+        (12.6, 13.5, 13.9, 14.2, 14.6, 15.0, 15.5, 16.6, 17.9, 18.7, 19.5, 20.4, 21.2, 22.9, 23.0),  # 123
+        (12.6, 13.5, 14.0, 14.2, 14.6, 15.0, 15.5, 16.6, 17.9, 18.8, 19.6, 20.5, 21.3, 23.0, 23.1),  # 124
+        (12.6, 13.5, 14.0, 14.3, 14.7, 15.0, 15.5, 16.6, 18.0, 18.8, 19.7, 20.6, 21.4, 23.1, 23.2),  # 125
+        (12.6, 13.5, 14.0, 14.3, 14.7, 15.1, 15.6, 16.7, 18.0, 18.9, 19.8, 20.7, 21.5, 23.2, 23.3),  # 126
+        (12.6, 13.6, 14.0, 14.3, 14.7, 15.1, 15.6, 16.7, 18.1, 19.0, 19.9, 20.7, 21.6, 23.3, 23.4),  # 127
+        (12.6, 13.6, 14.1, 14.3, 14.7, 15.1, 15.6, 16.8, 18.1, 19.0, 19.9, 20.8, 21.6, 23.4, 23.5),  # 128
+        (12.6, 13.6, 14.1, 14.4, 14.8, 15.2, 15.7, 16.8, 18.2, 19.1, 20.0, 20.9, 21.7, 23.5, 23.6),  # 129
+        (12.6, 13.6, 14.1, 14.4, 14.8, 15.2, 15.7, 16.9, 18.2, 19.1, 20.1, 21.0, 21.8, 23.6, 23.7),  # 130
+        (12.7, 13.7, 14.2, 14.4, 14.8, 15.2, 15.8, 16.9, 18.3, 19.2, 20.1, 21.0, 21.9, 23.7, 23.8),  # 131
+        (12.7, 13.7, 14.2, 14.5, 14.9, 15.3, 15.8, 16.9, 18.4, 19.3, 20.2, 21.1, 22.0, 23.8, 23.9),  # 132
+        (12.7, 13.7, 14.2, 14.5, 14.9, 15.3, 15.8, 17.0, 18.4, 19.3, 20.2, 21.2, 22.1, 23.9, 24.0),  # 133
+        (12.8, 13.8, 14.3, 14.5, 14.9, 15.3, 15.9, 17.0, 18.5, 19.4, 20.4, 21.3, 22.2, 24.0, 24.1),  # 134
+        (12.8, 13.8, 14.3, 14.6, 15.0, 15.4, 15.9, 17.1, 18.5, 19.4, 20.4, 21.4, 22.2, 24.1, 24.2),  # 135
+        (12.8, 13.8, 14.3, 14.6, 15.0, 15.4, 16.0, 17.1, 18.6, 19.5, 20.4, 21.4, 22.3, 24.3, 24.4),  # 136
+        (12.9, 13.9, 14.4, 14.6, 15.0, 15.4, 16.0, 17.2, 18.6, 19.6, 20.6, 21.5, 22.4, 24.4, 24.5),  # 137
+        (12.9, 13.9, 14.4, 14.7, 15.1, 15.5, 16.0, 17.2, 18.7, 19.6, 20.6, 21.6, 22.5, 24.5, 24.6),  # 138
+        (12.9, 13.9, 14.4, 14.7, 15.1, 15.5, 16.1, 17.3, 18.8, 19.7, 20.7, 21.7, 22.6, 24.6, 24.7),  # 139
+        (12.9, 13.9, 14.5, 14.7, 15.1, 15.6, 16.1, 17.3, 18.8, 19.8, 20.8, 21.8, 22.7, 24.7, 24.8),  # 140
+        (13.0, 14.0, 14.5, 14.8, 15.2, 15.6, 16.2, 17.4, 18.9, 19.8, 20.8, 21.8, 22.8, 24.8, 24.9),  # 141
+        (13.0, 14.0, 14.5, 14.8, 15.2, 15.6, 16.2, 17.4, 18.9, 19.9, 20.9, 21.9, 22.9, 24.9, 25.0),  # 142
+        (13.0, 14.0, 14.6, 14.9, 15.3, 15.7, 16.3, 17.5, 19.0, 20.0, 21.0, 22.0, 23.0, 25.0, 25.1),  # 143
+        (13.1, 14.1, 14.6, 14.9, 15.3, 15.7, 16.3, 17.5, 19.1, 20.1, 21.1, 22.1, 23.1, 25.1, 25.2),  # 144
+        (13.1, 14.1, 14.6, 14.9, 15.4, 15.8, 16.3, 17.6, 19.1, 20.1, 21.1, 22.2, 23.1, 25.2, 25.3),  # 145
+        (13.2, 14.2, 14.7, 15.0, 15.4, 15.8, 16.4, 17.6, 19.2, 20.2, 21.2, 22.3, 23.2, 25.3, 25.4),  # 146
+        (13.2, 14.2, 14.7, 15.0, 15.4, 15.9, 16.4, 17.7, 19.3, 20.3, 21.3, 22.3, 23.3, 25.5, 25.6),  # 147
+        (13.2, 14.2, 14.8, 15.1, 15.5, 15.9, 16.5, 17.8, 19.3, 20.3, 21.4, 22.4, 23.4, 25.6, 25.7),  # 148
+        (13.3, 14.3, 14.8, 15.1, 15.6, 16.0, 16.5, 17.8, 19.4, 20.4, 21.4, 22.5, 23.5, 25.7, 25.8),  # 149
+        (13.3, 14.3, 14.8, 15.1, 15.6, 16.0, 16.6, 17.9, 19.5, 20.5, 21.6, 22.6, 23.6, 25.8, 25.9),  # 150
+        (13.3, 14.3, 14.9, 15.2, 15.7, 16.1, 16.6, 17.9, 19.5, 20.6, 21.6, 22.7, 23.7, 25.9, 26.0),  # 151
+        (13.4, 14.4, 14.9, 15.2, 15.7, 16.1, 16.7, 18.0, 19.6, 20.6, 21.7, 22.8, 23.8, 26.0, 26.1),  # 152
+        (13.4, 14.4, 15.0, 15.3, 15.8, 16.2, 16.8, 18.0, 19.7, 20.7, 21.8, 22.9, 23.9, 26.1, 26.2),  # 153
+        (13.5, 14.5, 15.0, 15.3, 15.8, 16.2, 16.8, 18.1, 19.7, 20.8, 21.9, 23.0, 24.0, 26.2, 26.3),  # 154
+        (13.5, 14.5, 15.0, 15.4, 15.9, 16.3, 16.9, 18.2, 19.8, 20.9, 22.0, 23.1, 24.1, 26.3, 26.4),  # 155
+        (13.5, 14.5, 15.1, 15.4, 15.9, 16.3, 16.9, 18.2, 19.9, 20.9, 22.0, 23.1, 24.2, 26.4, 26.5),  # 156
+        (13.6, 14.6, 15.1, 15.4, 15.9, 16.4, 17.0, 18.3, 19.9, 21.0, 22.1, 23.2, 24.3, 26.6, 26.7),  # 157
+        (13.6, 14.6, 15.2, 15.5, 15.9, 16.4, 17.0, 18.4, 20.0, 21.1, 22.2, 23.3, 24.4, 26.7, 26.8),  # 158
+        (13.7, 14.7, 15.2, 15.5, 16.0, 16.5, 17.1, 18.4, 20.1, 21.2, 22.3, 23.4, 24.5, 26.8, 26.9),  # 159
+        (13.7, 14.7, 15.3, 15.6, 16.1, 16.5, 17.1, 18.5, 20.2, 21.3, 22.4, 23.5, 24.6, 26.9, 27.0),  # 160
+        (13.7, 14.7, 15.3, 15.6, 16.1, 16.6, 17.2, 18.6, 20.2, 21.3, 22.5, 23.6, 24.7, 27.0, 27.1),  # 161
+        (13.8, 14.8, 15.4, 15.7, 16.1, 16.6, 17.2, 18.6, 20.3, 21.4, 22.5, 23.7, 24.8, 27.1, 27.2),  # 162
+        (13.8, 14.8, 15.4, 15.7, 16.2, 16.7, 17.3, 18.7, 20.4, 21.5, 22.6, 23.8, 24.9, 27.2, 27.3),  # 163
+        (13.9, 14.9, 15.5, 15.8, 16.2, 16.7, 17.4, 18.7, 20.5, 21.6, 22.8, 23.9, 24.9, 27.3, 27.4),  # 164
+        (13.9, 14.9, 15.5, 15.8, 16.3, 16.8, 17.4, 18.8, 20.5, 21.7, 22.9, 24.0, 25.0, 27.4, 27.5),  # 165
+        (14.0, 15.0, 15.5, 15.9, 16.4, 16.8, 17.5, 18.9, 20.6, 21.7, 22.9, 24.0, 25.1, 27.5, 27.6),  # 166
+        (14.0, 15.0, 15.6, 15.9, 16.4, 16.9, 17.5, 18.9, 20.7, 21.8, 23.0, 24.1, 25.2, 27.6, 27.7),  # 167
+        (14.0, 15.1, 15.6, 16.0, 16.4, 16.9, 17.6, 19.0, 20.8, 21.9, 23.0, 24.2, 25.3, 27.7, 27.8),  # 168
+        (14.0, 15.1, 15.7, 16.0, 16.5, 17.0, 17.7, 19.1, 20.8, 22.0, 23.1, 24.3, 25.4, 27.8, 27.9),  # 169
+        (14.0, 15.1, 15.7, 16.1, 16.6, 17.0, 17.7, 19.1, 20.9, 22.0, 23.2, 24.4, 25.5, 27.9, 28.0),  # 170
+        (14.1, 15.2, 15.8, 16.1, 16.6, 17.1, 17.8, 19.2, 21.0, 22.1, 23.3, 24.5, 25.6, 28.0, 28.1),  # 171
+        (14.1, 15.2, 15.8, 16.2, 16.7, 17.2, 17.8, 19.3, 21.1, 22.2, 23.4, 24.6, 25.7, 28.1, 28.2),  # 172
+        (14.2, 15.3, 15.9, 16.2, 16.7, 17.2, 17.9, 19.3, 21.1, 22.3, 23.5, 24.7, 25.8, 28.2, 28.3),  # 173
+        (14.2, 15.3, 15.9, 16.3, 16.8, 17.3, 17.9, 19.4, 21.2, 22.4, 23.5, 24.7, 25.8, 28.3, 28.3),  # 174
+        (14.2, 15.3, 16.0, 16.3, 16.8, 17.3, 18.0, 19.5, 21.3, 22.4, 23.6, 24.8, 25.9, 28.3, 28.4),  # 175
+        (14.3, 15.4, 16.0, 16.4, 16.9, 17.4, 18.1, 19.5, 21.3, 22.5, 23.7, 24.9, 26.0, 28.4, 28.5),  # 176
+        (14.3, 15.4, 16.1, 16.4, 16.9, 17.4, 18.1, 19.6, 21.4, 22.6, 23.8, 25.0, 26.1, 28.5, 28.6),  # 177
+        (14.4, 15.5, 16.1, 16.5, 17.0, 17.5, 18.2, 19.6, 21.5, 22.7, 23.9, 25.1, 26.2, 28.6, 28.7),  # 178
+        (14.4, 15.5, 16.1, 16.5, 17.0, 17.5, 18.2, 19.7, 21.6, 22.7, 23.9, 25.1, 26.3, 28.7, 28.8),  # 179
+        (14.5, 15.6, 16.2, 16.5, 17.1, 17.6, 18.3, 19.8, 21.6, 22.8, 24.0, 25.2, 26.4, 28.8, 28.9),  # 180
+        (14.5, 15.6, 16.2, 16.6, 17.1, 17.6, 18.3, 19.8, 21.7, 22.9, 24.1, 25.3, 26.4, 28.8, 28.9),  # 181
+        (14.5, 15.6, 16.3, 16.6, 17.1, 17.7, 18.4, 19.9, 21.8, 23.0, 24.2, 25.4, 26.5, 28.9, 29.0),  # 182
+        (14.6, 15.7, 16.3, 16.7, 17.2, 17.7, 18.4, 20.0, 21.8, 23.0, 24.2, 25.5, 26.6, 29.0, 29.1),  # 183
+        (14.6, 15.7, 16.4, 16.7, 17.2, 17.8, 18.5, 20.0, 21.9, 23.1, 24.3, 25.5, 26.7, 29.1, 29.2),  # 184
+        (14.7, 15.8, 16.4, 16.8, 17.3, 17.8, 18.5, 20.1, 22.0, 23.2, 24.4, 25.6, 26.7, 29.2, 29.3),  # 185
+        (14.7, 15.8, 16.4, 16.8, 17.4, 17.9, 18.6, 20.1, 22.0, 23.2, 24.4, 25.7, 26.8, 29.3, 29.3),  # 186
+        (14.7, 15.8, 16.5, 16.9, 17.4, 17.9, 18.7, 20.2, 22.1, 23.3, 24.6, 25.8, 26.9, 29.4, 29.4),  # 187
+        (14.8, 15.9, 16.5, 16.9, 17.4, 18.0, 18.7, 20.3, 22.2, 23.4, 24.6, 25.8, 27.0, 29.4, 29.5),  # 188
+        (14.8, 15.9, 16.6, 17.0, 17.5, 18.0, 18.8, 20.3, 22.2, 23.5, 24.7, 25.9, 27.0, 29.4, 29.5),  # 189
+        (14.8, 15.9, 16.6, 17.0, 17.6, 18.1, 18.8, 20.4, 22.3, 23.5, 24.8, 26.0, 27.1, 29.5, 29.6),  # 190
+        (14.9, 16.0, 16.7, 17.0, 17.6, 18.1, 18.9, 20.4, 22.4, 23.6, 24.9, 26.1, 27.2, 29.6, 29.7),  # 191
+        (14.9, 16.0, 16.7, 17.1, 17.6, 18.2, 18.9, 20.5, 22.4, 23.7, 24.9, 26.1, 27.3, 29.6, 29.7),  # 192
+        (15.0, 16.1, 16.7, 17.1, 17.6, 18.2, 19.0, 20.6, 22.5, 23.7, 24.9, 26.2, 27.3, 29.7, 29.8),  # 193
+        (15.0, 16.1, 16.8, 17.2, 17.8, 18.3, 19.0, 20.6, 22.6, 23.8, 25.1, 26.3, 27.4, 29.8, 29.9),  # 194
+        (15.0, 16.1, 16.8, 17.2, 17.8, 18.3, 19.1, 20.7, 22.6, 23.9, 25.1, 26.3, 27.5, 29.8, 29.9),  # 195
+        (15.1, 16.2, 16.8, 17.2, 17.8, 18.4, 19.1, 20.7, 22.7, 23.9, 25.1, 26.4, 27.5, 29.9, 30.0),  # 196
+        (15.1, 16.2, 16.9, 17.3, 17.9, 18.4, 19.2, 20.8, 22.7, 24.0, 25.2, 26.5, 27.6, 30.0, 30.1),  # 197
+        (15.1, 16.2, 16.9, 17.3, 17.9, 18.5, 19.2, 20.8, 22.8, 24.0, 25.2, 26.5, 27.7, 30.0, 30.1),  # 198
+        (15.2, 16.3, 17.0, 17.4, 17.9, 18.5, 19.3, 20.9, 22.9, 24.1, 25.4, 26.6, 27.7, 30.1, 30.2),  # 199
+        (15.2, 16.3, 17.0, 17.4, 17.9, 18.5, 19.3, 20.9, 22.9, 24.2, 25.4, 26.7, 27.8, 30.1, 30.2),  # 200
+        (15.2, 16.3, 17.0, 17.4, 18.0, 18.6, 19.3, 21.0, 23.0, 24.2, 25.4, 26.7, 27.8, 30.2, 30.3),  # 201
+        (15.3, 16.4, 17.1, 17.5, 18.1, 18.6, 19.4, 21.0, 23.0, 24.3, 25.6, 26.8, 27.9, 30.3, 30.4),  # 202
+        (15.3, 16.4, 17.1, 17.5, 18.1, 18.7, 19.4, 21.1, 23.1, 24.4, 25.6, 26.9, 28.0, 30.4, 30.5),  # 203
+        (15.3, 16.4, 17.1, 17.5, 18.1, 18.7, 19.5, 21.1, 23.1, 24.4, 25.6, 26.9, 28.0, 30.4, 30.5),  # 204
+        (15.3, 16.4, 17.2, 17.6, 18.1, 18.7, 19.5, 21.2, 23.2, 24.5, 25.8, 27.0, 28.1, 30.4, 30.5),  # 205
+        (15.3, 16.5, 17.2, 17.6, 18.2, 18.8, 19.6, 21.2, 23.3, 24.5, 25.8, 27.0, 28.1, 30.5, 30.6),  # 206
+        (15.3, 16.5, 17.2, 17.6, 18.2, 18.8, 19.6, 21.3, 23.3, 24.6, 25.9, 27.1, 28.2, 30.5, 30.6),  # 207
+        (15.3, 16.5, 17.3, 17.7, 18.3, 18.9, 19.7, 21.3, 23.4, 24.6, 25.9, 27.1, 28.2, 30.6, 30.7),  # 208
+        (15.4, 16.6, 17.3, 17.7, 18.3, 18.9, 19.7, 21.4, 23.4, 24.7, 25.9, 27.2, 28.3, 30.6, 30.7),  # 209
+        (15.4, 16.6, 17.3, 17.7, 18.3, 18.9, 19.7, 21.4, 23.5, 24.7, 25.9, 27.2, 28.4, 30.7, 30.8),  # 210
+        (15.4, 16.6, 17.4, 17.8, 18.4, 19.0, 19.8, 21.5, 23.5, 24.8, 26.1, 27.3, 28.4, 30.7, 30.8),  # 211
+        (15.4, 16.6, 17.4, 17.8, 18.4, 19.0, 19.8, 21.5, 23.6, 24.8, 26.1, 27.3, 28.5, 30.7, 30.8),  # 212
+        (15.5, 16.7, 17.4, 17.8, 18.5, 19.1, 19.9, 21.6, 23.6, 24.9, 26.1, 27.4, 28.5, 30.8, 30.9),  # 213
+        (15.5, 16.7, 17.4, 17.9, 18.5, 19.1, 19.9, 21.6, 23.7, 24.9, 26.1, 27.4, 28.6, 30.8, 30.9),  # 214
+        (15.5, 16.7, 17.5, 17.9, 18.5, 19.1, 19.9, 21.7, 23.7, 25.0, 26.2, 27.5, 28.6, 30.9, 31.0),  # 215
+        (15.5, 16.7, 17.5, 17.9, 18.5, 19.2, 20.0, 21.7, 23.8, 25.0, 26.2, 27.5, 28.6, 30.9, 31.0),  # 216
+        (15.6, 16.8, 17.5, 18.0, 18.6, 19.2, 20.0, 21.8, 23.8, 25.1, 26.4, 27.6, 28.7, 31.0, 31.1),  # 217
+        (15.6, 16.8, 17.5, 18.0, 18.6, 19.2, 20.1, 21.8, 23.9, 25.1, 26.4, 27.6, 28.7, 31.0, 31.1),  # 218
+        (15.6, 16.8, 17.6, 18.0, 18.6, 19.3, 20.1, 21.8, 23.9, 25.2, 26.4, 27.7, 28.8, 31.0, 31.1),  # 219
+        (15.6, 16.8, 17.6, 18.0, 18.6, 19.3, 20.1, 21.9, 24.0, 25.2, 26.4, 27.7, 28.8, 31.1, 31.2),  # 220
+        (15.6, 16.8, 17.6, 18.1, 18.7, 19.3, 20.2, 21.9, 24.0, 25.3, 26.6, 27.8, 28.9, 31.1, 31.2),  # 221
+        (15.6, 16.8, 17.6, 18.1, 18.8, 19.4, 20.2, 22.0, 24.0, 25.3, 26.6, 27.8, 28.9, 31.1, 31.2),  # 222
+        (15.7, 16.9, 17.7, 18.1, 18.8, 19.4, 20.2, 22.0, 24.1, 25.4, 26.6, 27.9, 29.0, 31.2, 31.3),  # 223
+        (15.7, 16.9, 17.7, 18.1, 18.8, 19.4, 20.3, 22.0, 24.1, 25.4, 26.6, 27.9, 29.0, 31.2, 31.3),  # 224
+        (15.7, 16.9, 17.7, 18.2, 18.9, 19.5, 20.3, 22.1, 24.2, 25.5, 26.8, 28.0, 29.1, 31.3, 31.4),  # 225
+        (15.7, 16.9, 17.7, 18.2, 18.9, 19.5, 20.3, 22.1, 24.2, 25.5, 26.8, 28.0, 29.1, 31.3, 31.4),  # 226
+        (15.7, 16.9, 17.8, 18.2, 18.9, 19.5, 20.4, 22.2, 24.3, 25.5, 26.8, 28.0, 29.1, 31.3, 31.4),  # 227
+        (15.8, 17.0, 17.8, 18.2, 18.9, 19.5, 20.4, 22.2, 24.3, 25.6, 26.9, 28.1, 29.1, 31.3, 31.4),  # 228
+    ),
+    "girl": (
+        (10.0, 10.8, 11.2, 11.5, 11.8, 12.1, 12.5, 13.3, 14.2, 14.7, 15.1, 15.5, 15.9, 16.5, 16.6),  # 0
+        (10.8, 11.6, 12.1, 12.4, 12.8, 13.2, 13.6, 14.6, 15.5, 16.1, 16.6, 17.0, 17.3, 17.9, 18.0),  # 1
+        (11.7, 12.6, 13.2, 13.5, 13.9, 14.3, 14.8, 15.8, 16.8, 17.4, 17.9, 18.4, 18.8, 19.4, 19.5),  # 2
+        (12.3, 13.2, 13.7, 14.0, 14.4, 14.9, 15.4, 16.4, 17.4, 18.0, 18.5, 19.0, 19.4, 20.2, 20.3),  # 3
+        (12.6, 13.5, 14.0, 14.3, 14.8, 15.2, 15.7, 16.7, 17.7, 18.3, 18.9, 19.4, 19.8, 20.5, 20.6),  # 4
+        (12.7, 13.7, 14.2, 14.5, 14.9, 15.3, 15.8, 16.8, 17.9, 18.5, 19.1, 19.6, 20.0, 20.7, 20.8),  # 5
+        (12.7, 13.7, 14.3, 14.6, 15.0, 15.4, 15.9, 16.9, 18.0, 18.6, 19.1, 19.6, 20.1, 20.8, 20.9),  # 6
+        (12.8, 13.8, 14.3, 14.6, 15.0, 15.4, 15.9, 16.9, 18.0, 18.6, 19.1, 19.6, 20.1, 20.8, 20.9),  # 7
+        (12.7, 13.7, 14.3, 14.6, 15.0, 15.4, 15.9, 16.8, 17.9, 18.5, 19.1, 19.6, 20.0, 20.7, 20.8),  # 8
+        (12.7, 13.7, 14.2, 14.5, 14.9, 15.3, 15.8, 16.7, 17.8, 18.4, 18.9, 19.4, 19.9, 20.6, 20.7),  # 9
+        (12.6, 13.6, 14.1, 14.4, 14.8, 15.2, 15.7, 16.6, 17.7, 18.2, 18.8, 19.3, 19.7, 20.5, 20.6),  # 10
+        (12.6, 13.5, 14.0, 14.3, 14.7, 15.1, 15.5, 16.5, 17.5, 18.1, 18.6, 19.1, 19.6, 20.3, 20.4),  # 11
+        (12.5, 13.4, 13.9, 14.2, 14.6, 15.0, 15.4, 16.4, 17.4, 17.9, 18.4, 19.0, 19.4, 20.1, 20.2),  # 12
+        (12.4, 13.3, 13.8, 14.1, 14.4, 14.8, 15.3, 16.2, 17.2, 17.8, 18.3, 18.8, 19.2, 20.0, 20.1),  # 13
+        (12.4, 13.3, 13.7, 14.0, 14.3, 14.7, 15.2, 16.1, 17.1, 17.7, 18.2, 18.7, 19.1, 19.8, 19.9),  # 14
+        (12.3, 13.2, 13.7, 13.9, 14.2, 14.6, 15.1, 16.0, 17.0, 17.5, 18.1, 18.6, 19.0, 19.7, 19.8),  # 15
+        (12.2, 13.1, 13.6, 13.8, 14.2, 14.6, 15.0, 15.9, 16.9, 17.4, 17.9, 18.4, 18.8, 19.6, 19.7),  # 16
+        (12.1, 13.0, 13.5, 13.8, 14.2, 14.5, 14.9, 15.8, 16.8, 17.3, 17.8, 18.3, 18.7, 19.4, 19.5),  # 17
+        (12.1, 13.0, 13.4, 13.7, 14.1, 14.4, 14.8, 15.7, 16.7, 17.2, 17.7, 18.2, 18.6, 19.3, 19.4),  # 18
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.8, 15.7, 16.6, 17.2, 17.6, 18.1, 18.5, 19.2, 19.3),  # 19
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.3, 14.7, 15.6, 16.5, 17.1, 17.6, 18.1, 18.5, 19.2, 19.3),  # 20
+        (11.9, 12.8, 13.3, 13.6, 13.9, 14.2, 14.7, 15.5, 16.5, 17.0, 17.5, 18.0, 18.4, 19.1, 19.2),  # 21
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.4, 17.0, 17.4, 17.9, 18.3, 19.0, 19.1),  # 22
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.2, 14.6, 15.4, 16.4, 16.9, 17.4, 17.9, 18.3, 19.0, 19.1),  # 23
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.6, 15.4, 16.3, 16.9, 17.4, 17.8, 18.2, 18.9, 19.0),  # 24
+        (12.1, 13.0, 13.4, 13.7, 14.1, 14.4, 14.8, 15.7, 16.6, 17.1, 17.6, 18.1, 18.5, 19.2, 19.3),  # 25
+        (12.1, 13.0, 13.4, 13.7, 14.1, 14.4, 14.8, 15.6, 16.6, 17.1, 17.6, 18.1, 18.5, 19.2, 19.3),  # 26
+        (12.1, 13.0, 13.4, 13.7, 14.0, 14.3, 14.8, 15.6, 16.5, 17.1, 17.6, 18.0, 18.4, 19.1, 19.2),  # 27
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.6, 16.5, 17.0, 17.5, 18.0, 18.4, 19.1, 19.2),  # 28
+        (12.0, 12.9, 13.4, 13.6, 13.9, 14.3, 14.7, 15.6, 16.5, 17.0, 17.5, 18.0, 18.4, 19.1, 19.2),  # 29
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.3, 14.7, 15.5, 16.5, 17.0, 17.4, 17.9, 18.3, 19.0, 19.1),  # 30
+        (12.0, 12.9, 13.3, 13.6, 13.9, 14.2, 14.7, 15.5, 16.4, 17.0, 17.4, 17.9, 18.3, 19.0, 19.1),  # 31
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.4, 16.9, 17.4, 17.9, 18.3, 19.0, 19.1),  # 32
+        (11.9, 12.8, 13.3, 13.5, 13.8, 14.2, 14.6, 15.5, 16.4, 16.9, 17.4, 17.9, 18.3, 18.9, 19.0),  # 33
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.2, 14.6, 15.4, 16.4, 16.9, 17.4, 17.9, 18.2, 18.9, 19.0),  # 34
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.6, 15.4, 16.3, 16.9, 17.4, 17.8, 18.2, 18.9, 19.0),  # 35
+        (11.9, 12.8, 13.2, 13.5, 13.8, 14.1, 14.5, 15.4, 16.3, 16.9, 17.4, 17.8, 18.2, 18.9, 19.0),  # 36
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.1, 14.5, 15.4, 16.3, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 37
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.1, 14.5, 15.4, 16.3, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 38
+        (11.8, 12.7, 13.1, 13.4, 13.8, 14.1, 14.5, 15.3, 16.3, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 39
+        (11.8, 12.7, 13.1, 13.4, 13.7, 14.0, 14.5, 15.3, 16.3, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 40
+        (11.7, 12.6, 13.1, 13.3, 13.7, 14.0, 14.5, 15.3, 16.3, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 41
+        (11.7, 12.6, 13.1, 13.3, 13.7, 14.0, 14.4, 15.3, 16.3, 16.8, 17.3, 17.8, 18.2, 18.9, 19.0),  # 42
+        (11.7, 12.6, 13.0, 13.3, 13.7, 14.0, 14.4, 15.3, 16.3, 16.8, 17.3, 17.8, 18.2, 19.0, 19.1),  # 43
+        (11.7, 12.6, 13.0, 13.3, 13.7, 14.0, 14.4, 15.3, 16.3, 16.8, 17.3, 17.8, 18.2, 19.0, 19.1),  # 44
+        (11.6, 12.5, 13.0, 13.3, 13.7, 14.0, 14.4, 15.3, 16.3, 16.8, 17.3, 17.8, 18.3, 19.0, 19.1),  # 45
+        (11.6, 12.5, 13.0, 13.2, 13.6, 13.9, 14.4, 15.3, 16.3, 16.8, 17.3, 17.8, 18.3, 19.0, 19.1),  # 46
+        (11.6, 12.5, 13.0, 13.2, 13.6, 13.9, 14.4, 15.3, 16.3, 16.8, 17.4, 17.9, 18.3, 19.0, 19.1),  # 47
+        (11.6, 12.5, 12.9, 13.2, 13.6, 13.9, 14.4, 15.3, 16.3, 16.8, 17.4, 17.9, 18.3, 19.1, 19.2),  # 48
+        (11.6, 12.5, 12.9, 13.2, 13.6, 13.9, 14.4, 15.3, 16.3, 16.8, 17.4, 17.9, 18.3, 19.1, 19.2),  # 49
+        (11.5, 12.4, 12.9, 13.2, 13.6, 13.9, 14.3, 15.3, 16.3, 16.8, 17.4, 17.9, 18.3, 19.1, 19.2),  # 50
+        (11.5, 12.4, 12.9, 13.2, 13.6, 13.9, 14.3, 15.3, 16.3, 16.8, 17.4, 17.9, 18.4, 19.1, 19.2),  # 51
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.3, 15.2, 16.3, 16.9, 17.4, 17.9, 18.4, 19.2, 19.3),  # 52
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.3, 15.3, 16.3, 16.9, 17.4, 17.9, 18.4, 19.2, 19.3),  # 53
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.3, 15.3, 16.3, 16.9, 17.4, 18.0, 18.4, 19.2, 19.3),  # 54
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.3, 15.3, 16.3, 16.9, 17.4, 18.0, 18.4, 19.3, 19.4),  # 55
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.3, 16.9, 17.4, 18.0, 18.5, 19.3, 19.4),  # 56
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.3, 16.9, 17.4, 18.0, 18.5, 19.3, 19.4),  # 57
+        (11.4, 12.3, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.3, 16.9, 17.4, 18.0, 18.5, 19.3, 19.4),  # 58
+        (11.4, 12.3, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.3, 16.9, 17.5, 18.1, 18.5, 19.4, 19.5),  # 59
+        (11.4, 12.3, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.3, 17.0, 17.6, 18.1, 18.6, 19.4, 19.5),  # 60
+        (11.5, 12.4, 12.9, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 16.9, 17.5, 18.1, 18.6, 19.5, 19.6),  # 61
+        (11.5, 12.4, 12.9, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 16.9, 17.5, 18.1, 18.6, 19.5, 19.6),  # 62
+        (11.5, 12.4, 12.9, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 17.0, 17.6, 18.1, 18.7, 19.6, 19.7),  # 63
+        (11.5, 12.4, 12.9, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 17.0, 17.6, 18.2, 18.7, 19.6, 19.7),  # 64
+        (11.5, 12.4, 12.9, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 17.0, 17.6, 18.2, 18.7, 19.7, 19.8),  # 65
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 17.0, 17.6, 18.2, 18.7, 19.7, 19.8),  # 66
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.2, 16.3, 17.0, 17.6, 18.2, 18.8, 19.7, 19.8),  # 67
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.0, 17.6, 18.3, 18.8, 19.8, 19.9),  # 68
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.0, 17.6, 18.3, 18.8, 19.8, 19.9),  # 69
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.0, 17.6, 18.3, 18.9, 19.9, 20.0),  # 70
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.1, 17.7, 18.3, 18.9, 19.9, 20.0),  # 71
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.1, 17.8, 18.4, 18.9, 20.0, 20.1),  # 72
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.1, 17.8, 18.4, 19.0, 20.0, 20.1),  # 73
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.1, 17.8, 18.4, 19.0, 20.1, 20.2),  # 74
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.4, 17.1, 17.8, 18.5, 19.0, 20.1, 20.2),  # 75
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.5, 17.2, 17.9, 18.5, 19.1, 20.2, 20.3),  # 76
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.5, 17.2, 17.9, 18.5, 19.1, 20.3, 20.4),  # 77
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.5, 17.2, 17.9, 18.6, 19.2, 20.3, 20.4),  # 78
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.5, 17.2, 17.9, 18.6, 19.2, 20.4, 20.5),  # 79
+        (11.5, 12.4, 12.8, 13.1, 13.4, 13.8, 14.3, 15.3, 16.5, 17.3, 18.0, 18.6, 19.3, 20.4, 20.5),  # 80
+        (11.5, 12.4, 12.8, 13.1, 13.5, 13.9, 14.3, 15.4, 16.6, 17.3, 18.0, 18.7, 19.3, 20.5, 20.6),  # 81
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.3, 15.4, 16.6, 17.3, 18.0, 18.7, 19.3, 20.6, 20.7),  # 82
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.4, 15.4, 16.6, 17.3, 18.1, 18.8, 19.4, 20.6, 20.7),  # 83
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.4, 15.4, 16.6, 17.4, 18.1, 18.8, 19.4, 20.7, 20.8),  # 84
+        (11.5, 12.4, 12.9, 13.1, 13.5, 13.9, 14.4, 15.4, 16.6, 17.4, 18.1, 18.9, 19.5, 20.8, 20.9),  # 85
+        (11.5, 12.4, 12.9, 13.2, 13.6, 13.9, 14.4, 15.4, 16.7, 17.4, 18.1, 18.9, 19.6, 20.8, 20.9),  # 86
+        (11.5, 12.4, 12.9, 13.2, 13.6, 13.9, 14.4, 15.5, 16.7, 17.5, 18.2, 19.0, 19.6, 20.9, 21.0),  # 87
+        (11.5, 12.4, 12.9, 13.2, 13.6, 13.9, 14.4, 15.5, 16.7, 17.5, 18.2, 19.0, 19.7, 21.0, 21.1),  # 88
+        (11.5, 12.4, 12.9, 13.2, 13.6, 13.9, 14.4, 15.5, 16.8, 17.5, 18.3, 19.1, 19.7, 21.1, 21.2),  # 89
+        (11.6, 12.5, 12.9, 13.2, 13.6, 14.0, 14.5, 15.5, 16.8, 17.6, 18.4, 19.1, 19.8, 21.1, 21.2),  # 90
+        (11.6, 12.5, 12.9, 13.2, 13.6, 14.0, 14.5, 15.5, 16.8, 17.6, 18.4, 19.2, 19.8, 21.2, 21.3),  # 91
+        (11.6, 12.5, 13.0, 13.2, 13.6, 14.0, 14.5, 15.6, 16.9, 17.6, 18.4, 19.2, 19.9, 21.3, 21.4),  # 92
+        (11.6, 12.5, 13.0, 13.2, 13.6, 14.0, 14.5, 15.6, 16.9, 17.7, 18.5, 19.3, 20.0, 21.4, 21.5),  # 93
+        (11.6, 12.5, 13.0, 13.3, 13.7, 14.0, 14.5, 15.6, 16.9, 17.7, 18.5, 19.3, 20.0, 21.5, 21.6),  # 94
+        (11.6, 12.5, 13.0, 13.3, 13.7, 14.0, 14.6, 15.7, 17.0, 17.8, 18.6, 19.4, 20.1, 21.6, 21.7),  # 95
+        (11.6, 12.5, 13.0, 13.3, 13.7, 14.1, 14.6, 15.7, 17.0, 17.8, 18.6, 19.4, 20.2, 21.6, 21.7),  # 96
+        (11.7, 12.6, 13.0, 13.3, 13.7, 14.1, 14.6, 15.7, 17.0, 17.9, 18.7, 19.5, 20.2, 21.7, 21.8),  # 97
+        (11.7, 12.6, 13.1, 13.3, 13.7, 14.1, 14.6, 15.7, 17.1, 17.9, 18.8, 19.6, 20.3, 21.8, 21.9),  # 98
+        (11.7, 12.6, 13.1, 13.4, 13.8, 14.1, 14.7, 15.8, 17.1, 18.0, 18.8, 19.6, 20.4, 21.9, 22.0),  # 99
+        (11.7, 12.6, 13.1, 13.4, 13.8, 14.2, 14.7, 15.8, 17.2, 18.0, 18.9, 19.7, 20.4, 22.0, 22.1),  # 100
+        (11.7, 12.6, 13.1, 13.4, 13.8, 14.2, 14.7, 15.8, 17.2, 18.1, 19.0, 19.8, 20.5, 22.1, 22.2),  # 101
+        (11.7, 12.6, 13.1, 13.4, 13.8, 14.2, 14.7, 15.9, 17.2, 18.1, 19.0, 19.8, 20.6, 22.2, 22.3),  # 102
+        (11.8, 12.7, 13.2, 13.4, 13.8, 14.2, 14.8, 15.9, 17.3, 18.2, 19.0, 19.9, 20.7, 22.3, 22.4),  # 103
+        (11.8, 12.7, 13.2, 13.5, 13.9, 14.3, 14.8, 15.9, 17.3, 18.2, 19.1, 20.0, 20.7, 22.4, 22.5),  # 104
+        (11.8, 12.7, 13.2, 13.5, 13.9, 14.3, 14.8, 16.0, 17.4, 18.3, 19.1, 20.0, 20.8, 22.5, 22.6),  # 105
+        (11.8, 12.7, 13.2, 13.5, 13.9, 14.3, 14.9, 16.0, 17.4, 18.3, 19.2, 20.1, 20.9, 22.6, 22.7),  # 106
+        (11.9, 12.8, 13.3, 13.5, 13.9, 14.4, 14.9, 16.1, 17.5, 18.4, 19.3, 20.2, 21.0, 22.7, 22.8),  # 107
+        (11.9, 12.8, 13.3, 13.6, 14.0, 14.4, 14.9, 16.1, 17.5, 18.4, 19.3, 20.2, 21.1, 22.8, 22.9),  # 108
+        (11.9, 12.8, 13.3, 13.6, 14.0, 14.4, 15.0, 16.1, 17.6, 18.5, 19.4, 20.3, 21.1, 22.9, 23.0),  # 109
+        (11.9, 12.8, 13.3, 13.6, 14.0, 14.4, 15.0, 16.2, 17.6, 18.5, 19.4, 20.4, 21.2, 23.0, 23.1),  # 110
+        (11.9, 12.8, 13.4, 13.6, 14.1, 14.5, 15.0, 16.2, 17.7, 18.6, 19.6, 20.5, 21.3, 23.1, 23.2),  # 111
+        (12.0, 12.9, 13.4, 13.7, 14.1, 14.5, 15.1, 16.3, 17.7, 18.7, 19.6, 20.5, 21.4, 23.2, 23.3),  # 112
+        (12.0, 12.9, 13.4, 13.7, 14.1, 14.5, 15.1, 16.3, 17.8, 18.7, 19.6, 20.6, 21.5, 23.3, 23.4),  # 113
+        (12.0, 12.9, 13.4, 13.7, 14.1, 14.6, 15.1, 16.3, 17.8, 18.8, 19.8, 20.7, 21.6, 23.4, 23.5),  # 114
+        (12.1, 13.0, 13.5, 13.8, 14.2, 14.6, 15.2, 16.4, 17.9, 18.8, 19.8, 20.7, 21.6, 23.5, 23.6),  # 115
+        (12.1, 13.0, 13.5, 13.8, 14.2, 14.6, 15.2, 16.4, 17.9, 18.9, 19.9, 20.8, 21.7, 23.6, 23.7),  # 116
+        (12.1, 13.0, 13.5, 13.8, 14.2, 14.7, 15.2, 16.5, 18.0, 18.9, 19.9, 20.9, 21.8, 23.7, 23.8),  # 117
+        (12.1, 13.0, 13.6, 13.9, 14.3, 14.7, 15.3, 16.5, 18.0, 19.0, 20.0, 21.0, 21.9, 23.8, 23.9),  # 118
+        (12.2, 13.1, 13.6, 13.9, 14.3, 14.7, 15.3, 16.6, 18.1, 19.1, 20.1, 21.1, 22.0, 23.9, 24.0),  # 119
+        (12.2, 13.1, 13.6, 13.9, 14.4, 14.8, 15.4, 16.6, 18.2, 19.1, 20.1, 21.1, 22.1, 24.0, 24.1),  # 120
+        (12.2, 13.1, 13.6, 14.0, 14.4, 14.8, 15.4, 16.7, 18.2, 19.2, 20.2, 21.2, 22.2, 24.1, 24.2),  # 121
+        (12.2, 13.1, 13.7, 14.0, 14.4, 14.9, 15.4, 16.7, 18.3, 19.3, 20.3, 21.3, 22.2, 24.2, 24.3),  # 122
+        (12.3, 13.2, 13.7, 14.0, 14.4, 14.9, 15.5, 16.8, 18.3, 19.3, 20.4, 21.4, 22.3, 24.3, 24.4),  # 123
+        (12.3, 13.2, 13.7, 14.1, 14.5, 14.9, 15.5, 16.8, 18.4, 19.4, 20.4, 21.5, 22.4, 24.5, 24.6),  # 124
+        (12.3, 13.2, 13.8, 14.1, 14.6, 15.0, 15.6, 16.9, 18.5, 19.5, 20.5, 21.5, 22.5, 24.6, 24.7),  # 125
+        (12.4, 13.3, 13.8, 14.1, 14.6, 15.0, 15.6, 16.9, 18.5, 19.5, 20.6, 21.6, 22.6, 24.7, 24.8),  # 126
+        (12.4, 13.3, 13.9, 14.2, 14.6, 15.1, 15.7, 17.0, 18.6, 19.6, 20.6, 21.7, 22.7, 24.8, 24.9),  # 127
+        (12.4, 13.3, 13.9, 14.2, 14.6, 15.1, 15.7, 17.0, 18.6, 19.7, 20.8, 21.8, 22.8, 24.9, 25.0),  # 128
+        (12.5, 13.4, 13.9, 14.2, 14.6, 15.1, 15.8, 17.1, 18.7, 19.8, 20.9, 21.9, 22.9, 25.0, 25.1),  # 129
+        (12.5, 13.4, 14.0, 14.3, 14.8, 15.2, 15.8, 17.1, 18.8, 19.8, 20.9, 22.0, 23.0, 25.1, 25.2),  # 130
+        (12.5, 13.4, 14.0, 14.3, 14.8, 15.2, 15.9, 17.2, 18.8, 19.9, 21.0, 22.1, 23.1, 25.2, 25.3),  # 131
+        (12.6, 13.5, 14.0, 14.4, 14.9, 15.3, 15.9, 17.2, 18.9, 20.0, 21.1, 22.2, 23.2, 25.3, 25.4),  # 132
+        (12.6, 13.5, 14.1, 14.4, 14.9, 15.3, 16.0, 17.3, 19.0, 20.0, 21.1, 22.2, 23.3, 25.5, 25.6),  # 133
+        (12.6, 13.6, 14.1, 14.4, 14.9, 15.4, 16.0, 17.4, 19.0, 20.1, 21.2, 22.3, 23.4, 25.6, 25.7),  # 134
+        (12.6, 13.6, 14.2, 14.5, 14.9, 15.4, 16.1, 17.4, 19.1, 20.2, 21.3, 22.4, 23.5, 25.7, 25.8),  # 135
+        (12.6, 13.6, 14.2, 14.5, 15.0, 15.5, 16.1, 17.5, 19.2, 20.3, 21.4, 22.5, 23.6, 25.8, 25.9),  # 136
+        (12.7, 13.7, 14.2, 14.6, 15.1, 15.5, 16.2, 17.5, 19.3, 20.4, 21.5, 22.6, 23.7, 25.9, 26.0),  # 137
+        (12.7, 13.7, 14.3, 14.6, 15.1, 15.6, 16.2, 17.6, 19.3, 20.4, 21.5, 22.7, 23.8, 26.0, 26.1),  # 138
+        (12.7, 13.7, 14.3, 14.7, 15.1, 15.6, 16.3, 17.7, 19.4, 20.5, 21.6, 22.8, 23.9, 26.1, 26.2),  # 139
+        (12.8, 13.8, 14.4, 14.7, 15.2, 15.7, 16.3, 17.7, 19.5, 20.6, 21.8, 22.9, 24.0, 26.3, 26.4),  # 140
+        (12.8, 13.8, 14.4, 14.8, 15.2, 15.7, 16.4, 17.8, 19.6, 20.7, 21.9, 23.0, 24.1, 26.4, 26.5),  # 141
+        (12.9, 13.9, 14.5, 14.8, 15.3, 15.8, 16.4, 17.9, 19.6, 20.8, 22.0, 23.1, 24.2, 26.5, 26.6),  # 142
+        (12.9, 13.9, 14.5, 14.9, 15.4, 15.8, 16.5, 17.9, 19.7, 20.8, 22.0, 23.2, 24.3, 26.6, 26.7),  # 143
+        (13.0, 14.0, 14.6, 14.9, 15.4, 15.9, 16.6, 18.0, 19.8, 20.9, 22.1, 23.3, 24.4, 26.7, 26.8),  # 144
+        (13.0, 14.0, 14.6, 15.0, 15.4, 15.9, 16.6, 18.1, 19.9, 21.0, 22.2, 23.4, 24.5, 26.8, 26.9),  # 145
+        (13.0, 14.0, 14.7, 15.0, 15.5, 16.0, 16.7, 18.1, 19.9, 21.1, 22.3, 23.5, 24.6, 26.9, 27.0),  # 146
+        (13.1, 14.1, 14.7, 15.0, 15.6, 16.1, 16.7, 18.2, 20.0, 21.2, 22.4, 23.6, 24.7, 27.1, 27.2),  # 147
+        (13.1, 14.1, 14.7, 15.1, 15.6, 16.1, 16.8, 18.3, 20.1, 21.3, 22.5, 23.7, 24.8, 27.2, 27.3),  # 148
+        (13.2, 14.2, 14.8, 15.1, 15.6, 16.2, 16.8, 18.3, 20.2, 21.3, 22.6, 23.8, 24.9, 27.3, 27.4),  # 149
+        (13.2, 14.2, 14.8, 15.2, 15.7, 16.2, 16.9, 18.4, 20.2, 21.4, 22.6, 23.9, 25.0, 27.4, 27.5),  # 150
+        (13.3, 14.3, 14.9, 15.2, 15.8, 16.3, 17.0, 18.5, 20.3, 21.5, 22.7, 23.9, 25.1, 27.5, 27.6),  # 151
+        (13.3, 14.3, 14.9, 15.3, 15.8, 16.3, 17.0, 18.5, 20.4, 21.6, 22.8, 24.0, 25.2, 27.6, 27.7),  # 152
+        (13.3, 14.3, 15.0, 15.3, 15.8, 16.4, 17.1, 18.6, 20.5, 21.7, 22.9, 24.1, 25.3, 27.7, 27.8),  # 153
+        (13.4, 14.4, 15.0, 15.4, 15.9, 16.4, 17.1, 18.7, 20.6, 21.8, 23.0, 24.2, 25.4, 27.8, 27.9),  # 154
+        (13.4, 14.4, 15.1, 15.4, 15.9, 16.5, 17.2, 18.7, 20.6, 21.8, 23.1, 24.3, 25.5, 27.9, 28.0),  # 155
+        (13.5, 14.5, 15.1, 15.5, 16.0, 16.5, 17.3, 18.8, 20.7, 21.9, 23.1, 24.4, 25.6, 28.0, 28.1),  # 156
+        (13.5, 14.5, 15.2, 15.5, 16.1, 16.6, 17.3, 18.9, 20.8, 22.0, 23.2, 24.5, 25.7, 28.1, 28.2),  # 157
+        (13.6, 14.6, 15.2, 15.6, 16.1, 16.7, 17.4, 18.9, 20.9, 22.1, 23.4, 24.6, 25.8, 28.3, 28.4),  # 158
+        (13.6, 14.6, 15.3, 15.6, 16.1, 16.7, 17.4, 19.0, 20.9, 22.2, 23.4, 24.7, 25.9, 28.4, 28.5),  # 159
+        (13.6, 14.6, 15.3, 15.7, 16.2, 16.8, 17.5, 19.1, 21.0, 22.3, 23.6, 24.8, 26.0, 28.5, 28.6),  # 160
+        (13.7, 14.7, 15.3, 15.7, 16.2, 16.8, 17.5, 19.1, 21.1, 22.3, 23.6, 24.9, 26.1, 28.6, 28.7),  # 161
+        (13.7, 14.7, 15.4, 15.8, 16.4, 16.9, 17.6, 19.2, 21.2, 22.4, 23.7, 25.0, 26.1, 28.7, 28.8),  # 162
+        (13.8, 14.8, 15.4, 15.8, 16.4, 16.9, 17.7, 19.3, 21.2, 22.5, 23.8, 25.1, 26.2, 28.8, 28.9),  # 163
+        (13.8, 14.8, 15.5, 15.9, 16.4, 17.0, 17.7, 19.3, 21.3, 22.6, 23.9, 25.1, 26.3, 28.8, 28.9),  # 164
+        (13.8, 14.8, 15.5, 15.9, 16.4, 17.0, 17.8, 19.4, 21.4, 22.6, 23.9, 25.2, 26.4, 28.9, 29.0),  # 165
+        (13.9, 14.9, 15.6, 15.9, 16.5, 17.1, 17.8, 19.4, 21.4, 22.7, 24.0, 25.3, 26.5, 29.0, 29.1),  # 166
+        (13.9, 14.9, 15.6, 16.0, 16.6, 17.1, 17.9, 19.5, 21.5, 22.8, 24.1, 25.4, 26.6, 29.1, 29.2),  # 167
+        (14.0, 15.0, 15.6, 16.0, 16.6, 17.2, 17.9, 19.6, 21.6, 22.9, 24.2, 25.5, 26.7, 29.2, 29.3),  # 168
+        (14.0, 15.0, 15.7, 16.1, 16.6, 17.2, 18.0, 19.6, 21.6, 22.9, 24.2, 25.6, 26.8, 29.3, 29.4),  # 169
+        (14.0, 15.0, 15.7, 16.1, 16.7, 17.3, 18.0, 19.7, 21.7, 23.0, 24.3, 25.6, 26.8, 29.4, 29.5),  # 170
+        (14.0, 15.1, 15.8, 16.2, 16.8, 17.3, 18.1, 19.7, 21.8, 23.1, 24.4, 25.7, 26.9, 29.5, 29.6),  # 171
+        (14.0, 15.1, 15.8, 16.2, 16.8, 17.4, 18.1, 19.8, 21.8, 23.2, 24.5, 25.8, 27.0, 29.6, 29.7),  # 172
+        (14.0, 15.1, 15.8, 16.2, 16.8, 17.4, 18.2, 19.9, 21.9, 23.2, 24.5, 25.9, 27.1, 29.6, 29.7),  # 173
+        (14.1, 15.2, 15.9, 16.3, 16.9, 17.4, 18.2, 19.9, 22.0, 23.3, 24.6, 25.9, 27.1, 29.7, 29.8),  # 174
+        (14.1, 15.2, 15.9, 16.3, 16.9, 17.5, 18.3, 20.0, 22.0, 23.4, 24.7, 26.0, 27.2, 29.8, 29.9),  # 175
+        (14.1, 15.2, 15.9, 16.4, 16.9, 17.5, 18.3, 20.0, 22.1, 23.4, 24.8, 26.1, 27.3, 29.9, 30.0),  # 176
+        (14.2, 15.3, 16.0, 16.4, 17.0, 17.6, 18.4, 20.1, 22.2, 23.5, 24.8, 26.1, 27.4, 29.9, 30.0),  # 177
+        (14.2, 15.3, 16.0, 16.4, 17.0, 17.6, 18.4, 20.1, 22.2, 23.5, 24.9, 26.2, 27.4, 30.0, 30.1),  # 178
+        (14.2, 15.3, 16.0, 16.5, 17.1, 17.6, 18.4, 20.2, 22.3, 23.6, 25.0, 26.3, 27.5, 30.1, 30.2),  # 179
+        (14.2, 15.3, 16.1, 16.5, 17.1, 17.7, 18.5, 20.2, 22.3, 23.7, 25.0, 26.3, 27.6, 30.1, 30.2),  # 180
+        (14.3, 15.4, 16.1, 16.5, 17.1, 17.7, 18.5, 20.3, 22.4, 23.7, 25.0, 26.4, 27.6, 30.2, 30.3),  # 181
+        (14.3, 15.4, 16.1, 16.6, 17.2, 17.8, 18.6, 20.3, 22.4, 23.8, 25.1, 26.5, 27.7, 30.3, 30.4),  # 182
+        (14.3, 15.4, 16.2, 16.6, 17.2, 17.8, 18.6, 20.4, 22.5, 23.8, 25.1, 26.5, 27.7, 30.3, 30.4),  # 183
+        (14.3, 15.4, 16.2, 16.6, 17.2, 17.8, 18.6, 20.4, 22.5, 23.9, 25.2, 26.6, 27.8, 30.4, 30.5),  # 184
+        (14.4, 15.5, 16.2, 16.6, 17.2, 17.9, 18.7, 20.4, 22.6, 23.9, 25.2, 26.6, 27.9, 30.4, 30.5),  # 185
+        (14.4, 15.5, 16.2, 16.7, 17.3, 17.9, 18.7, 20.5, 22.6, 24.0, 25.4, 26.7, 27.9, 30.5, 30.6),  # 186
+        (14.4, 15.5, 16.3, 16.7, 17.3, 17.9, 18.8, 20.5, 22.7, 24.0, 25.4, 26.7, 28.0, 30.5, 30.6),  # 187
+        (14.4, 15.5, 16.3, 16.7, 17.4, 18.0, 18.8, 20.6, 22.7, 24.1, 25.5, 26.8, 28.0, 30.6, 30.7),  # 188
+        (14.5, 15.6, 16.3, 16.8, 17.4, 18.0, 18.8, 20.6, 22.8, 24.1, 25.5, 26.8, 28.1, 30.6, 30.7),  # 189
+        (14.5, 15.6, 16.3, 16.8, 17.4, 18.0, 18.8, 20.6, 22.8, 24.2, 25.5, 26.9, 28.1, 30.7, 30.8),  # 190
+        (14.5, 15.6, 16.4, 16.8, 17.4, 18.0, 18.9, 20.7, 22.8, 24.2, 25.5, 26.9, 28.2, 30.7, 30.8),  # 191
+        (14.5, 15.6, 16.4, 16.8, 17.5, 18.1, 18.9, 20.7, 22.9, 24.2, 25.6, 27.0, 28.2, 30.8, 30.9),  # 192
+        (14.5, 15.6, 16.4, 16.8, 17.5, 18.1, 18.9, 20.7, 22.9, 24.3, 25.6, 27.0, 28.2, 30.8, 30.9),  # 193
+        (14.6, 15.7, 16.4, 16.9, 17.5, 18.1, 19.0, 20.8, 23.0, 24.3, 25.7, 27.1, 28.3, 30.9, 31.0),  # 194
+        (14.6, 15.7, 16.4, 16.9, 17.5, 18.1, 19.0, 20.8, 23.0, 24.4, 25.8, 27.1, 28.3, 30.9, 31.0),  # 195
+        (14.6, 15.7, 16.5, 16.9, 17.5, 18.2, 19.0, 20.8, 23.0, 24.4, 25.8, 27.1, 28.4, 30.9, 31.0),  # 196
+        (14.6, 15.7, 16.5, 16.9, 17.5, 18.2, 19.0, 20.9, 23.1, 24.4, 25.8, 27.2, 28.4, 31.0, 31.1),  # 197
+        (14.6, 15.7, 16.5, 16.9, 17.5, 18.2, 19.1, 20.9, 23.1, 24.5, 25.9, 27.2, 28.4, 31.0, 31.1),  # 198
+        (14.6, 15.7, 16.5, 17.0, 17.6, 18.2, 19.1, 20.9, 23.1, 24.5, 25.9, 27.2, 28.5, 31.0, 31.1),  # 199
+        (14.6, 15.7, 16.5, 17.0, 17.6, 18.3, 19.1, 20.9, 23.1, 24.5, 25.9, 27.3, 28.5, 31.1, 31.2),  # 200
+        (14.6, 15.7, 16.5, 17.0, 17.6, 18.3, 19.1, 21.0, 23.2, 24.6, 26.0, 27.3, 28.5, 31.1, 31.2),  # 201
+        (14.7, 15.8, 16.6, 17.0, 17.6, 18.3, 19.2, 21.0, 23.2, 24.6, 26.0, 27.3, 28.6, 31.1, 31.2),  # 202
+        (14.7, 15.8, 16.6, 17.0, 17.6, 18.3, 19.2, 21.0, 23.2, 24.6, 26.0, 27.4, 28.6, 31.1, 31.2),  # 203
+        (14.7, 15.8, 16.6, 17.0, 17.6, 18.3, 19.2, 21.0, 23.3, 24.7, 26.0, 27.4, 28.6, 31.2, 31.3),  # 204
+        (14.7, 15.8, 16.6, 17.0, 17.6, 18.3, 19.2, 21.1, 23.3, 24.7, 26.0, 27.4, 28.6, 31.2, 31.3),  # 205
+        (14.7, 15.8, 16.6, 17.1, 17.8, 18.4, 19.2, 21.1, 23.3, 24.7, 26.0, 27.4, 28.7, 31.2, 31.3),  # 206
+        (14.7, 15.8, 16.6, 17.1, 17.8, 18.4, 19.2, 21.1, 23.3, 24.7, 26.1, 27.5, 28.7, 31.2, 31.3),  # 207
+        (14.7, 15.8, 16.6, 17.1, 17.8, 18.4, 19.3, 21.1, 23.4, 24.8, 26.1, 27.5, 28.7, 31.2, 31.3),  # 208
+        (14.7, 15.8, 16.6, 17.1, 17.8, 18.4, 19.3, 21.1, 23.4, 24.8, 26.1, 27.5, 28.7, 31.3, 31.4),  # 209
+        (14.7, 15.8, 16.6, 17.1, 17.8, 18.4, 19.3, 21.2, 23.4, 24.8, 26.1, 27.5, 28.8, 31.3, 31.4),  # 210
+        (14.7, 15.8, 16.6, 17.1, 17.8, 18.4, 19.3, 21.2, 23.4, 24.8, 26.2, 27.6, 28.8, 31.3, 31.4),  # 211
+        (14.7, 15.8, 16.7, 17.1, 17.8, 18.4, 19.3, 21.2, 23.4, 24.8, 26.2, 27.6, 28.8, 31.3, 31.4),  # 212
+        (14.7, 15.8, 16.7, 17.1, 17.8, 18.5, 19.3, 21.2, 23.5, 24.9, 26.2, 27.6, 28.8, 31.3, 31.4),  # 213
+        (14.7, 15.8, 16.7, 17.1, 17.8, 18.5, 19.3, 21.2, 23.5, 24.9, 26.2, 27.6, 28.8, 31.3, 31.4),  # 214
+        (14.7, 15.8, 16.7, 17.1, 17.8, 18.5, 19.4, 21.2, 23.5, 24.9, 26.2, 27.6, 28.9, 31.3, 31.4),  # 215
+        (14.8, 15.9, 16.7, 17.1, 17.8, 18.5, 19.4, 21.3, 23.5, 24.9, 26.3, 27.7, 28.9, 31.4, 31.5),  # 216
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.5, 19.4, 21.3, 23.5, 24.9, 26.3, 27.7, 28.9, 31.4, 31.5),  # 217
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.5, 19.4, 21.3, 23.6, 25.0, 26.4, 27.7, 28.9, 31.4, 31.5),  # 218
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.5, 19.4, 21.3, 23.6, 25.0, 26.4, 27.7, 28.9, 31.4, 31.5),  # 219
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.5, 19.4, 21.3, 23.6, 25.0, 26.4, 27.7, 28.9, 31.4, 31.5),  # 220
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.5, 19.4, 21.3, 23.6, 25.0, 26.4, 27.7, 28.9, 31.4, 31.5),  # 221
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.5, 19.4, 21.3, 23.6, 25.0, 26.4, 27.7, 29.0, 31.4, 31.5),  # 222
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.6, 19.5, 21.4, 23.6, 25.0, 26.4, 27.8, 29.0, 31.4, 31.5),  # 223
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.6, 19.5, 21.4, 23.6, 25.1, 26.5, 27.8, 29.0, 31.4, 31.5),  # 224
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.6, 19.5, 21.4, 23.7, 25.1, 26.5, 27.8, 29.0, 31.4, 31.5),  # 225
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.6, 19.5, 21.4, 23.7, 25.1, 26.5, 27.8, 29.0, 31.4, 31.5),  # 226
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.6, 19.5, 21.4, 23.7, 25.1, 26.5, 27.8, 29.0, 31.4, 31.5),  # 227
+        (14.8, 15.9, 16.7, 17.2, 17.9, 18.6, 19.5, 21.4, 23.7, 25.1, 26.5, 27.8, 29.0, 31.5, 31.6),  # 228
+    ),
 }
+
+# 兼容视图中每个月龄字典的键顺序（与原数据一致）
+_LEGACY_KEY_ORDER = (
+    "p1", "p3", "p5", "p15", "p25", "p50", "p75", "p85",
+    "p95", "p97", "p99", "p999", "p01", "p10", "p90",
+)
+
+
+def _build_standard_data() -> dict:
+    """由 BMI_STANDARD_ROWS 构建 {性别: {"月龄": {百分位: 数值}}} 形式的兼容数据"""
+    positions = [BMI_COLUMNS.index(key) for key in _LEGACY_KEY_ORDER]
+    return {
+        gender: {
+            str(age): {key: row[i] for key, i in zip(_LEGACY_KEY_ORDER, positions)}
+            for age, row in enumerate(rows)
+        }
+        for gender, rows in BMI_STANDARD_ROWS.items()
+    }
+
+
+def __getattr__(name):
+    # BMI_STANDARD_DATA 为兼容视图，首次访问时才构建
+    if name == "BMI_STANDARD_DATA":
+        return globals().setdefault("BMI_STANDARD_DATA", _build_standard_data())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
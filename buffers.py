@@ -0,0 +1,225 @@
+"""基于缓冲区的原地批量评分（基于NumPy）
+
+输入可以是任意支持缓冲区协议的对象（NumPy数组、array.array、memoryview、共享内存等），
+结果直接写入调用方提供的输出缓冲区（分列的数组，或带字段的结构化数组）。
+计算按 SCRATCH_SIZE 分块进行，中间结果只使用按线程复用的固定大小临时缓冲区，
+内存占用与输入行数无关：每个调用过的线程保留约 SCRATCH_SIZE * 61 字节（8192行时约0.5MB）。
+逐行结果与 WHOStandardService.calculate_bmi_with_percentile_batch 一致。
+
+原始字节缓冲区（bytes、bytearray、mmap）需先用 memoryview(...).cast("d") 等转换为带类型的视图。
+"""
+import threading
+from typing import Optional
+
+from .vectorized import (
+    AGE_OUT_OF_RANGE_DESCRIPTION,
+    MAX_AGE_MONTHS,
+    UNKNOWN_CODE,
+    UNSUPPORTED_GENDER_DESCRIPTION,
+    _BAND_SIZE,
+    _get_table_arrays,
+    _require_numpy,
+    np,
+)
+
+# 结构化输出数组的字段名
+BMI_FIELD = "bmi"
+PERCENTILE_CODE_FIELD = "percentile_code"
+DESCRIPTION_CODE_FIELD = "description_code"
+
+# 每块的行数；临时缓冲区按线程保留（线程池中每个线程一份），不宜过大
+SCRATCH_SIZE = 8192
+
+_local = threading.local()
+
+
+def _as_array(buffer, name: str) -> "np.ndarray":
+    array = np.asarray(memoryview(buffer)) if not isinstance(buffer, np.ndarray) else buffer
+    if array.ndim != 1:
+        raise ValueError(f"{name}必须为一维缓冲区")
+    return array
+
+
+def _as_output(buffer, name: str, length: int) -> Optional["np.ndarray"]:
+    if buffer is None:
+        return None
+    array = _as_array(buffer, name)
+    if not array.flags.writeable:
+        raise ValueError(f"{name}必须为可写缓冲区")
+    if len(array) != length:
+        raise ValueError(f"{name}的长度与输入不一致")
+    return array
+
+
+class _Scratch:
+    """单个线程复用的临时缓冲区（5个float64、2个int64、1个uint16和3个bool数组，每行61字节）
+
+    边界按列逐一比较，不分配 行数 × 列数 的矩阵。
+    """
+
+    def __init__(self, size: int):
+        self.raw = np.empty(size)
+        self.scaled = np.empty(size)
+        self.rounded = np.empty(size)
+        self.floor = np.empty(size)
+        self.bound = np.empty(size)
+        self.index = np.empty(size, dtype=np.int64)
+        self.row_index = np.empty(size, dtype=np.uint16)  # 与参考表行号表的类型相同
+        self.count = np.empty(size, dtype=np.int64)
+        self.mask = np.empty(size, dtype=bool)
+        self.flag = np.empty(size, dtype=bool)
+        self.invalid = np.empty(size, dtype=bool)
+
+
+def _get_scratch() -> _Scratch:
+    scratch = getattr(_local, "scratch", None)
+    if scratch is None:
+        scratch = _local.scratch = _Scratch(SCRATCH_SIZE)
+    return scratch
+
+
+def score_into(
+    genders,
+    ages_in_months,
+    heights_cm,
+    weights_kg,
+    out_bmi=None,
+    out_code=None,
+    out_description=None,
+    out=None,
+) -> int:
+    """读取输入缓冲区计算BMI及其百分位，结果写入调用方提供的缓冲区
+
+    Args:
+        genders: 性别编码（0=男孩，1=女孩，其他值视为不支持的性别），整数缓冲区
+        ages_in_months: 年龄（月），整数缓冲区；浮点缓冲区与逐条计算一样返回"unknown"
+        heights_cm: 身高（厘米）
+        weights_kg: 体重（千克）
+        out_bmi: BMI输出缓冲区（float64或float32）
+        out_code: 百分位编码输出缓冲区（见 PercentileCode），建议为uint8
+        out_description: 描述编号输出缓冲区（见 vectorized.BMI_DESCRIPTION_TABLE），可选
+        out: 结构化输出数组，包含 "bmi"、"percentile_code" 字段，可选 "description_code" 字段；
+            指定后替代 out_bmi/out_code/out_description
+
+    Returns:
+        int: 写入的行数
+
+    Raises:
+        ValueError: 缓冲区长度不一致、不可写，或任意一行身高、体重不大于0（此时不写入任何结果）
+    """
+    _require_numpy()
+    genders = _as_array(genders, "genders")
+    ages = _as_array(ages_in_months, "ages_in_months")
+    heights = _as_array(heights_cm, "heights_cm")
+    weights = _as_array(weights_kg, "weights_kg")
+    length = len(heights)
+    if not len(genders) == len(ages) == len(weights) == length:
+        raise ValueError("输入缓冲区的长度不一致")
+    if genders.dtype.kind not in "iu":
+        raise ValueError("genders必须为整数性别编码")
+
+    if out is not None:
+        out = _as_array(out, "out")
+        names = out.dtype.names or ()
+        out_bmi = out[BMI_FIELD]
+        out_code = out[PERCENTILE_CODE_FIELD]
+        out_description = out[DESCRIPTION_CODE_FIELD] if DESCRIPTION_CODE_FIELD in names else None
+    out_bmi = _as_output(out_bmi, "out_bmi", length)
+    out_code = _as_output(out_code, "out_code", length)
+    out_description = _as_output(out_description, "out_description", length)
+    if out_bmi is None or out_code is None:
+        raise ValueError("必须提供 out_bmi 和 out_code，或结构化输出数组 out")
+
+    unique_rows, row_ids = _get_table_arrays()
+    width = unique_rows.shape[1]
+    # 按列存放的边界（去重后的行数很少，复制开销可以忽略）
+    bounds_by_column = np.ascontiguousarray(unique_rows.T)
+    s = _get_scratch()
+    integer_ages = ages.dtype.kind in "iu"
+
+    # 先检查全部身高、体重，失败时不写入任何结果
+    for start in range(0, length, SCRATCH_SIZE):
+        n = min(SCRATCH_SIZE, length - start)
+        mask, flag = s.mask[:n], s.flag[:n]
+        np.less_equal(heights[start:start + n], 0, out=mask)
+        np.less_equal(weights[start:start + n], 0, out=flag)
+        np.logical_or(mask, flag, out=mask)
+        if mask.any():
+            raise ValueError("身高和体重必须大于0")
+
+    for start in range(0, length, SCRATCH_SIZE):
+        stop = start + min(SCRATCH_SIZE, length - start)
+        n = stop - start
+        gender, age = genders[start:stop], ages[start:stop]
+        raw, scaled, rounded = s.raw[:n], s.scaled[:n], s.rounded[:n]
+        mask, flag, invalid = s.mask[:n], s.flag[:n], s.invalid[:n]
+        count = s.count[:n]
+
+        # BMI = 体重 / (身高m)^2，按内置 round(x, 2) 的规则保留两位小数（同 vectorized.round_bmi）
+        np.divide(heights[start:stop], 100, out=scaled)
+        np.multiply(scaled, scaled, out=scaled)
+        np.divide(weights[start:stop], scaled, out=raw)
+        np.multiply(raw, 100.0, out=scaled)
+        np.rint(scaled, out=rounded)
+        np.divide(rounded, 100.0, out=rounded)
+        with np.errstate(invalid="ignore"):
+            np.floor(scaled, out=s.floor[:n])
+            np.subtract(scaled, s.floor[:n], out=scaled)
+            np.subtract(scaled, 0.5, out=scaled)
+            np.abs(scaled, out=scaled)
+            np.less(scaled, 1e-6, out=flag)
+        for i in np.flatnonzero(flag).tolist():
+            rounded[i] = round(float(raw[i]), 2)
+        np.copyto(out_bmi[start:stop], rounded, casting="same_kind")
+
+        # 年龄范围（优先）与性别；NaN年龄与逐条计算一样不算超出范围
+        with np.errstate(invalid="ignore"):
+            np.less(age, 0, out=mask)
+            np.greater(age, MAX_AGE_MONTHS, out=flag)
+        np.logical_or(mask, flag, out=mask)
+        np.logical_not(mask, out=mask)
+        np.equal(gender, 0, out=flag)
+        np.logical_or(flag, np.equal(gender, 1, out=invalid), out=flag)
+        np.logical_and(mask, flag, out=invalid)
+        np.logical_not(invalid, out=invalid)
+
+        if integer_ages:
+            # 行号 = 性别编码 * 229 + 月龄，无效行指向第0行，结果随后覆盖为"unknown"
+            index = s.index[:n]
+            np.copyto(index, gender, casting="unsafe")
+            np.multiply(index, MAX_AGE_MONTHS + 1, out=index)
+            np.add(index, age, out=index, casting="unsafe")
+            np.copyto(index, 0, where=invalid)
+            row_index = s.row_index[:n]
+            # 行号均已有效；mode="raise" 时 take 会先写入临时数组再复制
+            np.take(row_ids, index, out=row_index, mode="clip")
+            # 左闭右开：编码 = 15 - (边界 > BMI 的个数) - 1，NaN时落在最大百分位
+            bound = s.bound[:n]
+            count.fill(width - 1)
+            for column in bounds_by_column:
+                np.take(column, row_index, out=bound, mode="clip")
+                np.greater(bound, rounded, out=flag)
+                np.subtract(count, flag, out=count)
+            np.maximum(count, 0, out=count)
+            np.copyto(count, UNKNOWN_CODE, where=invalid)
+        else:
+            # 浮点年龄与逐条计算一样，范围内的行百分位为"unknown"
+            count.fill(UNKNOWN_CODE)
+        np.copyto(out_code[start:stop], count, casting="unsafe")
+
+        if out_description is not None:
+            # 有效行：年龄段 * 16 + 百分位编码
+            band = s.index[:n]
+            # 不小于24个月（包括NaN）按2岁以上描述
+            with np.errstate(invalid="ignore"):
+                np.less(age, 24, out=flag)
+            np.logical_not(flag, out=flag)
+            np.multiply(flag, _BAND_SIZE, out=band, casting="unsafe")
+            np.add(count, band, out=count)
+            np.logical_not(mask, out=flag)
+            np.copyto(count, AGE_OUT_OF_RANGE_DESCRIPTION, where=flag)
+            np.logical_and(invalid, mask, out=flag)
+            np.copyto(count, UNSUPPORTED_GENDER_DESCRIPTION, where=flag)
+            np.copyto(out_description[start:stop], count, casting="unsafe")
+
+    return length
@@ -0,0 +1,86 @@
+"""按 (性别, 月龄) 生成的专用BMI分类函数
+
+为指定性别、月龄生成一个只接受BMI的分类函数：边界值作为字面常量写入函数体，
+按 bisect_right 的二分顺序展开为嵌套比较（15个边界只需4次比较），
+各百分位的结果记录预先解析为该年龄段的 PercentileResult，
+调用时不再验证性别和月龄、解析月龄或查找参考表。
+生成的函数保存在有界LRU注册表中，参考表被替换后自动重新生成。
+"""
+from typing import Callable, List, Sequence
+
+from .records import AGE_OUT_OF_RANGE_RESULT, UNSUPPORTED_GENDER_RESULT, PercentileResult, bmi_percentile_result
+from .result_cache import LRUCache
+
+# BMI -> 百分位结果
+BMIClassifier = Callable[[float], PercentileResult]
+
+
+def _emit_bisect(lines: List[str], bounds: Sequence[float], lo: int, hi: int, indent: str) -> None:
+    """生成 bisect_right(bounds, bmi) 落在 [lo, hi] 时的比较代码，结果为 results[max(i - 1, 0)]"""
+    if lo == hi:
+        lines.append(f"{indent}return r{max(lo - 1, 0)}")
+        return
+    mid = (lo + hi) // 2
+    # bisect_right：bmi < bounds[mid] 时向左，否则（包括NaN）向右
+    lines.append(f"{indent}if bmi < {bounds[mid]!r}:")
+    _emit_bisect(lines, bounds, lo, mid, indent + "    ")
+    lines.append(f"{indent}else:")
+    _emit_bisect(lines, bounds, mid + 1, hi, indent + "    ")
+
+
+def compile_bmi_classifier(bounds: Sequence[float], results: Sequence[PercentileResult]) -> BMIClassifier:
+    """由一行边界值和各列的结果记录生成分类函数（左闭右开，与 ReferenceTable.find_bmi_in_row 一致）"""
+    lines = ["def classify(bmi):"]
+    _emit_bisect(lines, bounds, 0, len(bounds), "    ")
+    namespace = {f"r{i}": result for i, result in enumerate(results)}
+    exec(compile("\n".join(lines), "<bmi_classifier>", "exec"), namespace)
+    return namespace["classify"]
+
+
+def _constant(result: PercentileResult) -> BMIClassifier:
+    def classify(bmi: float) -> PercentileResult:
+        return result
+
+    return classify
+
+
+def build_bmi_classifier(table, gender: str, age_in_months) -> BMIClassifier:
+    """为指定性别、月龄生成分类函数，结果与 calculate_bmi_percentile_record 一致
+
+    年龄超出范围、性别不支持或月龄不是整数时返回固定结果的函数。
+    """
+    if age_in_months < 0 or age_in_months > 228:
+        return _constant(AGE_OUT_OF_RANGE_RESULT)
+    gender_code = table.gender_code(gender)
+    if gender_code is None:
+        return _constant(UNSUPPORTED_GENDER_RESULT)
+    start = table.row_start(gender_code, age_in_months)
+    if start is None:
+        return _constant(bmi_percentile_result("unknown", age_in_months))
+    width = len(table.columns)
+    bounds = table.values[start:start + width]
+    results = [bmi_percentile_result(column, age_in_months) for column in table.columns]
+    return compile_bmi_classifier(bounds, results)
+
+
+class ClassifierRegistry(LRUCache):
+    """线程安全的有界LRU分类函数注册表：(性别, 月龄) -> 分类函数
+
+    注册表与生成函数时使用的参考表绑定，参考表被替换后首次访问时自动清空。
+    """
+
+    def __init__(self, maxsize: int = 64):
+        super().__init__(maxsize)
+
+    def get_or_build(self, table, gender: str, age_in_months) -> BMIClassifier:
+        """获取指定性别、月龄的分类函数，不存在时生成并加入注册表"""
+        # 仅缓存整数月龄（浮点月龄与整数月龄哈希相同，但查找结果不同）
+        if age_in_months.__class__ is not int:
+            return build_bmi_classifier(table, gender, age_in_months)
+        key = (gender, age_in_months)
+        classifier = self.get(key, table)
+        if classifier is None:
+            # 在锁外生成，多个线程同时未命中时各自生成，结果相同
+            classifier = build_bmi_classifier(table, gender, age_in_months)
+            self.put(key, classifier, table)
+        return classifier
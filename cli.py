@@ -0,0 +1,166 @@
+"""命令行入口
+
+用法：
+    python -m who_bmi_calculator build-table -o who_bmi.table
+    python -m who_bmi_calculator build-table --source weight_for_age.json -o who_weight.table
+    python -m who_bmi_calculator export-thresholds -o thresholds.sql --format sql
+    python -m who_bmi_calculator score input.csv -o output.csv [--rejects rejects.csv]
+    python -m who_bmi_calculator serve --port 8080
+    python -m who_bmi_calculator bench-http --port 8080 --requests 20000 --concurrency 64
+    python -m who_bmi_calculator bench -o results.json [--baseline baseline.json --threshold 0.2]
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import date
+from typing import List, Optional
+
+
+def _build_table(args: argparse.Namespace) -> int:
+    from .reference_table import ReferenceTable
+    from .table_file import write_table_file
+
+    if args.source:
+        with open(args.source, encoding="utf-8") as f:
+            table = ReferenceTable.from_standard_data(json.load(f))
+    else:
+        from .bmi_data_final import BMI_COLUMNS, BMI_STANDARD_ROWS
+        table = ReferenceTable.from_rows(BMI_STANDARD_ROWS, BMI_COLUMNS)
+    size = write_table_file(table, args.output)
+    print(f"已写入 {args.output}（{size} 字节）", file=sys.stderr)
+    return 0
+
+
+def _sql_table(value: str) -> str:
+    from .thresholds import check_sql_identifier
+
+    try:
+        return check_sql_identifier(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _export_thresholds(args: argparse.Namespace) -> int:
+    from .reference_table import get_bmi_reference_table
+    from .thresholds import export_thresholds
+
+    fmt = args.format or ("sql" if args.output and args.output.endswith(".sql") else "csv")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            count = export_thresholds(f, get_bmi_reference_table(), fmt, args.table)
+    else:
+        count = export_thresholds(sys.stdout, get_bmi_reference_table(), fmt, args.table)
+    print(f"已导出 {count} 行", file=sys.stderr)
+    return 0
+
+
+def _score(args: argparse.Namespace) -> int:
+    from .scoring import score_file
+
+    stats = score_file(
+        args.input,
+        args.output,
+        reject_path=args.rejects,
+        input_format=args.input_format,
+        output_format=args.output_format,
+        reference_date=args.reference_date,
+        chunk_size=args.chunk_size,
+    )
+    print(
+        f"共 {stats['rows']} 行，成功 {stats['scored']} 行，拒绝 {stats['rejected']} 行，"
+        f"耗时 {stats['seconds']:.2f} 秒（{stats['rows_per_sec']:.0f} 行/秒）",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from .http_service import ScoringServer
+
+    server = ScoringServer(args.host, args.port, args.max_batch_size, args.max_wait_ms / 1000)
+
+    async def run() -> None:
+        await server.start()
+        print(f"服务已启动：http://{server.host}:{server.port}", file=sys.stderr)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _bench_http(args: argparse.Namespace) -> int:
+    from .http_service import run_benchmark
+
+    stats = asyncio.run(run_benchmark(args.host, args.port, args.requests, args.concurrency, args.path))
+    print(json.dumps(stats, indent=2))
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    from .benchmarks import run
+
+    return run(args.output, args.baseline, args.threshold, args.repeat, args.batch_size)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="who_bmi_calculator", description="WHO BMI计算器")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_table = subparsers.add_parser("build-table", help="将标准数据编译为二进制参考表文件")
+    build_table.add_argument("-o", "--output", default="who_bmi.table", help="输出文件路径")
+    build_table.add_argument(
+        "--source", help="JSON标准数据 {性别: {月龄: {百分位: 数值}}}（如身高、体重标准），默认使用包内的BMI标准数据"
+    )
+    build_table.set_defaults(handler=_build_table)
+
+    export = subparsers.add_parser("export-thresholds", help="导出BMI百分位阈值表（CSV或SQL INSERT语句）")
+    export.add_argument("-o", "--output", help="输出文件，默认输出到标准输出")
+    export.add_argument("--format", choices=["csv", "sql"], help="导出格式，默认按扩展名判断（.sql 为SQL，其他为CSV）")
+    export.add_argument("--table", type=_sql_table, default="bmi_percentile_thresholds", help="SQL表名")
+    export.set_defaults(handler=_export_thresholds)
+
+    score = subparsers.add_parser("score", help="流式评分CSV或JSON Lines文件")
+    score.add_argument("input", help="输入文件（.csv 或 .jsonl）")
+    score.add_argument("-o", "--output", required=True, help="评分结果文件")
+    score.add_argument("--rejects", help="拒绝文件，默认为输出文件名加 .rejects 后缀")
+    score.add_argument("--input-format", choices=["csv", "jsonl"], help="输入格式，默认按扩展名判断")
+    score.add_argument("--output-format", choices=["csv", "jsonl"], help="输出格式，默认与输入格式相同")
+    score.add_argument(
+        "--reference-date", type=date.fromisoformat, help="记录中没有测量日期时使用的日期（YYYY-MM-DD），默认为今天"
+    )
+    score.add_argument("--chunk-size", type=int, default=1000, help="每次写出的行数")
+    score.set_defaults(handler=_score)
+
+    serve = subparsers.add_parser("serve", help="启动HTTP评分服务")
+    serve.add_argument("--host", default="127.0.0.1", help="监听地址")
+    serve.add_argument("--port", type=int, default=8080, help="监听端口")
+    serve.add_argument("--max-batch-size", type=int, default=256, help="合并计算的最大请求数")
+    serve.add_argument("--max-wait-ms", type=float, default=2.0, help="合并请求的最长等待时间（毫秒）")
+    serve.set_defaults(handler=_serve)
+
+    bench_http = subparsers.add_parser("bench-http", help="压测HTTP评分服务")
+    bench_http.add_argument("--host", default="127.0.0.1", help="服务地址")
+    bench_http.add_argument("--port", type=int, default=8080, help="服务端口")
+    bench_http.add_argument("--requests", type=int, default=10000, help="请求总数")
+    bench_http.add_argument("--concurrency", type=int, default=64, help="并发连接数")
+    bench_http.add_argument("--path", default="/percentile", help="压测的接口")
+    bench_http.set_defaults(handler=_bench_http)
+
+    bench = subparsers.add_parser("bench", help="运行性能基准测试")
+    bench.add_argument("-o", "--output", help="结果JSON文件，默认输出到标准输出")
+    bench.add_argument("--baseline", help="基线JSON文件，指定后对比并在退化时返回非0")
+    bench.add_argument("--threshold", type=float, default=0.2, help="允许的退化比例")
+    bench.add_argument("--repeat", type=int, default=5, help="重复次数（取最小值）")
+    bench.add_argument("--batch-size", type=int, default=1000, help="批量调用的记录数")
+    bench.set_defaults(handler=_bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,318 @@
+"""基于asyncio的HTTP评分服务（仅使用标准库）
+
+接口（均为 POST，请求和响应体为JSON）：
+    /bmi             {"height_cm", "weight_kg"}                              -> {"bmi"}
+    /percentile      {"gender", "age_in_months", "height_cm", "weight_kg"}   -> {"bmi", "percentile", "description"}
+    /adult-category  {"bmi", "gender"}                                       -> {"category", "description"}
+
+/percentile 可选 "standard" 指定参考标准，/adult-category 可选 "policy" 指定成人分类策略（见 standards.py）。
+
+/percentile 的并发请求会在 max_wait 时间窗口内合并为一次批量查找（最多 max_batch_size 条），
+安装了NumPy时使用向量化计算，否则逐条计算。连接支持 HTTP/1.1 keep-alive。
+
+启动服务：
+    python -m who_bmi_calculator serve --port 8080
+压测：
+    python -m who_bmi_calculator bench-http --port 8080 --requests 20000 --concurrency 64
+"""
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import vectorized
+from .standards import DEFAULT_ADULT_POLICY, DEFAULT_STANDARD
+from .who_standard_service import WHOStandardService
+
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_WAIT = 0.002
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+_MAX_BODY_SIZE = 64 * 1024
+
+
+class HTTPError(Exception):
+    """返回给客户端的错误"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _number(payload: Dict[str, Any], name: str) -> float:
+    value = payload.get(name)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise HTTPError(400, f"{name}必须为数值")
+    return value
+
+
+def _measurements(payload: Dict[str, Any]) -> Tuple[float, float]:
+    try:
+        height_cm = float(_number(payload, "height_cm"))
+        weight_kg = float(_number(payload, "weight_kg"))
+    except OverflowError:
+        raise HTTPError(400, "身高和体重超出数值范围")
+    if height_cm <= 0 or weight_kg <= 0:
+        raise HTTPError(400, "身高和体重必须大于0")
+    return height_cm, weight_kg
+
+
+class MicroBatcher:
+    """将短时间内到达的单条百分位请求合并为一次批量计算"""
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.records = 0
+        self._pending: List[Tuple[Tuple[str, int, float, float], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, gender: str, age_in_months: int, height_cm: float, weight_kg: float) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((gender, age_in_months, height_cm, weight_kg), future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+        return future
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.batches += 1
+        self.records += len(pending)
+        try:
+            results = self._score([record for record, _ in pending])
+        except Exception as e:  # 整批失败时逐条返回同一错误
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _score(records: List[Tuple[str, int, float, float]]) -> List[Dict[str, Any]]:
+        if vectorized.np is None:
+            return [WHOStandardService.calculate_bmi_with_percentile(*record) for record in records]
+        np = vectorized.np
+        genders, ages, heights, weights = zip(*records)
+        # 显式指定类型：提交前已保证月龄在0-228之间，不会因个别请求退化为object数组
+        result = vectorized.calculate_bmi_with_percentile_batch(
+            np.array(genders, dtype=object),
+            np.array(ages, dtype=np.int64),
+            np.array(heights, dtype=np.float64),
+            np.array(weights, dtype=np.float64),
+        )
+        return [
+            {"bmi": bmi, "percentile": percentile, "description": description}
+            for bmi, percentile, description in zip(result.bmi.tolist(), result.percentiles(), result.descriptions())
+        ]
+
+
+class ScoringServer:
+    """HTTP评分服务"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ):
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(max_batch_size, max_wait)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        # 预先加载参考表，避免首个请求承担加载开销
+        WHOStandardService.calculate_bmi_percentile("boy", 0, 0.0)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # 端口为0时使用系统分配的端口
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _dispatch(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if path == "/bmi":
+            height_cm, weight_kg = _measurements(payload)
+            return {"bmi": WHOStandardService.calculate_bmi(height_cm, weight_kg)}
+        if path == "/percentile":
+            height_cm, weight_kg = _measurements(payload)
+            age_in_months = payload.get("age_in_months")
+            if isinstance(age_in_months, bool) or not isinstance(age_in_months, int):
+                raise HTTPError(400, "age_in_months必须为整数")
+            gender = payload.get("gender")
+            if not isinstance(gender, str):
+                raise HTTPError(400, "gender必须为字符串")
+            standard = payload.get("standard", DEFAULT_STANDARD)
+            if standard != DEFAULT_STANDARD:
+                # 批量查找只使用默认标准，其他标准逐条计算
+                if not isinstance(standard, str):
+                    raise HTTPError(400, "standard必须为字符串")
+                return WHOStandardService.calculate_bmi_with_percentile(
+                    gender, age_in_months, height_cm, weight_kg, standard
+                )
+            if age_in_months < 0 or age_in_months > 228:
+                # 超出范围的月龄直接逐条返回，不进入批量查找
+                return WHOStandardService.calculate_bmi_with_percentile(gender, age_in_months, height_cm, weight_kg)
+            return await self.batcher.submit(gender, age_in_months, height_cm, weight_kg)
+        if path == "/adult-category":
+            policy = payload.get("policy", DEFAULT_ADULT_POLICY)
+            if not isinstance(policy, str):
+                raise HTTPError(400, "policy必须为字符串")
+            return WHOStandardService.calculate_adult_bmi_category(_number(payload, "bmi"), payload.get("gender"), policy)
+        raise HTTPError(404, f"未知的接口：{path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                length = int(headers.get("content-length", "0"))
+                if length > _MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {"error": "请求体过大"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    if method != "POST":
+                        raise HTTPError(405, "仅支持POST")
+                    try:
+                        payload = json.loads(body or b"{}")
+                    except ValueError:
+                        raise HTTPError(400, "请求体必须为JSON")
+                    if not isinstance(payload, dict):
+                        raise HTTPError(400, "请求体必须为JSON对象")
+                    status, response = 200, await self._dispatch(path.split("?", 1)[0], payload)
+                except HTTPError as e:
+                    status, response = e.status, {"error": str(e)}
+                except ValueError as e:
+                    status, response = 400, {"error": str(e)}
+
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def _post(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str, path: str, payload: dict) -> Tuple[int, dict]:
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def run_benchmark(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    requests: int = 10000,
+    concurrency: int = 64,
+    path: str = "/percentile",
+) -> Dict[str, float]:
+    """压测客户端：concurrency 个 keep-alive 连接并发发送请求
+
+    Returns:
+        请求数、错误数、耗时、每秒请求数以及延迟的 p50/p95/p99（毫秒）
+    """
+    rng = random.Random(0)
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                payload = {
+                    "gender": rng.choice(("boy", "girl")),
+                    "age_in_months": rng.randint(0, 228),
+                    "height_cm": round(rng.uniform(50, 190), 1),
+                    "weight_kg": round(rng.uniform(3, 100), 1),
+                }
+                started = time.perf_counter()
+                status, _ = await _post(reader, writer, host, path, payload)
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": seconds,
+        "requests_per_sec": len(latencies) / seconds if seconds > 0 else 0.0,
+        "latency_p50_ms": percentile(0.50),
+        "latency_p95_ms": percentile(0.95),
+        "latency_p99_ms": percentile(0.99),
+    }
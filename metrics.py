@@ -0,0 +1,196 @@
+"""运行时指标
+
+可选地为 WHOStandardService 和 AgeCalculator 的公开方法记录调用次数、异常次数、
+"unknown" 百分位结果次数和耗时直方图，可导出为字典或 Prometheus 文本格式。
+
+开启时用计时包装替换类上的静态方法，关闭时恢复原方法，
+因此未开启指标时调用路径上没有任何额外开销。
+"""
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .age_calculator import AgeCalculator
+from .who_standard_service import WHOStandardService
+
+# 耗时直方图的桶上界（秒）
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2,
+)
+
+INSTRUMENTED_CLASSES = (WHOStandardService, AgeCalculator)
+
+_PREFIX = "who_bmi"
+
+
+class MethodMetrics:
+    """单个方法的指标"""
+
+    __slots__ = ("calls", "errors", "unknown", "bucket_counts", "duration_sum", "_bounds_ns", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._bounds_ns = [int(bound * 1e9) for bound in buckets]
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.unknown = 0
+        # 最后一个桶为 +Inf
+        self.bucket_counts = [0] * (len(self._bounds_ns) + 1)
+        self.duration_sum = 0.0
+
+    def observe(self, elapsed_ns: int, error: Optional[str] = None, unknown: bool = False) -> None:
+        index = bisect_left(self._bounds_ns, elapsed_ns)
+        with self._lock:
+            self.calls += 1
+            self.bucket_counts[index] += 1
+            self.duration_sum += elapsed_ns / 1e9
+            if error is not None:
+                self.errors[error] = self.errors.get(error, 0) + 1
+            if unknown:
+                self.unknown += 1
+
+
+def _is_unknown(result: Any) -> bool:
+    if isinstance(result, str):
+        return result == "unknown"
+    if isinstance(result, dict):
+        return result.get("percentile") == "unknown"
+    # PercentileResult / BMIResult 等结果记录
+    return getattr(result, "percentile", None) == "unknown"
+
+
+class MetricsRegistry:
+    """方法指标注册表"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._methods: Dict[str, MethodMetrics] = {}
+        self._lock = threading.Lock()
+
+    def method(self, name: str) -> MethodMetrics:
+        metrics = self._methods.get(name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._methods.setdefault(name, MethodMetrics(self.buckets))
+        return metrics
+
+    def instrument(self, name: str, func: Callable) -> Callable:
+        """返回记录指标的包装函数"""
+        metrics = self.method(name)
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                metrics.observe(perf_counter_ns() - started, error=type(e).__name__)
+                raise
+            metrics.observe(perf_counter_ns() - started, unknown=_is_unknown(result))
+            return result
+
+        return wrapper
+
+    def reset(self) -> None:
+        """清空所有指标"""
+        for metrics in list(self._methods.values()):
+            with metrics._lock:
+                metrics.reset()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """导出为字典：{方法名: {calls, errors, unknown, duration_sum, buckets}}"""
+        snapshot = {}
+        for name, metrics in sorted(self._methods.items()):
+            with metrics._lock:
+                cumulative = 0
+                buckets: List[Tuple[str, int]] = []
+                for bound, count in zip(self.buckets + (float("inf"),), metrics.bucket_counts):
+                    cumulative += count
+                    buckets.append((repr(bound) if bound != float("inf") else "+Inf", cumulative))
+                snapshot[name] = {
+                    "calls": metrics.calls,
+                    "errors": dict(metrics.errors),
+                    "unknown": metrics.unknown,
+                    "duration_sum": metrics.duration_sum,
+                    "buckets": dict(buckets),
+                }
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """导出为 Prometheus 文本格式"""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {_PREFIX}_calls_total Number of calls per method.",
+            f"# TYPE {_PREFIX}_calls_total counter",
+        ]
+        lines += [f'{_PREFIX}_calls_total{{method="{name}"}} {item["calls"]}' for name, item in snapshot.items()]
+        lines += [
+            f"# HELP {_PREFIX}_errors_total Number of calls that raised, by exception type.",
+            f"# TYPE {_PREFIX}_errors_total counter",
+        ]
+        for name, item in snapshot.items():
+            lines += [
+                f'{_PREFIX}_errors_total{{method="{name}",exception="{error}"}} {count}'
+                for error, count in sorted(item["errors"].items())
+            ]
+        lines += [
+            f'# HELP {_PREFIX}_unknown_total Number of calls that returned an "unknown" percentile.',
+            f"# TYPE {_PREFIX}_unknown_total counter",
+        ]
+        lines += [f'{_PREFIX}_unknown_total{{method="{name}"}} {item["unknown"]}' for name, item in snapshot.items()]
+        lines += [
+            f"# HELP {_PREFIX}_duration_seconds Call latency per method.",
+            f"# TYPE {_PREFIX}_duration_seconds histogram",
+        ]
+        for name, item in snapshot.items():
+            lines += [
+                f'{_PREFIX}_duration_seconds_bucket{{method="{name}",le="{bound}"}} {count}'
+                for bound, count in item["buckets"].items()
+            ]
+            lines.append(f'{_PREFIX}_duration_seconds_sum{{method="{name}"}} {item["duration_sum"]!r}')
+            lines.append(f'{_PREFIX}_duration_seconds_count{{method="{name}"}} {item["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+_registry: Optional[MetricsRegistry] = None
+# (类, 方法名, 原始的静态方法对象)
+_originals: List[Tuple[type, str, staticmethod]] = []
+_instrument_lock = threading.Lock()
+
+
+def enable_metrics(buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricsRegistry:
+    """开启指标记录，已开启时返回当前的注册表"""
+    global _registry
+    with _instrument_lock:
+        if _registry is not None:
+            return _registry
+        registry = MetricsRegistry(buckets)
+        for cls in INSTRUMENTED_CLASSES:
+            for name, attr in list(vars(cls).items()):
+                if name.startswith("_") or not isinstance(attr, staticmethod):
+                    continue
+                _originals.append((cls, name, attr))
+                setattr(cls, name, staticmethod(registry.instrument(f"{cls.__name__}.{name}", attr.__func__)))
+        _registry = registry
+        return registry
+
+
+def disable_metrics() -> None:
+    """关闭指标记录并恢复原方法"""
+    global _registry
+    with _instrument_lock:
+        while _originals:
+            cls, name, attr = _originals.pop()
+            setattr(cls, name, attr)
+        _registry = None
+
+
+def get_metrics_registry() -> Optional[MetricsRegistry]:
+    """获取当前的注册表，未开启时返回None"""
+    return _registry
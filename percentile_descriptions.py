@@ -1,4 +1,11 @@
 """百分位描述常量定义"""
+from enum import IntEnum
+
+# 标准数据中的百分位（按百分位从低到高排列）
+PERCENTILE_LABELS = (
+    "p01", "p1", "p3", "p5", "p10", "p15", "p25", "p50",
+    "p75", "p85", "p90", "p95", "p97", "p99", "p999",
+)
 
 # 身高百分位描述
 HEIGHT_PERCENTILE_DESCRIPTIONS = {
@@ -103,6 +110,63 @@ BMI_PERCENTILE_DESCRIPTIONS_GENERAL = {
 }
 
 
+class PercentileCode(IntEnum):
+    """百分位编码（与 PERCENTILE_LABELS 的顺序一致，UNKNOWN 表示未知）"""
+    P01 = 0
+    P1 = 1
+    P3 = 2
+    P5 = 3
+    P10 = 4
+    P15 = 5
+    P25 = 6
+    P50 = 7
+    P75 = 8
+    P85 = 9
+    P90 = 10
+    P95 = 11
+    P97 = 12
+    P99 = 13
+    P999 = 14
+    UNKNOWN = 15
+
+
+# 百分位编码 -> 百分位标签（最后一项为"unknown"）
+PERCENTILE_CODE_LABELS = PERCENTILE_LABELS + ("unknown",)
+
+# 百分位标签 -> 百分位编码
+PERCENTILE_CODES = {label: PercentileCode(code) for code, label in enumerate(PERCENTILE_CODE_LABELS)}
+
+# 按百分位编码排列的描述表
+HEIGHT_DESCRIPTIONS_BY_CODE = tuple(HEIGHT_PERCENTILE_DESCRIPTIONS[p] for p in PERCENTILE_CODE_LABELS)
+WEIGHT_DESCRIPTIONS_BY_CODE = tuple(WEIGHT_PERCENTILE_DESCRIPTIONS[p] for p in PERCENTILE_CODE_LABELS)
+
+# BMI描述表：[年龄段][百分位编码]，年龄段0为2岁以下（<24个月），1为2岁以上（≥24个月）
+BMI_DESCRIPTIONS_BY_CODE = (
+    tuple(BMI_PERCENTILE_DESCRIPTIONS_UNDER_2[p] for p in PERCENTILE_CODE_LABELS),
+    tuple(BMI_PERCENTILE_DESCRIPTIONS_OVER_2[p] for p in PERCENTILE_CODE_LABELS),
+)
+
+# BMI分类，按从低到高排列
+BMI_CATEGORIES = ("偏瘦", "正常", "超重", "肥胖", "重度肥胖")
+
+# BMI分类序号表：[年龄段][百分位编码] -> BMI_CATEGORIES 的序号，百分位未知时为 NO_CATEGORY
+NO_CATEGORY = 255
+BMI_CATEGORY_BY_CODE = tuple(
+    tuple(
+        NO_CATEGORY if code == PercentileCode.UNKNOWN else BMI_CATEGORIES.index(description.split(" (")[0])
+        for code, description in enumerate(descriptions)
+    )
+    for descriptions in BMI_DESCRIPTIONS_BY_CODE
+)
+
+# 指标类型 -> 描述字典（BMI在未提供年龄时使用通用描述）
+_METRIC_DESCRIPTIONS = {
+    "height": HEIGHT_PERCENTILE_DESCRIPTIONS,
+    "weight": WEIGHT_PERCENTILE_DESCRIPTIONS,
+    "bmi": BMI_PERCENTILE_DESCRIPTIONS_GENERAL,
+}
+
+
 def get_percentile_description(percentile: str, metric_type: str, age_months: int = None) -> str:
     """获取百分位描述
     
@@ -118,22 +182,16 @@ def get_percentile_description(percentile: str, metric_type: str, age_months: in
     if not isinstance(percentile, str):
         return f"无效的百分位类型: {type(percentile)}"
     
-    # 统一转为小写，以兼容大小写输入
-    percentile_lower = percentile.lower()
-    
-    if metric_type == "height":
-        return HEIGHT_PERCENTILE_DESCRIPTIONS.get(percentile_lower, "未知百分位")
-    elif metric_type == "weight":
-        return WEIGHT_PERCENTILE_DESCRIPTIONS.get(percentile_lower, "未知百分位")
-    elif metric_type == "bmi" and age_months is not None:
-        # 2岁以下（<24个月）的BMI标准
-        if age_months < 24:
-            return BMI_PERCENTILE_DESCRIPTIONS_UNDER_2.get(percentile_lower, "未知百分位")
-        # 2岁以上（≥24个月）的BMI标准
-        else:
-            return BMI_PERCENTILE_DESCRIPTIONS_OVER_2.get(percentile_lower, "未知百分位")
-    elif metric_type == "bmi":
-        # 兼容旧调用方式
-        return BMI_PERCENTILE_DESCRIPTIONS_GENERAL.get(percentile_lower, "未知百分位")
+    if metric_type == "bmi" and age_months is not None:
+        # 2岁以下（<24个月）与2岁以上（≥24个月）的BMI标准
+        descriptions = BMI_PERCENTILE_DESCRIPTIONS_UNDER_2 if age_months < 24 else BMI_PERCENTILE_DESCRIPTIONS_OVER_2
     else:
-        return "未知指标类型"
+        descriptions = _METRIC_DESCRIPTIONS.get(metric_type) if isinstance(metric_type, str) else None
+        if descriptions is None:
+            return "未知指标类型"
+    
+    # 标签通常已是小写，查不到时再统一转为小写，以兼容大小写输入
+    description = descriptions.get(percentile)
+    if description is None:
+        description = descriptions.get(percentile.lower(), "未知百分位")
+    return description
@@ -0,0 +1,151 @@
+"""百分位边界索引
+
+将 {年龄: {百分位: 数值}} 形式的标准数据按年龄预编译为
+(升序边界元组, 对应百分位标签元组)，查找时只需一次字典访问和一次二分查找。
+"""
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, Optional, Tuple
+
+# (升序边界值, 对应的百分位标签)
+PercentileRow = Tuple[Tuple[float, ...], Tuple[str, ...]]
+
+# 索引缓存容量（按标准数据字典对象计）
+INDEX_CACHE_SIZE = 32
+
+
+def compile_percentile_row(age_data: dict) -> PercentileRow:
+    """将单个年龄的百分位字典编译为升序边界元组和标签元组
+
+    Args:
+        age_data: 百分位字典，如 {"p50": 16.3, "p85": 17.8, ...}
+
+    Returns:
+        PercentileRow: (升序边界值, 对应的百分位标签)
+    """
+    # 按百分位值排序（稳定排序，与原逐次排序的结果一致）
+    sorted_percentiles = sorted(age_data.items(), key=lambda x: x[1])
+    return (
+        tuple(value for _, value in sorted_percentiles),
+        tuple(label for label, _ in sorted_percentiles),
+    )
+
+
+def find_in_row_left_closed(row: PercentileRow, value: float) -> str:
+    """左闭右开区间查找（BMI）
+
+    达到某个百分位的值后即归属该百分位，直到达到下一个百分位的值；
+    小于最小值返回最小百分位，大于等于最大值返回最大百分位。
+    """
+    values, labels = row
+    i = bisect_right(values, value)
+    return labels[i - 1] if i else labels[0]
+
+
+def find_in_row_right_closed(row: PercentileRow, value: float) -> str:
+    """左开右闭区间查找（体重、身高）
+
+    落在(前一百分位值, 当前百分位值]内返回当前百分位；
+    超过所有百分位值时返回最大百分位，其中p999按p99返回。
+    """
+    values, labels = row
+    i = bisect_left(values, value)
+    # NaN与任何值比较均为False，原逐项比较会落到“超过所有百分位值”的分支
+    if i == len(values) or (i == 0 and not value <= values[0]):
+        max_percentile = labels[-1]
+        return "p99" if max_percentile == "p999" else max_percentile
+    return labels[i]
+
+
+class PercentileIndex:
+    """按年龄预编译的百分位边界索引
+
+    每个年龄的数据在首次查询时编译一次，之后整数（或字符串）年龄的查询
+    只需一次字典访问。年龄键的解析规则与原实现一致：先按原值查找，
+    找不到再按字符串形式查找。
+    """
+
+    __slots__ = ("_gender_data", "_int_rows", "_str_rows")
+
+    def __init__(self, gender_data: dict):
+        self._gender_data = gender_data
+        self._int_rows: Dict[int, PercentileRow] = {}
+        self._str_rows: Dict[str, PercentileRow] = {}
+
+    def _compile(self, age) -> Optional[PercentileRow]:
+        gender_data = self._gender_data
+        if age in gender_data:
+            return compile_percentile_row(gender_data[age])
+        age_str = str(age)
+        if age_str in gender_data:
+            return compile_percentile_row(gender_data[age_str])
+        return None
+
+    def lookup(self, age) -> Optional[PercentileRow]:
+        """获取指定年龄的编译结果，年龄不存在时返回None"""
+        cls = age.__class__
+        if cls is int:
+            rows = self._int_rows
+        elif cls is str:
+            rows = self._str_rows
+        else:
+            # 其他类型（如float）按原规则解析，不缓存
+            return self._compile(age)
+
+        row = rows.get(age)
+        if row is None:
+            row = self._compile(age)
+            if row is not None:
+                rows[age] = row
+        return row
+
+    def find_bmi(self, age, bmi: float) -> str:
+        """查找BMI百分位（左闭右开）"""
+        row = self.lookup(age)
+        if row is None:
+            return "unknown"
+        return find_in_row_left_closed(row, bmi)
+
+    def find_weight(self, age, weight: float) -> str:
+        """查找体重百分位（左开右闭）"""
+        row = self.lookup(age)
+        if row is None:
+            return "unknown"
+        return find_in_row_right_closed(row, weight)
+
+    def find_height(self, age, height: float) -> str:
+        """查找身高百分位（左开右闭）"""
+        row = self.lookup(age)
+        if row is None:
+            return "unknown"
+        return find_in_row_right_closed(row, height)
+
+
+_index_cache: Dict[int, Tuple[dict, PercentileIndex]] = {}
+_index_cache_lock = threading.Lock()
+
+
+def get_percentile_index(gender_data: dict) -> PercentileIndex:
+    """获取标准数据字典对应的百分位索引（按对象缓存）
+
+    Note:
+        索引按字典对象缓存，原地修改标准数据后需调用
+        clear_percentile_index_cache() 使缓存失效。
+    """
+    entry = _index_cache.get(id(gender_data))
+    if entry is not None and entry[0] is gender_data:
+        return entry[1]
+
+    index = PercentileIndex(gender_data)
+    with _index_cache_lock:
+        if len(_index_cache) >= INDEX_CACHE_SIZE:
+            _index_cache.pop(next(iter(_index_cache)), None)
+        # 同时保存字典引用，保证id在缓存期间不会被复用
+        _index_cache[id(gender_data)] = (gender_data, index)
+    return index
+
+
+def clear_percentile_index_cache() -> None:
+    """清空百分位索引缓存（标准数据被修改后调用）"""
+    with _index_cache_lock:
+        _index_cache.clear()
@@ -0,0 +1,114 @@
+"""量化直接索引表
+
+calculate_bmi 将BMI保留两位小数，月龄为0-228的整数，因此 find_bmi 的全部分类结果可以预先计算：
+对参考表每个去重后的行，在 [QUANTIZED_MIN, QUANTIZED_MAX] 内按0.01的步长保存一个 uint8 百分位列号，
+查找时只需把BMI换算为整数下标并读取一个字节，不再做二分查找。
+超出范围、不在0.01网格上的BMI（以及NaN）回退到 ReferenceTable.find_bmi_in_row。
+"""
+from array import array
+from typing import Optional
+
+from .reference_table import ReferenceTable
+
+# 量化范围（含两端），覆盖全部标准数据边界
+QUANTIZED_MIN = 5.0
+QUANTIZED_MAX = 60.0
+
+_MIN_STEP = int(round(QUANTIZED_MIN * 100))
+_MAX_STEP = int(round(QUANTIZED_MAX * 100))
+_SPAN = _MAX_STEP - _MIN_STEP + 1
+
+
+class QuantizedBMIIndex:
+    """BMI百分位的量化直接索引表
+
+    Attributes:
+        table: 对应的参考表
+        codes: 每个去重行 _SPAN 个字节，第 i 个为BMI (QUANTIZED_MIN + i * 0.01) 的百分位列号
+        offsets: (性别编码 * (max_age + 1) + 月龄) -> codes 中该行的起始位置减去 QUANTIZED_MIN * 100，
+            加上 BMI * 100 即为下标
+    """
+
+    __slots__ = ("table", "codes", "_width", "offsets", "_ages")
+
+    def __init__(self, table: ReferenceTable):
+        width = len(table.columns)
+        if width > 255:
+            raise ValueError("百分位列数过多，无法用uint8保存")
+        values = table.values
+        codes = bytearray(len(values) // width * _SPAN)
+        for row in range(len(values) // width):
+            start = row * width
+            base = row * _SPAN
+            # 左闭右开：BMI >= 第k列边界的最小网格点起为第k列
+            for column in range(1, width):
+                step = _first_step_at_or_above(values[start + column])
+                if step <= _MAX_STEP:
+                    begin = base + max(step, _MIN_STEP) - _MIN_STEP
+                    codes[begin:base + _SPAN] = bytes([column]) * (base + _SPAN - begin)
+        self.table = table
+        self.codes = codes
+        self._width = width
+        self._ages = table.max_age + 1
+        self.offsets = array("q", (row_id * _SPAN - _MIN_STEP for row_id in table.row_ids))
+
+    @property
+    def nbytes(self) -> int:
+        """直接索引表占用的字节数"""
+        return len(self.codes)
+
+    def find_bmi(self, gender_code: int, age, bmi: float) -> str:
+        """查找BMI百分位（左闭右开），结果与 ReferenceTable.find_bmi 一致"""
+        if age.__class__ is int and 0 <= age < self._ages and QUANTIZED_MIN <= bmi <= QUANTIZED_MAX:
+            step = int(bmi * 100 + 0.5)
+            if step / 100 == bmi:
+                return self.table.columns[self.codes[self.offsets[gender_code * self._ages + age] + step]]
+        # 量化范围外、不在0.01网格上的BMI或非整数月龄，按二分查找
+        return self.table.find_bmi(gender_code, age, bmi)
+
+
+def _first_step_at_or_above(boundary: float) -> int:
+    """返回满足 step / 100 >= boundary 的最小整数 step"""
+    step = int(boundary * 100)
+    while step / 100 >= boundary:
+        step -= 1
+    while step / 100 < boundary:
+        step += 1
+    return step
+
+
+def verify_quantized_index(index: QuantizedBMIIndex) -> int:
+    """在整个网格（全部性别、月龄、量化范围内的每个0.01）上与二分查找逐点比较
+
+    Returns:
+        int: 比较的点数
+
+    Raises:
+        ValueError: 存在不一致的点
+    """
+    table = index.table
+    checked = 0
+    grid = [step / 100 for step in range(_MIN_STEP, _MAX_STEP + 1)]
+    for gender_code, gender in enumerate(table.genders):
+        for age in range(table.max_age + 1):
+            start = table.row_start_for(gender_code, age)
+            for bmi in grid:
+                expected = table.find_bmi_in_row(start, bmi)
+                actual = index.find_bmi(gender_code, age, bmi)
+                if actual != expected:
+                    raise ValueError(f"量化索引与二分查找不一致：{gender} {age} {bmi}：{actual} != {expected}")
+            checked += len(grid)
+    return checked
+
+
+# 最近使用的参考表的量化索引，参考表被替换后重新构建
+_index: Optional[QuantizedBMIIndex] = None
+
+
+def get_quantized_index(table: ReferenceTable) -> QuantizedBMIIndex:
+    """获取参考表对应的量化索引（首次使用时构建，按参考表对象缓存最近一份）"""
+    global _index
+    index = _index
+    if index is None or index.table is not table:
+        index = _index = QuantizedBMIIndex(table)
+    return index
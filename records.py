@@ -0,0 +1,69 @@
+"""不可变的结果记录
+
+百分位结果只有有限种组合（年龄段 × 百分位编码，再加年龄超范围、不支持的性别），
+因此全部预先创建，查找时直接返回同一个对象，不再为每次调用构建字典和描述字符串。
+"""
+from typing import Any, Dict, NamedTuple, Optional
+
+from .percentile_descriptions import (
+    BMI_DESCRIPTIONS_BY_CODE,
+    PERCENTILE_CODE_LABELS,
+    PERCENTILE_CODES,
+    PercentileCode,
+    get_percentile_description,
+)
+
+
+class PercentileResult(NamedTuple):
+    """百分位结果
+
+    Attributes:
+        code: 百分位编码，标签不在 PERCENTILE_CODE_LABELS 中时为None
+        percentile: 百分位标签，如 "p50"
+        description: 百分位描述
+    """
+
+    code: Optional[PercentileCode]
+    percentile: str
+    description: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """转换为 calculate_bmi_percentile 返回的字典"""
+        return {"percentile": self.percentile, "description": self.description}
+
+
+class BMIResult(NamedTuple):
+    """BMI及其百分位结果"""
+
+    bmi: float
+    code: Optional[PercentileCode]
+    percentile: str
+    description: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为 calculate_bmi_with_percentile 返回的字典"""
+        return {"bmi": self.bmi, "percentile": self.percentile, "description": self.description}
+
+
+# 预先创建的BMI百分位结果：[年龄段][百分位编码]，年龄段0为2岁以下，1为2岁以上
+BMI_PERCENTILE_RESULTS = tuple(
+    tuple(
+        PercentileResult(PercentileCode(code), label, descriptions[code])
+        for code, label in enumerate(PERCENTILE_CODE_LABELS)
+    )
+    for descriptions in BMI_DESCRIPTIONS_BY_CODE
+)
+
+AGE_OUT_OF_RANGE_RESULT = PercentileResult(PercentileCode.UNKNOWN, "unknown", "年龄超出数据范围(0-228个月)")
+UNSUPPORTED_GENDER_RESULT = PercentileResult(PercentileCode.UNKNOWN, "unknown", "不支持的性别")
+
+
+def bmi_percentile_result(percentile: str, age_months) -> PercentileResult:
+    """获取BMI百分位标签对应的预分配结果
+
+    标签不是标准百分位时（如自定义参考表的列）按 get_percentile_description 构建新记录。
+    """
+    code = PERCENTILE_CODES.get(percentile)
+    if code is None:
+        return PercentileResult(None, percentile, get_percentile_description(percentile, "bmi", age_months))
+    return BMI_PERCENTILE_RESULTS[0 if age_months < 24 else 1][code]
@@ -0,0 +1,313 @@
+"""紧凑的参考标准表
+
+将标准数据保存为连续的 array('d') 边界矩阵，按 (性别, 月龄, 百分位列) 寻址，
+内容相同的月龄行只保存一份。WHOStandardService 的百分位查找直接基于该表完成。
+"""
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Optional, Sequence, Tuple
+
+from .percentile_index import compile_percentile_row
+
+# 参考表对应的指标
+METRICS = ("bmi", "height", "weight")
+
+
+def normalize_age(age) -> Optional[int]:
+    """将月龄解析为整数，规则与按字典查找一致
+
+    整数直接使用，其他类型按字符串形式匹配，因此 5.0、"05"、True 等都视为不存在（返回None）。
+    """
+    if age.__class__ is int:
+        return age
+    age_str = str(age)
+    if not age_str.isdecimal() or str(int(age_str)) != age_str:
+        return None
+    return int(age_str)
+
+
+class ReferenceTable:
+    """紧凑的参考标准表
+
+    Attributes:
+        genders: 支持的性别，顺序即性别编码
+        columns: 百分位列（按数值从低到高）
+        max_age: 覆盖的最大月龄
+        values: 去重后的边界值，每 len(columns) 个为一行
+        row_ids: (性别编码 * (max_age + 1) + 月龄) -> values 中的行号
+    """
+
+    __slots__ = ("genders", "columns", "max_age", "values", "row_ids", "_gender_codes", "_width")
+
+    def __init__(
+        self,
+        genders: Tuple[str, ...],
+        columns: Tuple[str, ...],
+        max_age: int,
+        values: Sequence[float],
+        row_ids: Sequence[int],
+    ):
+        self.genders = genders
+        self.columns = columns
+        self.max_age = max_age
+        self.values = values
+        self.row_ids = row_ids
+        self._gender_codes: Dict[str, int] = {gender: code for code, gender in enumerate(genders)}
+        self._width = len(columns)
+
+    @classmethod
+    def from_rows(cls, rows_by_gender: Dict[str, Sequence[Sequence[float]]], columns: Tuple[str, ...]) -> "ReferenceTable":
+        """由 {性别: [每个月龄一行]} 构建参考表，相同的行只保存一份
+
+        Raises:
+            ValueError: 各性别月龄数不一致，或某行长度不符、数值不是单调不减
+        """
+        genders = tuple(rows_by_gender)
+        ages = {len(rows) for rows in rows_by_gender.values()}
+        if len(ages) != 1:
+            raise ValueError("各性别的月龄数不一致")
+
+        values = array("d")
+        row_ids = array("H")
+        seen: Dict[Tuple[float, ...], int] = {}
+        for gender in genders:
+            for age, row in enumerate(rows_by_gender[gender]):
+                row = tuple(row)
+                if len(row) != len(columns):
+                    raise ValueError(f"标准数据列数不正确：{gender} {age}")
+                if any(a > b for a, b in zip(row, row[1:])):
+                    raise ValueError(f"标准数据百分位不单调：{gender} {age}")
+                row_id = seen.get(row)
+                if row_id is None:
+                    row_id = seen[row] = len(seen)
+                    values.extend(row)
+                row_ids.append(row_id)
+        return cls(genders, tuple(columns), ages.pop() - 1, values, row_ids)
+
+    @classmethod
+    def from_standard_data(cls, standard_data: Dict[str, dict]) -> "ReferenceTable":
+        """由 {性别: {月龄: {百分位: 数值}}} 形式的标准数据构建参考表
+
+        月龄键可以是整数或字符串（如从JSON读取），必须从0开始连续；
+        列顺序按月龄0的数值从低到高确定，其他月龄排序后的百分位顺序必须与之相同。
+
+        Raises:
+            ValueError: 月龄不连续，或各月龄的百分位不一致
+        """
+        rows_by_gender = {}
+        columns = None
+        for gender, gender_data in standard_data.items():
+            by_age = {}
+            for age, age_data in gender_data.items():
+                normalized = normalize_age(age)
+                if normalized is None:
+                    raise ValueError(f"标准数据月龄不正确：{gender} {age!r}")
+                by_age[normalized] = age_data
+            if sorted(by_age) != list(range(len(by_age))):
+                raise ValueError(f"标准数据月龄必须从0开始连续：{gender}")
+
+            rows = []
+            for age in range(len(by_age)):
+                row, labels = compile_percentile_row(by_age[age])
+                if columns is None:
+                    columns = labels
+                elif labels != columns:
+                    raise ValueError(f"标准数据百分位不一致：{gender} {age}")
+                rows.append(row)
+            rows_by_gender[gender] = rows
+        if columns is None:
+            raise ValueError("标准数据为空")
+        return cls.from_rows(rows_by_gender, columns)
+
+    @property
+    def nbytes(self) -> int:
+        """边界值与行号占用的字节数"""
+        return len(self.values) * 8 + len(self.row_ids) * 2
+
+    def gender_code(self, gender: str) -> Optional[int]:
+        """性别 -> 性别编码，不支持时返回None"""
+        return self._gender_codes.get(gender)
+
+    def row_start(self, gender_code: int, age) -> Optional[int]:
+        """获取 (性别编码, 月龄) 对应行在 values 中的起始位置，月龄不存在时返回None
+
+        月龄的解析规则见 normalize_age。
+        """
+        if age.__class__ is not int:
+            age = normalize_age(age)
+            if age is None:
+                return None
+        return self.row_start_for(gender_code, age)
+
+    def row_start_for(self, gender_code: int, age: int) -> Optional[int]:
+        """与 row_start 相同，但月龄必须已解析为整数"""
+        if age < 0 or age > self.max_age:
+            return None
+        return self.row_ids[gender_code * (self.max_age + 1) + age] * self._width
+
+    def row(self, gender: str, age: int) -> Optional[Tuple[float, ...]]:
+        """获取指定性别、月龄的边界值（按 columns 顺序），不存在时返回None"""
+        gender_code = self._gender_codes.get(gender)
+        if gender_code is None:
+            return None
+        start = self.row_start(gender_code, age)
+        if start is None:
+            return None
+        return tuple(self.values[start:start + self._width])
+
+    def find_bmi(self, gender_code: int, age, bmi: float) -> str:
+        """查找BMI百分位（左闭右开），月龄不存在时返回"unknown"
+
+        达到某个百分位的值后即归属该百分位，直到达到下一个百分位的值。
+        """
+        start = self.row_start(gender_code, age)
+        if start is None:
+            return "unknown"
+        return self.find_bmi_in_row(start, bmi)
+
+    def find_bmi_in_row(self, start: int, bmi: float) -> str:
+        """在 row_start 返回的行内查找BMI百分位（左闭右开）"""
+        i = bisect_right(self.values, bmi, start, start + self._width) - start
+        return self.columns[i - 1] if i else self.columns[0]
+
+    def find_measure(self, gender_code: int, age, value: float) -> str:
+        """查找身高、体重百分位（左开右闭），月龄不存在时返回"unknown"
+
+        落在(前一百分位值, 当前百分位值]内返回当前百分位；
+        超过所有百分位值时返回最大百分位，其中p999按p99返回。
+        """
+        start = self.row_start(gender_code, age)
+        if start is None:
+            return "unknown"
+        return self.find_measure_in_row(start, value)
+
+    def find_measure_in_row(self, start: int, value: float) -> str:
+        """在 row_start 返回的行内查找身高、体重百分位（左开右闭）"""
+        width = self._width
+        i = bisect_left(self.values, value, start, start + width) - start
+        # NaN与任何值比较均为False，与逐项比较一样落到“超过所有百分位值”的分支
+        if i == width or (i == 0 and not value <= self.values[start]):
+            max_percentile = self.columns[-1]
+            return "p99" if max_percentile == "p999" else max_percentile
+        return self.columns[i]
+
+
+# 设置该环境变量后，从指定的二进制参考表文件（见 table_file.py）以 mmap 方式加载BMI参考表
+REFERENCE_TABLE_ENV = "WHO_BMI_REFERENCE_TABLE"
+
+# 身高、体重参考表文件对应的环境变量（包内不附带身高、体重标准数据）
+METRIC_TABLE_ENVS = {
+    "bmi": REFERENCE_TABLE_ENV,
+    "height": "WHO_HEIGHT_REFERENCE_TABLE",
+    "weight": "WHO_WEIGHT_REFERENCE_TABLE",
+}
+
+_METRIC_LABELS = {"bmi": "BMI", "height": "身高", "weight": "体重"}
+
+_bmi_reference_table: Optional[ReferenceTable] = None
+_load_lock = threading.Lock()
+
+# 指标 -> 已加载的身高、体重参考表，False 表示已确认未配置
+# 不原地修改：更新时在 _load_lock 内复制出新字典再整体赋值，读取方无需加锁
+_measure_tables: Dict[str, object] = {}
+
+
+def get_bmi_reference_table() -> ReferenceTable:
+    """获取BMI参考表（首次调用时构建，多线程同时首次调用时只构建一次）"""
+    global _bmi_reference_table
+    table = _bmi_reference_table
+    if table is None:
+        with _load_lock:
+            table = _bmi_reference_table
+            if table is None:
+                path = os.environ.get(REFERENCE_TABLE_ENV)
+                if path:
+                    from .table_file import open_table_file
+                    table = open_table_file(path)
+                else:
+                    # 标准数据模块较大，首次查找时才导入
+                    from .bmi_data_final import BMI_COLUMNS, BMI_STANDARD_ROWS
+                    table = ReferenceTable.from_rows(BMI_STANDARD_ROWS, BMI_COLUMNS)
+                _bmi_reference_table = table
+    return table
+
+
+def is_bmi_reference_table_loaded() -> bool:
+    """BMI参考表是否已加载"""
+    return _bmi_reference_table is not None
+
+
+def set_bmi_reference_table(table: Optional[ReferenceTable]) -> None:
+    """替换当前使用的BMI参考表，传入None时下次使用会重新加载默认数据"""
+    global _bmi_reference_table
+    _bmi_reference_table = table
+
+
+def _check_metric(metric: str) -> None:
+    if metric not in METRICS:
+        raise ValueError(f"不支持的指标：{metric}，应为 {'/'.join(METRICS)}")
+
+
+def get_reference_table(metric: str) -> Optional[ReferenceTable]:
+    """获取指定指标的参考表
+
+    身高、体重参考表需通过 set_reference_table 设置，或通过 METRIC_TABLE_ENVS 中的
+    环境变量指定二进制参考表文件，均未配置时返回None。
+
+    Raises:
+        ValueError: 不支持的指标
+    """
+    global _measure_tables
+    if metric == "bmi":
+        return get_bmi_reference_table()
+    table = _measure_tables.get(metric)
+    if table is None:
+        _check_metric(metric)
+        with _load_lock:
+            table = _measure_tables.get(metric)
+            if table is None:
+                path = os.environ.get(METRIC_TABLE_ENVS[metric])
+                if path:
+                    from .table_file import open_table_file
+                    table = open_table_file(path)
+                else:
+                    table = False
+                _measure_tables = {**_measure_tables, metric: table}
+    return table or None
+
+
+def require_reference_table(metric: str) -> ReferenceTable:
+    """获取指定指标的参考表，未配置时抛出异常（包内不附带身高、体重标准数据）
+
+    Raises:
+        ValueError: 不支持的指标，或该指标的参考表未加载
+    """
+    table = get_reference_table(metric)
+    if table is None:
+        raise ValueError(
+            f"未加载{_METRIC_LABELS[metric]}参考表，请先用 WHOStandardService.load_standard_data / load_reference_table "
+            f"或环境变量 {METRIC_TABLE_ENVS[metric]} 提供（包内不附带身高、体重标准数据）"
+        )
+    return table
+
+
+def set_reference_table(metric: str, table: Optional[ReferenceTable]) -> None:
+    """替换指定指标的参考表，传入None时下次使用会重新按环境变量加载
+
+    Raises:
+        ValueError: 不支持的指标
+    """
+    global _measure_tables
+    _check_metric(metric)
+    if metric == "bmi":
+        set_bmi_reference_table(table)
+        return
+    with _load_lock:
+        tables = dict(_measure_tables)
+        if table is None:
+            tables.pop(metric, None)
+        else:
+            tables[metric] = table
+        _measure_tables = tables
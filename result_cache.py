@@ -0,0 +1,86 @@
+"""结果缓存
+
+calculate_bmi 保留两位小数、月龄为0-228的整数，实际输入的取值范围很小且重复度高，
+可选地用有界LRU缓存保存 (性别, 月龄, BMI) -> PercentileResult 的结果；
+同一批记录的出生日期和测量日期也高度重复，年龄计算结果同样可以缓存。
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# 缓存的结果必须不可变（如 PercentileResult、ResolvedAge 等 NamedTuple），不会被调用方修改
+CachedValue = Any
+
+
+class LRUCache:
+    """线程安全的有界LRU结果缓存
+
+    缓存可与创建结果时使用的参考数据绑定，参考数据被替换后首次访问时自动清空。
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("缓存容量必须大于0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CachedValue]" = OrderedDict()
+        self._source = None
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, source=None) -> Optional[CachedValue]:
+        """查找缓存，未命中时返回None
+
+        Args:
+            key: 缓存键
+            source: 当前使用的参考数据，与缓存绑定的不是同一对象时清空缓存
+        """
+        with self._lock:
+            if source is not self._source:
+                self._entries.clear()
+                self._source = source
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, value: CachedValue, source=None) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的结果"""
+        with self._lock:
+            if source is not self._source:
+                self._entries.clear()
+                self._source = source
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """清空缓存（参考数据变化时调用），统计计数保留"""
+        with self._lock:
+            self._entries.clear()
+            self._source = None
+
+    def stats(self) -> Dict[str, int]:
+        """获取缓存统计信息"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+class PercentileCache(LRUCache):
+    """BMI百分位结果缓存：(性别, 月龄, BMI) -> PercentileResult，与BMI参考表绑定"""
+
+
+class AgeCache(LRUCache):
+    """年龄计算结果缓存：(age_date, 当前日期) -> ResolvedAge"""
@@ -0,0 +1,239 @@
+"""批量评分
+
+流式读取CSV或JSON Lines文件，逐行计算年龄、BMI、百分位和描述并分块写出，
+内存占用与文件大小无关。无法处理的行写入拒绝文件，不中断整体处理。
+
+输入字段：
+    age_date 或 birth_date: 出生日期，格式同 AgeCalculator.parse_age_date（YYYY-MM-DD 或 YYYY-MM-00）
+    gender: 性别 ("boy" 或 "girl")
+    height: 身高（厘米）
+    weight: 体重（千克）
+    measure_date: 测量日期（可选，YYYY-MM-DD），缺省时使用参考日期
+"""
+import csv
+import json
+import math
+import time
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .age_calculator import AgeCalculator
+from .who_standard_service import WHOStandardService
+
+# 评分结果追加的字段
+RESULT_FIELDS = ["age_display", "age_storage", "age_in_months", "bmi", "percentile", "description"]
+
+# 拒绝文件追加的字段
+ERROR_FIELD = "error"
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def detect_format(path: str) -> str:
+    """根据文件扩展名判断格式，.jsonl/.ndjson/.json 为 "jsonl"，其他为 "csv" """
+    lower = path.lower()
+    if lower.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def read_records(stream, fmt: str) -> Iterator[Dict[str, Any]]:
+    """逐行读取记录
+
+    JSON Lines 中无法解析的行以 {"_raw": 原始内容, "_error": 错误信息} 的形式返回，
+    由评分阶段写入拒绝文件。
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield {"_raw": line, "_error": f"JSON格式不正确：{e}"}
+            continue
+        if not isinstance(record, dict):
+            yield {"_raw": line, "_error": "每行必须是JSON对象"}
+            continue
+        yield record
+
+
+def _parse_date(value: Any) -> date:
+    try:
+        if not isinstance(value, str):
+            raise ValueError
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"测量日期格式不正确：{value}，应为'YYYY-MM-DD'格式")
+
+
+def score_record(record: Dict[str, Any], reference_date: Optional[date] = None) -> Dict[str, Any]:
+    """计算单条记录的年龄、BMI及百分位
+
+    Args:
+        record: 输入记录
+        reference_date: 记录中没有测量日期时使用的日期，默认为今天
+
+    Returns:
+        评分结果字段
+
+    Raises:
+        ValueError: 字段缺失（包括性别为空）、格式不正确，或身高、体重不是有限数值
+    """
+    age_date = record.get("age_date") or record.get("birth_date")
+    if not age_date:
+        raise ValueError("缺少出生日期字段(age_date/birth_date)")
+    measure_date = record.get("measure_date")
+    current_date = _parse_date(measure_date) if measure_date else reference_date
+
+    try:
+        height_cm = float(record["height"])
+        weight_kg = float(record["weight"])
+    except KeyError as e:
+        raise ValueError(f"缺少字段：{e.args[0]}")
+    except (TypeError, ValueError):
+        raise ValueError("身高和体重必须为数值")
+    # float() 接受 "nan"、"inf" 和 "1e400"（溢出为inf），这些值不能参与计算
+    if not (math.isfinite(height_cm) and math.isfinite(weight_kg)):
+        raise ValueError("身高和体重必须为有限数值")
+
+    gender = record.get("gender")
+    if gender is None or gender == "":
+        raise ValueError("缺少字段：gender")
+    if not isinstance(gender, str):
+        raise ValueError(f"性别必须为字符串：{gender!r}")
+
+    # 出生日期只解析一次，同时得到显示、存储格式的年龄和总月数
+    display_age, storage_age, age_in_months = AgeCalculator.resolve_age(str(age_date), current_date)
+
+    result = WHOStandardService.calculate_bmi_with_percentile(gender, age_in_months, height_cm, weight_kg)
+    return {
+        "age_display": display_age,
+        "age_storage": storage_age,
+        "age_in_months": age_in_months,
+        "bmi": result["bmi"],
+        "percentile": result["percentile"],
+        "description": result["description"],
+    }
+
+
+def score_records(
+    records: Iterable[Dict[str, Any]],
+    reference_date: Optional[date] = None,
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[str]]]:
+    """逐条评分
+
+    Yields:
+        (输入记录, 评分结果, 错误信息)，成功时错误信息为None，失败时评分结果为None
+    """
+    if reference_date is None:
+        reference_date = date.today()
+    for record in records:
+        # 读取阶段已发现的错误（如JSON格式不正确）
+        read_error = record.pop("_error", None)
+        if read_error is not None:
+            yield record, None, read_error
+            continue
+        try:
+            result = score_record(record, reference_date)
+        except (TypeError, ValueError) as e:
+            # 单行的任何输入错误都写入拒绝文件，不中断整体处理
+            yield record, None, str(e)
+            continue
+        yield record, result, None
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _RecordWriter:
+    """按格式增量写出记录，CSV表头取自第一条记录"""
+
+    def __init__(self, stream, fmt: str, extra_fields: List[str]):
+        self._stream = stream
+        self._fmt = fmt
+        self._extra_fields = extra_fields
+        self._csv_writer = None
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self._fmt == "jsonl":
+            self._stream.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+            return
+        if self._csv_writer is None:
+            fields = [name for name in rows[0] if name not in self._extra_fields] + self._extra_fields
+            self._csv_writer = csv.DictWriter(self._stream, fieldnames=fields, extrasaction="ignore")
+            self._csv_writer.writeheader()
+        self._csv_writer.writerows(rows)
+
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    reject_path: Optional[str] = None,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    reference_date: Optional[date] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """流式评分文件
+
+    Args:
+        input_path: 输入文件（CSV或JSON Lines）
+        output_path: 评分结果文件
+        reject_path: 拒绝文件，默认为输出文件名加 ".rejects" 后缀
+        input_format: 输入格式 "csv"/"jsonl"，默认按扩展名判断
+        output_format: 输出格式，默认与输入格式相同
+        reference_date: 记录中没有测量日期时使用的日期，默认为今天
+        chunk_size: 每次写出的行数
+
+    Returns:
+        统计信息：总行数、成功行数、拒绝行数、耗时（秒）、每秒行数
+    """
+    input_format = input_format or detect_format(input_path)
+    output_format = output_format or input_format
+    if reject_path is None:
+        reject_path = output_path + ".rejects"
+
+    rows = scored = rejected = 0
+    started = time.perf_counter()
+    with open(input_path, newline="", encoding="utf-8-sig") as source, \
+            open(output_path, "w", newline="", encoding="utf-8") as output, \
+            open(reject_path, "w", newline="", encoding="utf-8") as rejects:
+        output_writer = _RecordWriter(output, output_format, RESULT_FIELDS)
+        reject_writer = _RecordWriter(rejects, output_format, [ERROR_FIELD])
+        results = score_records(read_records(source, input_format), reference_date)
+        for chunk in _chunks(results, chunk_size):
+            scored_rows = []
+            rejected_rows = []
+            for record, result, error in chunk:
+                if error is None:
+                    scored_rows.append({**record, **result})
+                else:
+                    rejected_rows.append({**record, ERROR_FIELD: error})
+            output_writer.write_rows(scored_rows)
+            reject_writer.write_rows(rejected_rows)
+            rows += len(chunk)
+            scored += len(scored_rows)
+            rejected += len(rejected_rows)
+
+    seconds = time.perf_counter() - started
+    return {
+        "rows": rows,
+        "scored": scored,
+        "rejected": rejected,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds > 0 else 0.0,
+    }
@@ -31,5 +31,8 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy>=1.17"],
+    },
     keywords="bmi, who, children, growth, health, percentile",
 )
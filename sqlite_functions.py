@@ -0,0 +1,187 @@
+"""SQLite 集成
+
+在 sqlite3.Connection 上注册确定性的标量函数和人群患病率聚合函数，
+评分和汇总可以直接写成 SQL 查询，不必把每一行取回 Python：
+
+    SELECT who_bmi(height, weight) AS bmi,
+           who_bmi_percentile(gender, age_in_months, who_bmi(height, weight)) AS percentile
+    FROM measurements;
+
+    SELECT gender, age_in_months / 12 AS age_year,
+           who_bmi_prevalence(gender, age_in_months, who_bmi(height, weight), '肥胖') AS obesity_rate
+    FROM measurements GROUP BY 1, 2;
+
+查找使用与 WHOStandardService 相同的紧凑参考表；输入为 NULL 或非法（如身高不大于0）时返回 NULL。
+write_scores 在一个事务内用分批 executemany 写回评分结果。
+"""
+import sqlite3
+from itertools import islice
+from typing import Any, Iterable, Optional, Tuple
+
+from .percentile_descriptions import BMI_CATEGORIES, BMI_CATEGORY_BY_CODE, NO_CATEGORY, PercentileCode
+from .who_standard_service import WHOStandardService
+
+DEFAULT_SCORES_TABLE = "bmi_scores"
+DEFAULT_BATCH_SIZE = 1000
+
+# (键, 性别, 月龄, 身高cm, 体重kg)
+ScoreRow = Tuple[Any, str, int, float, float]
+
+
+def _bmi(height_cm, weight_kg) -> Optional[float]:
+    if height_cm is None or weight_kg is None:
+        return None
+    try:
+        return WHOStandardService.calculate_bmi(height_cm, weight_kg)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bmi_record(gender, age_in_months, bmi):
+    if gender is None or age_in_months is None or bmi is None:
+        return None
+    try:
+        return WHOStandardService.calculate_bmi_percentile_record(gender, age_in_months, bmi)
+    except TypeError:
+        return None
+
+
+def _bmi_percentile(gender, age_in_months, bmi) -> Optional[str]:
+    record = _bmi_record(gender, age_in_months, bmi)
+    return None if record is None else record.percentile
+
+
+def _bmi_description(gender, age_in_months, bmi) -> Optional[str]:
+    record = _bmi_record(gender, age_in_months, bmi)
+    return None if record is None else record.description
+
+
+def _bmi_category_code(gender, age_in_months, bmi) -> int:
+    record = _bmi_record(gender, age_in_months, bmi)
+    if record is None or record.code is None or record.code == PercentileCode.UNKNOWN:
+        return NO_CATEGORY
+    return BMI_CATEGORY_BY_CODE[0 if age_in_months < 24 else 1][record.code]
+
+
+def _bmi_category(gender, age_in_months, bmi) -> Optional[str]:
+    category = _bmi_category_code(gender, age_in_months, bmi)
+    return None if category == NO_CATEGORY else BMI_CATEGORIES[category]
+
+
+def _adult_category(bmi, gender) -> Optional[str]:
+    if bmi is None:
+        return None
+    try:
+        return WHOStandardService.calculate_adult_bmi_category(bmi, gender)["category"]
+    except TypeError:
+        return None
+
+
+class BMIPrevalence:
+    """聚合函数 who_bmi_prevalence(性别, 月龄, BMI, 分类)：分组内BMI分类为指定分类的比例
+
+    只统计能够分类的行（性别、月龄受支持且BMI不为NULL），没有可分类的行时返回 NULL。
+    """
+
+    def __init__(self):
+        self.classified = 0
+        self.matched = 0
+        self.category: Optional[int] = None
+
+    def step(self, gender, age_in_months, bmi, category) -> None:
+        if self.category is None:
+            if category not in BMI_CATEGORIES:
+                raise ValueError(f"未知的BMI分类：{category}")
+            self.category = BMI_CATEGORIES.index(category)
+        code = _bmi_category_code(gender, age_in_months, bmi)
+        if code == NO_CATEGORY:
+            return
+        self.classified += 1
+        if code == self.category:
+            self.matched += 1
+
+    def finalize(self) -> Optional[float]:
+        return self.matched / self.classified if self.classified else None
+
+
+# SQL函数名后缀 -> (参数个数, 实现)
+SCALAR_FUNCTIONS = {
+    "bmi": (2, _bmi),
+    "bmi_percentile": (3, _bmi_percentile),
+    "bmi_description": (3, _bmi_description),
+    "bmi_category": (3, _bmi_category),
+    "adult_category": (2, _adult_category),
+}
+
+
+def register_functions(connection: sqlite3.Connection, prefix: str = "who") -> None:
+    """在连接上注册 who_bmi、who_bmi_percentile、who_bmi_description、who_bmi_category、
+    who_adult_category 标量函数和 who_bmi_prevalence 聚合函数
+
+    Args:
+        connection: SQLite连接
+        prefix: 函数名前缀
+    """
+    for suffix, (arity, func) in SCALAR_FUNCTIONS.items():
+        try:
+            connection.create_function(f"{prefix}_{suffix}", arity, func, deterministic=True)
+        except sqlite3.NotSupportedError:  # pragma: no cover - SQLite < 3.8.3 不支持确定性函数
+            connection.create_function(f"{prefix}_{suffix}", arity, func)
+    connection.create_aggregate(f"{prefix}_bmi_prevalence", 4, BMIPrevalence)
+
+
+def write_scores(
+    connection: sqlite3.Connection,
+    rows: Iterable[ScoreRow],
+    table: str = DEFAULT_SCORES_TABLE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """计算BMI及其百分位并批量写入结果表（单个事务，出错时全部回滚）
+
+    结果表不存在时自动创建：(key PRIMARY KEY, bmi, percentile, description, error)，
+    键已存在的行被替换；身高或体重缺失、非法或类型不正确的行写入 error，其他结果列为 NULL。
+
+    Args:
+        connection: SQLite连接
+        rows: (键, 性别, 月龄, 身高cm, 体重kg) 的迭代器
+        table: 结果表名
+        batch_size: 每次 executemany 的行数
+
+    Returns:
+        int: 写入的行数
+
+    Raises:
+        ValueError: 表名不正确（表名直接写入SQL语句，见 thresholds.check_sql_identifier）
+    """
+    from .thresholds import check_sql_identifier
+
+    check_sql_identifier(table)
+    calculate = WHOStandardService.calculate_bmi_with_percentile_record
+    insert = f"INSERT OR REPLACE INTO {table} (key, bmi, percentile, description, error) VALUES (?, ?, ?, ?, ?)"
+    iterator = iter(rows)
+    count = 0
+    with connection:
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key PRIMARY KEY, bmi REAL, percentile TEXT, description TEXT, error TEXT)"
+        )
+        while True:
+            batch = []
+            for key, gender, age_in_months, height_cm, weight_kg in islice(iterator, batch_size):
+                if height_cm is None or weight_kg is None:
+                    batch.append((key, None, None, None, "缺少身高或体重"))
+                    continue
+                try:
+                    result = calculate(gender, age_in_months, height_cm, weight_kg)
+                except ValueError as e:
+                    batch.append((key, None, None, None, str(e)))
+                    continue
+                except TypeError as e:
+                    # 单行类型错误（如身高为字符串）同样写入 error，不回滚整个事务
+                    batch.append((key, None, None, None, f"输入类型不正确：{e}"))
+                    continue
+                batch.append((key, result.bmi, result.percentile, result.description, None))
+            if not batch:
+                return count
+            connection.executemany(insert, batch)
+            count += len(batch)
@@ -0,0 +1,290 @@
+"""参考标准与成人BMI分类策略注册表
+
+儿童青少年BMI参考标准（如WHO、WS/T 586、CDC 2000）统一编译为 ReferenceTable，
+按名称注册，参考表在首次使用时才加载，只用到一种标准的进程不会加载其他标准的数据；
+按请求切换标准只需一次字典查找。
+
+成人BMI分类的切点按性别编译为切点写为字面常量的分类函数（左闭右开，同 classifiers.py）。
+
+包内只附带WHO的BMI标准数据；其他标准的数据需由调用方提供，例如由
+`python -m who_bmi_calculator build-table --source data.json -o data.table` 生成二进制参考表文件后
+用 register_standard_file 注册。
+"""
+import threading
+from typing import Callable, Dict, Optional, Sequence
+
+from .records import AGE_OUT_OF_RANGE_RESULT, UNSUPPORTED_GENDER_RESULT, PercentileResult, bmi_percentile_result
+from .reference_table import ReferenceTable, get_bmi_reference_table, is_bmi_reference_table_loaded
+
+DEFAULT_STANDARD = "who"
+DEFAULT_ADULT_POLICY = "cn"
+
+# 成人BMI分类（从低到高），与 calculate_adult_bmi_category 返回的 category 一致
+ADULT_CATEGORIES = ("underweight", "normal", "overweight", "obese")
+ADULT_CATEGORY_LABELS = ("偏瘦", "正常", "超重", "肥胖")
+
+
+class ReferenceStandard:
+    """可注册的BMI参考标准
+
+    Args:
+        name: 标准名称
+        loader: 返回 ReferenceTable 的函数，首次使用时调用
+        description: 标准说明
+    """
+
+    __slots__ = ("name", "description", "_loader", "_table", "_lock")
+
+    def __init__(self, name: str, loader: Callable[[], ReferenceTable], description: str = ""):
+        self.name = name
+        self.description = description
+        self._loader = loader
+        self._table: Optional[ReferenceTable] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """参考表是否已加载"""
+        return self._table is not None
+
+    def table(self) -> ReferenceTable:
+        """获取参考表（首次调用时加载，多线程同时首次调用时只加载一次）"""
+        table = self._table
+        if table is None:
+            with self._lock:
+                table = self._table
+                if table is None:
+                    table = self._table = self._loader()
+        return table
+
+    def unload(self) -> None:
+        """丢弃已加载的参考表，下次使用时重新加载"""
+        self._table = None
+
+    def percentile_record(self, gender: str, age_in_months: int, bmi: float) -> PercentileResult:
+        """计算BMI百分位，规则同 WHOStandardService.calculate_bmi_percentile_record
+
+        月龄范围为0到参考表的最大月龄。
+        """
+        table = self.table()
+        if age_in_months < 0 or age_in_months > table.max_age:
+            return AGE_OUT_OF_RANGE_RESULT
+        gender_code = table.gender_code(gender)
+        if gender_code is None:
+            return UNSUPPORTED_GENDER_RESULT
+        return bmi_percentile_result(table.find_bmi(gender_code, age_in_months, bmi), age_in_months)
+
+
+class _DefaultStandard(ReferenceStandard):
+    """默认的WHO标准，参考表由 reference_table 加载和缓存（支持环境变量指定的参考表文件和替换）"""
+
+    __slots__ = ()
+
+    @property
+    def loaded(self) -> bool:
+        return is_bmi_reference_table_loaded()
+
+    def table(self) -> ReferenceTable:
+        return get_bmi_reference_table()
+
+    def unload(self) -> None:
+        raise ValueError(f"不能卸载默认参考标准：{self.name}")
+
+
+def _format_cutoff(value: float) -> str:
+    return f"{value:g}"
+
+
+class AdultBMIPolicy:
+    """成人BMI分类策略
+
+    Args:
+        name: 策略名称
+        cutoffs: {性别: (偏瘦/正常, 正常/超重, 超重/肥胖 三个切点)}，达到切点即归入较高的分类
+        default: 性别不在 cutoffs 中时使用的切点
+        description: 策略说明
+    """
+
+    __slots__ = ("name", "description", "cutoffs", "default", "_by_gender", "_default")
+
+    def __init__(
+        self,
+        name: str,
+        cutoffs: Dict[str, Sequence[float]],
+        default: Sequence[float],
+        description: str = "",
+    ):
+        for bounds in (default, *cutoffs.values()):
+            if len(bounds) != len(ADULT_CATEGORIES) - 1:
+                raise ValueError(f"成人BMI切点数量不正确：{name}")
+            if any(a >= b for a, b in zip(bounds, bounds[1:])):
+                raise ValueError(f"成人BMI切点必须递增：{name}")
+        self.name = name
+        self.description = description
+        self.cutoffs = {gender: tuple(bounds) for gender, bounds in cutoffs.items()}
+        self.default = tuple(default)
+        # 性别 -> 切点写为字面常量的分类函数
+        self._by_gender = {gender: compile_adult_classifier(bounds) for gender, bounds in self.cutoffs.items()}
+        self._default = compile_adult_classifier(self.default)
+
+    def classify(self, bmi: float, gender: str) -> Dict[str, str]:
+        """成人BMI分类
+
+        Returns:
+            {"category": 分类, "description": 描述}，每次返回新的字典
+        """
+        try:
+            classify = self._by_gender.get(gender, self._default)
+        except TypeError:  # 不可哈希的性别（如JSON数组）同样按默认切点
+            classify = self._default
+        return classify(bmi)
+
+
+def compile_adult_classifier(bounds: Sequence[float]) -> Callable[[float], Dict[str, str]]:
+    """由递增的切点生成成人BMI分类函数（左闭右开，NaN与任何值比较均为False，落入最高分类）"""
+    low, *_, high = bounds
+    ranges = [f"BMI<{_format_cutoff(low)}"]
+    ranges += [f"{_format_cutoff(a)}≤BMI<{_format_cutoff(b)}" for a, b in zip(bounds, bounds[1:])]
+    ranges.append(f"BMI≥{_format_cutoff(high)}")
+    namespace = {}
+    lines = ["def classify(bmi):"]
+    for i, (category, label, value_range) in enumerate(zip(ADULT_CATEGORIES, ADULT_CATEGORY_LABELS, ranges)):
+        namespace[f"c{i}"] = category
+        namespace[f"d{i}"] = f"{label} ({value_range})"
+        result = f'return {{"category": c{i}, "description": d{i}}}'
+        lines.append(f"    if bmi < {float(bounds[i])!r}:\n        {result}" if i < len(bounds) else f"    {result}")
+    exec(compile("\n".join(lines), "<adult_bmi_classifier>", "exec"), namespace)
+    return namespace["classify"]
+
+
+# 注册表不原地修改：注册、注销时在锁内复制出新字典再整体赋值，查找无需加锁
+_standards: Dict[str, ReferenceStandard] = {}
+_adult_policies: Dict[str, AdultBMIPolicy] = {}
+_registry_lock = threading.Lock()
+
+
+def register_standard(
+    name: str,
+    loader: Callable[[], ReferenceTable],
+    description: str = "",
+) -> ReferenceStandard:
+    """注册BMI参考标准（同名标准会被替换），参考表在首次使用时才加载
+
+    Args:
+        name: 标准名称
+        loader: 返回 ReferenceTable 的函数
+        description: 标准说明
+
+    Returns:
+        注册的参考标准
+
+    Raises:
+        ValueError: 名称与默认标准相同（默认标准请用 WHOStandardService.load_reference_table 替换）
+    """
+    global _standards
+    if name == DEFAULT_STANDARD:
+        raise ValueError(f"不能替换默认参考标准：{name}")
+    standard = ReferenceStandard(name, loader, description)
+    with _registry_lock:
+        _standards = {**_standards, name: standard}
+    return standard
+
+
+def register_standard_file(name: str, path: str, description: str = "", verify: bool = True) -> ReferenceStandard:
+    """注册以二进制参考表文件（见 table_file.py）提供的BMI参考标准，首次使用时以mmap方式打开
+
+    Args:
+        name: 标准名称
+        path: 由 `python -m who_bmi_calculator build-table` 生成的参考表文件
+        description: 标准说明
+        verify: 加载时是否校验文件的SHA-256
+    """
+    def load() -> ReferenceTable:
+        from .table_file import open_table_file
+        return open_table_file(path, verify)
+
+    return register_standard(name, load, description)
+
+
+def unregister_standard(name: str) -> None:
+    """注销BMI参考标准
+
+    Raises:
+        ValueError: 标准未注册，或试图注销默认标准
+    """
+    global _standards
+    if name == DEFAULT_STANDARD:
+        raise ValueError(f"不能注销默认参考标准：{name}")
+    with _registry_lock:
+        if name not in _standards:
+            raise ValueError(f"未注册的参考标准：{name}")
+        _standards = {key: value for key, value in _standards.items() if key != name}
+
+
+def get_standard(name: str = DEFAULT_STANDARD) -> ReferenceStandard:
+    """按名称获取BMI参考标准
+
+    Raises:
+        ValueError: 标准未注册
+    """
+    standard = _standards.get(name)
+    if standard is None:
+        raise ValueError(f"未注册的参考标准：{name}，可用：{'/'.join(_standards)}")
+    return standard
+
+
+def available_standards() -> Dict[str, Dict[str, object]]:
+    """已注册的BMI参考标准：{名称: {"description": 说明, "loaded": 是否已加载}}"""
+    return {
+        name: {"description": standard.description, "loaded": standard.loaded}
+        for name, standard in _standards.items()
+    }
+
+
+def register_adult_policy(policy: AdultBMIPolicy) -> AdultBMIPolicy:
+    """注册成人BMI分类策略（同名策略会被替换）"""
+    global _adult_policies
+    with _registry_lock:
+        _adult_policies = {**_adult_policies, policy.name: policy}
+    return policy
+
+
+def get_adult_policy(name: str = DEFAULT_ADULT_POLICY) -> AdultBMIPolicy:
+    """按名称获取成人BMI分类策略
+
+    Raises:
+        ValueError: 策略未注册
+    """
+    policy = _adult_policies.get(name)
+    if policy is None:
+        raise ValueError(f"未注册的成人BMI分类策略：{name}，可用：{'/'.join(_adult_policies)}")
+    return policy
+
+
+def available_adult_policies() -> Dict[str, str]:
+    """已注册的成人BMI分类策略：{名称: 说明}"""
+    return {name: policy.description for name, policy in _adult_policies.items()}
+
+
+_standards = {DEFAULT_STANDARD: _DefaultStandard(
+    DEFAULT_STANDARD, get_bmi_reference_table, "WHO儿童生长标准（0-19岁BMI百分位）"
+)}
+
+register_adult_policy(AdultBMIPolicy(
+    DEFAULT_ADULT_POLICY,
+    {"boy": (20.0, 25.0, 30.0)},
+    default=(19.0, 24.0, 29.0),
+    description="中国成人标准，区分男女（男性 20/25/30，女性 19/24/29）",
+))
+register_adult_policy(AdultBMIPolicy(
+    "who",
+    {},
+    default=(18.5, 25.0, 30.0),
+    description="WHO成人标准（18.5/25/30）",
+))
+register_adult_policy(AdultBMIPolicy(
+    "wst428",
+    {},
+    default=(18.5, 24.0, 28.0),
+    description="WS/T 428-2013 成人体重判定（18.5/24/28）",
+))
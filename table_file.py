@@ -0,0 +1,141 @@
+"""参考表二进制文件
+
+将 ReferenceTable 编译为带版本号和校验和的小端二进制文件，并以只读 mmap 方式加载，
+同一主机上的多个进程通过页缓存共享同一份物理内存。
+
+文件布局（小端）：
+    文件头（64字节）：魔数、版本、性别数、列数、月龄数、去重后行数、SHA-256校验和
+    性别标签表：每项8字节ASCII，右侧补0
+    百分位标签表：每项8字节ASCII，右侧补0
+    边界矩阵：去重后行数 x 列数 个 float64
+    行号表：性别数 x 月龄数 个 uint16
+"""
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from typing import Tuple
+
+from .reference_table import ReferenceTable
+
+MAGIC = b"WHOBMIT\x00"
+TABLE_FILE_VERSION = 1
+
+# 魔数、版本、性别数、列数、月龄数、去重后行数、保留字段、校验和
+_HEADER = struct.Struct("<8sHHHHII32s")
+_LABEL_SIZE = 8
+
+
+def _pack_labels(labels: Tuple[str, ...]) -> bytes:
+    packed = []
+    for label in labels:
+        raw = label.encode("ascii")
+        if len(raw) > _LABEL_SIZE:
+            raise ValueError(f"标签过长：{label}")
+        packed.append(raw.ljust(_LABEL_SIZE, b"\x00"))
+    return b"".join(packed)
+
+
+def _unpack_labels(buffer, offset: int, count: int) -> Tuple[str, ...]:
+    return tuple(
+        bytes(buffer[offset + i * _LABEL_SIZE:offset + (i + 1) * _LABEL_SIZE]).rstrip(b"\x00").decode("ascii")
+        for i in range(count)
+    )
+
+
+def dump_table(table: ReferenceTable) -> bytes:
+    """将参考表序列化为二进制文件内容"""
+    values = array("d", table.values)
+    row_ids = array("H", table.row_ids)
+    if sys.byteorder != "little":
+        values.byteswap()
+        row_ids.byteswap()
+
+    payload = b"".join((
+        _pack_labels(table.genders),
+        _pack_labels(table.columns),
+        values.tobytes(),
+        row_ids.tobytes(),
+    ))
+    header = _HEADER.pack(
+        MAGIC,
+        TABLE_FILE_VERSION,
+        len(table.genders),
+        len(table.columns),
+        table.max_age + 1,
+        len(values) // len(table.columns),
+        0,
+        hashlib.sha256(payload).digest(),
+    )
+    return header + payload
+
+
+def write_table_file(table: ReferenceTable, path: str) -> int:
+    """将参考表写入二进制文件
+
+    Returns:
+        int: 写入的字节数
+    """
+    content = dump_table(table)
+    with open(path, "wb") as f:
+        f.write(content)
+    return len(content)
+
+
+def load_table(buffer, verify: bool = True) -> ReferenceTable:
+    """从二进制内容构建参考表
+
+    小端主机上边界矩阵和行号表直接引用 buffer 中的数据，不做复制。
+
+    Args:
+        buffer: 支持缓冲区协议的对象（bytes、mmap等）
+        verify: 是否校验SHA-256
+
+    Raises:
+        ValueError: 魔数、版本、长度或校验和不正确
+    """
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        raise ValueError("参考表文件不完整")
+    magic, version, n_genders, n_columns, n_ages, n_rows, _, checksum = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("不是参考表文件")
+    if version != TABLE_FILE_VERSION:
+        raise ValueError(f"不支持的参考表文件版本：{version}")
+
+    genders_offset = _HEADER.size
+    columns_offset = genders_offset + n_genders * _LABEL_SIZE
+    values_offset = columns_offset + n_columns * _LABEL_SIZE
+    row_ids_offset = values_offset + n_rows * n_columns * 8
+    end = row_ids_offset + n_genders * n_ages * 2
+    if len(view) != end:
+        raise ValueError("参考表文件长度不正确")
+    if verify and hashlib.sha256(view[_HEADER.size:]).digest() != checksum:
+        raise ValueError("参考表文件校验和不正确")
+
+    values = view[values_offset:row_ids_offset].cast("d")
+    row_ids = view[row_ids_offset:end].cast("H")
+    if sys.byteorder != "little":
+        values = array("d", values)
+        row_ids = array("H", row_ids)
+        values.byteswap()
+        row_ids.byteswap()
+
+    return ReferenceTable(
+        _unpack_labels(view, genders_offset, n_genders),
+        _unpack_labels(view, columns_offset, n_columns),
+        n_ages - 1,
+        values,
+        row_ids,
+    )
+
+
+def open_table_file(path: str, verify: bool = True) -> ReferenceTable:
+    """以只读 mmap 方式加载参考表文件
+
+    映射在返回的参考表存活期间保持打开，多个进程映射同一文件时共享页缓存。
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return load_table(mapped, verify)
@@ -0,0 +1,21 @@
+"""测试配置：将仓库根目录作为 who_bmi_calculator 包导入（不要求安装或目录名一致）"""
+import importlib.util
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+PACKAGE_NAME = "who_bmi_calculator"
+
+# 在子进程中导入包的代码，与下面的导入方式相同
+LOAD_PACKAGE = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location(
+    {PACKAGE_NAME!r}, {str(PACKAGE_DIR / "__init__.py")!r}, submodule_search_locations=[{str(PACKAGE_DIR)!r}]
+)
+package = importlib.util.module_from_spec(spec)
+sys.modules[{PACKAGE_NAME!r}] = package
+spec.loader.exec_module(package)
+"""
+
+if PACKAGE_NAME not in sys.modules:
+    exec(LOAD_PACKAGE)
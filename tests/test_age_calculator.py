@@ -0,0 +1,140 @@
+"""年龄计算：批量解析、批量计算与逐条计算的一致性"""
+from datetime import date
+
+import pytest
+
+from who_bmi_calculator.age_calculator import AgeCalculator
+
+# 出生年月日网格：含按月份的 YYYY-MM-00、月末、闰日以及不存在的日期（如 2023-02-29、2024-04-31）
+AGE_DATES = [
+    f"{year:04d}-{month:02d}-{day:02d}"
+    for year in (2004, 2005, 2012, 2019, 2020, 2023, 2024, 2025, 2026)
+    for month in range(1, 13)
+    for day in (0, 1, 15, 28, 29, 30, 31)
+] + ["", "2024-13-00", "2024-00-10", "0000-01-01", "2024-1-5", "2024-01-05\n", "２０２４-01-05", "abcd-ef-gh"]
+
+# 当前日期：月初、月末、闰日、跨年，以及早于部分出生日期的日期
+CURRENT_DATES = [
+    date(2024, 2, 29),
+    date(2024, 3, 1),
+    date(2025, 1, 31),
+    date(2025, 3, 30),
+    date(2025, 12, 31),
+    date(2026, 1, 1),
+]
+
+
+def _parse(age_date):
+    try:
+        return AgeCalculator.parse_age_date(age_date)
+    except ValueError:
+        return None
+
+
+def _reference_format(birth_date, current_date):
+    """calculate_and_format_age 最初的实现：分别计算年月、月天后格式化"""
+    years, months = AgeCalculator.calculate_age_in_months(birth_date, current_date)
+    if years < 1:
+        total_months, days = AgeCalculator.calculate_age_in_days(birth_date, current_date)
+        display_age = AgeCalculator.format_age_for_display('day', months=total_months, days=days)
+    else:
+        display_age = AgeCalculator.format_age_for_display('month', years=years, months=months)
+    return display_age, AgeCalculator.format_age_for_storage(years, months)
+
+
+@pytest.mark.parametrize("current_date", CURRENT_DATES)
+def test_calculate_and_format_age_matches_reference(current_date):
+    for age_date in AGE_DATES:
+        parsed = _parse(age_date)
+        if parsed is None:
+            with pytest.raises(ValueError):
+                AgeCalculator.calculate_and_format_age(age_date, current_date)
+            continue
+        expected = _reference_format(parsed[0], current_date)
+        assert AgeCalculator.calculate_and_format_age(age_date, current_date) == expected, age_date
+
+
+def test_parse_age_date_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    batch = AgeCalculator.parse_age_date_batch(np.array(AGE_DATES))
+    assert batch.age_types() == [None if parsed is None else parsed[1] for parsed in map(_parse, AGE_DATES)]
+    for age_date, value, ok in zip(AGE_DATES, batch.dates.tolist(), batch.valid.tolist()):
+        parsed = _parse(age_date)
+        assert ok == (parsed is not None), age_date
+        assert value == (parsed[0] if ok else None), age_date
+    # 非字符串元素视为无效行
+    assert AgeCalculator.parse_age_date_batch(np.array(["2024-01-00", None], dtype=object)).valid.tolist() == [True, False]
+
+
+@pytest.mark.parametrize("current_date", CURRENT_DATES)
+def test_calculate_age_batch_matches_scalar(current_date):
+    np = pytest.importorskip("numpy")
+    result = AgeCalculator.calculate_age_batch(np.array(AGE_DATES), current_date)
+    rows = zip(
+        AGE_DATES,
+        result.valid.tolist(),
+        result.years.tolist(),
+        result.months.tolist(),
+        result.total_months.tolist(),
+        result.days.tolist(),
+        result.weeks.tolist(),
+    )
+    for age_date, ok, years, months, total_months, days, weeks in rows:
+        parsed = _parse(age_date)
+        assert ok == (parsed is not None), age_date
+        if parsed is None:
+            assert (years, months, total_months, days, weeks) == (0, 0, 0, 0, 0)
+            continue
+        birth_date = parsed[0]
+        assert (years, months) == AgeCalculator.calculate_age_in_months(birth_date, current_date), age_date
+        assert (total_months, days) == AgeCalculator.calculate_age_in_days(birth_date, current_date), age_date
+        assert weeks == AgeCalculator.calculate_age_in_weeks(birth_date, current_date), age_date
+        # 由批量结果格式化得到的年龄与逐条计算一致
+        if years < 1:
+            display_age = AgeCalculator.format_age_for_display('day', months=total_months, days=days)
+        else:
+            display_age = AgeCalculator.format_age_for_display('month', years=years, months=months)
+        storage_age = AgeCalculator.format_age_for_storage(years, months)
+        assert (display_age, storage_age) == AgeCalculator.calculate_and_format_age(age_date, current_date)
+
+
+@pytest.fixture
+def age_cache():
+    cache = AgeCalculator.enable_age_cache(maxsize=64)
+    yield cache
+    AgeCalculator.disable_age_cache()
+
+
+@pytest.mark.parametrize("current_date", CURRENT_DATES)
+def test_cached_resolve_age_matches_reference(age_cache, current_date):
+    # 缓存容量小于网格：第二轮的结果均已被淘汰、需要重新计算；紧接着的 calculate_and_format_age 命中缓存
+    for _ in range(2):
+        for age_date in AGE_DATES:
+            parsed = _parse(age_date)
+            if parsed is None:
+                with pytest.raises(ValueError):
+                    AgeCalculator.resolve_age(age_date, current_date)
+                continue
+            expected = _reference_format(parsed[0], current_date)
+            resolved = AgeCalculator.resolve_age(age_date, current_date)
+            assert resolved[:2] == expected, age_date
+            assert AgeCalculator.calculate_and_format_age(age_date, current_date) == expected, age_date
+            total_months, _ = AgeCalculator.calculate_age_in_days(parsed[0], current_date)
+            assert resolved.total_months == total_months, age_date
+    stats = age_cache.stats()
+    assert stats["hits"] and stats["misses"] and stats["evictions"]
+
+
+def test_age_cache_returns_cached_result_and_interned_strings(age_cache):
+    current_date = date(2025, 3, 30)
+    first = AgeCalculator.resolve_age("2020-05-00", current_date)
+    assert AgeCalculator.resolve_age("2020-05-00", current_date) is first
+    # 缓存以当前日期为键的一部分
+    assert AgeCalculator.resolve_age("2020-05-00", date(2025, 6, 1)) != first
+    # 相同年龄的不同出生日期得到同一个字符串对象
+    other = AgeCalculator.resolve_age("2020-05-15", current_date)
+    assert other is not first and other.storage is first.storage
+
+    AgeCalculator.disable_age_cache()
+    assert AgeCalculator.get_age_cache() is None
+    assert AgeCalculator.resolve_age("2020-05-00", current_date) == first
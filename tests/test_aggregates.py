@@ -0,0 +1,110 @@
+"""可合并的人群汇总统计"""
+import math
+import random
+
+import pytest
+
+from who_bmi_calculator.aggregates import HISTOGRAM_BINS, PopulationAggregate
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def _records(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    special = [math.inf, -math.inf, math.nan, 7.9, 8.0, 39.99, 40.0]
+    records = []
+    for _ in range(count):
+        gender = rng.choice(("boy", "girl", "boy", "girl", "other"))
+        age = rng.randint(-3, 232)
+        bmi = rng.choice(special) if rng.random() < 0.05 else round(rng.uniform(9, 38), 2)
+        records.append((gender, age, bmi))
+    return records
+
+
+def _state(aggregate: PopulationAggregate):
+    return (
+        list(aggregate.counts),
+        list(aggregate.histogram),
+        [repr(value) for value in aggregate.bmi_sum],
+        aggregate.age_out_of_range,
+        aggregate.unsupported_gender,
+        aggregate.invalid_age,
+        aggregate.errors,
+    )
+
+
+def test_scalar_add_counts_and_histogram():
+    aggregate = PopulationAggregate()
+    aggregate.add("boy", 60, 15.5)
+    aggregate.add("boy", 60, math.inf)
+    aggregate.add("boy", 60, math.nan)
+    aggregate.add("girl", 300, 15.5)
+    aggregate.add("other", 60, 15.5)
+    aggregate.add("boy", 60.5, 15.5)
+
+    assert aggregate.total == 3
+    assert (aggregate.age_out_of_range, aggregate.unsupported_gender, aggregate.invalid_age) == (1, 1, 1)
+    percentile = WHOStandardService.calculate_bmi_percentile("boy", 60, 15.5)["percentile"]
+    assert aggregate.percentile_counts("boy", 60, 61)[percentile] >= 1
+    histogram = aggregate.bmi_histogram("boy")
+    assert len(histogram) == HISTOGRAM_BINS
+    assert histogram[-1] == (40.0, math.inf, 1)
+    assert sum(count for _, _, count in histogram) == 2  # NaN不计入直方图
+
+
+def test_add_batch_matches_scalar_add():
+    np = pytest.importorskip("numpy")
+    records = _records(5000)
+    scalar = PopulationAggregate()
+    for record in records:
+        scalar.add(*record)
+    genders, ages, bmi = zip(*records)
+    batch = PopulationAggregate()
+    batch.add_batch(np.array(genders), np.array(ages), np.array(bmi))
+    assert _state(batch) == _state(scalar)
+
+
+def test_add_batch_float_ages_count_as_invalid():
+    np = pytest.importorskip("numpy")
+    scalar = PopulationAggregate()
+    for age in (12.0, 30.5, -1.0, 240.0):
+        scalar.add("girl", age, 16.0)
+    batch = PopulationAggregate()
+    batch.add_batch(np.array(["girl"] * 4), np.array([12.0, 30.5, -1.0, 240.0]), np.array([16.0] * 4))
+    assert _state(batch) == _state(scalar)
+
+
+def test_merge_matches_single_aggregate():
+    records = _records(3000, seed=5)
+    whole = PopulationAggregate()
+    parts = [PopulationAggregate() for _ in range(3)]
+    for i, record in enumerate(records):
+        whole.add(*record)
+        parts[i % 3].add(*record)
+    parts[1].add_result("boy", 60, {"error": "身高和体重必须大于0"})
+    whole.add_result("boy", 60, {"error": "身高和体重必须大于0"})
+
+    merged = PopulationAggregate.merge_all(parts)
+    assert list(merged.counts) == list(whole.counts)
+    assert list(merged.histogram) == list(whole.histogram)
+    assert [value for value in merged.bmi_sum] == pytest.approx([value for value in whole.bmi_sum], nan_ok=True)
+    assert (merged.age_out_of_range, merged.unsupported_gender, merged.invalid_age, merged.errors) == (
+        whole.age_out_of_range, whole.unsupported_gender, whole.invalid_age, whole.errors
+    )
+
+
+def test_prevalence_table():
+    aggregate = PopulationAggregate()
+    for _ in range(3):
+        aggregate.add("boy", 100, 30.0)
+    aggregate.add("boy", 100, 15.5)
+    aggregate.add("girl", 100, 16.0)
+
+    rows = aggregate.prevalence_table()
+    assert len(rows) == 2 * 19
+    row = next(row for row in rows if row["gender"] == "boy" and row["age_from"] <= 100 < row["age_to"])
+    assert row["count"] == 4
+    assert row["重度肥胖"] == 3 and row["重度肥胖率"] == pytest.approx(0.75)
+    assert row["mean_bmi"] == round((30.0 * 3 + 15.5) / 4, 2)
+    assert sum(row["count"] for row in rows) == aggregate.total
+    empty = next(row for row in rows if row["gender"] == "girl" and row["age_from"] == 0)
+    assert empty["count"] == 0 and empty["mean_bmi"] is None and empty["重度肥胖率"] is None
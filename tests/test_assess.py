@@ -0,0 +1,87 @@
+"""身高、体重与BMI一次评估"""
+import random
+
+import pytest
+
+from who_bmi_calculator.reference_table import set_reference_table
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+COLUMNS = ("p3", "p15", "p50", "p85", "p97")
+
+
+def _standard_data(base: float, step: float, spread: float) -> dict:
+    return {
+        gender: {
+            str(age): {
+                column: round(base + offset + age * step + (i - 2) * spread, 1)
+                for i, column in enumerate(COLUMNS)
+            }
+            for age in range(229)
+        }
+        for gender, offset in (("boy", 1.0), ("girl", 0.0))
+    }
+
+
+HEIGHT_DATA = _standard_data(50.0, 0.6, 3.0)
+WEIGHT_DATA = _standard_data(3.5, 0.25, 1.2)
+
+
+@pytest.fixture
+def measure_tables():
+    WHOStandardService.load_standard_data("height", HEIGHT_DATA)
+    WHOStandardService.load_standard_data("weight", WEIGHT_DATA)
+    yield
+    set_reference_table("height", None)
+    set_reference_table("weight", None)
+
+
+def _rows(count: int):
+    rng = random.Random(13)
+    rows = []
+    for _ in range(count):
+        gender = rng.choice(("boy", "girl"))
+        age = rng.randint(-5, 235)
+        row = HEIGHT_DATA.get(gender, {}).get(str(age))
+        # 一部分身高恰好落在边界上，检验左开右闭
+        height = rng.choice(list(row.values())) if row and rng.random() < 0.2 else round(rng.uniform(40, 200), 1)
+        rows.append((gender, age, height, round(rng.uniform(2, 90), 1)))
+    return rows
+
+
+def test_assess_matches_dict_lookups(measure_tables):
+    for gender, age, height, weight in _rows(2000):
+        result = WHOStandardService.assess(gender, age, height, weight)
+        bmi_result = WHOStandardService.calculate_bmi_with_percentile(gender, age, height, weight)
+        assert (result["bmi"], result["bmi_percentile"], result["bmi_description"]) == (
+            bmi_result["bmi"], bmi_result["percentile"], bmi_result["description"]
+        )
+        if 0 <= age <= 228:
+            assert result["height_percentile"] == WHOStandardService.find_percentile_for_height(HEIGHT_DATA[gender], age, height)
+            assert result["weight_percentile"] == WHOStandardService.find_percentile_for_weight(WEIGHT_DATA[gender], age, weight)
+        else:
+            assert result["height_percentile"] == result["weight_percentile"] == "unknown"
+
+
+def test_assess_batch_matches_scalar(measure_tables):
+    np = pytest.importorskip("numpy")
+    rows = _rows(2000) + [("other", 60, 110.0, 19.0)]
+    genders, ages, heights, weights = zip(*rows)
+    batch = WHOStandardService.assess_batch(np.array(genders), np.array(ages), np.array(heights), np.array(weights))
+    for metric in ("bmi", "height", "weight"):
+        percentiles = batch.percentiles(metric)
+        descriptions = batch.descriptions(metric)
+        for i, row in enumerate(rows):
+            expected = WHOStandardService.assess(*row)
+            assert percentiles[i] == expected[f"{metric}_percentile"]
+            assert descriptions[i] == expected[f"{metric}_description"]
+
+
+def test_assess_requires_measure_tables():
+    with pytest.raises(ValueError, match="身高参考表"):
+        WHOStandardService.assess("boy", 60, 110.0, 19.0)
+
+
+def test_assess_batch_requires_measure_tables():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="参考表"):
+        WHOStandardService.assess_batch(np.array([0]), np.array([60]), np.array([110.0]), np.array([19.0]))
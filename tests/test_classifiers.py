@@ -0,0 +1,49 @@
+"""按 (性别, 月龄) 生成的专用BMI分类函数"""
+import math
+
+from who_bmi_calculator.classifiers import ClassifierRegistry, build_bmi_classifier
+from who_bmi_calculator.reference_table import ReferenceTable, get_bmi_reference_table
+from who_bmi_calculator.result_cache import LRUCache
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def _bmi_values(table, gender_code, age):
+    start = table.row_start(gender_code, age)
+    values = [7.0, 12.345, 45.0, math.nan, math.inf, -math.inf]
+    for bound in table.values[start:start + len(table.columns)]:
+        values += [bound, round(bound - 0.01, 2), round(bound + 0.01, 2)]
+    return values
+
+
+def test_classifiers_match_service_over_grid():
+    table = get_bmi_reference_table()
+    for gender_code, gender in enumerate(table.genders):
+        for age in range(table.max_age + 1):
+            classify = build_bmi_classifier(table, gender, age)
+            for bmi in _bmi_values(table, gender_code, age):
+                assert classify(bmi) == WHOStandardService.calculate_bmi_percentile_record(gender, age, bmi), (gender, age, bmi)
+
+
+def test_unsupported_inputs_return_fixed_results():
+    table = get_bmi_reference_table()
+    for gender, age in (("boy", -1), ("girl", 229), ("other", 60), ("boy", 60.5)):
+        classify = build_bmi_classifier(table, gender, age)
+        assert classify(16.0) == WHOStandardService.calculate_bmi_percentile_record(gender, age, 16.0)
+
+
+def test_registry_is_an_lru_cache_bound_to_the_table():
+    table = get_bmi_reference_table()
+    registry = ClassifierRegistry(maxsize=2)
+    assert isinstance(registry, LRUCache)
+
+    first = registry.get_or_build(table, "boy", 60)
+    assert registry.get_or_build(table, "boy", 60) is first
+    registry.get_or_build(table, "girl", 60)
+    registry.get_or_build(table, "girl", 61)
+    assert registry.stats() == {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "maxsize": 2}
+    assert registry.get_or_build(table, "boy", 60) is not first  # 已被淘汰
+
+    # 参考表被替换后重新生成
+    replacement = ReferenceTable.from_rows({"boy": [list(table.values[:len(table.columns)])]}, table.columns)
+    assert registry.get_or_build(replacement, "boy", 0) is not registry.get_or_build(table, "boy", 0)
+    assert registry.stats()["size"] == 1
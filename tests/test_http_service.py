@@ -0,0 +1,30 @@
+"""HTTP评分服务：合并为同一批的请求互不影响"""
+import asyncio
+
+from who_bmi_calculator.http_service import ScoringServer
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def _percentile_requests(payloads):
+    async def run():
+        server = ScoringServer(max_batch_size=len(payloads), max_wait=0.01)
+        return await asyncio.gather(*(server._dispatch("/percentile", payload) for payload in payloads))
+
+    return asyncio.run(run())
+
+
+def test_out_of_range_age_does_not_affect_batch():
+    payloads = [
+        {"gender": "boy", "age_in_months": 60, "height_cm": 110, "weight_kg": 19},
+        {"gender": "girl", "age_in_months": 10 ** 20, "height_cm": 110, "weight_kg": 19},
+        {"gender": "girl", "age_in_months": -1, "height_cm": 110, "weight_kg": 19},
+        {"gender": "girl", "age_in_months": 120, "height_cm": 140, "weight_kg": 35},
+    ]
+    responses = _percentile_requests(payloads)
+
+    for payload, response in zip(payloads, responses):
+        expected = WHOStandardService.calculate_bmi_with_percentile(
+            payload["gender"], payload["age_in_months"], payload["height_cm"], payload["weight_kg"]
+        )
+        assert response == expected
+    assert responses[0]["percentile"] != "unknown"
@@ -0,0 +1,52 @@
+"""包导入开销的回归测试：导入包时不应加载标准数据和可选的重量级模块"""
+import json
+import subprocess
+import sys
+
+from conftest import LOAD_PACKAGE
+
+# 导入包（不含解释器启动）的时间上限，单位秒
+IMPORT_BUDGET = 0.2
+
+# 导入包时不应加载的模块
+DEFERRED_MODULES = (
+    "who_bmi_calculator.bmi_data_final",
+    "who_bmi_calculator.zscore",
+    "who_bmi_calculator.thresholds",
+    "who_bmi_calculator.quantized",
+    "who_bmi_calculator.classifiers",
+    "who_bmi_calculator.standards",
+    "statistics",
+    "csv",
+    "numpy",
+)
+
+
+def _run(code: str) -> str:
+    return subprocess.check_output([sys.executable, "-c", code], text=True)
+
+
+def test_import_does_not_load_deferred_modules():
+    output = _run(
+        "import json, sys\n"
+        + LOAD_PACKAGE
+        + "print(json.dumps(sorted(sys.modules)))"
+    )
+    loaded = set(json.loads(output))
+    assert [name for name in DEFERRED_MODULES if name in loaded] == []
+
+
+def test_first_lookup_loads_reference_data():
+    output = _run(
+        "import json, sys\n"
+        + LOAD_PACKAGE
+        + "package.WHOStandardService.calculate_bmi_percentile('boy', 60, 16.0)\n"
+        + "print(json.dumps('who_bmi_calculator.bmi_data_final' in sys.modules))"
+    )
+    assert json.loads(output) is True
+
+
+def test_import_time_within_budget():
+    code = "import time\nstarted = time.perf_counter()\n" + LOAD_PACKAGE + "print(time.perf_counter() - started)"
+    elapsed = min(float(_run(code)) for _ in range(3))
+    assert elapsed < IMPORT_BUDGET
@@ -0,0 +1,29 @@
+"""源文件换行符：保持各文件原有的换行符，避免整文件的换行符改动掩盖实际修改"""
+import pytest
+
+from conftest import PACKAGE_DIR
+
+# 原本使用CRLF换行的文件，其余源文件使用LF
+CRLF_FILES = (
+    "age_calculator.py",
+    "bmi_data_final.py",
+    "percentile_descriptions.py",
+    "who_standard_service.py",
+)
+
+SOURCE_FILES = sorted(
+    path.relative_to(PACKAGE_DIR).as_posix()
+    for path in PACKAGE_DIR.rglob("*.py")
+    if not any(part.startswith(".") or part == "__pycache__" for part in path.relative_to(PACKAGE_DIR).parts)
+)
+
+
+@pytest.mark.parametrize("name", SOURCE_FILES)
+def test_line_endings_are_consistent(name):
+    data = (PACKAGE_DIR / name).read_bytes()
+    crlf = data.count(b"\r\n")
+    lf = data.count(b"\n") - crlf
+    if name in CRLF_FILES:
+        assert lf == 0, f"{name} 中有 {lf} 行使用LF换行"
+    else:
+        assert crlf == 0, f"{name} 中有 {crlf} 行使用CRLF换行"
@@ -0,0 +1,83 @@
+"""运行时指标"""
+from datetime import date
+
+import pytest
+
+from who_bmi_calculator.age_calculator import AgeCalculator
+from who_bmi_calculator.metrics import (
+    INSTRUMENTED_CLASSES,
+    disable_metrics,
+    enable_metrics,
+    get_metrics_registry,
+)
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def _static_methods():
+    return {
+        (cls, name): attr
+        for cls in INSTRUMENTED_CLASSES
+        for name, attr in vars(cls).items()
+        if isinstance(attr, staticmethod)
+    }
+
+
+@pytest.fixture
+def registry():
+    registry = enable_metrics()
+    yield registry
+    disable_metrics()
+
+
+def test_disable_restores_original_methods():
+    originals = _static_methods()
+    registry = enable_metrics()
+    assert enable_metrics() is registry  # 已开启时返回同一个注册表
+    assert get_metrics_registry() is registry
+    assert vars(WHOStandardService)["calculate_bmi"] is not originals[(WHOStandardService, "calculate_bmi")]
+
+    disable_metrics()
+    assert get_metrics_registry() is None
+    restored = _static_methods()
+    assert restored.keys() == originals.keys()
+    assert all(restored[key] is originals[key] for key in originals)
+    disable_metrics()  # 重复关闭没有影响
+    assert _static_methods() == originals
+
+
+def test_calls_errors_and_unknown_are_counted(registry):
+    WHOStandardService.calculate_bmi(110, 19)
+    with pytest.raises(ValueError):
+        WHOStandardService.calculate_bmi(0, 19)
+    assert WHOStandardService.calculate_bmi_percentile("boy", 300, 16.0)["percentile"] == "unknown"
+    WHOStandardService.calculate_bmi_percentile("boy", 60, 16.0)
+    AgeCalculator.calculate_and_format_age("2020-01-15", date(2025, 3, 1))
+
+    snapshot = registry.snapshot()
+    bmi = snapshot["WHOStandardService.calculate_bmi"]
+    assert (bmi["calls"], bmi["errors"], bmi["unknown"]) == (2, {"ValueError": 1}, 0)
+    percentile = snapshot["WHOStandardService.calculate_bmi_percentile"]
+    assert (percentile["calls"], percentile["unknown"]) == (2, 1)
+    assert snapshot["AgeCalculator.calculate_and_format_age"]["calls"] == 1
+    # 直方图为累计计数，最后一个桶等于调用次数
+    assert bmi["buckets"]["+Inf"] == 2
+    assert list(bmi["buckets"].values()) == sorted(bmi["buckets"].values())
+    assert bmi["duration_sum"] > 0
+
+    registry.reset()
+    assert registry.snapshot()["WHOStandardService.calculate_bmi"]["calls"] == 0
+
+
+def test_prometheus_output(registry):
+    WHOStandardService.calculate_bmi(110, 19)
+    with pytest.raises(ValueError):
+        WHOStandardService.calculate_bmi(-1, 19)
+    text = registry.to_prometheus()
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# TYPE who_bmi_calls_total counter" in lines
+    assert "# TYPE who_bmi_duration_seconds histogram" in lines
+    assert 'who_bmi_calls_total{method="WHOStandardService.calculate_bmi"} 2' in lines
+    assert 'who_bmi_errors_total{method="WHOStandardService.calculate_bmi",exception="ValueError"} 1' in lines
+    assert 'who_bmi_duration_seconds_bucket{method="WHOStandardService.calculate_bmi",le="+Inf"} 2' in lines
+    assert 'who_bmi_duration_seconds_count{method="WHOStandardService.calculate_bmi"} 2' in lines
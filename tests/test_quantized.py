@@ -0,0 +1,29 @@
+"""量化BMI索引"""
+from who_bmi_calculator.quantized import get_quantized_index, verify_quantized_index
+from who_bmi_calculator.reference_table import get_bmi_reference_table
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def test_index_matches_reference_table_on_full_grid():
+    # 逐一比对所有(性别, 月龄, 量化BMI)格点，任一不一致即抛出 ValueError
+    assert verify_quantized_index(get_quantized_index(get_bmi_reference_table())) > 0
+
+
+def test_quantized_lookup_matches_exact_lookup():
+    exact = [
+        WHOStandardService.calculate_bmi_percentile(gender, age, bmi)
+        for gender in ("boy", "girl")
+        for age in (0, 23, 24, 60, 228)
+        for bmi in (10.0, 15.55, 17.0, 22.3, 35.0)
+    ]
+    WHOStandardService.enable_quantized_lookup()
+    try:
+        quantized = [
+            WHOStandardService.calculate_bmi_percentile(gender, age, bmi)
+            for gender in ("boy", "girl")
+            for age in (0, 23, 24, 60, 228)
+            for bmi in (10.0, 15.55, 17.0, 22.3, 35.0)
+        ]
+    finally:
+        WHOStandardService.disable_quantized_lookup()
+    assert quantized == exact
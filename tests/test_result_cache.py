@@ -0,0 +1,76 @@
+"""结果缓存"""
+import pytest
+
+from who_bmi_calculator.reference_table import ReferenceTable, get_bmi_reference_table, set_bmi_reference_table
+from who_bmi_calculator.result_cache import LRUCache
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+@pytest.fixture
+def percentile_cache():
+    cache = WHOStandardService.enable_percentile_cache(maxsize=3)
+    yield cache
+    WHOStandardService.disable_percentile_cache()
+
+
+def test_lru_eviction_and_stats():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a 变为最近使用
+    cache.put("c", 3)  # 淘汰 b
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == {"hits": 3, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2}
+
+    cache.invalidate()
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0 and cache.stats()["hits"] == 3
+
+
+def test_lru_is_bound_to_source():
+    cache = LRUCache()
+    first, second = object(), object()
+    cache.put("key", "value", first)
+    assert cache.get("key", first) == "value"
+    assert cache.get("key", second) is None
+    assert cache.get("key", first) is None  # 绑定已切换到 second，原有结果已清空
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_cached_results_match_uncached(percentile_cache):
+    queries = [("boy", 60, 16.0), ("girl", 12, 17.5), ("boy", 60, 16.0), ("boy", 200, 22.1), ("girl", 30, 15.0)]
+    results = [WHOStandardService.calculate_bmi_percentile_record(*query) for query in queries]
+    assert results[0] is results[2]
+    assert percentile_cache.stats() == {"hits": 1, "misses": 4, "evictions": 1, "size": 3, "maxsize": 3}
+
+    WHOStandardService.disable_percentile_cache()
+    assert results == [WHOStandardService.calculate_bmi_percentile_record(*query) for query in queries]
+
+
+def test_float_ages_are_not_cached(percentile_cache):
+    WHOStandardService.calculate_bmi_percentile("boy", 60.0, 16.0)
+    assert percentile_cache.stats()["size"] == 0
+    assert WHOStandardService.calculate_bmi_percentile("boy", 60.0, 16.0)["percentile"] == "unknown"
+
+
+def test_cache_is_invalidated_when_table_is_replaced(percentile_cache):
+    original = get_bmi_reference_table()
+    before = WHOStandardService.calculate_bmi_percentile("boy", 0, 12.0)
+    # 边界全部上移5.0的参考表：同一BMI落到更低的百分位
+    shifted = ReferenceTable(
+        original.genders, original.columns, original.max_age,
+        [value + 5.0 for value in original.values], original.row_ids,
+    )
+    set_bmi_reference_table(shifted)
+    try:
+        after = WHOStandardService.calculate_bmi_percentile("boy", 0, 12.0)
+        assert after != before
+        assert percentile_cache.stats()["size"] == 1
+    finally:
+        set_bmi_reference_table(original)
+    assert WHOStandardService.calculate_bmi_percentile("boy", 0, 12.0) == before
@@ -0,0 +1,69 @@
+"""流式批量评分：无法处理的行写入拒绝文件，不中断整体处理"""
+import json
+from datetime import date
+
+import pytest
+
+from who_bmi_calculator.age_calculator import AgeCalculator
+from who_bmi_calculator.scoring import score_file, score_record
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+REFERENCE_DATE = date(2025, 9, 1)
+
+
+def test_score_record_matches_service():
+    record = {"age_date": "2018-03-15", "gender": "girl", "height": "120.5", "weight": "23.4"}
+    result = score_record(record, REFERENCE_DATE)
+
+    years, months = AgeCalculator.calculate_age_in_months(date(2018, 3, 15), REFERENCE_DATE)
+    expected = WHOStandardService.calculate_bmi_with_percentile("girl", years * 12 + months, 120.5, 23.4)
+    assert result["age_in_months"] == years * 12 + months
+    assert (result["age_display"], result["age_storage"]) == AgeCalculator.calculate_and_format_age(
+        "2018-03-15", REFERENCE_DATE
+    )
+    assert {key: result[key] for key in expected} == expected
+
+
+def test_bad_rows_are_rejected(tmp_path):
+    rows = [
+        {"age_date": "2018-03-15", "gender": "boy", "height": 120, "weight": 23},
+        {"age_date": "2018-03-15", "gender": "boy", "height": 120, "weight": 23, "measure_date": 20240101},
+        {"age_date": "2018-03-15", "gender": ["boy"], "height": 120, "weight": 23},
+        {"age_date": 20180315, "gender": "boy", "height": 120, "weight": 23},
+        {"age_date": "2018-03-15", "gender": "boy", "height": None, "weight": 23},
+        {"age_date": "2018-03-15", "gender": "girl", "height": 118, "weight": 21, "measure_date": "2025-01-01"},
+    ]
+    source = tmp_path / "input.jsonl"
+    source.write_text("".join(json.dumps(row) + "\n" for row in rows) + "not json\n", encoding="utf-8")
+    output = tmp_path / "output.jsonl"
+
+    stats = score_file(str(source), str(output), reference_date=REFERENCE_DATE)
+
+    assert (stats["rows"], stats["scored"], stats["rejected"]) == (7, 2, 5)
+    rejects = [json.loads(line) for line in (tmp_path / "output.jsonl.rejects").read_text(encoding="utf-8").splitlines()]
+    assert all(reject["error"] for reject in rejects)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("height", "nan"), ("height", "inf"), ("weight", "-inf"), ("weight", "1e400"), ("height", float("nan")),
+])
+def test_non_finite_measurements_are_rejected(field, value):
+    record = {"age_date": "2018-03-15", "gender": "boy", "height": "120", "weight": "23", field: value}
+    with pytest.raises(ValueError, match="有限数值"):
+        score_record(record, REFERENCE_DATE)
+
+
+@pytest.mark.parametrize("gender", [None, ""])
+def test_missing_gender_is_rejected(gender):
+    record = {"age_date": "2018-03-15", "height": "120", "weight": "23"}
+    if gender is not None:
+        record["gender"] = gender
+    with pytest.raises(ValueError, match="gender"):
+        score_record(record, REFERENCE_DATE)
+
+
+def test_missing_gender_goes_to_rejects(tmp_path):
+    source = tmp_path / "input.csv"
+    source.write_text("age_date,gender,height,weight\n2018-03-15,,120,23\n2018-03-15,boy,nan,23\n2018-03-15,boy,120,23\n", encoding="utf-8")
+    stats = score_file(str(source), str(tmp_path / "output.csv"), reference_date=REFERENCE_DATE)
+    assert (stats["rows"], stats["scored"], stats["rejected"]) == (3, 1, 2)
@@ -0,0 +1,49 @@
+"""SQLite 集成"""
+import sqlite3
+
+import pytest
+
+from who_bmi_calculator.sqlite_functions import register_functions, write_scores
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def test_scalar_functions_match_service():
+    connection = sqlite3.connect(":memory:")
+    register_functions(connection)
+    bmi, percentile = connection.execute(
+        "SELECT who_bmi(110, 19), who_bmi_percentile('boy', 60, who_bmi(110, 19))"
+    ).fetchone()
+    assert bmi == WHOStandardService.calculate_bmi(110, 19)
+    assert percentile == WHOStandardService.calculate_bmi_percentile("boy", 60, bmi)["percentile"]
+    assert connection.execute("SELECT who_bmi(NULL, 19), who_bmi_percentile('boy', 60, NULL)").fetchone() == (None, None)
+
+
+def test_write_scores_records_invalid_rows():
+    connection = sqlite3.connect(":memory:")
+    rows = [
+        (1, "boy", 60, 110, 19),
+        (2, "boy", 60, None, 19),
+        (3, "girl", 60, 0, 19),
+        (4, "girl", 60, "abc", 19),
+        (5, "girl", 96, 125, 24),
+    ]
+    assert write_scores(connection, rows, batch_size=2) == 5
+
+    stored = dict(connection.execute("SELECT key, error FROM bmi_scores").fetchall())
+    assert stored[1] is None and stored[5] is None
+    assert all(stored[key] for key in (2, 3, 4))
+    assert connection.execute("SELECT bmi FROM bmi_scores WHERE key = 1").fetchone()[0] == WHOStandardService.calculate_bmi(110, 19)
+
+
+def test_write_scores_accepts_custom_table():
+    connection = sqlite3.connect(":memory:")
+    assert write_scores(connection, [(1, "boy", 60, 110, 19)], table="scores_2024") == 1
+    assert connection.execute("SELECT COUNT(*) FROM scores_2024").fetchone() == (1,)
+
+
+@pytest.mark.parametrize("table", ["scores; DROP TABLE bmi_scores", 'x"', "a b", ""])
+def test_write_scores_rejects_unsafe_table_names(table):
+    connection = sqlite3.connect(":memory:")
+    with pytest.raises(ValueError, match="SQL表名"):
+        write_scores(connection, [(1, "boy", 60, 110, 19)], table=table)
+    assert connection.execute("SELECT name FROM sqlite_master").fetchall() == []
@@ -0,0 +1,102 @@
+"""参考标准与成人BMI分类策略注册表"""
+import pytest
+
+from who_bmi_calculator.reference_table import ReferenceTable, get_bmi_reference_table
+from who_bmi_calculator.standards import (
+    ADULT_CATEGORIES,
+    DEFAULT_STANDARD,
+    AdultBMIPolicy,
+    available_adult_policies,
+    available_standards,
+    get_adult_policy,
+    get_standard,
+    register_standard,
+    unregister_standard,
+)
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+def _shifted_table():
+    # 与WHO表结构相同、边界整体上移1.0的参考表
+    table = get_bmi_reference_table()
+    width = len(table.columns)
+    rows = {
+        gender: [
+            [value + 1.0 for value in table.values[table.row_start(code, age):table.row_start(code, age) + width]]
+            for age in range(table.max_age + 1)
+        ]
+        for code, gender in enumerate(table.genders)
+    }
+    return ReferenceTable.from_rows(rows, table.columns)
+
+
+@pytest.fixture
+def shifted():
+    calls = []
+
+    def load():
+        calls.append(1)
+        return _shifted_table()
+
+    standard = register_standard("shifted", load, "测试用")
+    yield standard, calls
+    unregister_standard("shifted")
+
+
+def test_registered_standard_loads_on_first_use(shifted):
+    standard, calls = shifted
+    assert not standard.loaded and calls == []
+    assert available_standards()["shifted"] == {"description": "测试用", "loaded": False}
+
+    result = WHOStandardService.calculate_bmi_percentile("boy", 60, 16.0, standard="shifted")
+    assert standard.loaded and calls == [1]
+    assert available_standards()["shifted"]["loaded"] is True
+    # 边界上移1.0，相当于在WHO表上查 BMI - 1.0
+    assert result == WHOStandardService.calculate_bmi_percentile("boy", 60, 15.0)
+
+    WHOStandardService.calculate_bmi_percentile("girl", 100, 18.0, standard="shifted")
+    assert calls == [1]
+    standard.unload()
+    assert not standard.loaded
+
+
+def test_unregister_removes_standard(shifted):
+    unregister_standard("shifted")
+    with pytest.raises(ValueError, match="未注册的参考标准"):
+        get_standard("shifted")
+    with pytest.raises(ValueError, match="未注册的参考标准"):
+        unregister_standard("shifted")
+    register_standard("shifted", _shifted_table)  # 供 fixture 注销
+
+
+def test_default_standard_cannot_be_replaced_or_removed():
+    with pytest.raises(ValueError):
+        register_standard(DEFAULT_STANDARD, _shifted_table)
+    with pytest.raises(ValueError):
+        unregister_standard(DEFAULT_STANDARD)
+    with pytest.raises(ValueError):
+        get_standard(DEFAULT_STANDARD).unload()
+    assert get_standard().table() is get_bmi_reference_table()
+
+
+@pytest.mark.parametrize("name", sorted(available_adult_policies()))
+def test_adult_policy_cutoffs_are_left_closed(name):
+    policy = get_adult_policy(name)
+    for gender in ("boy", "girl", "other"):
+        cutoffs = policy.cutoffs.get(gender, policy.default)
+        for i, cutoff in enumerate(cutoffs):
+            assert policy.classify(cutoff, gender)["category"] == ADULT_CATEGORIES[i + 1]
+            assert policy.classify(round(cutoff - 0.01, 2), gender)["category"] == ADULT_CATEGORIES[i]
+        assert WHOStandardService.calculate_adult_bmi_category(cutoffs[0], gender, name) == policy.classify(cutoffs[0], gender)
+
+
+def test_adult_policy_defaults_and_validation():
+    assert WHOStandardService.calculate_adult_bmi_category(24.0, "girl")["category"] == "overweight"
+    assert WHOStandardService.calculate_adult_bmi_category(24.0, "boy")["category"] == "normal"
+    assert get_adult_policy("who").classify(25.0, ["boy"])["category"] == "overweight"  # 不可哈希的性别按默认切点
+    with pytest.raises(ValueError, match="未注册的成人BMI分类策略"):
+        get_adult_policy("missing")
+    with pytest.raises(ValueError, match="数量"):
+        AdultBMIPolicy("bad", {}, default=(18.5, 25.0))
+    with pytest.raises(ValueError, match="递增"):
+        AdultBMIPolicy("bad", {}, default=(18.5, 30.0, 25.0))
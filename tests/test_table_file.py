@@ -0,0 +1,74 @@
+"""参考表二进制文件"""
+import random
+import subprocess
+import sys
+
+import pytest
+
+from who_bmi_calculator.reference_table import get_bmi_reference_table
+from who_bmi_calculator.table_file import dump_table, load_table, open_table_file, write_table_file
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+from conftest import LOAD_PACKAGE, PACKAGE_DIR
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = tmp_path / "who_bmi.table"
+    assert write_table_file(get_bmi_reference_table(), str(path)) == path.stat().st_size
+    return path
+
+
+def test_round_trip_preserves_table(table_path):
+    original = get_bmi_reference_table()
+    mapped = open_table_file(str(table_path))
+    assert (mapped.genders, mapped.columns, mapped.max_age) == (original.genders, original.columns, original.max_age)
+    assert list(mapped.values) == list(original.values)
+    assert list(mapped.row_ids) == list(original.row_ids)
+    assert dump_table(mapped) == table_path.read_bytes()
+
+
+def test_lookups_on_mapped_table_match_builtin(table_path):
+    original = get_bmi_reference_table()
+    mapped = open_table_file(str(table_path))
+    rng = random.Random(4)
+    for _ in range(5000):
+        gender_code, age = rng.randint(0, 1), rng.randint(0, 228)
+        bmi = round(rng.uniform(9, 40), 2)
+        assert mapped.find_bmi(gender_code, age, bmi) == original.find_bmi(gender_code, age, bmi)
+
+
+def test_checksum_mismatch_is_rejected(table_path):
+    content = bytearray(table_path.read_bytes())
+    content[-1] ^= 0xFF  # 改动行号表的最后一个字节
+    table_path.write_bytes(bytes(content))
+    with pytest.raises(ValueError, match="校验和"):
+        open_table_file(str(table_path))
+    # 关闭校验时可以加载（由调用方自行保证文件完整）
+    assert open_table_file(str(table_path), verify=False).max_age == 228
+
+
+@pytest.mark.parametrize("mutate, message", [
+    (lambda data: data[:40], "不完整"),
+    (lambda data: b"NOTATABL" + data[8:], "不是参考表文件"),
+    (lambda data: data + b"\x00", "长度"),
+])
+def test_malformed_files_are_rejected(table_path, mutate, message):
+    with pytest.raises(ValueError, match=message):
+        load_table(mutate(table_path.read_bytes()))
+
+
+def test_service_uses_loaded_table_file(table_path):
+    expected = WHOStandardService.calculate_bmi_with_percentile("girl", 96, 128, 27)
+    script = LOAD_PACKAGE + (
+        "from who_bmi_calculator.who_standard_service import WHOStandardService\n"
+        "from who_bmi_calculator.reference_table import get_bmi_reference_table\n"
+        "import mmap\n"
+        "print(WHOStandardService.calculate_bmi_with_percentile('girl', 96, 128, 27))\n"
+        "print(isinstance(get_bmi_reference_table().values.obj, mmap.mmap))\n"
+    )
+    env = {"WHO_BMI_REFERENCE_TABLE": str(table_path), "PATH": ""}
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env, cwd=PACKAGE_DIR
+    ).stdout.splitlines()
+    assert output == [repr(expected), "True"]
@@ -0,0 +1,36 @@
+"""多线程批量评分"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from who_bmi_calculator.threaded import ThreadedScorer, stress_test
+from who_bmi_calculator.vectorized import calculate_bmi_with_percentile_batch
+
+
+def test_stress_test_reports_no_mismatches():
+    report = stress_test(threads=4, iterations=5, records=500)
+    assert report["checks"] > 0
+    assert report["mismatches"] == 0
+    assert report["errors"] == 0
+
+
+def test_threaded_score_matches_single_threaded_batch():
+    rng = np.random.default_rng(7)
+    size = 10000
+    genders = rng.integers(0, 2, size).astype(np.uint8)
+    ages = rng.integers(0, 229, size)
+    heights = rng.uniform(45, 190, size)
+    weights = rng.uniform(2, 90, size)
+    expected = calculate_bmi_with_percentile_batch(genders, ages, heights, weights)
+    with ThreadedScorer(max_workers=4, slice_size=1024) as scorer:
+        result = scorer.score(genders, ages, heights, weights)
+    for name in expected._fields:
+        np.testing.assert_array_equal(getattr(result, name), getattr(expected, name))
+
+
+@pytest.mark.parametrize("lengths", [(10, 12, 8, 8), (8, 8, 8, 9), (8, 7, 8, 8)])
+def test_threaded_score_rejects_mismatched_lengths(lengths):
+    genders, ages, heights, weights = lengths
+    with ThreadedScorer(max_workers=2, slice_size=4) as scorer:
+        with pytest.raises(ValueError):
+            scorer.score(np.zeros(genders, dtype=np.uint8), np.full(ages, 60), np.full(heights, 120.0), np.full(weights, 25.0))
@@ -0,0 +1,93 @@
+"""百分位阈值（反向查找）与健康体重范围"""
+import math
+import random
+
+import pytest
+
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+
+@pytest.mark.parametrize("age", [-1, -229, 229, 60.0, "abc"])
+def test_unsupported_age_returns_none(age):
+    assert WHOStandardService.get_bmi_threshold("boy", age, "p85") is None
+    assert WHOStandardService.get_weight_threshold("girl", age, "p85", 110) is None
+    assert WHOStandardService.calculate_healthy_weight_range("girl", age, 100) == {"min_weight": None, "max_weight": None}
+
+
+def test_threshold_is_entry_point_of_percentile():
+    bmi = WHOStandardService.get_bmi_threshold("girl", 96, "p85")
+    assert WHOStandardService.calculate_bmi_percentile("girl", 96, bmi)["percentile"] == "p85"
+    below = WHOStandardService.calculate_bmi_percentile("girl", 96, round(bmi - 0.01, 2))["percentile"]
+    assert below != "p85"
+
+
+def test_healthy_weight_range_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(0)
+    genders = [rng.choice(["boy", "girl"]) for _ in range(20000)]
+    ages = [rng.randint(-20, 240) for _ in range(20000)]
+    heights = [round(rng.uniform(45, 190), 1) for _ in range(20000)]
+
+    result = WHOStandardService.calculate_healthy_weight_range_batch(np.array(genders, dtype=object), np.array(ages), heights)
+    for i, (gender, age, height) in enumerate(zip(genders, ages, heights)):
+        expected = WHOStandardService.calculate_healthy_weight_range(gender, age, height)
+        for key, values in (("min_weight", result.min_weight), ("max_weight", result.max_weight)):
+            actual = float(values[i])
+            if expected[key] is None:
+                assert math.isnan(actual), (gender, age, height)
+            else:
+                assert actual == expected[key], (gender, age, height)
+
+
+def _previous_float(value):
+    from who_bmi_calculator.thresholds import _adjacent_float
+
+    return _adjacent_float(value, -1)
+
+
+def test_weight_threshold_round_trips_through_calculate_bmi():
+    rng = random.Random(1)
+    labels = ("p3", "p15", "p50", "p85", "p97")
+    for _ in range(5000):
+        gender, age = rng.choice(["boy", "girl"]), rng.randint(0, 228)
+        height, label = round(rng.uniform(45, 190), 1), rng.choice(labels)
+        bmi = WHOStandardService.get_bmi_threshold(gender, age, label)
+        weight = WHOStandardService.get_weight_threshold(gender, age, label, height)
+        # 阈值体重取两位小数后刚好达到阈值，再小一点的体重就达不到
+        assert WHOStandardService.calculate_bmi(height, weight) >= bmi
+        assert WHOStandardService.calculate_bmi(height, _previous_float(weight)) < bmi
+
+
+def test_healthy_weight_range_matches_forward_classification():
+    for gender, age, height in (("boy", 60, 110.0), ("girl", 12, 75.3), ("boy", 200, 170.0)):
+        weights = WHOStandardService.calculate_healthy_weight_range(gender, age, height)
+        low, high = weights["min_weight"], weights["max_weight"]
+        assert "正常" in WHOStandardService.calculate_bmi_with_percentile(gender, age, height, low)["description"]
+        assert "正常" in WHOStandardService.calculate_bmi_with_percentile(gender, age, height, _previous_float(high))["description"]
+        assert "正常" not in WHOStandardService.calculate_bmi_with_percentile(gender, age, height, _previous_float(low))["description"]
+        assert "正常" not in WHOStandardService.calculate_bmi_with_percentile(gender, age, height, high)["description"]
+
+
+@pytest.mark.parametrize("name", ["bmi_thresholds", "analytics.bmi_thresholds", "_t1"])
+def test_export_sql_accepts_plain_identifiers(name):
+    import io
+
+    from who_bmi_calculator.reference_table import get_bmi_reference_table
+    from who_bmi_calculator.thresholds import export_thresholds
+
+    stream = io.StringIO()
+    assert export_thresholds(stream, get_bmi_reference_table(), "sql", name) > 0
+    assert stream.getvalue().startswith(f"CREATE TABLE IF NOT EXISTS {name} (")
+
+
+@pytest.mark.parametrize("name", ["t; DROP TABLE x", 't"', "1abc", "a b", "a.b.c", "", "t--"])
+def test_export_sql_rejects_unsafe_table_names(name):
+    import io
+
+    from who_bmi_calculator.reference_table import get_bmi_reference_table
+    from who_bmi_calculator.thresholds import export_thresholds
+
+    stream = io.StringIO()
+    with pytest.raises(ValueError, match="SQL表名"):
+        export_thresholds(stream, get_bmi_reference_table(), "sql", name)
+    assert stream.getvalue() == ""
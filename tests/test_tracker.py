@@ -0,0 +1,26 @@
+"""纵向生长跟踪"""
+import pytest
+
+from who_bmi_calculator.tracker import GrowthTracker
+
+
+def test_crossing_event_on_category_change():
+    tracker = GrowthTracker()
+    assert tracker.update_bmi("a", "boy", 60, 15.3) is None
+    event = tracker.update_bmi("a", "boy", 72, 19.5)
+    assert event is not None and event.direction == "up"
+    assert tracker.get("a").age_in_months == 72
+
+
+@pytest.mark.parametrize("age", [60.0, 60.5, float("nan"), "abc", True, -1, 229, 10 ** 20])
+def test_invalid_age_raises_value_error(age):
+    tracker = GrowthTracker()
+    with pytest.raises(ValueError):
+        tracker.update_bmi("a", "boy", age, 16.0)
+    assert tracker.get("a") is None
+
+
+def test_integer_string_age_is_normalized():
+    tracker = GrowthTracker()
+    tracker.update_bmi("a", "girl", "60", 16.0)
+    assert tracker.get("a").age_in_months == 60
@@ -0,0 +1,68 @@
+"""批量计算与逐条计算的一致性"""
+import math
+
+import pytest
+
+from who_bmi_calculator.who_standard_service import WHOStandardService
+
+np = pytest.importorskip("numpy")
+
+from who_bmi_calculator.buffers import score_into  # noqa: E402
+from who_bmi_calculator.vectorized import BMI_DESCRIPTION_TABLE, calculate_bmi_percentile_batch  # noqa: E402
+
+GENDERS = ("boy", "girl", "x")
+
+# 年龄（整数和浮点，含超出范围和NaN）、性别编码（2为不支持的性别）
+AGE_CASES = [
+    [0, 23, 24, 228, 229, -1, 60, 100],
+    [0.0, 23.5, 24.0, math.nan, 229.0, -1.0, math.nan, 100.0],
+]
+GENDER_CODES = [0, 1, 0, 1, 0, 1, 2, 0]
+
+
+def _scalar_descriptions(ages, bmi):
+    return [
+        WHOStandardService.calculate_bmi_percentile_record(GENDERS[code], age, value).description
+        for code, age, value in zip(GENDER_CODES, ages, bmi)
+    ]
+
+
+@pytest.mark.parametrize("ages", AGE_CASES)
+def test_percentile_batch_matches_scalar(ages):
+    bmi = [15.2, 17.0, 16.1, 18.3, 20.0, 15.0, 16.0, math.nan]
+    result = calculate_bmi_percentile_batch(np.array(GENDER_CODES), np.array(ages), bmi)
+    assert result.descriptions() == _scalar_descriptions(ages, bmi)
+
+
+@pytest.mark.parametrize("ages", AGE_CASES)
+def test_score_into_matches_scalar(ages):
+    heights = np.array([100.0, 110.0, 95.0, 120.0, 150.0, 80.0, 100.0, 100.0])
+    weights = np.array([15.0, 20.0, 14.0, 26.0, 45.0, 10.0, 16.0, math.nan])
+    out = np.empty(len(ages), dtype=[("bmi", "f8"), ("percentile_code", "u1"), ("description_code", "u1")])
+    score_into(np.array(GENDER_CODES), np.array(ages), heights, weights, out=out)
+
+    descriptions = [BMI_DESCRIPTION_TABLE[code] for code in out["description_code"].tolist()]
+    assert descriptions == _scalar_descriptions(ages, out["bmi"].tolist())
+
+
+def test_score_into_across_chunks_matches_batch():
+    from who_bmi_calculator.buffers import SCRATCH_SIZE, _get_scratch
+    from who_bmi_calculator.vectorized import calculate_bmi_with_percentile_batch
+
+    rng = np.random.default_rng(11)
+    size = SCRATCH_SIZE * 2 + 17
+    genders = rng.integers(0, 3, size).astype(np.uint8)
+    ages = rng.integers(-3, 232, size)
+    heights = np.round(rng.uniform(45, 190, size), 1)
+    weights = np.round(rng.uniform(2, 100, size), 1)
+    out_bmi, out_code, out_description = np.empty(size), np.empty(size, np.uint8), np.empty(size, np.uint8)
+
+    assert score_into(genders, ages, heights, weights, out_bmi, out_code, out_description) == size
+    expected = calculate_bmi_with_percentile_batch(genders, ages, heights, weights)
+    np.testing.assert_array_equal(out_bmi, expected.bmi)
+    np.testing.assert_array_equal(out_code, expected.percentile_codes)
+    np.testing.assert_array_equal(out_description, expected.description_codes)
+
+    # 每个线程保留的临时缓冲区大小固定，与行数无关
+    scratch = _get_scratch()
+    assert sum(value.nbytes for value in vars(scratch).values()) <= SCRATCH_SIZE * 64
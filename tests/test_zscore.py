@@ -0,0 +1,63 @@
+"""连续百分位与Z评分"""
+import math
+import random
+from statistics import NormalDist
+
+import pytest
+
+from who_bmi_calculator.reference_table import get_bmi_reference_table
+from who_bmi_calculator.who_standard_service import WHOStandardService
+from who_bmi_calculator.zscore import PERCENTILE_PROBABILITIES
+
+
+def test_stored_boundaries_map_to_their_percentile():
+    table = get_bmi_reference_table()
+    width = len(table.columns)
+    for gender_code, gender in enumerate(table.genders):
+        for age in range(0, table.max_age + 1, 7):
+            start = table.row_start(gender_code, age)
+            row = table.values[start:start + width]
+            for k, column in enumerate(table.columns):
+                # 与后一列边界相同时，该值属于后一列
+                if k + 1 < width and row[k + 1] == row[k]:
+                    continue
+                probability = PERCENTILE_PROBABILITIES[column]
+                result = WHOStandardService.calculate_bmi_zscore(gender, age, row[k])
+                assert result["zscore"] == pytest.approx(NormalDist().inv_cdf(probability), abs=1e-9), (gender, age, column)
+                assert result["percentile_rank"] == pytest.approx(probability * 100, abs=1e-7), (gender, age, column)
+
+
+def test_zscore_is_monotonic_within_a_row():
+    values = [round(10 + i * 0.05, 2) for i in range(500)]
+    zscores = [WHOStandardService.calculate_bmi_zscore("girl", 96, bmi)["zscore"] for bmi in values]
+    assert zscores == sorted(zscores)
+
+
+def test_unsupported_inputs_return_none():
+    for gender, age in (("boy", -1), ("girl", 229), ("other", 60), ("boy", 60.5)):
+        assert WHOStandardService.calculate_bmi_zscore(gender, age, 16.0) == {"zscore": None, "percentile_rank": None}
+
+
+def test_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(2)
+    rows = [
+        (rng.choice(("boy", "girl", "other")), rng.randint(-5, 235), rng.choice((math.nan, round(rng.uniform(8, 45), 2))))
+        for _ in range(5000)
+    ]
+    genders, ages, bmi = zip(*rows)
+    result = WHOStandardService.calculate_bmi_zscore_batch(np.array(genders), np.array(ages), np.array(bmi))
+    for i, (gender, age, value) in enumerate(rows):
+        expected = WHOStandardService.calculate_bmi_zscore(gender, age, value)
+        for key, column in (("zscore", result.zscore), ("percentile_rank", result.percentile_rank)):
+            actual = float(column[i])
+            if expected[key] is None or math.isnan(expected[key]):
+                assert math.isnan(actual), (gender, age, value)
+            else:
+                assert actual == expected[key], (gender, age, value)
+
+
+def test_batch_float_ages_are_unsupported():
+    np = pytest.importorskip("numpy")
+    result = WHOStandardService.calculate_bmi_zscore_batch(np.array([0, 1]), np.array([60.0, 12.5]), np.array([16.0, 17.0]))
+    assert np.isnan(result.zscore).all() and np.isnan(result.percentile_rank).all()
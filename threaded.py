@@ -0,0 +1,272 @@
+"""多线程批量评分
+
+将大数组切分为若干片，在共享的线程池中分别用 buffers.score_into 评分，结果直接写入预先分配的输出数组。
+NumPy 在逐元素计算时释放GIL，因此多个分片可以在多个CPU核上同时计算；
+各线程只读共享的参考表，临时缓冲区按线程分配（见 buffers._get_scratch），不共享可变状态。
+
+线程安全说明：
+    - 参考表（ReferenceTable）构建后只读，首次构建有锁保护，替换参考表时各缓存按对象身份自动失效；
+    - WHOStandardService 的逐条计算方法可在多线程中直接调用。进程内仍有以下模块级状态：
+        * 服务开关（who_standard_service 的百分位缓存、量化查找、专用分类函数注册表）和
+          按参考表缓存最近一份的派生数据（thresholds、quantized、zscore、vectorized 的单槽缓存），
+          只做整体赋值替换；
+        * 按名称或指标的字典（reference_table._measure_tables、vectorized._measure_arrays、
+          standards 的注册表）不原地修改，更新时复制出新字典再整体赋值，需要只加载一次的在锁内更新；
+        * 百分位缓存、专用分类函数注册表、percentile_index 的索引缓存和 metrics 内部加锁；
+      读取方因此不需要加锁，也不会看到更新到一半的对象；
+    - GrowthTracker、PopulationAggregate 不是线程安全的，应每个线程一个实例，最后合并。
+
+吞吐量与线程数：
+    python -m who_bmi_calculator.threaded --records 2000000 --threads 1 2 4 8
+并发压力测试：
+    python -m who_bmi_calculator.threaded --stress
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from .buffers import score_into
+from .vectorized import BMIBatchResult, _require_numpy, encode_genders, np
+
+DEFAULT_SLICE_SIZE = 262144
+
+
+class ThreadedScorer:
+    """基于线程池的批量评分器
+
+    Args:
+        max_workers: 线程数，默认为CPU核数
+        slice_size: 每个分片的行数
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, slice_size: int = DEFAULT_SLICE_SIZE):
+        if slice_size <= 0:
+            raise ValueError("slice_size必须大于0")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.slice_size = slice_size
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="who-bmi")
+
+    def __enter__(self) -> "ThreadedScorer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """关闭线程池"""
+        self._executor.shutdown(wait=True)
+
+    def score(self, genders, ages_in_months, heights_cm, weights_kg) -> BMIBatchResult:
+        """多线程计算BMI及其百分位
+
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            heights_cm: 身高数组（厘米）
+            weights_kg: 体重数组（千克）
+
+        Returns:
+            BMIBatchResult: 与 calculate_bmi_with_percentile_batch 的结果一致
+
+        Raises:
+            ValueError: 数组长度不一致，或任意一行身高、体重不大于0
+        """
+        _require_numpy()
+        genders = np.ascontiguousarray(encode_genders(genders).ravel())
+        ages = np.ascontiguousarray(np.asarray(ages_in_months).ravel())
+        heights = np.ascontiguousarray(np.asarray(heights_cm, dtype=np.float64).ravel())
+        weights = np.ascontiguousarray(np.asarray(weights_kg, dtype=np.float64).ravel())
+        length = len(heights)
+        # 各分片按同一区间切片，长度不一致时多出的行会被静默丢弃，必须在提交前检查
+        if not len(genders) == len(ages) == len(weights) == length:
+            raise ValueError("输入数组的长度不一致")
+        bmi = np.empty(length)
+        codes = np.empty(length, dtype=np.uint8)
+        descriptions = np.empty(length, dtype=np.uint8)
+
+        futures = [
+            self._executor.submit(
+                score_into,
+                genders[start:start + self.slice_size],
+                ages[start:start + self.slice_size],
+                heights[start:start + self.slice_size],
+                weights[start:start + self.slice_size],
+                bmi[start:start + self.slice_size],
+                codes[start:start + self.slice_size],
+                descriptions[start:start + self.slice_size],
+            )
+            for start in range(0, length, self.slice_size)
+        ]
+        # 等待全部分片完成后再抛出第一个异常，避免仍在写入的分片与调用方竞争
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return BMIBatchResult(bmi, codes, descriptions)
+
+
+_shared_scorer: Optional[ThreadedScorer] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_scorer() -> ThreadedScorer:
+    """获取进程内共享的评分器（首次调用时创建，线程数为CPU核数）"""
+    global _shared_scorer
+    scorer = _shared_scorer
+    if scorer is None:
+        with _shared_lock:
+            scorer = _shared_scorer
+            if scorer is None:
+                scorer = _shared_scorer = ThreadedScorer()
+    return scorer
+
+
+def score_threaded(genders, ages_in_months, heights_cm, weights_kg) -> BMIBatchResult:
+    """使用共享线程池计算BMI及其百分位，参数与返回值同 ThreadedScorer.score"""
+    return get_shared_scorer().score(genders, ages_in_months, heights_cm, weights_kg)
+
+
+def _random_batch(count: int, seed: int = 0) -> Dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    return {
+        "genders": rng.integers(0, 2, count),
+        "ages": rng.integers(0, 229, count),
+        "heights": np.round(rng.uniform(50, 190, count), 1),
+        "weights": np.round(rng.uniform(3, 100, count), 1),
+    }
+
+
+def benchmark_threads(records: int, thread_counts: Sequence[int], repeat: int = 3) -> List[Dict[str, float]]:
+    """测量不同线程数下的吞吐量（行/秒），取多次运行的最快结果"""
+    from .who_standard_service import WHOStandardService
+
+    batch = _random_batch(records)
+    args = (batch["genders"], batch["ages"], batch["heights"], batch["weights"])
+    expected = WHOStandardService.calculate_bmi_with_percentile_batch(*args)
+    results = []
+    for threads in thread_counts:
+        with ThreadedScorer(max_workers=threads, slice_size=max(records // (threads * 4), 1)) as scorer:
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                result = scorer.score(*args)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            if not (np.array_equal(result.percentile_codes, expected.percentile_codes)
+                    and np.array_equal(result.bmi, expected.bmi)):
+                raise AssertionError("多线程结果与单线程结果不一致")
+        results.append({"threads": threads, "seconds": best, "rows_per_sec": records / best})
+    return results
+
+
+def stress_test(threads: int = 8, iterations: int = 20, records: int = 1000) -> Dict[str, int]:
+    """并发压力测试
+
+    多个线程同时调用逐条计算、专用分类函数、结果缓存和多线程批量评分，
+    另一个线程反复开关结果缓存与量化查找，所有结果与预先串行计算的结果逐一比较。
+
+    Returns:
+        {"checks": 比较次数, "mismatches": 不一致次数, "errors": 异常次数}
+    """
+    from .who_standard_service import WHOStandardService
+
+    batch = _random_batch(records, seed=1)
+    genders = ["boy" if code == 0 else "girl" for code in batch["genders"].tolist()]
+    ages = batch["ages"].tolist()
+    heights = batch["heights"].tolist()
+    weights = batch["weights"].tolist()
+    expected = [
+        WHOStandardService.calculate_bmi_with_percentile(genders[i], ages[i], heights[i], weights[i])
+        for i in range(records)
+    ]
+    expected_batch = WHOStandardService.calculate_bmi_with_percentile_batch(
+        batch["genders"], batch["ages"], batch["heights"], batch["weights"]
+    )
+
+    counters = {"checks": 0, "mismatches": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def record(checks: int, mismatches: int = 0, errors: int = 0) -> None:
+        with lock:
+            counters["checks"] += checks
+            counters["mismatches"] += mismatches
+            counters["errors"] += errors
+
+    def scalar_worker(offset: int) -> None:
+        try:
+            for iteration in range(iterations):
+                mismatches = 0
+                for i in range(offset % 7, records, 7):
+                    if iteration % 2:
+                        classify = WHOStandardService.get_bmi_classifier(genders[i], ages[i])
+                        result = classify(expected[i]["bmi"]).to_dict()
+                        result["bmi"] = expected[i]["bmi"]
+                    else:
+                        result = WHOStandardService.calculate_bmi_with_percentile(
+                            genders[i], ages[i], heights[i], weights[i]
+                        )
+                    mismatches += result != expected[i]
+                record(len(range(offset % 7, records, 7)), mismatches)
+        except Exception:
+            record(0, errors=1)
+
+    def batch_worker() -> None:
+        try:
+            with ThreadedScorer(max_workers=2, slice_size=max(records // 4, 1)) as scorer:
+                for _ in range(iterations):
+                    result = scorer.score(batch["genders"], batch["ages"], batch["heights"], batch["weights"])
+                    same = np.array_equal(result.description_codes, expected_batch.description_codes)
+                    record(1, 0 if same else 1)
+        except Exception:
+            record(0, errors=1)
+
+    def toggler() -> None:
+        while not stop.is_set():
+            WHOStandardService.enable_percentile_cache(256)
+            WHOStandardService.enable_quantized_lookup()
+            time.sleep(0.001)
+            WHOStandardService.disable_percentile_cache()
+            WHOStandardService.disable_quantized_lookup()
+            time.sleep(0.001)
+
+    workers = [threading.Thread(target=scalar_worker, args=(n,)) for n in range(max(threads - 1, 1))]
+    workers.append(threading.Thread(target=batch_worker))
+    toggle = threading.Thread(target=toggler)
+    toggle.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stop.set()
+    toggle.join()
+    WHOStandardService.disable_percentile_cache()
+    WHOStandardService.disable_quantized_lookup()
+    return counters
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="多线程批量评分的吞吐量测试与并发压力测试")
+    parser.add_argument("--records", type=int, default=1_000_000, help="记录数")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="要测试的线程数")
+    parser.add_argument("--stress", action="store_true", help="运行并发压力测试")
+    args = parser.parse_args(argv)
+
+    if args.stress:
+        counters = stress_test()
+        print(f"比较 {counters['checks']} 次，不一致 {counters['mismatches']} 次，异常 {counters['errors']} 次")
+        return 1 if counters["mismatches"] or counters["errors"] else 0
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"记录数 {args.records}，CPU核数 {os.cpu_count()}，GIL {'开启' if gil else '关闭'}")
+    for row in benchmark_threads(args.records, args.threads):
+        print(f"{row['threads']:>3} 线程：{row['seconds']:.3f} 秒（{row['rows_per_sec']:.0f} 行/秒）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
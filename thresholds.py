@@ -0,0 +1,238 @@
+"""百分位阈值（反向查找）与阈值表导出
+
+由BMI参考表预先计算每个 (性别, 月龄) 下各百分位编码对应的BMI区间 [下界, 上界)，
+区间规则与 ReferenceTable.find_bmi 的左闭右开查找一致：最低百分位没有下界，最高百分位没有上界。
+在此基础上可以回答"BMI（或给定身高下的体重）达到多少时进入 p85/p97"，
+也可以把阈值表导出为 CSV 或 SQL INSERT 语句，在数据仓库中用区间连接完成分类。
+"""
+import csv
+import math
+import re
+import struct
+from array import array
+from typing import IO, Iterator, Optional, Tuple
+
+from .percentile_descriptions import (
+    BMI_CATEGORIES,
+    BMI_CATEGORY_BY_CODE,
+    BMI_DESCRIPTIONS_BY_CODE,
+    NO_CATEGORY,
+    PERCENTILE_CODES,
+)
+from .reference_table import ReferenceTable
+
+# 导出的列：性别、月龄、百分位、百分位编码、BMI下界（含）、BMI上界（不含）、BMI分类、描述
+EXPORT_FIELDS = ("gender", "age_in_months", "percentile", "percentile_code", "bmi_min", "bmi_max", "category", "description")
+
+DEFAULT_SQL_TABLE = "bmi_percentile_thresholds"
+
+# 可直接拼接到SQL语句中的表名：字母或下划线开头，可带一级模式名（如 analytics.bmi_thresholds）
+SQL_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?")
+
+# 每条 INSERT 语句包含的行数
+SQL_INSERT_BATCH = 500
+
+# 浮点数与其位模式的转换，用于逐个相邻浮点数调整体重（math.nextafter 需要 Python 3.9）
+_DOUBLE = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+
+
+class BMIThresholds:
+    """参考表各 (性别, 月龄) 的BMI区间边界
+
+    Attributes:
+        table: 对应的参考表
+        bounds: 每个 (性别编码 * (max_age + 1) + 月龄) 有 len(columns) + 1 个边界，
+            第 k 个百分位列的区间为 [bounds[k], bounds[k + 1])，首末分别为 -inf 和 inf
+    """
+
+    __slots__ = ("table", "bounds", "_width")
+
+    def __init__(self, table: ReferenceTable):
+        width = len(table.columns)
+        bounds = array("d")
+        for gender_code in range(len(table.genders)):
+            for age in range(table.max_age + 1):
+                start = table.row_start_for(gender_code, age)
+                bounds.append(-math.inf)
+                bounds.extend(table.values[start + 1:start + width])
+                bounds.append(math.inf)
+        self.table = table
+        self.bounds = bounds
+        self._width = width
+
+    def _offset(self, gender_code: int, age: int) -> int:
+        return (gender_code * (self.table.max_age + 1) + age) * (self._width + 1)
+
+    def threshold(self, gender_code: int, age: int, column: int) -> float:
+        """第 column 个百分位列的参考值（如 p85 曲线上的BMI）"""
+        return self.table.values[self.table.row_start_for(gender_code, age) + column]
+
+    def column_range(self, gender_code: int, age: int, column: int) -> Tuple[float, float]:
+        """第 column 个百分位列对应的BMI区间 [下界, 上界)"""
+        offset = self._offset(gender_code, age) + column
+        return self.bounds[offset], self.bounds[offset + 1]
+
+    def category_range(self, gender_code: int, age: int, category: int) -> Optional[Tuple[float, float]]:
+        """BMI分类（BMI_CATEGORIES 的序号）对应的BMI区间 [下界, 上界)，该年龄段没有此分类时返回None
+
+        Raises:
+            ValueError: 参考表的百分位列不是标准百分位
+        """
+        category_by_code = BMI_CATEGORY_BY_CODE[0 if age < 24 else 1]
+        columns = []
+        for column, label in enumerate(self.table.columns):
+            code = PERCENTILE_CODES.get(label)
+            if code is None:
+                raise ValueError(f"参考表含有非标准百分位列：{label}")
+            if category_by_code[code] == category:
+                columns.append(column)
+        if not columns:
+            return None
+        offset = self._offset(gender_code, age)
+        return self.bounds[offset + columns[0]], self.bounds[offset + columns[-1] + 1]
+
+    def rows(self) -> Iterator[tuple]:
+        """按 EXPORT_FIELDS 的顺序逐行返回阈值表，无穷的边界为None，空区间（相邻边界相同）不输出"""
+        table = self.table
+        labels = table.columns
+        for gender_code, gender in enumerate(table.genders):
+            for age in range(table.max_age + 1):
+                band = 0 if age < 24 else 1
+                offset = self._offset(gender_code, age)
+                for column, label in enumerate(labels):
+                    lower, upper = self.bounds[offset + column], self.bounds[offset + column + 1]
+                    if lower >= upper:
+                        continue
+                    code = PERCENTILE_CODES.get(label)
+                    category = NO_CATEGORY if code is None else BMI_CATEGORY_BY_CODE[band][code]
+                    yield (
+                        gender,
+                        age,
+                        label,
+                        None if code is None else int(code),
+                        None if lower == -math.inf else lower,
+                        None if upper == math.inf else upper,
+                        None if category == NO_CATEGORY else BMI_CATEGORIES[category],
+                        None if code is None else BMI_DESCRIPTIONS_BY_CODE[band][code],
+                    )
+
+
+# 最近使用的参考表的阈值，参考表被替换后重新计算
+_thresholds: Optional[BMIThresholds] = None
+
+
+def get_bmi_thresholds(table: ReferenceTable) -> BMIThresholds:
+    """获取参考表对应的BMI阈值（按参考表对象缓存最近一份）"""
+    global _thresholds
+    thresholds = _thresholds
+    if thresholds is None or thresholds.table is not table:
+        thresholds = _thresholds = BMIThresholds(table)
+    return thresholds
+
+
+def _adjacent_float(value: float, step: int) -> float:
+    """正的有限浮点数的相邻值，step 为 1 时取更大的一个，为 -1 时取更小的一个"""
+    return _DOUBLE.unpack(_INT64.pack(_INT64.unpack(_DOUBLE.pack(value))[0] + step))[0]
+
+
+def min_weight_for_bmi(bmi: float, height_cm: float) -> float:
+    """给定身高时，BMI（按 calculate_bmi 保留两位小数后）达到 bmi 的最小体重
+
+    calculate_bmi 先取两位小数再与阈值比较，因此体重 bmi * 身高² 稍低一点时BMI也会进位到阈值；
+    这里从 (bmi - 0.005) * 身高² 出发逐个相邻浮点数调整，返回的体重及以上都达到阈值，
+    比它小的任何体重都达不到。
+
+    Args:
+        bmi: BMI阈值，±inf 时直接返回 ±inf
+        height_cm: 身高（厘米），应大于0
+
+    Returns:
+        体重（千克）
+    """
+    height_m2 = (height_cm / 100) ** 2
+    weight = (bmi - 0.005) * height_m2
+    if not math.isfinite(weight) or weight <= 0:
+        return weight
+    while round(weight / height_m2, 2) >= bmi:
+        weight = _adjacent_float(weight, -1)
+    while round(weight / height_m2, 2) < bmi:
+        weight = _adjacent_float(weight, 1)
+    return weight
+
+
+def check_sql_identifier(name: str) -> str:
+    """检查表名能否直接拼接到SQL语句中（表名不能作为参数绑定），返回原表名
+
+    Raises:
+        ValueError: 表名含有字母、数字、下划线以外的字符（如引号、空格、分号）
+    """
+    if not isinstance(name, str) or SQL_IDENTIFIER_PATTERN.fullmatch(name) is None:
+        raise ValueError(f"SQL表名不正确：{name!r}，只能包含字母、数字和下划线，可带一级模式名")
+    return name
+
+
+def _sql_literal(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+
+def export_thresholds(stream: IO[str], table: ReferenceTable, fmt: str = "csv", sql_table: str = DEFAULT_SQL_TABLE) -> int:
+    """导出BMI阈值表
+
+    分类时先将BMI保留两位小数（同 calculate_bmi），再按
+    gender = 性别 AND age_in_months = 月龄 AND (bmi_min IS NULL OR bmi >= bmi_min) AND (bmi_max IS NULL OR bmi < bmi_max)
+    连接，得到的百分位与 calculate_bmi_percentile 一致。
+
+    Args:
+        stream: 文本输出流
+        table: BMI参考表
+        fmt: "csv" 或 "sql"（CREATE TABLE 及批量 INSERT 语句）
+        sql_table: SQL表名
+
+    Returns:
+        int: 导出的行数
+
+    Raises:
+        ValueError: 不支持的导出格式，或SQL表名不正确（见 check_sql_identifier）
+    """
+    if fmt not in ("csv", "sql"):
+        raise ValueError(f"不支持的导出格式：{fmt}")
+    if fmt == "sql":
+        check_sql_identifier(sql_table)
+    rows = get_bmi_thresholds(table).rows()
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(EXPORT_FIELDS)
+        for row in rows:
+            writer.writerow(["" if value is None else value for value in row])
+            count += 1
+        return count
+
+    stream.write(
+        f"CREATE TABLE IF NOT EXISTS {sql_table} (\n"
+        "    gender VARCHAR(8) NOT NULL,\n"
+        "    age_in_months SMALLINT NOT NULL,\n"
+        "    percentile VARCHAR(8) NOT NULL,\n"
+        "    percentile_code SMALLINT,\n"
+        "    bmi_min DOUBLE PRECISION,\n"
+        "    bmi_max DOUBLE PRECISION,\n"
+        "    category VARCHAR(16),\n"
+        "    description VARCHAR(32)\n"
+        ");\n"
+    )
+    header = f"INSERT INTO {sql_table} ({', '.join(EXPORT_FIELDS)}) VALUES\n"
+    batch = []
+    for row in rows:
+        batch.append("(" + ", ".join(_sql_literal(value) for value in row) + ")")
+        count += 1
+        if len(batch) == SQL_INSERT_BATCH:
+            stream.write(header + ",\n".join(batch) + ";\n")
+            batch = []
+    if batch:
+        stream.write(header + ",\n".join(batch) + ";\n")
+    return count
@@ -0,0 +1,263 @@
+"""纵向生长跟踪
+
+按儿童保存最近一次测量的紧凑状态（月龄、BMI、百分位编码、BMI增速），
+新测量到达时只与上一次测量比较，不再重算历史；BMI分类（偏瘦、正常、超重、肥胖、重度肥胖，
+取自 BMI_PERCENTILE_DESCRIPTIONS_UNDER_2 / OVER_2）发生变化时产生跨越事件。
+
+状态保存在按列排列的 array 中，儿童编号 -> 行号的映射按最近更新顺序排列，
+设置 max_children 后超出容量时淘汰最久未更新的儿童。跟踪器不是线程安全的。
+"""
+import math
+import pickle
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .percentile_descriptions import (
+    BMI_CATEGORIES,
+    BMI_CATEGORY_BY_CODE,
+    NO_CATEGORY,
+    PERCENTILE_CODE_LABELS,
+    PercentileCode,
+)
+from .reference_table import normalize_age
+from .who_standard_service import WHOStandardService
+
+CHECKPOINT_VERSION = 1
+
+
+class ChildState(NamedTuple):
+    """儿童最近一次测量的状态"""
+
+    age_in_months: int
+    bmi: float
+    percentile: str
+    category: Optional[str]
+    velocity: float  # 相对上一次测量的BMI增速（每月），首次测量为NaN
+
+
+class CrossingEvent(NamedTuple):
+    """BMI分类跨越事件"""
+
+    child_id: Hashable
+    age_in_months: int
+    bmi: float
+    previous_percentile: str
+    percentile: str
+    previous_category: str
+    category: str
+
+    @property
+    def direction(self) -> str:
+        """"up" 表示分类升高，"down" 表示降低"""
+        return "up" if BMI_CATEGORIES.index(self.category) > BMI_CATEGORIES.index(self.previous_category) else "down"
+
+
+class GrowthTracker:
+    """增量更新的纵向生长跟踪器
+
+    Args:
+        max_children: 最多跟踪的儿童数，超出后淘汰最久未更新的儿童；None表示不限制
+    """
+
+    def __init__(self, max_children: Optional[int] = None):
+        if max_children is not None and max_children <= 0:
+            raise ValueError("max_children必须大于0")
+        self.max_children = max_children
+        self.updates = 0
+        self.stale = 0
+        self.evictions = 0
+        self._slots: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._free: List[int] = []
+        self._age = array("i")
+        self._bmi = array("d")
+        self._code = array("B")
+        self._category = array("B")
+        self._velocity = array("d")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, child_id: Hashable) -> bool:
+        return child_id in self._slots
+
+    def _allocate(self, child_id: Hashable) -> int:
+        if self.max_children is not None and len(self._slots) >= self.max_children:
+            _, slot = self._slots.popitem(last=False)
+            self.evictions += 1
+        elif self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._age)
+            self._age.append(0)
+            self._bmi.append(0.0)
+            self._code.append(0)
+            self._category.append(0)
+            self._velocity.append(0.0)
+        self._slots[child_id] = slot
+        return slot
+
+    def update(self, child_id: Hashable, gender: str, age_in_months: int,
+               height_cm: float, weight_kg: float) -> Optional[CrossingEvent]:
+        """记录一次测量
+
+        Args:
+            child_id: 儿童编号
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 测量时的年龄（月）
+            height_cm: 身高（厘米）
+            weight_kg: 体重（千克）
+
+        Returns:
+            BMI分类发生变化时返回跨越事件，否则返回None
+
+        Raises:
+            ValueError: 身高或体重不大于0，或月龄不是0-228之间的整数
+        """
+        bmi = WHOStandardService.calculate_bmi(height_cm, weight_kg)
+        return self.update_bmi(child_id, gender, age_in_months, bmi)
+
+    def update_bmi(self, child_id: Hashable, gender: str, age_in_months: int, bmi: float) -> Optional[CrossingEvent]:
+        """以BMI值记录一次测量，规则同 update
+
+        月龄早于上一次测量的记录视为过期，不更新状态（计入 stale）；
+        月龄与上一次相同时以新测量替换上一次测量，BMI增速保持不变。
+
+        Raises:
+            ValueError: 月龄不是0-228之间的整数（逐条计算对这些月龄返回"unknown"，无法跟踪）
+        """
+        age = normalize_age(age_in_months)
+        if age is None:
+            raise ValueError(f"月龄必须为整数：{age_in_months!r}")
+        if age < 0 or age > 228:
+            raise ValueError(f"年龄超出数据范围(0-228个月)：{age_in_months!r}")
+        age_in_months = age
+        code = WHOStandardService.calculate_bmi_percentile_record(gender, age_in_months, bmi).code
+        if code is None:
+            code = PercentileCode.UNKNOWN
+        category = BMI_CATEGORY_BY_CODE[0 if age_in_months < 24 else 1][code]
+
+        slot = self._slots.get(child_id)
+        if slot is None:
+            slot = self._allocate(child_id)
+            self._age[slot] = age_in_months
+            self._bmi[slot] = bmi
+            self._code[slot] = code
+            self._category[slot] = category
+            self._velocity[slot] = math.nan
+            self.updates += 1
+            return None
+
+        previous_age = self._age[slot]
+        if age_in_months < previous_age:
+            self.stale += 1
+            return None
+        self._slots.move_to_end(child_id)
+        self.updates += 1
+
+        if age_in_months > previous_age:
+            self._velocity[slot] = (bmi - self._bmi[slot]) / (age_in_months - previous_age)
+        previous_code = self._code[slot]
+        previous_category = self._category[slot]
+        self._age[slot] = age_in_months
+        self._bmi[slot] = bmi
+        self._code[slot] = code
+        if category == NO_CATEGORY:
+            # 百分位未知时保留上一次的分类，用于与之后的测量比较
+            return None
+        self._category[slot] = category
+
+        if previous_category == NO_CATEGORY or previous_category == category:
+            return None
+        return CrossingEvent(
+            child_id,
+            age_in_months,
+            bmi,
+            PERCENTILE_CODE_LABELS[previous_code],
+            PERCENTILE_CODE_LABELS[code],
+            BMI_CATEGORIES[previous_category],
+            BMI_CATEGORIES[category],
+        )
+
+    def get(self, child_id: Hashable) -> Optional[ChildState]:
+        """获取儿童最近一次测量的状态，未跟踪时返回None"""
+        slot = self._slots.get(child_id)
+        if slot is None:
+            return None
+        category = self._category[slot]
+        return ChildState(
+            self._age[slot],
+            self._bmi[slot],
+            PERCENTILE_CODE_LABELS[self._code[slot]],
+            None if category == NO_CATEGORY else BMI_CATEGORIES[category],
+            self._velocity[slot],
+        )
+
+    def remove(self, child_id: Hashable) -> bool:
+        """停止跟踪指定儿童，返回是否存在"""
+        slot = self._slots.pop(child_id, None)
+        if slot is None:
+            return False
+        self._free.append(slot)
+        return True
+
+    def children(self) -> Iterator[Hashable]:
+        """按最久未更新到最近更新的顺序返回儿童编号"""
+        return iter(list(self._slots))
+
+    def stats(self) -> Dict[str, Any]:
+        """返回跟踪人数、更新次数、过期记录数和淘汰次数"""
+        return {
+            "children": len(self._slots),
+            "max_children": self.max_children,
+            "updates": self.updates,
+            "stale": self.stale,
+            "evictions": self.evictions,
+        }
+
+    def _compact(self) -> Tuple[List[Hashable], array, array, array, array, array]:
+        """按最近更新顺序返回儿童编号及对应的连续状态列"""
+        child_ids = list(self._slots)
+        slots = list(self._slots.values())
+        return (
+            child_ids,
+            array("i", (self._age[slot] for slot in slots)),
+            array("d", (self._bmi[slot] for slot in slots)),
+            array("B", (self._code[slot] for slot in slots)),
+            array("B", (self._category[slot] for slot in slots)),
+            array("d", (self._velocity[slot] for slot in slots)),
+        )
+
+    def checkpoint(self, path: str) -> None:
+        """将全部状态写入检查点文件（pickle格式，只应加载自己生成的检查点）"""
+        child_ids, ages, bmis, codes, categories, velocities = self._compact()
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "max_children": self.max_children,
+            "counters": (self.updates, self.stale, self.evictions),
+            "child_ids": child_ids,
+            "columns": (ages.tobytes(), bmis.tobytes(), codes.tobytes(), categories.tobytes(), velocities.tobytes()),
+        }
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def restore(cls, path: str) -> "GrowthTracker":
+        """从检查点文件恢复跟踪器
+
+        Raises:
+            ValueError: 检查点版本不支持
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"不支持的检查点版本：{state.get('version')}")
+
+        tracker = cls(state["max_children"])
+        tracker.updates, tracker.stale, tracker.evictions = state["counters"]
+        for column, raw in zip(
+            (tracker._age, tracker._bmi, tracker._code, tracker._category, tracker._velocity), state["columns"]
+        ):
+            column.frombytes(raw)
+        tracker._slots = OrderedDict((child_id, slot) for slot, child_id in enumerate(state["child_ids"]))
+        return tracker
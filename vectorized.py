@@ -0,0 +1,689 @@
+"""BMI百分位批量计算（基于NumPy）
+
+对整列数据一次性计算BMI、百分位编码和描述编号，结果与逐条调用
+WHOStandardService.calculate_bmi_with_percentile 完全一致。
+需要安装NumPy：pip install "who-bmi-calculator[numpy]"
+"""
+import calendar
+import math
+from datetime import date
+from typing import List, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy为可选依赖
+    np = None
+
+from .age_calculator import AgeCalculator
+from .percentile_descriptions import (
+    BMI_CATEGORIES,
+    PERCENTILE_CODE_LABELS,
+    PERCENTILE_LABELS,
+    BMI_DESCRIPTIONS_BY_CODE,
+    HEIGHT_DESCRIPTIONS_BY_CODE,
+    WEIGHT_DESCRIPTIONS_BY_CODE,
+    PercentileCode,
+)
+from .percentile_index import compile_percentile_row
+from .quantized import QUANTIZED_MAX, QUANTIZED_MIN, get_quantized_index
+from .reference_table import get_bmi_reference_table, require_reference_table
+from .thresholds import get_bmi_thresholds
+from .zscore import get_zscore_curves
+
+# 性别编码：0=男孩，1=女孩
+GENDERS = ("boy", "girl")
+
+# 数据覆盖的最大年龄（月）
+MAX_AGE_MONTHS = 228
+
+# 百分位编码见 PercentileCode，PERCENTILE_CODE_LABELS 为编码 -> 百分位标签
+UNKNOWN_CODE = int(PercentileCode.UNKNOWN)
+
+# 描述编号 -> 描述文本
+# [0, 16): 2岁以下，按百分位编码排列；[16, 32): 2岁以上；之后为年龄超范围、不支持的性别
+_BAND_SIZE = len(PERCENTILE_CODE_LABELS)
+BMI_DESCRIPTION_TABLE = BMI_DESCRIPTIONS_BY_CODE[0] + BMI_DESCRIPTIONS_BY_CODE[1] + ("年龄超出数据范围(0-228个月)", "不支持的性别")
+AGE_OUT_OF_RANGE_DESCRIPTION = 2 * _BAND_SIZE
+UNSUPPORTED_GENDER_DESCRIPTION = 2 * _BAND_SIZE + 1
+
+# 身高、体重描述编号 -> 描述文本
+# [0, 16): 按百分位编码排列；之后为年龄超范围、不支持的性别
+_MEASURE_STATUS_DESCRIPTIONS = ("年龄超出数据范围", "不支持的性别")
+HEIGHT_DESCRIPTION_TABLE = HEIGHT_DESCRIPTIONS_BY_CODE + _MEASURE_STATUS_DESCRIPTIONS
+WEIGHT_DESCRIPTION_TABLE = WEIGHT_DESCRIPTIONS_BY_CODE + _MEASURE_STATUS_DESCRIPTIONS
+MEASURE_AGE_OUT_OF_RANGE_DESCRIPTION = _BAND_SIZE
+MEASURE_UNSUPPORTED_GENDER_DESCRIPTION = _BAND_SIZE + 1
+
+DESCRIPTION_TABLES = {
+    "bmi": BMI_DESCRIPTION_TABLE,
+    "height": HEIGHT_DESCRIPTION_TABLE,
+    "weight": WEIGHT_DESCRIPTION_TABLE,
+}
+
+# 每次比较的最大行数，限制中间布尔矩阵的内存占用
+CHUNK_SIZE = 65536
+
+# 年龄类型编码 -> 年龄类型（与 AgeCalculator.parse_age_date 返回的类型一致）
+AGE_TYPES = ("month", "week")
+MONTH_TYPE_CODE = 0
+WEEK_TYPE_CODE = 1
+
+# "YYYY-MM-DD" 中数字所在的位置
+_DIGIT_POSITIONS = [0, 1, 2, 3, 5, 6, 8, 9]
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# (参考表, 去重后的边界矩阵, 行号表)，参考表被替换后重新生成
+_table_arrays = (None, None, None)
+
+# 指标 -> (参考表, 去重后的边界矩阵, 行号表, 列的百分位编码, 超出最大值时的编码, 性别编码映射)
+# 不原地修改：更新时复制出新字典再整体赋值（并发更新时丢失的条目只会在下次使用时重新生成）
+_measure_arrays = {}
+
+
+class BMIBatchResult(NamedTuple):
+    """批量计算结果"""
+
+    bmi: "np.ndarray"
+    percentile_codes: "np.ndarray"
+    description_codes: "np.ndarray"
+
+    def percentiles(self) -> List[str]:
+        """将百分位编码还原为百分位标签"""
+        return [PERCENTILE_CODE_LABELS[code] for code in self.percentile_codes.tolist()]
+
+    def descriptions(self) -> List[str]:
+        """将描述编号还原为描述文本"""
+        return [BMI_DESCRIPTION_TABLE[code] for code in self.description_codes.tolist()]
+
+
+class AgeDateBatch(NamedTuple):
+    """批量解析结果"""
+
+    dates: "np.ndarray"
+    type_codes: "np.ndarray"
+    valid: "np.ndarray"
+
+    def age_types(self) -> List[Optional[str]]:
+        """将类型编码还原为 'month'/'week'，无效行为None"""
+        return [AGE_TYPES[code] if ok else None for code, ok in zip(self.type_codes.tolist(), self.valid.tolist())]
+
+
+class AgeBatchResult(NamedTuple):
+    """批量年龄计算结果，无效行的各项年龄均为0"""
+
+    type_codes: "np.ndarray"
+    valid: "np.ndarray"
+    years: "np.ndarray"
+    months: "np.ndarray"
+    total_months: "np.ndarray"
+    days: "np.ndarray"
+    weeks: "np.ndarray"
+
+    def age_types(self) -> List[Optional[str]]:
+        """将类型编码还原为 'month'/'week'，无效行为None"""
+        return [AGE_TYPES[code] if ok else None for code, ok in zip(self.type_codes.tolist(), self.valid.tolist())]
+
+
+class ZScoreBatchResult(NamedTuple):
+    """Z评分批量计算结果，年龄或性别不支持的行为NaN"""
+
+    zscore: "np.ndarray"
+    percentile_rank: "np.ndarray"
+
+
+class WeightRangeBatchResult(NamedTuple):
+    """体重范围批量计算结果，性别或月龄不支持的行为NaN"""
+
+    min_weight: "np.ndarray"
+    max_weight: "np.ndarray"
+
+
+class AssessmentBatchResult(NamedTuple):
+    """身高、体重、BMI批量计算结果"""
+
+    bmi: "np.ndarray"
+    bmi_percentile_codes: "np.ndarray"
+    bmi_description_codes: "np.ndarray"
+    height_percentile_codes: "np.ndarray"
+    height_description_codes: "np.ndarray"
+    weight_percentile_codes: "np.ndarray"
+    weight_description_codes: "np.ndarray"
+
+    def percentiles(self, metric: str) -> List[str]:
+        """将指定指标（"bmi"/"height"/"weight"）的百分位编码还原为百分位标签"""
+        codes = getattr(self, f"{metric}_percentile_codes")
+        return [PERCENTILE_CODE_LABELS[code] for code in codes.tolist()]
+
+    def descriptions(self, metric: str) -> List[str]:
+        """将指定指标的描述编号还原为描述文本"""
+        table = DESCRIPTION_TABLES[metric]
+        return [table[code] for code in getattr(self, f"{metric}_description_codes").tolist()]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("批量计算需要NumPy，请执行 pip install numpy")
+
+
+def build_boundary_matrix(standard_data: dict) -> "np.ndarray":
+    """将标准数据构建为 (性别, 年龄, 百分位) 的边界矩阵
+
+    Args:
+        standard_data: 与 BMI_STANDARD_DATA 结构相同的标准数据
+
+    Returns:
+        np.ndarray: 形状为 (2, 229, 15) 的float64矩阵，列顺序为 PERCENTILE_LABELS
+
+    Raises:
+        ValueError: 数据缺少年龄，或某行排序后的百分位顺序与 PERCENTILE_LABELS 不一致
+    """
+    _require_numpy()
+    matrix = np.empty((len(GENDERS), MAX_AGE_MONTHS + 1, len(PERCENTILE_LABELS)))
+    for g, gender in enumerate(GENDERS):
+        gender_data = standard_data[gender]
+        for age in range(MAX_AGE_MONTHS + 1):
+            age_data = gender_data.get(age, gender_data.get(str(age)))
+            if age_data is None:
+                raise ValueError(f"标准数据缺少年龄：{gender} {age}")
+            values, labels = compile_percentile_row(age_data)
+            if labels != PERCENTILE_LABELS:
+                raise ValueError(f"标准数据百分位不单调：{gender} {age}")
+            matrix[g, age] = values
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _get_table_arrays():
+    """获取当前BMI参考表的 (去重后的边界矩阵, 行号表)，直接引用参考表的缓冲区"""
+    global _table_arrays
+    table = get_bmi_reference_table()
+    if _table_arrays[0] is not table:
+        _require_numpy()
+        if table.genders != GENDERS or table.columns != PERCENTILE_LABELS or table.max_age != MAX_AGE_MONTHS:
+            raise ValueError("BMI参考表结构与批量计算不一致")
+        unique_rows = np.frombuffer(table.values, dtype=np.float64).reshape(-1, len(table.columns))
+        row_ids = np.frombuffer(table.row_ids, dtype=np.uint16)
+        _table_arrays = (table, unique_rows, row_ids)
+    return _table_arrays[1], _table_arrays[2]
+
+
+def _get_quantized_arrays():
+    """获取当前BMI参考表的量化索引数组视图：(百分位编码表, 各 (性别, 月龄) 的起始位置)"""
+    index = get_quantized_index(get_bmi_reference_table())
+    return np.frombuffer(index.codes, dtype=np.uint8), np.frombuffer(index.offsets, dtype=np.int64)
+
+
+def _get_measure_arrays(metric: str):
+    """获取身高或体重参考表的数组视图
+
+    Raises:
+        ValueError: 未加载该指标的参考表
+    """
+    global _measure_arrays
+    table = require_reference_table(metric)
+    cached = _measure_arrays.get(metric)
+    if cached is None or cached[0] is not table:
+        _require_numpy()
+        if any(column not in PERCENTILE_LABELS for column in table.columns):
+            raise ValueError(f"{metric}参考表含有批量计算不支持的百分位列")
+        width = len(table.columns)
+        unique_rows = np.frombuffer(table.values, dtype=np.float64).reshape(-1, width)
+        row_ids = np.frombuffer(table.row_ids, dtype=np.uint16)
+        column_codes = np.array([PERCENTILE_LABELS.index(column) for column in table.columns], dtype=np.uint8)
+        overflow_label = "p99" if table.columns[-1] == "p999" else table.columns[-1]
+        gender_map = np.array(
+            [-1 if table.gender_code(gender) is None else table.gender_code(gender) for gender in GENDERS],
+            dtype=np.int64,
+        )
+        cached = (table, unique_rows, row_ids, column_codes, PERCENTILE_LABELS.index(overflow_label), gender_map)
+        _measure_arrays = {**_measure_arrays, metric: cached}
+    return cached
+
+
+def get_bmi_boundary_matrix() -> "np.ndarray":
+    """获取BMI参考表展开后的 (2, 229, 15) 边界矩阵"""
+    unique_rows, row_ids = _get_table_arrays()
+    matrix = unique_rows[row_ids].reshape(len(GENDERS), MAX_AGE_MONTHS + 1, len(PERCENTILE_LABELS))
+    matrix.setflags(write=False)
+    return matrix
+
+
+def round_bmi(values: "np.ndarray") -> "np.ndarray":
+    """按内置 round(x, 2) 的规则保留两位小数
+
+    np.round 先乘100再取整，在接近 .5 的位置可能与内置 round 不一致，
+    这些位置逐个使用内置 round 重新计算。
+    """
+    scaled = values * 100.0
+    rounded = np.rint(scaled) / 100.0
+    with np.errstate(invalid="ignore"):
+        frac = scaled - np.floor(scaled)
+        near_tie = np.nonzero(np.abs(frac - 0.5) < 1e-6)[0]
+    for i in near_tie.tolist():
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+def calculate_bmi_batch(heights_cm, weights_kg) -> "np.ndarray":
+    """批量计算BMI值
+
+    Args:
+        heights_cm: 身高数组（厘米）
+        weights_kg: 体重数组（千克）
+
+    Returns:
+        np.ndarray: BMI数组，保留两位小数
+
+    Raises:
+        ValueError: 任意一行身高或体重不大于0
+    """
+    _require_numpy()
+    heights = np.asarray(heights_cm, dtype=np.float64)
+    weights = np.asarray(weights_kg, dtype=np.float64)
+    if np.any((heights <= 0) | (weights <= 0)):
+        raise ValueError("身高和体重必须大于0")
+
+    height_m = heights / 100
+    return round_bmi(weights / (height_m ** 2))
+
+
+def encode_genders(genders) -> "np.ndarray":
+    """将性别数组转换为性别编码（0=男孩，1=女孩，-1=不支持）"""
+    _require_numpy()
+    genders = np.asarray(genders)
+    if genders.dtype.kind in "iu":
+        return genders.astype(np.int64)
+    codes = np.full(genders.shape, -1, dtype=np.int64)
+    for code, gender in enumerate(GENDERS):
+        codes[genders == gender] = code
+    return codes
+
+
+def calculate_bmi_percentile_batch(genders, ages_in_months, bmi) -> BMIBatchResult:
+    """批量计算BMI百分位
+
+    Args:
+        genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+        ages_in_months: 年龄数组（月），应为整数类型；浮点年龄与逐条计算一样返回"unknown"
+        bmi: BMI数组
+
+    Returns:
+        BMIBatchResult: BMI、百分位编码（见 PERCENTILE_CODE_LABELS）和描述编号（见 BMI_DESCRIPTION_TABLE）
+    """
+    _require_numpy()
+    unique_rows, row_ids = _get_table_arrays()
+    genders, ages, bmi = np.broadcast_arrays(
+        encode_genders(genders), np.asarray(ages_in_months), np.asarray(bmi, dtype=np.float64)
+    )
+    genders, ages, bmi = genders.ravel(), ages.ravel(), bmi.ravel()
+
+    codes = np.full(bmi.shape, UNKNOWN_CODE, dtype=np.uint8)
+    descriptions = np.empty(bmi.shape, dtype=np.uint8)
+
+    # 验证年龄范围与性别（顺序与逐条计算一致）；NaN年龄与逐条计算一样不算超出范围，百分位为"unknown"
+    age_ok = ~((ages < 0) | (ages > MAX_AGE_MONTHS))
+    gender_ok = (genders == 0) | (genders == 1)
+    descriptions[~age_ok] = AGE_OUT_OF_RANGE_DESCRIPTION
+    descriptions[age_ok & ~gender_ok] = UNSUPPORTED_GENDER_DESCRIPTION
+
+    valid = age_ok & gender_ok
+    if ages.dtype.kind in "iu":
+        from .who_standard_service import WHOStandardService
+
+        if WHOStandardService.is_quantized_lookup_enabled():
+            # 量化范围内、在0.01网格上的BMI直接索引，其余行按边界比较
+            quantized_codes, offsets = _get_quantized_arrays()
+            with np.errstate(invalid="ignore"):
+                steps = np.rint(bmi * 100)
+                direct = valid & (bmi >= QUANTIZED_MIN) & (bmi <= QUANTIZED_MAX) & (steps / 100 == bmi)
+            selected = np.nonzero(direct)[0]
+            cells = genders[selected] * (MAX_AGE_MONTHS + 1) + ages[selected]
+            codes[selected] = quantized_codes[offsets[cells] + steps[selected].astype(np.int64)]
+            valid_remaining = valid & ~direct
+        else:
+            valid_remaining = valid
+
+        # 左闭右开：bisect_right 等价于 15 - (边界 > BMI 的个数)，NaN时落在最大百分位
+        selected = np.nonzero(valid_remaining)[0]
+        for start in range(0, selected.size, CHUNK_SIZE):
+            sel = selected[start:start + CHUNK_SIZE]
+            rows = unique_rows[row_ids[genders[sel] * (MAX_AGE_MONTHS + 1) + ages[sel]]]
+            position = len(PERCENTILE_LABELS) - (rows > bmi[sel, None]).sum(axis=1)
+            codes[sel] = np.maximum(position - 1, 0)
+
+    # 与 bmi_percentile_result 一致：不小于24个月（包括NaN）按2岁以上描述
+    band = (~(ages < 24)).astype(np.uint8)
+    descriptions[valid] = (band * _BAND_SIZE + codes)[valid]
+    return BMIBatchResult(bmi, codes, descriptions)
+
+
+def calculate_bmi_with_percentile_batch(genders, ages_in_months, heights_cm, weights_kg) -> BMIBatchResult:
+    """批量计算BMI及其百分位
+
+    Args:
+        genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+        ages_in_months: 年龄数组（月）
+        heights_cm: 身高数组（厘米）
+        weights_kg: 体重数组（千克）
+
+    Returns:
+        BMIBatchResult: BMI、百分位编码和描述编号
+    """
+    bmi = calculate_bmi_batch(heights_cm, weights_kg)
+    return calculate_bmi_percentile_batch(genders, ages_in_months, bmi)
+
+
+def _parse_age_date_components(age_dates):
+    """将age_date数组解析为 (年, 月, 日, 类型编码, 有效性掩码)
+
+    按月份的行日取1；无效行的年月日为1970-01-01。
+    标准的 "YYYY-MM-DD" 直接按字符编码计算，其他写法（如全角数字、末尾换行）
+    逐个交给 AgeCalculator.parse_age_date 判断，保证与逐条解析一致。
+    """
+    _require_numpy()
+    values = np.asarray(age_dates)
+    if values.dtype.kind != "U":
+        values = np.array([v if isinstance(v, str) else "" for v in values.ravel().tolist()], dtype=str)
+    values = np.ascontiguousarray(values.ravel())
+    count = values.size
+    width = values.dtype.itemsize // 4
+
+    # 每行前11个字符的编码，不足的位置为0
+    chars = np.zeros((count, 11), dtype=np.int64)
+    if width:
+        used = min(width, 11)
+        chars[:, :used] = values.view(np.uint32).reshape(count, width)[:, :used]
+
+    digits = chars[:, _DIGIT_POSITIONS] - ord("0")
+    valid = (
+        ((digits >= 0) & (digits <= 9)).all(axis=1)
+        & (chars[:, 4] == ord("-"))
+        & (chars[:, 7] == ord("-"))
+        & (chars[:, 10] == 0)
+    )
+    years = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    months = digits[:, 4] * 10 + digits[:, 5]
+    days = digits[:, 6] * 10 + digits[:, 7]
+
+    valid &= (years >= 1) & (months >= 1) & (months <= 12)
+    month_index = np.where(valid, months, 1)
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    days_in_month = np.asarray(_DAYS_IN_MONTH)[month_index] + (leap & (month_index == 2))
+    valid &= days <= days_in_month
+
+    type_codes = np.where(days == 0, MONTH_TYPE_CODE, WEEK_TYPE_CODE).astype(np.uint8)
+
+    for i in np.nonzero(~valid)[0].tolist():
+        value = values[i]
+        if not value:
+            continue
+        try:
+            parsed_date, age_type = AgeCalculator.parse_age_date(str(value))
+        except ValueError:
+            continue
+        valid[i] = True
+        years[i], months[i], days[i] = parsed_date.year, parsed_date.month, parsed_date.day
+        type_codes[i] = AGE_TYPES.index(age_type)
+
+    years[~valid] = 1970
+    months[~valid] = 1
+    days[~valid | (days == 0)] = 1
+    return years, months, days, type_codes, valid
+
+
+def _epoch_days(years, months, days) -> "np.ndarray":
+    """年月日数组 -> 距1970-01-01的天数"""
+    first_of_month = ((years - 1970) * 12 + months - 1).astype("datetime64[M]").astype("datetime64[D]")
+    return first_of_month.astype(np.int64) + days - 1
+
+
+def parse_age_date_batch(age_dates) -> AgeDateBatch:
+    """批量解析age_date字段
+
+    Args:
+        age_dates: age_date字符串数组，格式同 AgeCalculator.parse_age_date
+
+    Returns:
+        AgeDateBatch: 日期数组（datetime64[D]，无效行为NaT）、类型编码（见 AGE_TYPES）和有效性掩码
+    """
+    years, months, days, type_codes, valid = _parse_age_date_components(age_dates)
+    dates = _epoch_days(years, months, days).astype("datetime64[D]")
+    dates[~valid] = np.datetime64("NaT")
+    return AgeDateBatch(dates, type_codes, valid)
+
+
+def calculate_age_batch(age_dates, current_date: Optional[date] = None) -> AgeBatchResult:
+    """批量解析age_date并计算相对于同一日期的年龄
+
+    规则与 AgeCalculator 的逐条计算一致：出生日期晚于当前日期时各项为0；
+    当前日期的天数小于出生日期的天数时月数减1，剩余天数按当前日期上个月的天数借位。
+
+    Args:
+        age_dates: age_date字符串数组，格式同 AgeCalculator.parse_age_date
+        current_date: 当前日期，默认为今天
+
+    Returns:
+        AgeBatchResult: 类型编码、有效性掩码，以及年、月、总月数、天数、周数数组
+    """
+    if current_date is None:
+        current_date = date.today()
+    years, months, days, type_codes, valid = _parse_age_date_components(age_dates)
+
+    current_days = current_date.toordinal() - _EPOCH_ORDINAL
+    elapsed_days = current_days - _epoch_days(years, months, days)
+    # 出生日期晚于当前日期或无效的行，各项年龄为0
+    counted = valid & (elapsed_days >= 0)
+
+    borrow = (current_date.day < days).astype(np.int64)
+    total_months = (current_date.year - years) * 12 + (current_date.month - months) - borrow
+
+    prev_year, prev_month = (current_date.year, current_date.month - 1) if current_date.month > 1 \
+        else (current_date.year - 1, 12)
+    days_in_prev_month = calendar.monthrange(prev_year, prev_month)[1]
+    remaining_days = np.where(borrow, days_in_prev_month - days + current_date.day, current_date.day - days)
+
+    zero = np.zeros_like(total_months)
+    total_months = np.where(counted, total_months, zero)
+    return AgeBatchResult(
+        type_codes,
+        valid,
+        total_months // 12,
+        total_months % 12,
+        total_months,
+        np.where(counted, remaining_days, zero),
+        np.where(counted, elapsed_days // 7, zero),
+    )
+
+
+def _measure_percentile_batch(metric: str, genders, ages, values):
+    """身高或体重的批量百分位查找（左开右闭），参数为已展平的数组
+
+    Returns:
+        (百分位编码数组, 描述编号数组)，描述编号见 HEIGHT_DESCRIPTION_TABLE / WEIGHT_DESCRIPTION_TABLE
+    """
+    table, unique_rows, row_ids, column_codes, overflow_code, gender_map = _get_measure_arrays(metric)
+    codes = np.full(values.shape, UNKNOWN_CODE, dtype=np.uint8)
+    descriptions = np.full(values.shape, UNKNOWN_CODE, dtype=np.uint8)
+    width = len(column_codes)
+
+    # 验证性别与年龄（顺序与 WHOStandardService.assess 一致）
+    gender_ok = (genders == 0) | (genders == 1)
+    table_genders = np.where(gender_ok, gender_map[np.where(gender_ok, genders, 0)], -1)
+    gender_ok &= table_genders >= 0
+    descriptions[~gender_ok] = MEASURE_UNSUPPORTED_GENDER_DESCRIPTION
+    if ages.dtype.kind not in "iu":
+        # 非整数年龄与逐条计算一样返回"unknown"
+        return codes, descriptions
+
+    age_ok = (ages >= 0) & (ages <= table.max_age)
+    descriptions[gender_ok & ~age_ok] = MEASURE_AGE_OUT_OF_RANGE_DESCRIPTION
+    selected = np.nonzero(gender_ok & age_ok)[0]
+    for start in range(0, selected.size, CHUNK_SIZE):
+        sel = selected[start:start + CHUNK_SIZE]
+        rows = unique_rows[row_ids[table_genders[sel] * (table.max_age + 1) + ages[sel]]]
+        value = values[sel]
+        # bisect_left 等价于 (边界 < 值) 的个数；超过所有边界或NaN时取最大百分位
+        position = (rows < value[:, None]).sum(axis=1)
+        overflow = (position == width) | np.isnan(value)
+        codes[sel] = np.where(overflow, overflow_code, column_codes[np.minimum(position, width - 1)])
+    descriptions[selected] = codes[selected]
+    return codes, descriptions
+
+
+def assess_batch(genders, ages_in_months, heights_cm, weights_kg) -> AssessmentBatchResult:
+    """批量计算身高、体重和BMI的百分位
+
+    Args:
+        genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+        ages_in_months: 年龄数组（月）
+        heights_cm: 身高数组（厘米）
+        weights_kg: 体重数组（千克）
+
+    Returns:
+        AssessmentBatchResult: 各指标的百分位编码和描述编号，逐行结果与 WHOStandardService.assess 一致
+
+    Raises:
+        ValueError: 任意一行身高或体重不大于0，或未加载身高、体重参考表
+    """
+    _require_numpy()
+    # 先确认两张参考表都已加载，再做任何计算
+    _get_measure_arrays("height")
+    _get_measure_arrays("weight")
+    genders, ages, heights, weights = np.broadcast_arrays(
+        encode_genders(genders),
+        np.asarray(ages_in_months),
+        np.asarray(heights_cm, dtype=np.float64),
+        np.asarray(weights_kg, dtype=np.float64),
+    )
+    genders, ages, heights, weights = genders.ravel(), ages.ravel(), heights.ravel(), weights.ravel()
+
+    bmi_result = calculate_bmi_percentile_batch(genders, ages, calculate_bmi_batch(heights, weights))
+    height_codes, height_descriptions = _measure_percentile_batch("height", genders, ages, heights)
+    weight_codes, weight_descriptions = _measure_percentile_batch("weight", genders, ages, weights)
+    return AssessmentBatchResult(
+        bmi_result.bmi,
+        bmi_result.percentile_codes,
+        bmi_result.description_codes,
+        height_codes,
+        height_descriptions,
+        weight_codes,
+        weight_descriptions,
+    )
+
+
+def normal_cdf_batch(zscores: "np.ndarray") -> "np.ndarray":
+    """标准正态分布函数，返回百分位（0-100），逐个使用 math.erfc 保证与逐条计算一致"""
+    _require_numpy()
+    scaled = (-zscores / math.sqrt(2.0)).tolist()
+    return 50.0 * np.fromiter(map(math.erfc, scaled), dtype=np.float64, count=len(scaled))
+
+
+def calculate_bmi_zscore_batch(genders, ages_in_months, bmi) -> ZScoreBatchResult:
+    """批量计算BMI的Z评分和连续百分位
+
+    Args:
+        genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+        ages_in_months: 年龄数组（月），应为整数类型；浮点年龄与逐条计算一样视为不支持
+        bmi: BMI数组
+
+    Returns:
+        ZScoreBatchResult: Z评分数组和连续百分位数组（0-100）
+    """
+    _require_numpy()
+    unique_rows, row_ids = _get_table_arrays()
+    curves = get_zscore_curves(get_bmi_reference_table())
+    segments = unique_rows.shape[1] - 1
+    intercepts = np.frombuffer(curves.intercepts, dtype=np.float64).reshape(-1, segments)
+    slopes = np.frombuffer(curves.slopes, dtype=np.float64).reshape(-1, segments)
+
+    genders, ages, bmi = np.broadcast_arrays(
+        encode_genders(genders), np.asarray(ages_in_months), np.asarray(bmi, dtype=np.float64)
+    )
+    genders, ages, bmi = genders.ravel(), ages.ravel(), bmi.ravel()
+    zscores = np.full(bmi.shape, np.nan)
+
+    if ages.dtype.kind in "iu":
+        valid = (genders >= 0) & (genders < len(GENDERS)) & (ages >= 0) & (ages <= MAX_AGE_MONTHS)
+        selected = np.nonzero(valid)[0]
+        for start in range(0, selected.size, CHUNK_SIZE):
+            sel = selected[start:start + CHUNK_SIZE]
+            ids = row_ids[genders[sel] * (MAX_AGE_MONTHS + 1) + ages[sel]]
+            value = bmi[sel]
+            # bisect_right 等价于 (边界 <= 值) 的个数
+            position = (unique_rows[ids] <= value[:, None]).sum(axis=1)
+            segment = np.clip(position - 1, 0, segments - 1)
+            zscores[sel] = intercepts[ids, segment] + slopes[ids, segment] * value
+
+    return ZScoreBatchResult(zscores, normal_cdf_batch(zscores))
+
+
+# (BMI阈值, "正常"分类的BMI下界, 上界)，下标为 性别编码 * 229 + 月龄
+_healthy_bmi_ranges = (None, None, None)
+
+
+def _get_healthy_bmi_ranges():
+    global _healthy_bmi_ranges
+    table = get_bmi_reference_table()
+    thresholds = get_bmi_thresholds(table)
+    cached, lower, upper = _healthy_bmi_ranges
+    if cached is not thresholds:
+        category = BMI_CATEGORIES.index("正常")
+        ranges = [
+            thresholds.category_range(gender_code, age, category)
+            for gender_code in range(len(GENDERS))
+            for age in range(MAX_AGE_MONTHS + 1)
+        ]
+        lower = np.array([bounds[0] for bounds in ranges])
+        upper = np.array([bounds[1] for bounds in ranges])
+        _healthy_bmi_ranges = (thresholds, lower, upper)
+    return lower, upper
+
+
+def calculate_healthy_weight_range_batch(genders, ages_in_months, heights_cm) -> WeightRangeBatchResult:
+    """批量计算BMI分类为"正常"的体重范围
+
+    Args:
+        genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+        ages_in_months: 年龄数组（月），应为整数类型；浮点年龄与逐条计算一样视为不支持
+        heights_cm: 身高数组（厘米）
+
+    Returns:
+        WeightRangeBatchResult: 体重下限（含）和上限（不含）数组，单位千克
+
+    Raises:
+        ValueError: 任意一行身高不大于0
+    """
+    _require_numpy()
+    genders, ages, heights = np.broadcast_arrays(
+        encode_genders(genders), np.asarray(ages_in_months), np.asarray(heights_cm, dtype=np.float64)
+    )
+    genders, ages, heights = genders.ravel(), ages.ravel(), heights.ravel()
+    if np.any(heights <= 0):
+        raise ValueError("身高必须大于0")
+
+    min_weight = np.full(heights.shape, np.nan)
+    max_weight = np.full(heights.shape, np.nan)
+    if ages.dtype.kind in "iu":
+        lower, upper = _get_healthy_bmi_ranges()
+        valid = (genders >= 0) & (genders < len(GENDERS)) & (ages >= 0) & (ages <= MAX_AGE_MONTHS)
+        cells = genders[valid] * (MAX_AGE_MONTHS + 1) + ages[valid]
+        height_m2 = (heights[valid] / 100) ** 2
+        min_weight[valid] = _min_weight_for_bmi_batch(lower[cells], height_m2)
+        max_weight[valid] = _min_weight_for_bmi_batch(upper[cells], height_m2)
+    return WeightRangeBatchResult(min_weight, max_weight)
+
+
+def _min_weight_for_bmi_batch(bmi: "np.ndarray", height_m2: "np.ndarray") -> "np.ndarray":
+    """逐行计算BMI（取两位小数后）达到 bmi 的最小体重，规则同 thresholds.min_weight_for_bmi"""
+    with np.errstate(invalid="ignore"):
+        weight = (bmi - 0.005) * height_m2
+    # 起点与结果只差几个相邻浮点数，先向下调整到达不到阈值，再向上调整到刚好达到
+    for direction, keep_stepping in ((-np.inf, np.greater_equal), (np.inf, np.less)):
+        todo = np.flatnonzero(np.isfinite(weight) & (weight > 0))
+        while todo.size:
+            current = weight[todo]
+            step = keep_stepping(round_bmi(current / height_m2[todo]), bmi[todo])
+            todo = todo[step]
+            weight[todo] = np.nextafter(current[step], direction)
+    return weight
@@ -2,10 +2,39 @@
 
 提供BMI的百分位计算功能，基于WHO儿童生长标准
 """
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from .bmi_data_final import BMI_STANDARD_DATA
-from .percentile_descriptions import get_percentile_description
+from .percentile_descriptions import BMI_CATEGORIES, get_percentile_description
+from .percentile_index import get_percentile_index
+from .reference_table import (
+    ReferenceTable,
+    get_bmi_reference_table,
+    normalize_age,
+    require_reference_table,
+    set_reference_table,
+)
+from .records import (
+    AGE_OUT_OF_RANGE_RESULT,
+    UNSUPPORTED_GENDER_RESULT,
+    BMIResult,
+    PercentileResult,
+    bmi_percentile_result,
+)
+
+# 缓存、量化索引、专用分类函数、阈值、Z评分和参考标准注册表只在使用时才导入，不增加包的导入时间
+if TYPE_CHECKING:
+    from .classifiers import BMIClassifier, ClassifierRegistry
+    from .quantized import QuantizedBMIIndex
+    from .result_cache import PercentileCache
+
+# 可选的BMI百分位结果缓存，默认关闭
+_percentile_cache: Optional["PercentileCache"] = None
+
+# 是否使用量化直接索引表查找BMI百分位，默认关闭
+_quantized_lookup = False
+
+# 按 (性别, 月龄) 生成的专用分类函数，首次使用时创建
+_classifier_registry: Optional["ClassifierRegistry"] = None
 
 
 class WHOStandardService:
@@ -23,37 +52,8 @@ class WHOStandardService:
         Returns:
             str: 对应的百分位值（如"p50"）
         """
-        # 同时检查整数和字符串形式的年龄键
-        age_key = age
-        age_str_key = str(age)
-        
-        if age_key not in gender_data and age_str_key not in gender_data:
-            return "unknown"
-        
-        # 使用存在的键获取数据
-        age_data = gender_data.get(age_key, gender_data.get(age_str_key))
-        
-        # 按百分位值排序
-        sorted_percentiles = sorted(age_data.items(), key=lambda x: x[1])
-        
-        # 使用区间判断（左开右闭）
-        # 如果体重小于最小百分位值，则返回最小百分位
-        if weight <= sorted_percentiles[0][1]:
-            return sorted_percentiles[0][0]
-        
-        # 遍历相邻的百分位对，确定区间
-        for i in range(len(sorted_percentiles) - 1):
-            current_percentile, current_weight = sorted_percentiles[i]
-            next_percentile, next_weight = sorted_percentiles[i + 1]
-            
-            # 判断是否在区间(current_weight, next_weight]内
-            if current_weight < weight <= next_weight:
-                return next_percentile
-        
-        # 如果体重超过所有百分位值，则返回最大百分位
-        # 特殊处理：如果最大百分位是p999，返回p99
-        max_percentile = sorted_percentiles[-1][0]
-        return "p99" if max_percentile == "p999" else max_percentile
+        # 使用区间判断（左开右闭），超过所有百分位值时p999按p99返回
+        return get_percentile_index(gender_data).find_weight(age, weight)
     
     @staticmethod
     def find_percentile_for_height(gender_data: dict, age: int, height: float) -> str:
@@ -67,38 +67,8 @@ class WHOStandardService:
         Returns:
             str: 对应的百分位值（如"p50"）
         """
-        # 先尝试整数类型查找
-        if age in gender_data:
-            age_data = gender_data[age]
-        else:
-            # 如果整数查找失败，尝试转为字符串类型查找
-            age_str = str(age)
-            if age_str in gender_data:
-                age_data = gender_data[age_str]
-            else:
-                return "unknown"
-        
-        # 按百分位值排序
-        sorted_percentiles = sorted(age_data.items(), key=lambda x: x[1])
-        
-        # 使用区间判断（左开右闭）
-        # 如果身高小于最小百分位值，则返回最小百分位
-        if height <= sorted_percentiles[0][1]:
-            return sorted_percentiles[0][0]
-        
-        # 遍历相邻的百分位对，确定区间
-        for i in range(len(sorted_percentiles) - 1):
-            current_percentile, current_height = sorted_percentiles[i]
-            next_percentile, next_height = sorted_percentiles[i + 1]
-            
-            # 判断是否在区间(current_height, next_height]内
-            if current_height < height <= next_height:
-                return next_percentile
-        
-        # 如果身高超过所有百分位值，则返回最大百分位
-        # 特殊处理：如果最大百分位是p999，返回p99
-        max_percentile = sorted_percentiles[-1][0]
-        return "p99" if max_percentile == "p999" else max_percentile
+        # 使用区间判断（左开右闭），超过所有百分位值时p999按p99返回
+        return get_percentile_index(gender_data).find_height(age, height)
     
     @staticmethod
     def find_percentile_for_bmi(gender_data: dict, age: int, bmi: float) -> str:
@@ -112,40 +82,10 @@ class WHOStandardService:
         Returns:
             str: 对应的百分位值（如"p50"）
         """
-        # 先尝试整数类型查找
-        if age in gender_data:
-            age_data = gender_data[age]
-        else:
-            # 如果整数查找失败，尝试转为字符串类型查找
-            age_str = str(age)
-            if age_str in gender_data:
-                age_data = gender_data[age_str]
-            else:
-                return "unknown"
-        
-        # 按百分位值排序
-        sorted_percentiles = sorted(age_data.items(), key=lambda x: x[1])
-        
         # 使用区间判断（左闭右开）
         # 逻辑：达到某个百分位的值后，就归属到该百分位，直到达到下一个百分位的值
         # 例如：P97=24.0, P99=25.5，则 24.0 <= BMI < 25.5 返回P97，BMI >= 25.5 返回P99
-        
-        # 如果BMI小于最小百分位值，则返回最小百分位
-        if bmi < sorted_percentiles[0][1]:
-            return sorted_percentiles[0][0]
-        
-        # 遍历相邻的百分位对，确定区间
-        for i in range(len(sorted_percentiles) - 1):
-            current_percentile, current_bmi = sorted_percentiles[i]
-            next_percentile, next_bmi = sorted_percentiles[i + 1]
-            
-            # 判断是否在区间[current_bmi, next_bmi)内
-            # 达到current_bmi就归属到current_percentile，直到达到next_bmi
-            if current_bmi <= bmi < next_bmi:
-                return current_percentile
-        
-        # 如果BMI大于等于最大百分位值，则返回最大百分位
-        return sorted_percentiles[-1][0]
+        return get_percentile_index(gender_data).find_bmi(age, bmi)
     
     @staticmethod
     def get_bmi_data_by_gender(gender: str) -> Optional[Dict]:
@@ -157,70 +97,381 @@ class WHOStandardService:
         Returns:
             BMI标准数据字典，如果不支持则返回None
         """
-        if gender in BMI_STANDARD_DATA:
-            return BMI_STANDARD_DATA[gender]
+        from .bmi_data_final import BMI_STANDARD_DATA as standard_data
+        if gender in standard_data:
+            return standard_data[gender]
         return None
     
     @staticmethod
-    def calculate_bmi_percentile(gender: str, age_in_months: int, bmi: float) -> Dict[str, str]:
+    def load_reference_table(path: str, verify: bool = True, metric: str = "bmi") -> ReferenceTable:
+        """以只读mmap方式加载二进制参考表，之后该指标的百分位计算均基于该表
+        
+        Args:
+            path: 由 `python -m who_bmi_calculator build-table` 生成的参考表文件
+            verify: 是否校验文件的SHA-256
+            metric: 参考表对应的指标，"bmi"、"height" 或 "weight"
+            
+        Returns:
+            加载后的参考表
+            
+        Raises:
+            ValueError: 文件格式、版本或校验和不正确，或不支持的指标
+        """
+        from .table_file import open_table_file
+        table = open_table_file(path, verify)
+        set_reference_table(metric, table)
+        return table
+    
+    @staticmethod
+    def load_standard_data(metric: str, standard_data: Dict[str, dict]) -> ReferenceTable:
+        """由标准数据字典构建参考表并用于该指标的百分位计算
+        
+        包内只附带BMI标准数据，身高、体重标准数据需由调用方提供。
+        
+        Args:
+            metric: 指标，"bmi"、"height" 或 "weight"
+            standard_data: {性别: {月龄: {百分位: 数值}}}，结构与 BMI_STANDARD_DATA 相同
+            
+        Returns:
+            构建的参考表
+            
+        Raises:
+            ValueError: 标准数据结构不正确，或不支持的指标
+        """
+        table = ReferenceTable.from_standard_data(standard_data)
+        set_reference_table(metric, table)
+        return table
+    
+    @staticmethod
+    def calculate_bmi_percentile(
+        gender: str,
+        age_in_months: int,
+        bmi: float,
+        standard: Optional[str] = None
+    ) -> Dict[str, str]:
         """计算BMI百分位
         
         Args:
             gender: 性别 ("boy" 或 "girl")
             age_in_months: 年龄（月）
             bmi: BMI值
+            standard: 参考标准名称（见 standards.register_standard），默认为WHO标准
             
         Returns:
             包含百分位和描述的字典
         """
+        result = WHOStandardService.calculate_bmi_percentile_record(gender, age_in_months, bmi, standard)
+        return {"percentile": result.percentile, "description": result.description}
+    
+    @staticmethod
+    def calculate_bmi_percentile_record(
+        gender: str,
+        age_in_months: int,
+        bmi: float,
+        standard: Optional[str] = None
+    ) -> PercentileResult:
+        """计算BMI百分位，返回预先创建的不可变记录
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            bmi: BMI值
+            standard: 参考标准名称（见 standards.register_standard），默认为WHO标准；
+                其他标准的参考表在首次使用时加载，不使用结果缓存和量化索引
+            
+        Returns:
+            PercentileResult: 百分位编码、百分位标签和描述，同一结果总是同一个对象
+            
+        Raises:
+            ValueError: 参考标准未注册
+        """
+        if standard is not None:
+            from .standards import DEFAULT_STANDARD, get_standard
+            if standard != DEFAULT_STANDARD:
+                return get_standard(standard).percentile_record(gender, age_in_months, bmi)
+        
         # 验证年龄范围
         if age_in_months < 0 or age_in_months > 228:
-            return {"percentile": "unknown", "description": "年龄超出数据范围(0-228个月)"}
+            return AGE_OUT_OF_RANGE_RESULT
+        
+        table = get_bmi_reference_table()
+        gender_code = table.gender_code(gender)
+        if gender_code is None:
+            return UNSUPPORTED_GENDER_RESULT
+        
+        # 仅缓存整数月龄（浮点月龄与整数月龄哈希相同，但查找结果不同）
+        cache = _percentile_cache
+        if cache is not None and age_in_months.__class__ is int:
+            key = (gender, age_in_months, bmi)
+            cached = cache.get(key, table)
+            if cached is not None:
+                return cached
+        else:
+            cache = None
+        
+        # 直接在紧凑参考表上查找（左闭右开区间），开启量化查找时直接索引
+        if _quantized_lookup:
+            from .quantized import get_quantized_index
+            percentile = get_quantized_index(table).find_bmi(gender_code, age_in_months, bmi)
+        else:
+            percentile = table.find_bmi(gender_code, age_in_months, bmi)
+        result = bmi_percentile_result(percentile, age_in_months)
+        
+        if cache is not None:
+            cache.put(key, result, table)
+        return result
+    
+    @staticmethod
+    def calculate_bmi_zscore(gender: str, age_in_months: int, bmi: float) -> Dict[str, Optional[float]]:
+        """计算BMI的Z评分和连续百分位
+        
+        在参考表相邻的百分位边界之间按正态分位数线性插值，超出首末边界时沿首段或末段外推，
+        百分位标签与数值的对应见 zscore.PERCENTILE_PROBABILITIES。
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            bmi: BMI值
+            
+        Returns:
+            {"zscore": Z评分, "percentile_rank": 连续百分位（0-100）}，
+            年龄或性别不支持时两者均为None
+        """
+        table = get_bmi_reference_table()
+        gender_code = table.gender_code(gender)
+        if gender_code is None:
+            return {"zscore": None, "percentile_rank": None}
+        from .zscore import get_zscore_curves, normal_cdf
+        zscore = get_zscore_curves(table).zscore(gender_code, age_in_months, bmi)
+        if zscore is None:
+            return {"zscore": None, "percentile_rank": None}
+        return {"zscore": zscore, "percentile_rank": normal_cdf(zscore)}
+    
+    @staticmethod
+    def calculate_bmi_zscore_batch(genders, ages_in_months, bmi):
+        """批量计算BMI的Z评分和连续百分位（需要NumPy）
+        
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            bmi: BMI数组
+            
+        Returns:
+            ZScoreBatchResult: Z评分数组和连续百分位数组，年龄或性别不支持的行为NaN，
+            逐行结果与 calculate_bmi_zscore 一致
+        """
+        from .vectorized import calculate_bmi_zscore_batch
+        return calculate_bmi_zscore_batch(genders, ages_in_months, bmi)
+    
+    @staticmethod
+    def get_bmi_threshold(gender: str, age_in_months: int, percentile: str) -> Optional[float]:
+        """反向查找：指定百分位在该性别、月龄下的BMI参考值
+        
+        BMI（保留两位小数后）达到该值即归入此百分位（最低百分位还包括更低的BMI），
+        例如 percentile="p85" 返回进入 p85 的BMI。
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            percentile: 百分位，如 "p85"、"p97"
+            
+        Returns:
+            BMI参考值，性别、月龄或百分位不存在时返回None
+        """
+        table = get_bmi_reference_table()
+        gender_code = table.gender_code(gender)
+        age = normalize_age(age_in_months)
+        if gender_code is None or age is None or age < 0 or age > table.max_age or percentile not in table.columns:
+            return None
+        from .thresholds import get_bmi_thresholds
+        return get_bmi_thresholds(table).threshold(gender_code, age, table.columns.index(percentile))
+    
+    @staticmethod
+    def get_weight_threshold(gender: str, age_in_months: int, percentile: str, height_cm: float) -> Optional[float]:
+        """反向查找：给定身高时，BMI达到指定百分位所需的体重
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            percentile: 百分位，如 "p85"、"p97"
+            height_cm: 身高（厘米）
+            
+        Returns:
+            体重（千克，未取整）：该体重及以上经 calculate_bmi 取两位小数后达到阈值，
+            更小的体重达不到；性别、月龄或百分位不存在时返回None
+            
+        Raises:
+            ValueError: 身高不大于0
+        """
+        if height_cm <= 0:
+            raise ValueError("身高必须大于0")
+        bmi = WHOStandardService.get_bmi_threshold(gender, age_in_months, percentile)
+        if bmi is None:
+            return None
+        from .thresholds import min_weight_for_bmi
+        return min_weight_for_bmi(bmi, height_cm)
+    
+    @staticmethod
+    def calculate_healthy_weight_range(gender: str, age_in_months: int, height_cm: float) -> Dict[str, Optional[float]]:
+        """计算给定身高、月龄下BMI分类为"正常"的体重范围
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            height_cm: 身高（厘米）
+            
+        Returns:
+            {"min_weight": 下限（含）, "max_weight": 上限（不含）}，单位千克、未取整，
+            按 calculate_bmi 取两位小数后的BMI划分（同 get_weight_threshold），
+            性别或月龄不支持时两者均为None
+            
+        Raises:
+            ValueError: 身高不大于0
+        """
+        if height_cm <= 0:
+            raise ValueError("身高必须大于0")
+        table = get_bmi_reference_table()
+        gender_code = table.gender_code(gender)
+        age = normalize_age(age_in_months)
+        if gender_code is None or age is None or age < 0 or age > table.max_age:
+            return {"min_weight": None, "max_weight": None}
+        from .thresholds import get_bmi_thresholds, min_weight_for_bmi
+        lower, upper = get_bmi_thresholds(table).category_range(gender_code, age, BMI_CATEGORIES.index("正常"))
+        return {"min_weight": min_weight_for_bmi(lower, height_cm), "max_weight": min_weight_for_bmi(upper, height_cm)}
+    
+    @staticmethod
+    def calculate_healthy_weight_range_batch(genders, ages_in_months, heights_cm):
+        """批量计算BMI分类为"正常"的体重范围（需要NumPy）
+        
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            heights_cm: 身高数组（厘米）
+            
+        Returns:
+            WeightRangeBatchResult: 体重下限数组和上限数组，性别或月龄不支持的行为NaN，
+            逐行结果与 calculate_healthy_weight_range 一致
+            
+        Raises:
+            ValueError: 任意一行身高不大于0
+        """
+        from .vectorized import calculate_healthy_weight_range_batch
+        return calculate_healthy_weight_range_batch(genders, ages_in_months, heights_cm)
+    
+    @staticmethod
+    def enable_percentile_cache(maxsize: int = 4096) -> "PercentileCache":
+        """开启BMI百分位结果缓存
+        
+        Args:
+            maxsize: 最多缓存的结果数，超出后淘汰最久未使用的结果
+            
+        Returns:
+            新建的缓存，可通过 stats() 查看命中、未命中和淘汰次数
+        """
+        from .result_cache import PercentileCache
+        global _percentile_cache
+        _percentile_cache = PercentileCache(maxsize)
+        return _percentile_cache
+    
+    @staticmethod
+    def disable_percentile_cache() -> None:
+        """关闭并丢弃BMI百分位结果缓存"""
+        global _percentile_cache
+        _percentile_cache = None
+    
+    @staticmethod
+    def get_percentile_cache() -> Optional["PercentileCache"]:
+        """获取当前的BMI百分位结果缓存，未开启时返回None"""
+        return _percentile_cache
+    
+    @staticmethod
+    def get_bmi_classifier(gender: str, age_in_months: int) -> "BMIClassifier":
+        """获取指定性别、月龄的专用BMI分类函数
+        
+        分类函数只接受BMI，边界值和结果记录已预先绑定，调用时不再验证性别和月龄或查找参考表，
+        适合反复评估少数几个月龄的场景。生成的函数缓存在有界注册表中（见 configure_classifier_registry）。
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            
+        Returns:
+            BMI -> PercentileResult 的函数，结果与 calculate_bmi_percentile_record(gender, age_in_months, bmi) 一致
+        """
+        registry = _classifier_registry or WHOStandardService.get_classifier_registry()
+        return registry.get_or_build(get_bmi_reference_table(), gender, age_in_months)
+    
+    @staticmethod
+    def configure_classifier_registry(maxsize: int = 64) -> "ClassifierRegistry":
+        """替换专用分类函数注册表
         
-        data = WHOStandardService.get_bmi_data_by_gender(gender)
-        if not data:
-            return {"percentile": "unknown", "description": "不支持的性别"}
+        Args:
+            maxsize: 最多保存的分类函数数，超出后淘汰最久未使用的函数
+            
+        Returns:
+            新建的注册表，可通过 stats() 查看命中统计
+        """
+        from .classifiers import ClassifierRegistry
+        global _classifier_registry
+        _classifier_registry = ClassifierRegistry(maxsize)
+        return _classifier_registry
+    
+    @staticmethod
+    def get_classifier_registry() -> "ClassifierRegistry":
+        """获取当前的专用分类函数注册表（首次调用时按默认容量创建）"""
+        registry = _classifier_registry
+        if registry is None:
+            registry = WHOStandardService.configure_classifier_registry()
+        return registry
+    
+    @staticmethod
+    def enable_quantized_lookup() -> "QuantizedBMIIndex":
+        """开启量化直接索引查找
         
-        percentile = WHOStandardService.find_percentile_for_bmi(data, age_in_months, bmi)
-        description = get_percentile_description(percentile, "bmi", age_in_months)
+        为当前BMI参考表构建（仅一次）按0.01量化的百分位直接索引表，之后的BMI百分位查找
+        （包括批量计算）只做整数换算和一次数组索引，结果与二分查找完全一致。
         
-        return {"percentile": percentile, "description": description}
+        Returns:
+            量化索引表，nbytes 为占用的字节数
+        """
+        from .quantized import get_quantized_index
+        global _quantized_lookup
+        index = get_quantized_index(get_bmi_reference_table())
+        _quantized_lookup = True
+        return index
+    
+    @staticmethod
+    def disable_quantized_lookup() -> None:
+        """关闭量化直接索引查找，恢复二分查找"""
+        global _quantized_lookup
+        _quantized_lookup = False
+    
+    @staticmethod
+    def is_quantized_lookup_enabled() -> bool:
+        """是否已开启量化直接索引查找"""
+        return _quantized_lookup
     
     @staticmethod
-    def calculate_adult_bmi_category(bmi: float, gender: str) -> Dict[str, str]:
-        """计算成人BMI分类（中国成人标准，区分男女）
+    def calculate_adult_bmi_category(bmi: float, gender: str, policy: Optional[str] = None) -> Dict[str, str]:
+        """计算成人BMI分类（默认为中国成人标准，区分男女）
         
         Args:
             bmi: BMI值
             gender: 性别 ("boy" 或 "girl")
+            policy: 成人BMI分类策略名称（见 standards.available_adult_policies），默认为 "cn"
             
         Returns:
             包含分类和描述的字典
             
+        Raises:
+            ValueError: 分类策略未注册
+            
         Note:
             男性标准：偏瘦<20, 正常20-25, 超重25-30, 肥胖≥30
             女性标准：偏瘦<19, 正常19-24, 超重24-29, 肥胖≥29
         """
-        if gender == "boy":
-            # 男性标准
-            if bmi < 20.0:
-                return {"category": "underweight", "description": "偏瘦 (BMI<20)"}
-            elif bmi < 25.0:
-                return {"category": "normal", "description": "正常 (20≤BMI<25)"}
-            elif bmi < 30.0:
-                return {"category": "overweight", "description": "超重 (25≤BMI<30)"}
-            else:
-                return {"category": "obese", "description": "肥胖 (BMI≥30)"}
-        else:
-            # 女性标准
-            if bmi < 19.0:
-                return {"category": "underweight", "description": "偏瘦 (BMI<19)"}
-            elif bmi < 24.0:
-                return {"category": "normal", "description": "正常 (19≤BMI<24)"}
-            elif bmi < 29.0:
-                return {"category": "overweight", "description": "超重 (24≤BMI<29)"}
-            else:
-                return {"category": "obese", "description": "肥胖 (BMI≥29)"}
+        from .standards import DEFAULT_ADULT_POLICY, get_adult_policy
+        return get_adult_policy(DEFAULT_ADULT_POLICY if policy is None else policy).classify(bmi, gender)
     
     @staticmethod
     def calculate_bmi(height_cm: float, weight_kg: float) -> float:
@@ -245,7 +496,8 @@ class WHOStandardService:
         gender: str,
         age_in_months: int,
         height_cm: float,
-        weight_kg: float
+        weight_kg: float,
+        standard: Optional[str] = None
     ) -> Dict[str, Any]:
         """计算BMI及其百分位
         
@@ -254,18 +506,182 @@ class WHOStandardService:
             age_in_months: 年龄（月）
             height_cm: 身高（厘米）
             weight_kg: 体重（千克）
+            standard: 参考标准名称，默认为WHO标准
             
         Returns:
             包含BMI值、百分位和描述的字典
         """
         bmi = WHOStandardService.calculate_bmi(height_cm, weight_kg)
-        percentile_result = WHOStandardService.calculate_bmi_percentile(gender, age_in_months, bmi)
+        result = WHOStandardService.calculate_bmi_percentile_record(gender, age_in_months, bmi, standard)
+        return {"bmi": bmi, "percentile": result.percentile, "description": result.description}
+    
+    @staticmethod
+    def calculate_bmi_with_percentile_record(
+        gender: str,
+        age_in_months: int,
+        height_cm: float,
+        weight_kg: float,
+        standard: Optional[str] = None
+    ) -> BMIResult:
+        """计算BMI及其百分位，返回不可变记录
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            height_cm: 身高（厘米）
+            weight_kg: 体重（千克）
+            standard: 参考标准名称，默认为WHO标准
+            
+        Returns:
+            BMIResult: BMI值、百分位编码、百分位标签和描述
+        """
+        bmi = WHOStandardService.calculate_bmi(height_cm, weight_kg)
+        record = WHOStandardService.calculate_bmi_percentile_record(gender, age_in_months, bmi, standard)
+        return BMIResult._make((bmi,) + record)
+    
+    @staticmethod
+    def assess(gender: str, age_in_months: int, height_cm: float, weight_kg: float) -> Dict[str, Any]:
+        """一次计算身高、体重和BMI的百分位
+        
+        月龄只解析一次，三张参考表共用同一个月龄行号。BMI部分的结果与
+        calculate_bmi_with_percentile 一致；身高、体重按左开右闭区间查找，
+        与 find_percentile_for_height / find_percentile_for_weight 一致。
+        
+        Args:
+            gender: 性别 ("boy" 或 "girl")
+            age_in_months: 年龄（月）
+            height_cm: 身高（厘米）
+            weight_kg: 体重（千克）
+            
+        Returns:
+            包含 bmi、bmi_percentile、bmi_description、height_percentile、height_description、
+            weight_percentile、weight_description 的字典
+            
+        Raises:
+            ValueError: 身高或体重不大于0，或未加载身高、体重参考表（包内不附带这两项标准数据）
+        """
+        measure_tables = (("height", require_reference_table("height"), height_cm),
+                          ("weight", require_reference_table("weight"), weight_kg))
+        bmi = WHOStandardService.calculate_bmi(height_cm, weight_kg)
+        age = normalize_age(age_in_months)
+        result: Dict[str, Any] = {"bmi": bmi}
+        
+        # BMI：先验证年龄范围，再验证性别（与 calculate_bmi_percentile 的顺序一致）
+        if age_in_months < 0 or age_in_months > 228:
+            percentile, description = "unknown", "年龄超出数据范围(0-228个月)"
+        else:
+            table = get_bmi_reference_table()
+            gender_code = table.gender_code(gender)
+            if gender_code is None:
+                percentile, description = "unknown", "不支持的性别"
+            else:
+                start = table.row_start_for(gender_code, age) if age is not None else None
+                percentile = table.find_bmi_in_row(start, bmi) if start is not None else "unknown"
+                description = bmi_percentile_result(percentile, age_in_months).description
+        result["bmi_percentile"] = percentile
+        result["bmi_description"] = description
+        
+        for metric, table, value in measure_tables:
+            gender_code = table.gender_code(gender)
+            if gender_code is None:
+                percentile, description = "unknown", "不支持的性别"
+            elif age is None:
+                percentile = "unknown"
+                description = get_percentile_description(percentile, metric)
+            else:
+                start = table.row_start_for(gender_code, age)
+                if start is None:
+                    percentile, description = "unknown", "年龄超出数据范围"
+                else:
+                    percentile = table.find_measure_in_row(start, value)
+                    description = get_percentile_description(percentile, metric)
+            result[f"{metric}_percentile"] = percentile
+            result[f"{metric}_description"] = description
+        
+        return result
+    
+    @staticmethod
+    def assess_batch(genders, ages_in_months, heights_cm, weights_kg):
+        """批量计算身高、体重和BMI的百分位（需要NumPy）
+        
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            heights_cm: 身高数组（厘米）
+            weights_kg: 体重数组（千克）
+            
+        Returns:
+            AssessmentBatchResult: 各指标的百分位编码和描述编号，逐行结果与 assess 一致
+            
+        Raises:
+            ValueError: 任意一行身高或体重不大于0，或未加载身高、体重参考表
+        """
+        from .vectorized import assess_batch
+        return assess_batch(genders, ages_in_months, heights_cm, weights_kg)
+    
+    @staticmethod
+    def calculate_bmi_with_percentile_batch(genders, ages_in_months, heights_cm, weights_kg):
+        """批量计算BMI及其百分位（需要NumPy）
+        
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            heights_cm: 身高数组（厘米）
+            weights_kg: 体重数组（千克）
+            
+        Returns:
+            BMIBatchResult: BMI数组、百分位编码数组和描述编号数组，
+            逐行结果与 calculate_bmi_with_percentile 一致
+        """
+        from .vectorized import calculate_bmi_with_percentile_batch
+        return calculate_bmi_with_percentile_batch(genders, ages_in_months, heights_cm, weights_kg)
+    
+    @staticmethod
+    def calculate_bmi_with_percentile_threaded(genders, ages_in_months, heights_cm, weights_kg):
+        """在共享线程池中分片批量计算BMI及其百分位（需要NumPy）
+        
+        NumPy计算时释放GIL，多个分片可在多个CPU核上同时计算，见 threaded.py。
         
-        return {
-            "bmi": bmi,
-            "percentile": percentile_result["percentile"],
-            "description": percentile_result["description"]
-        }
+        Args:
+            genders: 性别编码数组（0=男孩，1=女孩），也可传入"boy"/"girl"字符串数组
+            ages_in_months: 年龄数组（月）
+            heights_cm: 身高数组（厘米）
+            weights_kg: 体重数组（千克）
+            
+        Returns:
+            BMIBatchResult: 与 calculate_bmi_with_percentile_batch 的结果一致
+            
+        Raises:
+            ValueError: 任意一行身高、体重不大于0
+        """
+        from .threaded import score_threaded
+        return score_threaded(genders, ages_in_months, heights_cm, weights_kg)
+    
+    @staticmethod
+    def score_into(genders, ages_in_months, heights_cm, weights_kg,
+                   out_bmi=None, out_code=None, out_description=None, out=None) -> int:
+        """读取缓冲区计算BMI及其百分位，结果写入调用方提供的缓冲区（需要NumPy）
+        
+        输入可以是任意支持缓冲区协议的对象，不为每行创建Python对象，适合在共享内存中原地评分。
+        
+        Args:
+            genders: 性别编码缓冲区（0=男孩，1=女孩）
+            ages_in_months: 年龄（月）缓冲区
+            heights_cm: 身高（厘米）缓冲区
+            weights_kg: 体重（千克）缓冲区
+            out_bmi: BMI输出缓冲区
+            out_code: 百分位编码输出缓冲区（见 PercentileCode）
+            out_description: 描述编号输出缓冲区，可选
+            out: 含 "bmi"、"percentile_code"（可选 "description_code"）字段的结构化输出数组
+            
+        Returns:
+            int: 写入的行数
+            
+        Raises:
+            ValueError: 缓冲区不符合要求，或任意一行身高、体重不大于0
+        """
+        from .buffers import score_into
+        return score_into(genders, ages_in_months, heights_cm, weights_kg, out_bmi, out_code, out_description, out)
 
 
 # 创建全局实例
@@ -0,0 +1,126 @@
+"""连续百分位与Z评分
+
+参考表每行只保存15个百分位边界，本模块在相邻边界之间按正态分位数线性插值：
+把每个百分位换算为标准正态分布的Z值（如 p50 -> 0，p97 -> 1.881），
+落在两个边界之间的测量值按比例得到Z值，再由正态分布函数得到连续的百分位（0-100）。
+低于最小边界或高于最大边界时沿首段或末段的斜率外推。
+
+每个去重后的行预先计算各分段的截距和斜率（Z = 截距 + 斜率 × 测量值），
+查找时只需一次二分查找和一次乘加。
+"""
+import math
+from array import array
+from bisect import bisect_right
+from typing import Dict, Optional
+
+from .reference_table import ReferenceTable
+
+# 百分位标签 -> 累积概率
+PERCENTILE_PROBABILITIES: Dict[str, float] = {
+    "p01": 0.001,
+    "p1": 0.01,
+    "p3": 0.03,
+    "p5": 0.05,
+    "p10": 0.10,
+    "p15": 0.15,
+    "p25": 0.25,
+    "p50": 0.50,
+    "p75": 0.75,
+    "p85": 0.85,
+    "p90": 0.90,
+    "p95": 0.95,
+    "p97": 0.97,
+    "p977": 0.977,
+    "p99": 0.99,
+    "p999": 0.999,
+}
+
+_SQRT2 = math.sqrt(2.0)
+
+
+def normal_cdf(z: float) -> float:
+    """标准正态分布函数，返回百分位（0-100）"""
+    return 50.0 * math.erfc(-z / _SQRT2)
+
+
+class ZScoreCurves:
+    """参考表各行的分段线性Z值系数
+
+    Attributes:
+        table: 对应的参考表
+        intercepts: 每个去重行 len(columns) - 1 个分段截距
+        slopes: 每个去重行 len(columns) - 1 个分段斜率
+    """
+
+    __slots__ = ("table", "intercepts", "slopes", "_segments")
+
+    def __init__(self, table: ReferenceTable):
+        """
+        Raises:
+            ValueError: 参考表含有无法换算为概率的百分位列，或列数少于2
+        """
+        columns = table.columns
+        if len(columns) < 2:
+            raise ValueError("参考表至少需要两个百分位列")
+        # statistics 会连带导入 fractions、decimal、random，只在构建曲线时导入
+        from statistics import NormalDist
+        try:
+            z_values = [NormalDist().inv_cdf(PERCENTILE_PROBABILITIES[column]) for column in columns]
+        except KeyError as e:
+            raise ValueError(f"无法换算为概率的百分位列：{e.args[0]}")
+
+        width = len(columns)
+        segments = width - 1
+        values = table.values
+        intercepts = array("d")
+        slopes = array("d")
+        for start in range(0, len(values), width):
+            row = values[start:start + width]
+            coefficients = [
+                None if row[k + 1] == row[k] else (z_values[k + 1] - z_values[k]) / (row[k + 1] - row[k])
+                for k in range(segments)
+            ]
+            for k in range(segments):
+                slope = coefficients[k]
+                if slope is None:
+                    # 相邻边界相同的分段只会在外推时用到，取向内最近的有效分段
+                    inward = range(k + 1, segments) if k < segments // 2 else range(k - 1, -1, -1)
+                    nearest = next((j for j in inward if coefficients[j] is not None), None)
+                    if nearest is None:
+                        slope, z, boundary = 0.0, 0.0, 0.0
+                    else:
+                        slope, z, boundary = coefficients[nearest], z_values[nearest], row[nearest]
+                else:
+                    z, boundary = z_values[k], row[k]
+                slopes.append(slope)
+                intercepts.append(z - slope * boundary)
+
+        self.table = table
+        self.intercepts = intercepts
+        self.slopes = slopes
+        self._segments = segments
+
+    def zscore(self, gender_code: int, age, value: float) -> Optional[float]:
+        """计算Z值，月龄不存在时返回None，测量值为NaN时返回NaN"""
+        table = self.table
+        start = table.row_start(gender_code, age)
+        if start is None:
+            return None
+        width = self._segments + 1
+        i = bisect_right(table.values, value, start, start + width) - start
+        k = min(max(i - 1, 0), self._segments - 1)
+        offset = start // width * self._segments + k
+        return self.intercepts[offset] + self.slopes[offset] * value
+
+
+# 最近使用的参考表的系数，参考表被替换后重新计算
+_curves: Optional[ZScoreCurves] = None
+
+
+def get_zscore_curves(table: ReferenceTable) -> ZScoreCurves:
+    """获取参考表对应的Z值系数（按参考表对象缓存最近一份）"""
+    global _curves
+    curves = _curves
+    if curves is None or curves.table is not table:
+        curves = _curves = ZScoreCurves(table)
+    return curves